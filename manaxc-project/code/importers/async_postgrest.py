@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Asyncio PostgREST client for the importers.
+
+supabase.create_client is synchronous: every lookup and insert waits for
+the one before it. AsyncPostgrest talks to the same REST endpoint
+(<SUPABASE_URL>/rest/v1) over one pooled httpx.AsyncClient, so the chunks
+of a lookup or an insert can be in flight together:
+
+    async with AsyncPostgrest.from_env() as client:
+        rows = await client.select_in('athletes', 'id, first_name, last_name, school_id', 'school_id', school_ids)
+        written, failed = await client.write_rows('results', new_rows, on_conflict='athlete_id,meet_id,race_id,time_cs,data_source')
+
+- Concurrency is bounded by a semaphore (IMPORT_CONCURRENCY, default 8),
+  and the connection pool is sized to match.
+- HTTP/2 is used when the h2 package is installed (pip install httpx[http2]).
+- Timeouts, connection errors, 429 and 5xx responses are retried with
+  exponential backoff (IMPORT_MAX_RETRIES, default 4).
+- Plain inserts are not idempotent, so they are only retried when the
+  request cannot have reached the database: connection failures, 429 and
+  503. Selects and ignore-duplicates upserts are retried on any transient
+  error. A plain insert chunk that may have landed is reported as failed
+  rather than resent row by row (staged_import looks its rows up again).
+
+select_in and write_rows mirror bulk_upsert (same chunking, same
+fallbacks), so staged_import can run a stage either way.
+"""
+
+import asyncio
+import os
+import random
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+try:
+    import h2  # noqa: F401 - enables http2=True in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:  # optional dependency
+    HTTP2_AVAILABLE = False
+
+from bulk_upsert import (
+    IN_CHUNK_SIZE, SELECT_PAGE_SIZE, WRITE_CHUNK_SIZE, chunked, may_have_landed, no_matching_constraint
+)
+
+
+# Requests in flight at once
+IMPORT_CONCURRENCY = int(os.getenv('IMPORT_CONCURRENCY', '8'))
+
+# Retries per request on transient errors
+IMPORT_MAX_RETRIES = int(os.getenv('IMPORT_MAX_RETRIES', '4'))
+
+# Seconds per request
+IMPORT_TIMEOUT = float(os.getenv('IMPORT_TIMEOUT', '30'))
+
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+
+class PostgrestError(Exception):
+    """Error response from PostgREST (message includes the Postgres error code)"""
+
+    def __init__(self, status_code: int, payload: Dict):
+        self.status_code = status_code
+        self.code = payload.get('code')
+        self.payload = payload
+        super().__init__(f"HTTP {status_code} {self.code or ''}: {payload.get('message', payload)}")
+
+
+def _error_payload(response: 'httpx.Response') -> Dict:
+    try:
+        payload = response.json()
+    except ValueError:
+        return {'message': response.text[:200]}
+    return payload if isinstance(payload, dict) else {'message': str(payload)[:200]}
+
+
+def _in_filter(values: Iterable) -> str:
+    """PostgREST in.() filter with every value quoted (names may contain commas)"""
+    quoted = []
+    for value in values:
+        text = str(value).replace('\\', '\\\\').replace('"', '\\"')
+        quoted.append(f'"{text}"')
+    return f"in.({','.join(quoted)})"
+
+
+def _retryable(error: Exception, idempotent: bool) -> bool:
+    if isinstance(error, PostgrestError):
+        if error.status_code in (429, 503):
+            return True
+        return idempotent and error.status_code >= 500
+    # Connection never established: safe to resend anything
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+    return idempotent and isinstance(error, httpx.TransportError)
+
+
+class AsyncPostgrest:
+    """Pooled asyncio client for the Supabase REST API with bounded concurrency and retries"""
+
+    def __init__(
+        self,
+        url: str,
+        key: str,
+        concurrency: int = IMPORT_CONCURRENCY,
+        timeout: float = IMPORT_TIMEOUT,
+        max_retries: int = IMPORT_MAX_RETRIES,
+        http2: bool = True,
+        transport: Optional['httpx.AsyncBaseTransport'] = None
+    ):
+        """
+        Args:
+            url: Supabase project URL (NEXT_PUBLIC_SUPABASE_URL)
+            key: API key (NEXT_PUBLIC_SUPABASE_ANON_KEY)
+            concurrency: Requests in flight at once
+            timeout: Seconds per request
+            max_retries: Retries per request on transient errors
+            http2: Use HTTP/2 if h2 is installed
+            transport: httpx transport (e.g. httpx.MockTransport for offline runs)
+        """
+        self.max_retries = max_retries
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.client = httpx.AsyncClient(
+            base_url=f"{url.rstrip('/')}/rest/v1",
+            headers={'apikey': key, 'Authorization': f"Bearer {key}"},
+            timeout=timeout,
+            http2=http2 and HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            transport=transport
+        )
+        self.requests = 0
+        self.retries = 0
+        self._plain_insert_tables = set()  # Tables found to have no matching unique constraint
+
+    @classmethod
+    def from_env(cls, **kwargs) -> 'AsyncPostgrest':
+        """Client for NEXT_PUBLIC_SUPABASE_URL / NEXT_PUBLIC_SUPABASE_ANON_KEY"""
+        return cls(os.getenv('NEXT_PUBLIC_SUPABASE_URL'), os.getenv('NEXT_PUBLIC_SUPABASE_ANON_KEY'), **kwargs)
+
+    async def __aenter__(self) -> 'AsyncPostgrest':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def request(
+        self,
+        method: str,
+        table: str,
+        params: Optional[Dict] = None,
+        json_body=None,
+        prefer: Optional[str] = None,
+        idempotent: bool = True
+    ) -> List[Dict]:
+        """
+        Send one request, retrying transient failures with backoff.
+
+        Returns:
+            Response rows (empty list for empty bodies)
+
+        Raises:
+            PostgrestError / httpx.TransportError once retries are used up
+            or for non-transient errors
+        """
+        headers = {'Prefer': prefer} if prefer else None
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.semaphore:
+                    self.requests += 1
+                    response = await self.client.request(
+                        method, f"/{table}", params=params, json=json_body, headers=headers
+                    )
+                if response.status_code < 400:
+                    return response.json() if response.content else []
+                error = PostgrestError(response.status_code, _error_payload(response))
+            except httpx.TransportError as e:
+                error = e
+
+            if attempt == self.max_retries or not _retryable(error, idempotent):
+                raise error
+            self.retries += 1
+            delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * (0.5 + random.random() / 2)
+            print(f"  ⚠️  {method} {table} failed ({str(error)[:80]}), "
+                  f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    # ==========================================================================
+    # READ
+    # ==========================================================================
+
+    async def _select_chunk(self, table: str, columns: str, key_column: str, chunk, page_size: int) -> List[Dict]:
+        rows = []
+        offset = 0
+        while True:
+            page = await self.request('GET', table, params={
+                'select': columns.replace(' ', ''),
+                key_column: _in_filter(chunk),
+                'limit': page_size,
+                'offset': offset
+            })
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+            offset += page_size
+
+    async def select_in(
+        self,
+        table: str,
+        columns: str,
+        key_column: str,
+        keys: Iterable,
+        chunk_size: int = IN_CHUNK_SIZE,
+        page_size: int = SELECT_PAGE_SIZE
+    ) -> List[Dict]:
+        """Fetch all rows whose `key_column` is one of `keys` (chunks run concurrently, see bulk_upsert.select_in)"""
+        distinct_keys = list(dict.fromkeys(key for key in keys if key not in (None, '')))
+        pages = await asyncio.gather(*(
+            self._select_chunk(table, columns, key_column, chunk, page_size)
+            for chunk in chunked(distinct_keys, chunk_size)
+        ))
+        return [row for page in pages for row in page]
+
+    # ==========================================================================
+    # WRITE
+    # ==========================================================================
+
+    async def insert(self, table: str, rows, on_conflict: Optional[str] = None) -> List[Dict]:
+        """Insert rows (a dict or a list); with on_conflict, rows colliding with it are skipped"""
+        if on_conflict:
+            return await self.request(
+                'POST', table, params={'on_conflict': on_conflict}, json_body=rows,
+                prefer='return=representation,resolution=ignore-duplicates'
+            )
+        return await self.request('POST', table, json_body=rows, prefer='return=representation', idempotent=False)
+
+    async def _write_chunk(self, table: str, chunk: List[Dict], on_conflict: Optional[str],
+                           written: List[Dict], failed: List[Tuple[Dict, Exception]]):
+        if table in self._plain_insert_tables:
+            on_conflict = None
+        try:
+            written.extend(await self.insert(table, chunk, on_conflict))
+            return
+        except Exception as e:
+            error = e
+            if on_conflict and no_matching_constraint(e):
+                if table not in self._plain_insert_tables:
+                    print(f"  ⚠️  {table} has no unique constraint on ({on_conflict}), using plain inserts")
+                    self._plain_insert_tables.add(table)
+                on_conflict = None
+                try:
+                    written.extend(await self.insert(table, chunk))
+                    return
+                except Exception as e:
+                    error = e
+
+        # insert() did not resend a plain insert that may have landed; neither do we
+        if not on_conflict and may_have_landed(error):
+            print(f"  ⚠️  Chunk of {len(chunk)} {table} may have been written ({type(error).__name__}), not resending")
+            failed.extend((row, error) for row in chunk)
+            return
+
+        # Chunk failed - write row by row to isolate the bad rows
+        print(f"  ⚠️  Chunk of {len(chunk)} {table} failed, writing individually...")
+        for row in chunk:
+            try:
+                written.extend(await self.insert(table, row, on_conflict))
+            except Exception as e:
+                failed.append((row, e))
+
+    async def write_rows(
+        self,
+        table: str,
+        rows: List[Dict],
+        on_conflict: Optional[str] = None,
+        chunk_size: int = WRITE_CHUNK_SIZE
+    ) -> Tuple[List[Dict], List[Tuple[Dict, Exception]]]:
+        """Write rows in concurrent chunks (same contract as bulk_upsert.write_rows)"""
+        written = []
+        failed = []
+        await asyncio.gather(*(
+            self._write_chunk(table, list(chunk), on_conflict, written, failed)
+            for chunk in chunked(rows, chunk_size)
+        ))
+        return written, failed
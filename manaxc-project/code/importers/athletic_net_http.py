@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+HTTP fetch backend for Athletic.net race results (EXPERIMENTAL).
+
+Fetches a race's results as JSON over a pooled HTTP connection instead of
+rendering the page in Chrome, and converts the payload into the same
+RacePage (body text + result row texts) that the Selenium path captures.
+That keeps parse_race_page, ScrapeResult and write_csv_files unchanged.
+
+Any failure (HTTP error, non-JSON body, unexpected payload shape) returns
+None so the caller can fall back to Selenium for that race.
+
+The endpoint (RESULTS_API_URL) and the payload key names below have not
+been checked against a live response yet, so the scrapers only use this
+backend with --http. Once a few races in a row miss without a single hit,
+HttpRaceFetcher stops asking (and stops spending rate limiter tokens) for
+the rest of the run. tests/fixtures/http/synthetic_race_* were built from
+a scraped CSV in the assumed shape; they test the conversion, not the
+site.
+
+Payloads can be replayed offline:
+    python athletic_net_http.py parse <payload.json> <race_id>
+
+and recorded next to the Selenium capture of the same race (tests
+compare every recorded race_<id>.payload.json with its race_<id>.selenium.json):
+    python athletic_net_http.py record <meet_id> <race_id>
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+import httpx
+
+from athletic_net_parser import MENS, WOMENS
+from athletic_net_scraper_v2 import RacePage, parse_race_page
+from rate_limiter import AdaptiveRateLimiter, RATE_LIMITER
+
+
+# Results endpoint template (unverified); override with ATHLETIC_NET_RESULTS_API
+RESULTS_API_URL = os.getenv(
+    'ATHLETIC_NET_RESULTS_API',
+    'https://www.athletic.net/api/v1/Meet/GetResultsData?meetId={meet_id}&raceId={race_id}'
+)
+
+# Misses without any hit before HttpRaceFetcher gives up for the run
+MAX_MISSES_WITHOUT_HIT = 3
+
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept': 'application/json'
+}
+
+
+# Payload fields read by race_page_from_payload (one name per field, assumed):
+#
+#   {"race": {"RaceName": "2.74 Miles Varsity", "Gender": "M"},
+#    "results": [{"Place": 1, "FirstName": "Vincent", "LastName": "Cheung",
+#                 "SchoolName": "Silver Creek", "Result": "15:05.50", "Grade": 12}, ...]}
+#
+# tests/fixtures/http/synthetic_race_1053255.payload.json is a race in this
+# shape built from a scraped CSV; `python athletic_net_http.py record` saves
+# a real payload next to the Selenium capture of the same race.
+RACE_KEY = 'race'
+RESULTS_KEY = 'results'
+RACE_NAME_KEY = 'RaceName'
+GENDER_KEY = 'Gender'
+PLACE_KEY = 'Place'
+FIRST_NAME_KEY = 'FirstName'
+LAST_NAME_KEY = 'LastName'
+SCHOOL_KEY = 'SchoolName'
+MARK_KEY = 'Result'
+GRADE_KEY = 'Grade'
+
+
+def _value(record: Dict, key: str):
+    """record[key] as a stripped string, None if missing or empty"""
+    value = record.get(key)
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _race_title(race: Dict) -> Optional[str]:
+    """Build a race title like "Mens 2.74 Miles Varsity" from the payload's race object"""
+    title = _value(race, RACE_NAME_KEY)
+
+    # Titles without a gender word get one from the Gender field so the
+    # parser doesn't have to infer it
+    gender = _value(race, GENDER_KEY)
+    if title and gender and not (MENS.search(title) or WOMENS.search(title)):
+        gender_word = {'M': 'Mens', 'F': 'Womens'}.get(gender.upper()[:1])
+        if gender_word:
+            title = f"{gender_word} {title}"
+
+    return title
+
+
+def _row_text(row: Dict) -> Optional[str]:
+    """
+    Render one JSON result as the multi-line text of a DOM result row:
+    place / initials / name / school / time / "Yr: N"
+    """
+    place = _value(row, PLACE_KEY)
+    name = ' '.join(filter(None, (_value(row, FIRST_NAME_KEY), _value(row, LAST_NAME_KEY))))
+    school = _value(row, SCHOOL_KEY)
+    mark = _value(row, MARK_KEY)
+    grade = _value(row, GRADE_KEY)
+
+    if place is None or not name or not school or not mark:
+        return None
+
+    initials = ''.join(part[0] for part in name.split() if part)[:3].upper()
+    lines = [place]
+    if len(initials) >= 2:
+        lines.append(initials)
+    lines.extend([name, school, mark])
+    if grade is not None:
+        lines.append(f"Yr: {grade}")
+    return '\n'.join(lines)
+
+
+def race_page_from_payload(race_id: str, payload) -> Optional[RacePage]:
+    """
+    Convert a results JSON payload into a RacePage.
+
+    Args:
+        race_id: Athletic.net race ID
+        payload: Decoded JSON (see the key names above)
+
+    Returns:
+        RacePage, or None if the payload has no race title or no results
+    """
+    if not isinstance(payload, dict):
+        return None
+
+    race = payload.get(RACE_KEY)
+    rows = payload.get(RESULTS_KEY)
+    if not isinstance(race, dict) or not isinstance(rows, list):
+        return None
+
+    title = _race_title(race)
+    row_texts = [text for text in (_row_text(r) for r in rows if isinstance(r, dict)) if text]
+    if not title or not row_texts:
+        return None
+
+    return RacePage(race_id=race_id, body_text=title, row_texts=row_texts)
+
+
+class HttpRaceFetcher:
+    """Pooled HTTP client that fetches race results as RacePages (thread-safe)"""
+
+    def __init__(
+        self,
+        max_connections: int = 8,
+        timeout: float = 20.0,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        transport: Optional['httpx.BaseTransport'] = None
+    ):
+        self.limiter = limiter or RATE_LIMITER
+        self.client = httpx.Client(
+            headers=REQUEST_HEADERS,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            transport=transport
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> 'HttpRaceFetcher':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def fetch_payload(self, meet_id: str, race_id: str):
+        """Fetch one race's results JSON; None on any HTTP or decoding error"""
+        url = RESULTS_API_URL.format(meet_id=meet_id, race_id=race_id)
+        self.limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = self.client.get(url)
+            # 429 and 5xx mean "slow down"; other errors are just a Selenium fallback
+            if response.status_code == 429 or response.status_code >= 500:
+                self.limiter.on_failure()
+            else:
+                self.limiter.on_success(time.monotonic() - start)
+            response.raise_for_status()
+            return response.json()
+        except httpx.TransportError:
+            self.limiter.on_failure()
+            return None
+        except (httpx.HTTPError, ValueError):
+            return None
+
+    @property
+    def gave_up(self) -> bool:
+        """True once MAX_MISSES_WITHOUT_HIT races missed and none hit"""
+        return self.hits == 0 and self.misses >= MAX_MISSES_WITHOUT_HIT
+
+    def fetch_race_page(self, meet_id: str, race_id: str) -> Optional[RacePage]:
+        """Fetch one race over HTTP; None means 'use Selenium instead'"""
+        if self.gave_up:
+            return None
+        payload = self.fetch_payload(meet_id, race_id)
+        page = race_page_from_payload(race_id, payload) if payload is not None else None
+
+        with self._lock:
+            if page:
+                self.hits += 1
+            else:
+                self.misses += 1
+                if self.hits == 0 and self.misses == MAX_MISSES_WITHOUT_HIT:
+                    print(f"  ⚠️  HTTP backend missed {self.misses} races without a hit, "
+                          f"using Selenium only for the rest of the run")
+        return page
+
+    def close(self):
+        self.client.close()
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+# Recorded payload + Selenium capture pairs, and the synthetic payload (tests/test_athletic_net_http.py)
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'fixtures', 'http')
+
+
+def record_fixture(meet_id: str, race_id: str, folder: str = FIXTURES_DIR) -> str:
+    """
+    Record one race both ways: the raw results JSON and the Selenium RacePage.
+
+    Writes race_<race_id>.payload.json and race_<race_id>.selenium.json.
+
+    Returns:
+        Path of the payload file
+
+    Raises:
+        RuntimeError if the HTTP fetch fails
+    """
+    from athletic_net_scraper_v2 import create_driver, fetch_race_page as fetch_race_page_selenium
+
+    with HttpRaceFetcher() as fetcher:
+        payload = fetcher.fetch_payload(meet_id, race_id)
+    if payload is None:
+        raise RuntimeError(f"HTTP fetch of race {race_id} failed")
+
+    driver = create_driver()
+    try:
+        page = fetch_race_page_selenium(driver, meet_id, race_id)
+    finally:
+        driver.quit()
+
+    os.makedirs(folder, exist_ok=True)
+    payload_path = os.path.join(folder, f"race_{race_id}.payload.json")
+    with open(payload_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+    with open(os.path.join(folder, f"race_{race_id}.selenium.json"), 'w', encoding='utf-8') as f:
+        json.dump({'meet_id': meet_id, 'race_id': race_id, 'body_text': page.body_text,
+                   'row_texts': page.row_texts}, f, indent=2, ensure_ascii=False)
+    return payload_path
+
+
+# ==============================================================================
+# CLI INTERFACE (fixture record / replay)
+# ==============================================================================
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == 'record':
+        path = record_fixture(sys.argv[2], sys.argv[3])
+        print(f"💾 Recorded {path} (+ Selenium capture)")
+        sys.exit(0)
+
+    if len(sys.argv) < 4 or sys.argv[1] != 'parse':
+        print("Usage:")
+        print("  python athletic_net_http.py parse <payload.json> <race_id>")
+        print("  python athletic_net_http.py record <meet_id> <race_id>   # saves to tests/fixtures/http")
+        sys.exit(1)
+
+    with open(sys.argv[2], 'r', encoding='utf-8') as f:
+        page = race_page_from_payload(sys.argv[3], json.load(f))
+
+    if not page:
+        print("❌ Payload not recognised (Selenium fallback would be used)")
+        sys.exit(1)
+
+    # Run the same parser the scrapers use (season year only affects grad_year)
+    schools, athletes, results = [], [], []
+    race = parse_race_page(page, meet_id='replay', season_year=2025,
+                           schools=schools, athletes=athletes, results=results)
+
+    print(f"Race: {race.name if race else page.body_text} ({race.gender if race else '?'})")
+    print(f"Results: {len(results)}, Athletes: {len(athletes)}, Schools: {len(schools)}")
+    for result in results[:5]:
+        print(f"  {result.place_overall}. {result.athlete_name} ({result.athlete_school_id}) {result.time_cs}cs")
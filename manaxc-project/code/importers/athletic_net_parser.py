@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Text parsers shared by the Athletic.net scrapers (v2, v3, scrape_meet_lists).
+
+Pure functions over captured page text: race title detection, gender and
+race type classification, result row tokenizing, and the ID/date/venue
+patterns read from meet and team pages. Every pattern is compiled once at
+import instead of on each call.
+
+Benchmark: python benchmark_parser.py
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+
+# ==============================================================================
+# PRECOMPILED PATTERNS
+# ==============================================================================
+
+# Race titles: a distance plus a gender/level keyword, e.g. "Mens 2.74 Miles Varsity"
+DISTANCE = re.compile(r'(?:[\d,]+\.?\d*)\s*(?:Miles?|km|Kilometers?|m|Meters?|k)\b', re.IGNORECASE)
+RACE_KEYWORDS = re.compile(
+    r'(Mens?|Womens?|Varsity|JV|Junior Varsity|Frosh|Freshman|Reserves?|Freshmen|Sophomore|Junior|Senior)',
+    re.IGNORECASE
+)
+STRICT_RACE_TITLE = re.compile(
+    r'\b(Mens?|Womens?)\s+[\d.]+\s+(?:Miles?|km|Kilometers?|m)\s+(Varsity|JV|Junior Varsity|Frosh|Freshman|Reserves?)\b',
+    re.IGNORECASE
+)
+MENS = re.compile(r'\b(?:mens?|boys?)\b|\(m\)', re.IGNORECASE)
+WOMENS = re.compile(r'\b(?:womens?|girls?)\b|\(f\)', re.IGNORECASE)
+
+# Every race type word in one alternation ("junior varsity" first so it wins over "junior")
+RACE_TYPE_WORDS = re.compile(
+    r'\b(junior varsity|jv|varsity|frosh|freshman|freshmen|sophomore|junior|senior|reserves?)\b',
+    re.IGNORECASE
+)
+
+# Distances inside a race name (matched against the lower-cased name);
+# "2Mi" / "2 mi" are miles, so meters need a word boundary after the "m"
+METERS_PER_MILE = 1609.34
+MILES = re.compile(r'(\d+\.?\d*)\s*mi(?:les?)?\b')
+KILOMETERS = re.compile(r'(\d+\.?\d*)\s*k(?:m)?')
+METERS = re.compile(r'(\d+)\s*m(?:eters)?\b')
+DISTANCE_DISPLAY = re.compile(r'([\d.]+\s+(?:Miles?|Kilometers?|km|m)\b)', re.IGNORECASE)
+
+# Distances in miles, as read by the CSV report/import scripts ("2.95 Miles", "4,000 Meters", "5K")
+MILE_NAME = re.compile(r'(\d+\.?\d*)\s*Mile', re.IGNORECASE)
+METERS_NAME = re.compile(r'([\d,]+)\s*Meters', re.IGNORECASE)
+K_NAME = re.compile(r'(\d+\.?\d*)\s*K', re.IGNORECASE)
+
+# Result rows
+TIME = re.compile(r'(\d{1,2}):(\d{2})(?:\.(\d{1,2}))?')
+GRADE = re.compile(r'Yr:\s*(\d+)')
+
+# Meet pages
+DAY_OF_WEEK_PREFIX = re.compile(r'^[A-Za-z]{3},?\s+')
+MEET_DATE = re.compile(r'\w{3},?\s+\w{3}\s+\d{1,2},\s+\d{4}')
+VENUE_LINE = re.compile(r'[A-Z][a-z]+ [A-Z][a-z]+.*(Park|Course|Field|Center)', re.IGNORECASE)
+STATE = re.compile(r'\b([A-Z]{2})\b')
+STATE_SUFFIX = re.compile(r',?\s*[A-Z]{2}\s*US.*$')
+
+# Link hrefs
+RACE_ID_HREF = re.compile(r'/results/(\d+)')
+MEET_ID_HREF = re.compile(r'/meet/(\d+)')
+SCHOOL_ID_HREF = re.compile(r'SchoolID=(\d+)')
+ATHLETE_ID_HREF = re.compile(r'/athlete/(\d+)', re.IGNORECASE)
+
+
+# ==============================================================================
+# RACE TITLES
+# ==============================================================================
+
+def find_race_title(lines: Iterable[str], limit: int = 40) -> Optional[str]:
+    """
+    Find the race title among the first `limit` page lines.
+
+    A title is a line with a distance ("2.74 Miles", "5K", "4,000 Meters")
+    and a gender, level or grade keyword.
+
+    Args:
+        lines: Stripped, non-empty page lines
+        limit: Number of leading lines to check
+
+    Returns:
+        Title line or None
+    """
+    for index, line in enumerate(lines):
+        if index >= limit:
+            break
+        if DISTANCE.search(line) and RACE_KEYWORDS.search(line):
+            return line
+    return None
+
+
+def find_strict_race_title(lines: Iterable[str], limit: int = 40) -> Optional[str]:
+    """
+    Find a "Mens/Womens <distance> <level>" title among the first `limit` lines
+    (the v3 rule: titles without an explicit gender are not accepted).
+    """
+    for index, line in enumerate(lines):
+        if index >= limit:
+            break
+        if STRICT_RACE_TITLE.search(line):
+            return line
+    return None
+
+
+def gender_from_race_name(race_name: str) -> Optional[str]:
+    """'M' for Mens/Men/Boys/(M), 'F' for Womens/Women/Girls/(F), None if the name has neither"""
+    if MENS.search(race_name):
+        return 'M'
+    if WOMENS.search(race_name):
+        return 'F'
+    return None
+
+
+def classify_race_type(race_name: str, grade_levels: bool = True) -> str:
+    """
+    Classify a race name as Varsity, JV, Frosh, Reserves or Other.
+
+    Args:
+        race_name: Race title
+        grade_levels: Also recognise Sophomore/Junior/Senior races and
+            "Freshmen" (v2); v3 only knows the basic levels
+
+    Returns:
+        Race type string
+    """
+    words = {word.lower() for word in RACE_TYPE_WORDS.findall(race_name)}
+
+    if 'varsity' in words and 'junior' not in words and 'junior varsity' not in words:
+        return 'Varsity'
+    if 'jv' in words or 'junior varsity' in words:
+        return 'JV'
+    if 'frosh' in words or 'freshman' in words or (grade_levels and 'freshmen' in words):
+        return 'Frosh'
+    if grade_levels:
+        if 'sophomore' in words:
+            return 'Sophomore'
+        if 'junior' in words:
+            return 'Junior'
+        if 'senior' in words:
+            return 'Senior'
+    if 'reserve' in words or 'reserves' in words:
+        return 'Reserves'
+    return 'Other'
+
+
+def find_distance_display(race_name: str) -> Optional[str]:
+    """Distance with its unit as written in the race name, e.g. "2.74 Miles" """
+    match = DISTANCE_DISPLAY.search(race_name)
+    return match.group(1) if match else None
+
+
+def parse_distance_from_name(race_name: str) -> int:
+    """
+    Extract distance in meters from race name.
+
+    Examples:
+        "2.74 Miles Varsity" → 4409
+        "5K JV" → 5000
+        "3 Mile Varsity" → 4828
+
+    Args:
+        race_name: Race name containing distance
+
+    Returns:
+        Distance in meters (default 5000 if can't parse)
+    """
+    distance_meters = find_distance_meters(race_name)
+
+    # Default to 5K if can't parse
+    return distance_meters if distance_meters is not None else 5000
+
+
+def find_distance_meters(race_name: str) -> Optional[int]:
+    """Distance in meters from a race name, or None if it has none (see parse_distance_from_name)"""
+    # "4,000 Meters" → "4000 meters"
+    race_name = race_name.lower().replace(',', '')
+
+    # Try miles pattern: "2.74 miles", "3 mile", "2mi"
+    miles_match = MILES.search(race_name)
+    if miles_match:
+        return int(float(miles_match.group(1)) * METERS_PER_MILE)
+
+    # Try kilometers pattern: "5k", "5000m"
+    km_match = KILOMETERS.search(race_name)
+    if km_match:
+        return int(float(km_match.group(1)) * 1000)
+
+    meters_match = METERS.search(race_name)
+    if meters_match:
+        return int(meters_match.group(1))
+
+    return None
+
+
+def distance_miles_from_name(race_name: str) -> Optional[float]:
+    """
+    Extract distance in miles from a race name like '2.95 Miles Junior Boys'.
+
+    Examples:
+        "2.95 Miles Junior Boys" → 2.95
+        "4,000 Meters Freshmen" → 2.485
+        "5K Varsity" → 3.107
+
+    Returns:
+        Distance in miles or None if the name has no distance
+    """
+    match = MILE_NAME.search(race_name)
+    if match:
+        return float(match.group(1))
+    # Match "4,000 Meters" or "5K" formats
+    match = METERS_NAME.search(race_name)
+    if match:
+        meters = float(match.group(1).replace(',', ''))
+        return meters * 0.000621371  # meters to miles
+    match = K_NAME.search(race_name)
+    if match:
+        # Convert km to miles
+        return float(match.group(1)) * 0.621371
+    return None
+
+
+# ==============================================================================
+# RESULT ROWS
+# ==============================================================================
+
+@dataclass
+class ResultRow:
+    """Fields of one result row, still as page text (except place/grade)"""
+    place: int
+    athlete_name: str
+    school_name: str
+    time_str: str
+    grade: Optional[int]
+
+
+def tokenize_result_row(row_text: str) -> Optional[ResultRow]:
+    """
+    Split the text of a result row into its fields in one pass
+    (one split, one strip per line, a regex only on the "Yr:" line).
+
+    Row lines are:
+        place / [initials] / athlete name / school / time / "PR • Yr: 12 • +1pts"
+
+    The initials line (2-3 capitals) is only skipped when the row has at
+    least five lines.
+
+    Args:
+        row_text: Text of a div[class*="result-row"] element
+
+    Returns:
+        ResultRow, or None if the row has fewer than four lines or no numeric place
+    """
+    lines = list(filter(None, map(str.strip, row_text.split('\n'))))
+    if len(lines) < 4:
+        return None
+
+    try:
+        place = int(lines[0])
+    except ValueError:
+        return None
+
+    # Initials line: 2-3 ASCII capitals, i.e. ^[A-Z]{2,3}$ without a regex call
+    initials = lines[1]
+    offset = 1 if (
+        len(lines) >= 5 and 2 <= len(initials) <= 3
+        and initials.isascii() and initials.isalpha() and initials.isupper()
+    ) else 0
+
+    grade = None
+    for line in lines[4 + offset:]:
+        if 'Yr:' in line:
+            grade_match = GRADE.search(line)
+            if grade_match:
+                grade = int(grade_match.group(1))
+                break
+
+    return ResultRow(
+        place=place,
+        athlete_name=lines[1 + offset],
+        school_name=lines[2 + offset],
+        time_str=lines[3 + offset],
+        grade=grade
+    )
+
+
+def time_to_centiseconds(time_str: str) -> Optional[int]:
+    """
+    Convert time string to centiseconds.
+
+    Examples:
+        "15:05.5" → 90550
+        "19:30.45" → 117045
+        "16:45" → 100500
+
+    Args:
+        time_str: Time in format MM:SS.CC or MM:SS
+
+    Returns:
+        Total centiseconds or None if invalid
+    """
+    try:
+        match = TIME.match(time_str.strip())
+        if not match:
+            return None
+
+        minutes = int(match.group(1))
+        seconds = int(match.group(2))
+        centiseconds = int(match.group(3).ljust(2, '0')) if match.group(3) else 0
+
+        return (minutes * 60 * 100) + (seconds * 100) + centiseconds
+    except:
+        return None
+
+
+# ==============================================================================
+# MEET / TEAM PAGES
+# ==============================================================================
+
+def find_meet_date_text(body_text: str) -> Optional[str]:
+    """First "Sat, Sep 14, 2024"-style date in the page text (unparsed)"""
+    match = MEET_DATE.search(body_text)
+    return match.group(0) if match else None
+
+
+def find_venue(lines: Iterable[str], limit: int = 30) -> Tuple[str, str]:
+    """
+    Find the venue line (e.g. "Montgomery Hill Park, CA US") in a meet page.
+
+    Args:
+        lines: Stripped, non-empty page lines
+        limit: Number of leading lines to check
+
+    Returns:
+        (venue_name, venue_state); ("Unknown Venue", "") if not found
+    """
+    for index, line in enumerate(lines):
+        if index >= limit:
+            break
+        if VENUE_LINE.search(line):
+            state_match = STATE.search(line)
+            if state_match:
+                # Remove state and "US" from venue name
+                return STATE_SUFFIX.sub('', line).strip(), state_match.group(1)
+            return line.strip(), ""
+    return "Unknown Venue", ""
+
+
+def _id_from_href(pattern: re.Pattern, href: Optional[str]) -> Optional[str]:
+    match = pattern.search(href) if href else None
+    return match.group(1) if match else None
+
+
+def race_id_from_href(href: Optional[str]) -> Optional[str]:
+    """Race ID from a ".../results/<race_id>" link"""
+    return _id_from_href(RACE_ID_HREF, href)
+
+
+def meet_id_from_href(href: Optional[str]) -> Optional[str]:
+    """Meet ID from a ".../meet/<meet_id>..." link"""
+    return _id_from_href(MEET_ID_HREF, href)
+
+
+def school_id_from_href(href: Optional[str]) -> Optional[str]:
+    """School ID from a "School.aspx?SchoolID=<id>" link"""
+    return _id_from_href(SCHOOL_ID_HREF, href)
+
+
+def athlete_id_from_href(href: Optional[str]) -> Optional[str]:
+    """Athlete ID from a ".../athlete/<athlete_id>/..." link"""
+    return _id_from_href(ATHLETE_ID_HREF, href)
+
+
+def race_ids_from_hrefs(hrefs: Iterable[Optional[str]]) -> List[str]:
+    """Unique race IDs from meet page links, sorted ascending"""
+    race_ids = {race_id_from_href(href) for href in hrefs}
+    race_ids.discard(None)
+    return sorted(race_ids)
+
+
+def race_refs_from_hrefs(hrefs: Iterable[Optional[str]]) -> List[Tuple[str, str]]:
+    """
+    Unique (meet_id, race_id) pairs from ".../meet/<meet_id>/results/<race_id>"
+    links (e.g. an athlete profile), in page order.
+    """
+    refs = []
+    seen = set()
+    for href in hrefs:
+        meet_id, race_id = meet_id_from_href(href), race_id_from_href(href)
+        if meet_id and race_id and race_id not in seen:
+            seen.add(race_id)
+            refs.append((meet_id, race_id))
+    return refs
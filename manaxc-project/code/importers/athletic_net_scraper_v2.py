@@ -5,20 +5,41 @@ Provides targeted scraping functions for schools, meets, races, and athletes
 with support for CSV generation and progress callbacks.
 """
 
-import re
 import time
 import csv
 import json
 import os
-from dataclasses import dataclass, asdict
+import heapq
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
-from typing import List, Dict, Optional, Callable
+from functools import lru_cache
+from typing import List, Dict, Optional, Callable, Iterable, Iterator, Set, Tuple, get_args, get_type_hints
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException
 from nameparser import HumanName
+from driver_pool import DriverPool
+from page_cache import PageCache
+from scrape_checkpoint import CheckpointLog
+from rate_limiter import AdaptiveRateLimiter, RATE_LIMITER
+from scrape_columnar import ParquetTableWriter, require_pyarrow, write_parquet_table
+from scrape_manifest import MANIFEST_FILE, race_fingerprints, write_manifest
+from athletic_net_parser import (
+    DAY_OF_WEEK_PREFIX, time_to_centiseconds, find_race_title,
+    tokenize_result_row, find_meet_date_text, find_venue,
+    race_ids_from_hrefs, race_refs_from_hrefs, meet_id_from_href, athlete_id_from_href
+)
+from race_classifier import classify_race_name
+from scraper_waits import (
+    WAIT_STATS, wait_for_stable_elements,
+    RESULT_ROWS, RACE_LINKS, MEET_LINKS
+)
 
 
 # ==============================================================================
@@ -123,76 +144,32 @@ class ScrapeResult:
     metadata: Dict
 
 
-# ==============================================================================
-# HELPER FUNCTIONS
-# ==============================================================================
-
-def time_to_centiseconds(time_str: str) -> Optional[int]:
-    """
-    Convert time string to centiseconds.
-
-    Examples:
-        "15:05.5" → 90550
-        "19:30.45" → 117045
-        "16:45" → 100500
-
-    Args:
-        time_str: Time in format MM:SS.CC or MM:SS
-
-    Returns:
-        Total centiseconds or None if invalid
-    """
-    try:
-        time_str = time_str.strip()
-        match = re.match(r'(\d{1,2}):(\d{2})(?:\.(\d{1,2}))?', time_str)
-        if not match:
-            return None
-
-        minutes = int(match.group(1))
-        seconds = int(match.group(2))
-        centiseconds = int(match.group(3).ljust(2, '0')) if match.group(3) else 0
-
-        total_cs = (minutes * 60 * 100) + (seconds * 100) + centiseconds
-        return total_cs
-    except:
-        return None
-
-
-def parse_distance_from_name(race_name: str) -> int:
-    """
-    Extract distance in meters from race name.
-
-    Examples:
-        "2.74 Miles Varsity" → 4409
-        "5K JV" → 5000
-        "3 Mile Varsity" → 4828
-
-    Args:
-        race_name: Race name containing distance
+@dataclass
+class RacePage:
+    """Raw text captured from a single race results page (before parsing)"""
+    race_id: str
+    body_text: str
+    row_texts: List[str]
+    # Athletic.net athlete ID linked from each row ('' if none); empty for
+    # pages captured before the IDs were recorded
+    athlete_ids: List[str] = field(default_factory=list)
 
-    Returns:
-        Distance in meters (default 5000 if can't parse)
-    """
-    race_name = race_name.lower()
 
-    # Try miles pattern: "2.74 miles", "3 mile"
-    miles_match = re.search(r'(\d+\.?\d*)\s*miles?', race_name)
-    if miles_match:
-        miles = float(miles_match.group(1))
-        return int(miles * 1609.34)
+@dataclass
+class MeetPage:
+    """Raw text captured from a meet results page (before parsing)"""
+    meet_id: str
+    title: str
+    body_text: str
+    race_ids: List[str]
 
-    # Try kilometers pattern: "5k", "5000m"
-    km_match = re.search(r'(\d+\.?\d*)\s*k(?:m)?', race_name)
-    if km_match:
-        km = float(km_match.group(1))
-        return int(km * 1000)
 
-    meters_match = re.search(r'(\d+)\s*m(?:eters)?', race_name)
-    if meters_match:
-        return int(meters_match.group(1))
+# ==============================================================================
+# HELPER FUNCTIONS
+# ==============================================================================
 
-    # Default to 5K if can't parse
-    return 5000
+# Distinct athlete names whose HumanName split is kept in memory
+ATHLETE_NAME_CACHE_SIZE = int(os.getenv('ATHLETE_NAME_CACHE_SIZE', '65536'))
 
 
 def calculate_grad_year(grade: int, season_year: int) -> int:
@@ -228,10 +205,14 @@ def calculate_grad_year(grade: int, season_year: int) -> int:
     return season_year + (13 - grade)
 
 
+@lru_cache(maxsize=ATHLETE_NAME_CACHE_SIZE)
 def parse_athlete_name(full_name: str) -> tuple:
     """
     Parse full name into first and last name.
 
+    HumanName is the most expensive step of parsing a result row, and the
+    same athletes recur across races and meets, so splits are memoized.
+
     Args:
         full_name: Full name string
 
@@ -256,7 +237,7 @@ def parse_meet_date(date_str: str) -> Optional[str]:
     """
     try:
         # Remove day of week if present
-        date_str = re.sub(r'^[A-Za-z]{3},?\s+', '', date_str)
+        date_str = DAY_OF_WEEK_PREFIX.sub('', date_str)
         date_obj = datetime.strptime(date_str, "%b %d, %Y")
         return date_obj.strftime("%Y-%m-%d")
     except:
@@ -291,6 +272,232 @@ def create_driver() -> webdriver.Chrome:
     return driver
 
 
+# ==============================================================================
+# RACE PAGE FETCHING
+# ==============================================================================
+
+def meet_page_url(meet_id: str) -> str:
+    return f'https://www.athletic.net/CrossCountry/meet/{meet_id}/results'
+
+
+def race_page_url(meet_id: str, race_id: str) -> str:
+    return f"https://www.athletic.net/CrossCountry/meet/{meet_id}/results/{race_id}"
+
+
+def fetch_meet_page(
+    driver: webdriver.Chrome,
+    meet_id: str,
+    limiter: Optional[AdaptiveRateLimiter] = None
+) -> MeetPage:
+    """
+    Load a meet results page and capture its title, text and race IDs.
+
+    Args:
+        driver: Chrome WebDriver to load the page with
+        meet_id: Athletic.net meet ID
+        limiter: Rate limiter to pace the load (default RATE_LIMITER)
+
+    Returns:
+        MeetPage with race IDs sorted ascending
+    """
+    with (limiter or RATE_LIMITER).request():
+        driver.get(meet_page_url(meet_id))
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.TAG_NAME, "body"))
+    )
+    wait_for_stable_elements(driver, RACE_LINKS)
+
+    body_text = driver.find_element(By.TAG_NAME, "body").text
+
+    # Extract all unique race IDs from meet page links
+    race_links = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/results/"]')
+
+    return MeetPage(
+        meet_id=meet_id,
+        title=driver.title,
+        body_text=body_text,
+        race_ids=race_ids_from_hrefs(link.get_attribute('href') for link in race_links)
+    )
+
+
+# href of the athlete link in each result row ('' for rows without one)
+ROW_ATHLETE_HREFS_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0])).map(function (row) {
+    var link = row.querySelector('a[href*="/athlete/"]');
+    return link ? link.href : '';
+});
+"""
+
+
+def fetch_race_page(
+    driver: webdriver.Chrome,
+    meet_id: str,
+    race_id: str,
+    limiter: Optional[AdaptiveRateLimiter] = None
+) -> RacePage:
+    """
+    Load one race results page and capture its raw text.
+
+    All WebDriver calls happen here so the returned RacePage can be parsed
+    on any thread after the driver has moved on to another page.
+
+    Args:
+        driver: Chrome WebDriver to load the page with
+        meet_id: Athletic.net meet ID
+        race_id: Athletic.net race ID
+        limiter: Rate limiter to pace the load (default RATE_LIMITER)
+
+    Returns:
+        RacePage with body text and the text of every result row
+    """
+    with (limiter or RATE_LIMITER).request():
+        driver.get(race_page_url(meet_id, race_id))
+    wait_for_stable_elements(driver, RESULT_ROWS)
+
+    body_text = driver.find_element(By.TAG_NAME, "body").text
+    row_texts = [row.text for row in driver.find_elements(By.CSS_SELECTOR, RESULT_ROWS)]
+    # One round trip for every row's athlete link
+    hrefs = driver.execute_script(ROW_ATHLETE_HREFS_SCRIPT, RESULT_ROWS) or []
+    athlete_ids = [athlete_id_from_href(href) or '' for href in hrefs]
+    if len(athlete_ids) != len(row_texts):
+        athlete_ids = []  # Rows changed between the two reads; match by name
+
+    return RacePage(race_id=race_id, body_text=body_text, row_texts=row_texts, athlete_ids=athlete_ids)
+
+
+def fetch_race_pages(
+    meet_id: str,
+    race_ids: List[str],
+    pool: DriverPool,
+    workers: int = 1,
+    limiter: Optional[AdaptiveRateLimiter] = None,
+    progress_callback: Optional[Callable[[str], None]] = None,
+    http_fetcher=None,
+    cache: Optional[PageCache] = None,
+    refresh: bool = False
+) -> Iterator[RacePage]:
+    """
+    Fetch race pages with drivers borrowed from `pool`.
+
+    With workers > 1, up to `workers` races are loaded concurrently; every
+    load goes through the shared rate limiter either way. Pages are yielded in the same order as `race_ids`
+    regardless of which worker finished first, so downstream parsing is
+    deterministic. A driver that crashes mid-page is discarded by the pool
+    and the race is retried once on a fresh driver.
+
+    If `http_fetcher` (athletic_net_http.HttpRaceFetcher) is given, each race
+    is first requested over plain HTTP and a driver is only borrowed when
+    that fails.
+
+    If `cache` (page_cache.PageCache) is given, fresh cached pages are used
+    instead of fetching, and every fetched page is stored. With refresh=True
+    every race is fetched and the cache is only written.
+
+    Args:
+        meet_id: Athletic.net meet ID
+        race_ids: Race IDs to fetch (yield order)
+        pool: DriverPool to borrow drivers from
+        workers: Maximum number of concurrent page loads (1 = serial)
+        limiter: Rate limiter shared by all page loads (default RATE_LIMITER)
+        progress_callback: Optional callback for progress updates
+        http_fetcher: Optional HTTP-first backend with Selenium fallback
+            (paced by its own limiter)
+        cache: Optional read-through page cache
+        refresh: Fetch every race even if it is cached (still stores it)
+
+    Yields:
+        RacePage for each race ID, in order
+    """
+
+    def fetch(race_id: str) -> RacePage:
+        url = race_page_url(meet_id, race_id)
+        if cache is not None and not refresh:
+            cached = cache.get(url)
+            if cached is not None:
+                return RacePage(**cached)
+
+        page = fetch_live(race_id)
+        if cache is not None:
+            cache.put(url, asdict(page))
+        return page
+
+    def fetch_live(race_id: str) -> RacePage:
+        if progress_callback:
+            progress_callback(f"Scraping race {race_id}...")
+
+        if http_fetcher is not None:
+            page = http_fetcher.fetch_race_page(meet_id, race_id)
+            if page:
+                return page
+            if progress_callback:
+                progress_callback(f"  HTTP fetch failed for race {race_id}, falling back to browser")
+
+        for attempt in (1, 2):
+            try:
+                with pool.driver() as driver:
+                    return fetch_race_page(driver, meet_id, race_id, limiter)
+            except WebDriverException:
+                if attempt == 2:
+                    raise
+                if progress_callback:
+                    progress_callback(f"WARNING: Driver crashed on race {race_id}, retrying with a fresh driver")
+
+    if workers <= 1:
+        for race_id in race_ids:
+            yield fetch(race_id)
+        return
+
+    # At most `workers` races are submitted at a time: nothing sits queued
+    # behind a failing pool, and finished pages wait only for the head race
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        remaining = iter(race_ids)
+        for race_id in itertools.islice(remaining, workers):
+            pending.append(executor.submit(fetch, race_id))
+        while pending:
+            page = pending.popleft().result()
+            race_id = next(remaining, None)
+            if race_id is not None:
+                pending.append(executor.submit(fetch, race_id))
+            yield page
+
+
+def replay_race_pages(
+    meet_id: str,
+    race_ids: List[str],
+    cache: PageCache,
+    progress_callback: Optional[Callable[[str], None]] = None
+) -> Iterator[RacePage]:
+    """
+    Yield race pages from the page cache only (no network, any age).
+
+    Races that were never cached are skipped with a warning.
+
+    Args:
+        meet_id: Athletic.net meet ID
+        race_ids: Race IDs to replay (yield order)
+        cache: page_cache.PageCache to read from
+        progress_callback: Optional callback for progress updates
+
+    Yields:
+        Cached RacePage for each race ID that has one, in order
+    """
+    for race_id in race_ids:
+        cached = cache.get(race_page_url(meet_id, race_id), fresh_only=False)
+        if cached is None:
+            if progress_callback:
+                progress_callback(f"WARNING: Race {race_id} is not in the page cache, skipping")
+            continue
+        yield RacePage(**cached)
+
+
+def checkpointed(pages: Iterable[RacePage], checkpoint: CheckpointLog) -> Iterator[RacePage]:
+    """Append each page to `checkpoint` (durably) before passing it on"""
+    for page in pages:
+        checkpoint.append({'type': 'race', 'page': asdict(page)})
+        yield page
+
+
 # ==============================================================================
 # CORE SCRAPING FUNCTIONS
 # ==============================================================================
@@ -298,7 +505,8 @@ def create_driver() -> webdriver.Chrome:
 def get_school_meets(
     school_id: str,
     seasons: List[int],
-    progress_callback: Optional[Callable[[str], None]] = None
+    progress_callback: Optional[Callable[[str], None]] = None,
+    pool: Optional[DriverPool] = None
 ) -> List[Dict]:
     """
     Fetch list of meets for a school (without scraping full results).
@@ -308,6 +516,7 @@ def get_school_meets(
         school_id: Athletic.net school ID (e.g., "1076")
         seasons: List of season years (e.g., [2024, 2025])
         progress_callback: Optional callback for progress updates
+        pool: Optional DriverPool to borrow a driver from (default: launch one)
 
     Returns:
         List of meet dictionaries with:
@@ -320,55 +529,378 @@ def get_school_meets(
     if progress_callback:
         progress_callback(f"Fetching meet list for school {school_id}...")
 
-    driver = create_driver()
+    own_pool = pool is None
+    if own_pool:
+        pool = DriverPool(create_driver)
     all_meets = []
 
     try:
-        for season in seasons:
-            if progress_callback:
-                progress_callback(f"Loading {season} season...")
+        with pool.driver() as driver:
+            for season in seasons:
+                if progress_callback:
+                    progress_callback(f"Loading {season} season...")
 
-            team_url = f'https://www.athletic.net/team/{school_id}/cross-country/{season}'
-            driver.get(team_url)
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(2)
-
-            # Find all meet links
-            meet_elements = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/CrossCountry/meet/"]')
-
-            for elem in meet_elements:
-                url = elem.get_attribute('href')
-                if url and '/CrossCountry/meet/' in url:
-                    # Extract meet ID
-                    meet_id_match = re.search(r'/meet/(\d+)', url)
-                    if meet_id_match:
-                        meet_id = meet_id_match.group(1)
-                        meet_name = elem.text.strip() or "Unknown Meet"
-
-                        # Check if already added
-                        if not any(m['athletic_net_id'] == meet_id for m in all_meets):
-                            all_meets.append({
-                                'athletic_net_id': meet_id,
-                                'name': meet_name,
-                                'date': None,  # Will be scraped later if selected
-                                'url': url,
-                                'season_year': season
-                            })
+                team_url = f'https://www.athletic.net/team/{school_id}/cross-country/{season}'
+                with RATE_LIMITER.request():
+                    driver.get(team_url)
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+                wait_for_stable_elements(driver, MEET_LINKS)
+
+                # Find all meet links
+                meet_elements = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/CrossCountry/meet/"]')
+
+                for elem in meet_elements:
+                    url = elem.get_attribute('href')
+                    if url and '/CrossCountry/meet/' in url:
+                        # Extract meet ID
+                        meet_id = meet_id_from_href(url)
+                        if meet_id:
+                            meet_name = elem.text.strip() or "Unknown Meet"
+
+                            # Check if already added
+                            if not any(m['athletic_net_id'] == meet_id for m in all_meets):
+                                all_meets.append({
+                                    'athletic_net_id': meet_id,
+                                    'name': meet_name,
+                                    'date': None,  # Will be scraped later if selected
+                                    'url': url,
+                                    'season_year': season
+                                })
 
-            if progress_callback:
-                progress_callback(f"Found {len(all_meets)} meets so far...")
+                if progress_callback:
+                    progress_callback(f"Found {len(all_meets)} meets so far...")
 
     finally:
-        driver.quit()
+        if own_pool:
+            pool.close()
 
     return all_meets
 
 
+class EntityIndex:
+    """
+    Keys of the schools and athletes collected so far for one scrape.
+
+    parse_race_page checks these sets instead of scanning the accumulated
+    lists, so de-duplication costs O(1) per result row.
+    """
+
+    def __init__(
+        self,
+        schools: Iterable[ScrapedSchool] = (),
+        athletes: Iterable[ScrapedAthlete] = ()
+    ):
+        self.school_names: Set[str] = {s.name for s in schools}
+        self.athlete_keys: Set[Tuple[str, str]] = {
+            (a.name, a.school_athletic_net_id) for a in athletes
+        }
+
+
+def parse_race_page(
+    page: RacePage,
+    meet_id: str,
+    season_year: int,
+    schools: List[ScrapedSchool],
+    athletes: List[ScrapedAthlete],
+    results: List[ScrapedResult],
+    progress_callback: Optional[Callable[[str], None]] = None,
+    index: Optional[EntityIndex] = None
+) -> Optional[ScrapedRace]:
+    """
+    Parse one fetched race page, appending new schools, athletes and results.
+
+    Pages must be parsed in race ID order so entity de-duplication (first
+    occurrence wins) matches a serial scrape.
+
+    Args:
+        page: Raw race page from fetch_race_page
+        meet_id: Athletic.net meet ID
+        season_year: Season year used for grad year calculation
+        schools: Accumulated schools (appended to)
+        athletes: Accumulated athletes (appended to)
+        results: Accumulated results (appended to)
+        progress_callback: Optional callback for progress updates
+        index: EntityIndex kept in step with `schools`/`athletes` across
+            pages (built from the lists if omitted)
+
+    Returns:
+        ScrapedRace, or None if the race name could not be found
+    """
+    if index is None:
+        index = EntityIndex(schools, athletes)
+
+    race_id = page.race_id
+    race_lines = [line.strip() for line in page.body_text.splitlines() if line.strip()]
+
+    # Extract race name - more flexible pattern
+    # Look for distance pattern followed by any descriptive text
+    # Examples: "Mens 2.74 Miles Varsity", "4,000 Meters Freshmen", "5K Sophomore"
+    race_name = find_race_title(race_lines)  # Checks first 40 lines
+
+    if not race_name:
+        if progress_callback:
+            progress_callback(f"WARNING: Could not extract race name from race {race_id}, skipping")
+        return None
+
+    # Gender, race type (including grade-based classifications) and distance
+    # from the race name, memoized per distinct name
+    race_class = classify_race_name(race_name)
+    race_gender = race_class.gender
+    race_type = race_class.race_type
+    distance_meters = race_class.distance_meters if race_class.distance_meters is not None else 5000
+
+    # Add race
+    race = ScrapedRace(
+        athletic_net_race_id=race_id,
+        meet_athletic_net_id=meet_id,
+        name=race_name,
+        gender=race_gender,
+        distance_meters=distance_meters,
+        race_type=race_type
+    )
+
+    if progress_callback:
+        progress_callback(f"  → {race_name} ({race_gender})")
+
+    # Parse results from the captured result rows
+    # Results are in div[class*="result-row"] elements with structure:
+    # Place / Name / School / Time / Year info on separate lines
+    results_for_this_race = 0
+
+    # If gender not found in race name, we'll try to infer it from the first athlete's name
+    # or look for gender indicators in the page
+    gender_inferred = False
+
+    athlete_ids = page.athlete_ids if len(page.athlete_ids) == len(page.row_texts) else []
+    for row_index, row_text in enumerate(page.row_texts):
+        # Place / [initials] / name / school / time / "PR • Yr: 12 • +1pts"
+        row = tokenize_result_row(row_text)
+        if row is None:
+            continue  # Need at least: place, name, school, time
+
+        place = row.place
+        athlete_name = row.athlete_name
+        school_name = row.school_name
+        time_str = row.time_str
+        grade = row.grade
+
+        # Parse athlete name
+        first_name, last_name = parse_athlete_name(athlete_name)
+
+        # If gender not yet determined, try to infer from athlete's gender field or first name
+        # For now, we'll check if the page has any gender indicators
+        if not race_gender and not gender_inferred:
+            # Try to find gender from the page text - look for "Boys" or "Girls" near results
+            page_text_lower = page.body_text.lower()
+            if 'boys' in page_text_lower or 'men' in page_text_lower:
+                race_gender = 'M'
+                gender_inferred = True
+                if progress_callback:
+                    progress_callback(f"    Inferred gender: M (from page content)")
+            elif 'girls' in page_text_lower or 'women' in page_text_lower:
+                race_gender = 'F'
+                gender_inferred = True
+                if progress_callback:
+                    progress_callback(f"    Inferred gender: F (from page content)")
+            else:
+                # Default to Unknown - we'll need to manually review
+                race_gender = 'U'
+                gender_inferred = True
+                if progress_callback:
+                    progress_callback(f"    WARNING: Could not determine gender, using 'U' (Unknown)")
+
+        # Convert time
+        time_cs = time_to_centiseconds(time_str)
+        if not time_cs:
+            continue
+
+        # Calculate grad year
+        if grade:
+            try:
+                grad_year = calculate_grad_year(grade, season_year)
+            except ValueError:
+                grad_year = season_year + 1
+        else:
+            grad_year = season_year + 1
+
+        # Generate school ID
+        school_id = f"school_{school_name.replace(' ', '_').lower()}"
+
+        # Add school (if not already added)
+        if school_name not in index.school_names:
+            index.school_names.add(school_name)
+            school = ScrapedSchool(
+                athletic_net_id=school_id,
+                name=school_name,
+                short_name=school_name.replace(' High School', '').replace(' HS', ''),
+                city="",
+                state="",
+                league=""
+            )
+            schools.append(school)
+
+        # Add athlete (if not already added)
+        athlete_key = (athlete_name, school_id)
+        if athlete_key not in index.athlete_keys:
+            index.athlete_keys.add(athlete_key)
+            athlete = ScrapedAthlete(
+                athletic_net_id=(athlete_ids[row_index] if athlete_ids else '') or None,
+                name=athlete_name,
+                first_name=first_name,
+                last_name=last_name,
+                school_athletic_net_id=school_id,
+                grad_year=grad_year,
+                gender=race_gender,
+                needs_review=False
+            )
+            athletes.append(athlete)
+
+        # Add result
+        result = ScrapedResult(
+            athletic_net_race_id=race_id,
+            athlete_name=athlete_name,
+            athlete_first_name=first_name,
+            athlete_last_name=last_name,
+            athlete_school_id=school_id,
+            time_cs=time_cs,
+            place_overall=place,
+            grade=grade or 12,  # Default to senior if grade not found
+            needs_review=False
+        )
+        results.append(result)
+        results_for_this_race += 1
+
+    # Update race gender if it was inferred during result parsing
+    if gender_inferred and race:
+        race.gender = race_gender
+
+    if progress_callback and results_for_this_race > 0:
+        progress_callback(f"    Parsed {results_for_this_race} results")
+
+    return race
+
+
+def parse_meet_details(title: str, body_text: str) -> Tuple[str, Optional[str], int, str, str]:
+    """
+    Meet name, date, season and venue from a meet (or race) results page.
+
+    Args:
+        title: Page title ("<meet name> - ...")
+        body_text: Page body text
+
+    Returns:
+        (meet_name, meet_date or None, season_year, venue_name, venue_state)
+    """
+    meet_name = title.split(" - ")[0] if " - " in title else title
+
+    # Extract meet date
+    meet_date = None
+    date_text = find_meet_date_text(body_text)
+    if date_text:
+        meet_date = parse_meet_date(date_text)
+
+    # Extract season year from date or use current year
+    season_year = int(meet_date.split('-')[0]) if meet_date else datetime.now().year
+
+    # Extract venue information from body text
+    # Look for patterns like "Montgomery Hill Park, CA US"
+    lines = [line.strip() for line in body_text.splitlines() if line.strip()]
+    venue_name, venue_state = find_venue(lines)
+
+    return meet_name, meet_date, season_year, venue_name, venue_state
+
+
+def build_meet_entities(
+    meet_id: str,
+    meet_name: str,
+    meet_date: Optional[str],
+    season_year: int,
+    venue_name: str,
+    venue_state: str,
+    races: List[ScrapedRace]
+) -> Tuple[ScrapedMeet, ScrapedVenue, Optional[ScrapedCourse]]:
+    """
+    Meet, venue and course rows for the scraped races of one meet.
+
+    The course is named after the venue and the first race's distance, and
+    every race's course_name is set to it.
+
+    Returns:
+        (meet, venue, course); course is None when there are no races
+    """
+    # Add meet
+    meet = ScrapedMeet(
+        athletic_net_id=meet_id,
+        name=meet_name,
+        meet_date=meet_date or f"{season_year}-01-01",
+        venue_name=venue_name,
+        season_year=season_year,
+        meet_type=""  # Admin will select
+    )
+
+    # Create venue
+    venue = ScrapedVenue(
+        athletic_net_id=None,
+        name=venue_name,
+        city="",
+        state=venue_state,
+        notes=f"Auto-generated for meet {meet_id}"
+    )
+
+    # Create course
+    course = None
+    if races:
+        first_race_name = races[0].name
+        # Extract distance with unit
+        distance_display = classify_race_name(first_race_name).distance_display or "Unknown Distance"
+
+        distance_meters = races[0].distance_meters
+        course_name = f"{venue_name}, {distance_display}"
+
+        # Update all races with the course_name
+        for race in races:
+            race.course_name = course_name
+
+        course = ScrapedCourse(
+            athletic_net_id=None,
+            name=course_name,
+            venue_name=venue_name,
+            distance_meters=distance_meters,
+            distance_display=distance_display,
+            difficulty_rating=5.0,
+            needs_review=True,
+            needs_records_scraping=False
+        )
+
+    return meet, venue, course
+
+
+def meet_checkpoint(checkpoint_dir: str, meet_id: str) -> CheckpointLog:
+    """Checkpoint log of one meet scrape (meet page, race pages, done marker)"""
+    return CheckpointLog(os.path.join(checkpoint_dir, f"meet_{meet_id}.jsonl"))
+
+
+def school_checkpoint(checkpoint_dir: str, school_id: str, seasons: List[int]) -> CheckpointLog:
+    """Checkpoint log of a school scrape's meet list"""
+    season_key = '-'.join(str(season) for season in seasons)
+    return CheckpointLog(os.path.join(checkpoint_dir, f"school_{school_id}_{season_key}.jsonl"))
+
+
 def scrape_by_meet(
     meet_id: str,
-    progress_callback: Optional[Callable[[str], None]] = None
+    progress_callback: Optional[Callable[[str], None]] = None,
+    workers: int = 1,
+    limiter: Optional[AdaptiveRateLimiter] = None,
+    pool: Optional[DriverPool] = None,
+    http_first: bool = False,
+    cache: Optional[PageCache] = None,
+    replay: bool = False,
+    previous_folder: Optional[str] = None,
+    new_races_only: bool = False,
+    checkpoint_dir: Optional[str] = None,
+    resume: bool = False
 ) -> ScrapeResult:
     """
     Scrape all data for a single meet - V3 with individual race page scraping.
@@ -377,9 +909,45 @@ def scrape_by_meet(
     - Gender detection: Scrapes each race page individually to get "Mens" or "Womens" from race title
     - Missing races: Extracts ALL race IDs from meet page links
 
+    With workers > 1, race pages are fetched concurrently over a pool of
+    headless drivers and parsed in race ID order, so the ScrapeResult is
+    identical to a serial scrape.
+
+    With replay=True nothing is fetched: the meet page and race pages are
+    read from the page cache (regardless of age), so parser changes can be
+    re-run against previously scraped pages in seconds.
+
+    With previous_folder, only races that are new or whose result count or
+    content fingerprint differs from that scrape are returned (a delta, see
+    delta_scrape_result). Athletic.net has no per-race change marker, so
+    existing races are still fetched to be fingerprinted; new_races_only
+    skips them entirely. A delta never reads the page cache (a cached page
+    would hide new races and corrected results) but still writes it.
+
+    With checkpoint_dir, the meet page and every race page are appended to
+    meet_<id>.jsonl as soon as they are fetched, and a done marker once the
+    meet is complete. resume=True picks up from that log: completed races
+    are not fetched again (a finished meet needs no network at all).
+    Without resume an old log is discarded. Callers remove the log with
+    meet_checkpoint(...).remove() once the output is written.
+
     Args:
         meet_id: Athletic.net meet ID
         progress_callback: Optional callback for progress updates
+        workers: Number of drivers fetching race pages concurrently (1 = serial)
+        limiter: Rate limiter for every page load (default: the process-wide RATE_LIMITER)
+        pool: Optional DriverPool to borrow drivers from; by default a pool of
+            `workers` drivers is created for this meet and closed afterwards
+        http_first: Experimental - fetch race results over plain HTTP
+            (athletic_net_http), falling back to Selenium per race when that fails
+        cache: Optional PageCache; fresh pages are read from it (except in a
+            delta) and every fetched page is stored in it
+        replay: Parse purely from the page cache (default PageCache if none given)
+        previous_folder: Earlier scrape folder of this meet to diff against
+            (pages are fetched live, not read from `cache`)
+        new_races_only: With previous_folder, only fetch races not in it
+        checkpoint_dir: Directory for the append-only checkpoint log
+        resume: Continue from an existing checkpoint log
 
     Returns:
         ScrapeResult with all entities
@@ -387,7 +955,25 @@ def scrape_by_meet(
     if progress_callback:
         progress_callback(f"Starting scrape for meet {meet_id}...")
 
-    driver = create_driver()
+    if replay and cache is None:
+        cache = PageCache()
+    if limiter is None:
+        limiter = RATE_LIMITER
+    # A delta must see the site as it is now, not as it was cached
+    refresh = previous_folder is not None and not replay
+
+    http_fetcher = None
+    if http_first and not replay:
+        from athletic_net_http import HttpRaceFetcher
+        http_fetcher = HttpRaceFetcher(max_connections=max(workers, 2), limiter=limiter)
+
+    own_pool = pool is None and not replay
+    if own_pool:
+        pool = DriverPool(create_driver, size=workers)
+    driver = None
+    wait_seconds_before = WAIT_STATS.total_seconds
+    limit_seconds_before = limiter.wait_seconds
+    cache_hits_before = cache.hits if cache else 0
 
     # Storage for all entities
     venues = []
@@ -398,334 +984,121 @@ def scrape_by_meet(
     races = []
     results = []
 
+    # Checkpoint state from an interrupted run
+    checkpoint = meet_checkpoint(checkpoint_dir, meet_id) if checkpoint_dir else None
+    meet_page = None
+    completed_pages = {}
+    checkpoint_done = False
+    if checkpoint and resume:
+        for record in checkpoint.records():
+            if record['type'] == 'meet':
+                meet_page = MeetPage(**record['page'])
+            elif record['type'] == 'race':
+                completed_pages[record['page']['race_id']] = RacePage(**record['page'])
+            elif record['type'] == 'done':
+                checkpoint_done = True
+    elif checkpoint:
+        checkpoint.remove()
+    checkpoint_has_meet = meet_page is not None
+
     try:
-        # Load meet page
-        meet_url = f'https://www.athletic.net/CrossCountry/meet/{meet_id}/results'
+        # Load meet page (from the checkpoint or cache when possible)
+        meet_url = meet_page_url(meet_id)
         if progress_callback:
             progress_callback(f"Loading meet page...")
 
-        driver.get(meet_url)
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(3)
+        cached = cache.get(meet_url, fresh_only=not replay) if cache and meet_page is None and not refresh else None
+        if meet_page is not None:
+            pass
+        elif cached is not None:
+            meet_page = MeetPage(**cached)
+        elif replay:
+            raise LookupError(f"Meet {meet_id} is not in the page cache ({cache.root}); scrape it once with --cache first")
+        else:
+            driver = pool.acquire()
+            meet_page = fetch_meet_page(driver, meet_id, limiter)
+            # Meet page is done; hand its driver back for the race fetches
+            pool.release(driver)
+            driver = None
+            if cache:
+                cache.put(meet_url, asdict(meet_page))
+
+        if checkpoint and not checkpoint_has_meet:
+            checkpoint.append({'type': 'meet', 'page': asdict(meet_page)})
 
         # Extract meet metadata from main page
-        meet_name = driver.title.split(" - ")[0] if " - " in driver.title else driver.title
-        body_text = driver.find_element(By.TAG_NAME, "body").text
-
-        # Extract meet date
-        meet_date = None
-        date_match = re.search(r'\w{3},?\s+\w{3}\s+\d{1,2},\s+\d{4}', body_text)
-        if date_match:
-            meet_date = parse_meet_date(date_match.group(0))
-
-        # Extract season year from date or use current year
-        season_year = int(meet_date.split('-')[0]) if meet_date else datetime.now().year
-
-        # Extract venue information from body text
-        venue_name = "Unknown Venue"
-        venue_state = ""
-
-        lines = [line.strip() for line in body_text.splitlines() if line.strip()]
-
-        # Try to find venue in page text
-        # Look for patterns like "Montgomery Hill Park, CA US"
-        for line in lines[:30]:
-            if re.search(r'[A-Z][a-z]+ [A-Z][a-z]+.*(Park|Course|Field|Center)', line, re.IGNORECASE):
-                # Extract state if present
-                state_match = re.search(r'\b([A-Z]{2})\b', line)
-                if state_match:
-                    venue_state = state_match.group(1)
-                    # Remove state and "US" from venue name
-                    venue_name = re.sub(r',?\s*[A-Z]{2}\s*US.*$', '', line).strip()
-                else:
-                    venue_name = line.strip()
-                break
+        meet_name, meet_date, season_year, venue_name, venue_state = parse_meet_details(
+            meet_page.title, meet_page.body_text
+        )
 
         if progress_callback:
             progress_callback(f"Meet: {meet_name} at {venue_name}, {venue_state}")
 
-        # STEP 1: Extract all unique race IDs from meet page links
-        if progress_callback:
-            progress_callback(f"Finding all races...")
-
-        race_links = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/results/"]')
-        race_ids_found = set()
-        for link in race_links:
-            href = link.get_attribute('href')
-            match = re.search(r'/results/(\d+)', href)
-            if match:
-                race_ids_found.add(match.group(1))
-
-        race_ids = sorted(race_ids_found)
+        # STEP 1: All unique race IDs from meet page links
+        race_ids = meet_page.race_ids
         if progress_callback:
             progress_callback(f"Found {len(race_ids)} races")
 
-        # STEP 2: Scrape each race individually
-        for race_id in race_ids:
-            race_url = f"https://www.athletic.net/CrossCountry/meet/{meet_id}/results/{race_id}"
+        previous = load_race_fingerprints(previous_folder) if previous_folder else None
+        fetch_ids = race_ids
+        if previous is not None and new_races_only:
+            fetch_ids = [race_id for race_id in race_ids if race_id not in previous]
             if progress_callback:
-                progress_callback(f"Scraping race {race_id}...")
-
-            driver.get(race_url)
-            time.sleep(4)  # Increased wait for page to fully load
-
-            race_body_text = driver.find_element(By.TAG_NAME, "body").text
-            race_lines = [line.strip() for line in race_body_text.splitlines() if line.strip()]
-
-            # Extract race name - more flexible pattern
-            # Look for distance pattern followed by any descriptive text
-            # Examples: "Mens 2.74 Miles Varsity", "4,000 Meters Freshmen", "5K Sophomore"
-            race_name = None
-            race_gender = None
-
-            for line in race_lines[:40]:  # Check first 40 lines
-                # Look for distance pattern (with or without gender prefix)
-                # Pattern: optional gender + distance (number + unit) + optional description
-                distance_pattern = r'(?:[\d,]+\.?\d*)\s*(?:Miles?|km|Kilometers?|m|Meters?|k)\b'
-                if re.search(distance_pattern, line, re.IGNORECASE):
-                    # Check if this line looks like a race name (not just a random distance mention)
-                    # It should have either gender, race type keywords, or grade level keywords
-                    race_keywords = r'(Mens?|Womens?|Varsity|JV|Junior Varsity|Frosh|Freshman|Reserves?|Freshmen|Sophomore|Junior|Senior)'
-                    if re.search(race_keywords, line, re.IGNORECASE):
-                        race_name = line
-                        # Try to extract gender from race name
-                        if re.search(r'\bmens?\b', line, re.IGNORECASE):
-                            race_gender = 'M'
-                        elif re.search(r'\bwomens?\b', line, re.IGNORECASE):
-                            race_gender = 'F'
-                        break
-
-            if not race_name:
-                if progress_callback:
-                    progress_callback(f"WARNING: Could not extract race name from race {race_id}, skipping")
-                continue
+                progress_callback(f"Incremental: {len(fetch_ids)} new races, "
+                                  f"{len(race_ids) - len(fetch_ids)} already scraped")
+
+        # Races already in the checkpoint are not fetched again
+        resumed_pages = [completed_pages[race_id] for race_id in fetch_ids if race_id in completed_pages]
+        remaining_ids = [] if checkpoint_done else [
+            race_id for race_id in fetch_ids if race_id not in completed_pages
+        ]
+        if resumed_pages and progress_callback:
+            progress_callback(f"Resuming: {len(resumed_pages)} races from checkpoint, "
+                              f"{len(remaining_ids)} left to fetch")
+
+        # STEP 2: Fetch each race page (optionally across several pooled drivers)
+        if replay:
+            pages = replay_race_pages(meet_id, remaining_ids, cache, progress_callback)
+        else:
+            if progress_callback and workers > 1 and remaining_ids:
+                progress_callback(f"Fetching races with {workers} workers...")
+            pages = fetch_race_pages(
+                meet_id, remaining_ids, pool, workers,
+                limiter=limiter,
+                progress_callback=progress_callback,
+                http_fetcher=http_fetcher,
+                cache=cache,
+                refresh=refresh
+            )
 
-            # Determine race type (including grade-based classifications)
-            if re.search(r'\bvarsity\b', race_name, re.IGNORECASE) and not re.search(r'\bjunior\b', race_name, re.IGNORECASE):
-                race_type = 'Varsity'
-            elif re.search(r'\b(jv|junior varsity)\b', race_name, re.IGNORECASE):
-                race_type = 'JV'
-            elif re.search(r'\b(frosh|freshman|freshmen)\b', race_name, re.IGNORECASE):
-                race_type = 'Frosh'
-            elif re.search(r'\bsophomore\b', race_name, re.IGNORECASE):
-                race_type = 'Sophomore'
-            elif re.search(r'\bjunior\b', race_name, re.IGNORECASE):
-                race_type = 'Junior'
-            elif re.search(r'\bsenior\b', race_name, re.IGNORECASE):
-                race_type = 'Senior'
-            elif re.search(r'\breserves?\b', race_name, re.IGNORECASE):
-                race_type = 'Reserves'
-            else:
-                race_type = 'Other'
+        if checkpoint:
+            pages = checkpointed(pages, checkpoint)
 
-            # Parse distance from race name
-            distance_meters = parse_distance_from_name(race_name)
+        # Merge checkpointed and freshly fetched pages back into race ID order
+        position = {race_id: i for i, race_id in enumerate(fetch_ids)}
+        pages = heapq.merge(resumed_pages, pages, key=lambda page: position[page.race_id])
 
-            # Add race
-            race = ScrapedRace(
-                athletic_net_race_id=race_id,
-                meet_athletic_net_id=meet_id,
-                name=race_name,
-                gender=race_gender,
-                distance_meters=distance_meters,
-                race_type=race_type
+        # STEP 3: Parse race pages in race ID order
+        index = EntityIndex()
+        for page in pages:
+            race = parse_race_page(
+                page, meet_id, season_year,
+                schools, athletes, results,
+                progress_callback, index
             )
-            races.append(race)
+            if race:
+                races.append(race)
 
-            if progress_callback:
-                progress_callback(f"  → {race_name} ({race_gender})")
-
-            # STEP 3: Parse results from this race page using DOM parsing
-            # Results are in div[class*="result-row"] elements with structure:
-            # Place / Name / School / Time / Year info on separate lines
-            results_for_this_race = 0
-            result_rows = driver.find_elements(By.CSS_SELECTOR, 'div[class*="result-row"]')
-
-            # If gender not found in race name, we'll try to infer it from the first athlete's name
-            # or look for gender indicators in the page
-            gender_inferred = False
-
-            for row in result_rows:
-                row_text = row.text.strip()
-                if not row_text:
-                    continue
-
-                row_lines = [line.strip() for line in row_text.split('\n') if line.strip()]
-                if len(row_lines) < 4:
-                    continue  # Need at least: place, name, school, time
-
-                # Extract components
-                # Format can be:
-                # Line 0: place
-                # Line 1: initials (optional, 2-3 uppercase letters)
-                # Line 2: athlete name (or line 1 if no initials)
-                # Line 3: school name (or line 2 if no initials)
-                # Line 4: time (or line 3 if no initials)
-                # Line 5+: PR • Yr: 12 • +1pts
-
-                try:
-                    place = int(row_lines[0])
-                except ValueError:
-                    continue
-
-                # Check if line 1 is initials (2-3 uppercase letters)
-                offset = 0
-                if len(row_lines) >= 5 and re.match(r'^[A-Z]{2,3}$', row_lines[1]):
-                    offset = 1  # Skip initials line
-
-                athlete_name = row_lines[1 + offset]
-                school_name = row_lines[2 + offset]
-                time_str = row_lines[3 + offset]
-
-                # Extract grade from remaining lines
-                grade = None
-                for line in row_lines[4 + offset:]:
-                    yr_match = re.search(r'Yr:\s*(\d+)', line)
-                    if yr_match:
-                        grade = int(yr_match.group(1))
-                        break
-
-                # Parse athlete name
-                first_name, last_name = parse_athlete_name(athlete_name)
-
-                # If gender not yet determined, try to infer from athlete's gender field or first name
-                # For now, we'll check if the page has any gender indicators
-                if not race_gender and not gender_inferred:
-                    # Try to find gender from the page text - look for "Boys" or "Girls" near results
-                    page_text_lower = race_body_text.lower()
-                    if 'boys' in page_text_lower or 'men' in page_text_lower:
-                        race_gender = 'M'
-                        gender_inferred = True
-                        if progress_callback:
-                            progress_callback(f"    Inferred gender: M (from page content)")
-                    elif 'girls' in page_text_lower or 'women' in page_text_lower:
-                        race_gender = 'F'
-                        gender_inferred = True
-                        if progress_callback:
-                            progress_callback(f"    Inferred gender: F (from page content)")
-                    else:
-                        # Default to Unknown - we'll need to manually review
-                        race_gender = 'U'
-                        gender_inferred = True
-                        if progress_callback:
-                            progress_callback(f"    WARNING: Could not determine gender, using 'U' (Unknown)")
-
-                # Convert time
-                time_cs = time_to_centiseconds(time_str)
-                if not time_cs:
-                    continue
-
-                # Calculate grad year
-                if grade:
-                    try:
-                        grad_year = calculate_grad_year(grade, season_year)
-                    except ValueError:
-                        grad_year = season_year + 1
-                else:
-                    grad_year = season_year + 1
-
-                # Generate school ID
-                school_id = f"school_{school_name.replace(' ', '_').lower()}"
-
-                # Add school (if not already added)
-                if not any(s.name == school_name for s in schools):
-                    school = ScrapedSchool(
-                        athletic_net_id=school_id,
-                        name=school_name,
-                        short_name=school_name.replace(' High School', '').replace(' HS', ''),
-                        city="",
-                        state="",
-                        league=""
-                    )
-                    schools.append(school)
-
-                # Add athlete (if not already added)
-                athlete_key = (athlete_name, school_id)
-                if not any((a.name, a.school_athletic_net_id) == athlete_key for a in athletes):
-                    athlete = ScrapedAthlete(
-                        athletic_net_id=None,
-                        name=athlete_name,
-                        first_name=first_name,
-                        last_name=last_name,
-                        school_athletic_net_id=school_id,
-                        grad_year=grad_year,
-                        gender=race_gender,
-                        needs_review=False
-                    )
-                    athletes.append(athlete)
-
-                # Add result
-                result = ScrapedResult(
-                    athletic_net_race_id=race_id,
-                    athlete_name=athlete_name,
-                    athlete_first_name=first_name,
-                    athlete_last_name=last_name,
-                    athlete_school_id=school_id,
-                    time_cs=time_cs,
-                    place_overall=place,
-                    grade=grade or 12,  # Default to senior if grade not found
-                    needs_review=False
-                )
-                results.append(result)
-                results_for_this_race += 1
-
-            # Update race gender if it was inferred during result parsing
-            if gender_inferred and race:
-                race.gender = race_gender
+        if checkpoint and not checkpoint_done:
+            checkpoint.append({'type': 'done'})
 
-            if progress_callback and results_for_this_race > 0:
-                progress_callback(f"    Parsed {results_for_this_race} results")
-
-        # Add meet
-        meet = ScrapedMeet(
-            athletic_net_id=meet_id,
-            name=meet_name,
-            meet_date=meet_date or f"{season_year}-01-01",
-            venue_name=venue_name,
-            season_year=season_year,
-            meet_type=""  # Admin will select
+        # Add meet, venue and course
+        meet, venue, course = build_meet_entities(
+            meet_id, meet_name, meet_date, season_year, venue_name, venue_state, races
         )
         meets.append(meet)
-
-        # Create venue
-        venue = ScrapedVenue(
-            athletic_net_id=None,
-            name=venue_name,
-            city="",
-            state=venue_state,
-            notes=f"Auto-generated for meet {meet_id}"
-        )
         venues.append(venue)
-
-        # Create course
-        if races:
-            first_race_name = races[0].name
-            distance_display = "Unknown Distance"
-
-            # Extract distance with unit
-            distance_match = re.search(r'([\d.]+\s+(?:Miles?|Kilometers?|km|m)\b)', first_race_name, re.IGNORECASE)
-            if distance_match:
-                distance_display = distance_match.group(1)
-
-            distance_meters = races[0].distance_meters
-            course_name = f"{venue_name}, {distance_display}"
-
-            # Update all races with the course_name
-            for race in races:
-                race.course_name = course_name
-
-            course = ScrapedCourse(
-                athletic_net_id=None,
-                name=course_name,
-                venue_name=venue_name,
-                distance_meters=distance_meters,
-                distance_display=distance_display,
-                difficulty_rating=5.0,
-                needs_review=True,
-                needs_records_scraping=False
-            )
+        if course:
             courses.append(course)
 
         if progress_callback:
@@ -739,10 +1112,25 @@ def scrape_by_meet(
             'total_results': len(results),
             'total_races': len(races),
             'total_schools': len(schools),
-            'total_athletes': len(athletes)
+            'total_athletes': len(athletes),
+            'page_wait_seconds': round(WAIT_STATS.total_seconds - wait_seconds_before, 2),
+            'rate_limit_wait_seconds': round(limiter.wait_seconds - limit_seconds_before, 2),
+            'request_rate': round(limiter.rate, 2),
+            'fetch_backend': 'replay' if replay else 'http' if http_fetcher else 'selenium',
+            'race_fingerprints': race_fingerprints(
+                (asdict(r) for r in results),
+                (race.athletic_net_race_id for race in races)
+            )
         }
-
-        return ScrapeResult(
+        if http_fetcher:
+            metadata['http_race_pages'] = http_fetcher.hits
+            metadata['browser_fallback_race_pages'] = http_fetcher.misses
+        if cache:
+            metadata['cached_pages'] = cache.hits - cache_hits_before
+        if resumed_pages:
+            metadata['resumed_race_pages'] = len(resumed_pages)
+
+        result = ScrapeResult(
             venues=venues,
             courses=courses,
             schools=schools,
@@ -753,15 +1141,35 @@ def scrape_by_meet(
             metadata=metadata
         )
 
+        if previous is not None:
+            result = delta_scrape_result(result, previous, race_ids, previous_folder)
+            if progress_callback:
+                delta = result.metadata['delta']
+                progress_callback(f"Delta: {len(delta['new_races'])} new, {len(delta['changed_races'])} changed, "
+                                  f"{len(delta['unchanged_races'])} unchanged races")
+
+        return result
+
     finally:
-        driver.quit()
+        if driver is not None:
+            pool.release(driver, broken=True)
+        if own_pool:
+            pool.close()
+        if http_fetcher:
+            http_fetcher.close()
 
 
 def scrape_by_school(
     school_id: str,
     seasons: List[int],
     selected_meet_ids: Optional[List[str]] = None,
-    progress_callback: Optional[Callable[[str], None]] = None
+    progress_callback: Optional[Callable[[str], None]] = None,
+    workers: int = 1,
+    http_first: bool = False,
+    cache: Optional[PageCache] = None,
+    checkpoint_dir: Optional[str] = None,
+    resume: bool = False,
+    sink: Optional['ScrapeSink'] = None
 ) -> ScrapeResult:
     """
     Scrape all data for a school across seasons.
@@ -770,98 +1178,369 @@ def scrape_by_school(
     1. If selected_meet_ids is None: Get all meets for school
     2. Scrape only selected meets
 
+    With checkpoint_dir, the meet list and every meet are checkpointed
+    (see scrape_by_meet); resume=True reuses the meet list, replays
+    finished meets from their logs and continues the interrupted one.
+
+    Each meet is handed to `sink` as soon as it is scraped and then
+    dropped. With a CsvSink the rows go straight to disk, so memory stays
+    flat however many meets are scraped; the returned ScrapeResult then
+    only carries metadata (its entity lists are empty). By default the
+    meets are collected in memory as before.
+
     Args:
         school_id: Athletic.net school ID
         seasons: List of season years to scrape
         selected_meet_ids: Optional list of meet IDs to scrape (None = all meets)
         progress_callback: Optional callback for progress updates
+        workers: Number of drivers fetching race pages concurrently per meet
+        http_first: Fetch race results over HTTP with Selenium fallback
+        cache: Optional PageCache shared by every meet scrape
+        checkpoint_dir: Directory for checkpoint logs
+        resume: Continue from existing checkpoint logs
+        sink: Optional ScrapeSink receiving each meet (default: ScrapeCollector)
 
     Returns:
-        ScrapeResult with all entities
+        ScrapeResult with all entities (metadata only when streaming to a CsvSink)
     """
     if progress_callback:
         progress_callback(f"Starting school scrape for {school_id}...")
 
-    # Step 1: Get meet list if not provided
-    if selected_meet_ids is None:
-        meets_list = get_school_meets(school_id, seasons, progress_callback)
-        selected_meet_ids = [m['athletic_net_id'] for m in meets_list]
-
-    # Step 2: Scrape each selected meet
-    all_venues = []
-    all_courses = []
-    all_schools = []
-    all_athletes = []
-    all_meets = []
-    all_races = []
-    all_results = []
+    if sink is None:
+        sink = ScrapeCollector()
+
+    # One driver pool for the whole season: Chrome is launched once per
+    # worker instead of once per meet
+    with DriverPool(create_driver, size=workers) as pool:
+        # Step 1: Get meet list if not provided (or from the checkpoint)
+        checkpoint = school_checkpoint(checkpoint_dir, school_id, seasons) if checkpoint_dir else None
+        if checkpoint and not resume:
+            checkpoint.remove()
+
+        if selected_meet_ids is None and checkpoint and resume:
+            for record in checkpoint.records():
+                if record['type'] == 'meets':
+                    selected_meet_ids = record['meet_ids']
+            if selected_meet_ids is not None and progress_callback:
+                progress_callback(f"Resuming: meet list of {len(selected_meet_ids)} meets from checkpoint")
+
+        if selected_meet_ids is None:
+            meets_list = get_school_meets(school_id, seasons, progress_callback, pool=pool)
+            selected_meet_ids = [m['athletic_net_id'] for m in meets_list]
+            if checkpoint:
+                checkpoint.append({'type': 'meets', 'meet_ids': selected_meet_ids})
+
+        # Step 2: Scrape each selected meet (the sink adds repeated entities once)
+        for idx, meet_id in enumerate(selected_meet_ids, 1):
+            if progress_callback:
+                progress_callback(f"Scraping meet {idx}/{len(selected_meet_ids)}: {meet_id}")
 
-    for idx, meet_id in enumerate(selected_meet_ids, 1):
-        if progress_callback:
-            progress_callback(f"Scraping meet {idx}/{len(selected_meet_ids)}: {meet_id}")
+            meet_result = scrape_by_meet(
+                meet_id, progress_callback,
+                workers=workers, pool=pool, http_first=http_first,
+                cache=cache, checkpoint_dir=checkpoint_dir, resume=resume
+            )
 
-        meet_result = scrape_by_meet(meet_id, progress_callback)
+            sink.add(meet_result)
 
-        # Merge results (avoiding duplicates)
-        all_venues.extend(meet_result.venues)
-        all_courses.extend(meet_result.courses)
-        all_schools.extend(meet_result.schools)
-        all_athletes.extend(meet_result.athletes)
-        all_meets.extend(meet_result.meets)
-        all_races.extend(meet_result.races)
-        all_results.extend(meet_result.results)
+        if progress_callback:
+            progress_callback(f"Driver pool: {pool.started} launched, {pool.recycled} recycled, {pool.crashed} crashed")
 
     metadata = {
         'scrape_type': 'school',
         'entity_id': school_id,
         'seasons': seasons,
         'scraped_at': datetime.now().isoformat(),
-        'total_meets': len(all_meets),
-        'total_results': len(all_results),
-        'total_races': len(all_races),
-        'total_schools': len(all_schools),
-        'total_athletes': len(all_athletes)
+        'meet_ids': selected_meet_ids,
+        'total_meets': sink.counts['meets'],
+        'total_results': sink.counts['results'],
+        'total_races': sink.counts['races'],
+        'total_schools': sink.counts['schools'],
+        'total_athletes': sink.counts['athletes']
     }
 
+    return sink.scrape_result(metadata)
+
+
+def scrape_races(
+    race_refs: List[Tuple[str, str]],
+    progress_callback: Optional[Callable[[str], None]] = None,
+    pool: Optional[DriverPool] = None,
+    limiter: Optional[AdaptiveRateLimiter] = None
+) -> ScrapeResult:
+    """
+    Scrape individual race pages without loading their meet pages.
+
+    Meet name, date and venue are read from each race page itself, so
+    every race costs exactly one page load. Races of the same meet share
+    one meet/venue row.
+
+    Args:
+        race_refs: (meet_id, race_id) pairs, scraped in this order
+        progress_callback: Optional callback for progress updates
+        pool: Optional DriverPool to borrow drivers from (default: one driver for the batch)
+        limiter: Rate limiter for the page loads (default RATE_LIMITER)
+
+    Returns:
+        ScrapeResult with the races, their results and their meets (metadata empty)
+    """
+    own_pool = pool is None
+    if own_pool:
+        pool = DriverPool(create_driver)
+
+    venues = []
+    courses = []
+    schools = []
+    athletes = []
+    meets = []
+    races = []
+    results = []
+    seen_venues, seen_courses, seen_meets = set(), set(), set()
+    index = EntityIndex()
+
+    try:
+        for meet_id, race_id in race_refs:
+            if progress_callback:
+                progress_callback(f"Scraping race {race_id} (meet {meet_id})...")
+
+            with pool.driver() as driver:
+                page = fetch_race_page(driver, meet_id, race_id, limiter)
+                title = driver.title
+
+            meet_name, meet_date, season_year, venue_name, venue_state = parse_meet_details(
+                title, page.body_text
+            )
+            race = parse_race_page(
+                page, meet_id, season_year,
+                schools, athletes, results,
+                progress_callback, index
+            )
+            if not race:
+                continue
+            races.append(race)
+
+            meet, venue, course = build_meet_entities(
+                meet_id, meet_name, meet_date, season_year, venue_name, venue_state, [race]
+            )
+            if meet.athletic_net_id not in seen_meets:
+                seen_meets.add(meet.athletic_net_id)
+                meets.append(meet)
+            if venue.name not in seen_venues:
+                seen_venues.add(venue.name)
+                venues.append(venue)
+            if course.name not in seen_courses:
+                seen_courses.add(course.name)
+                courses.append(course)
+    finally:
+        if own_pool:
+            pool.close()
+
     return ScrapeResult(
-        venues=all_venues,
-        courses=all_courses,
-        schools=all_schools,
-        athletes=all_athletes,
-        meets=all_meets,
-        races=all_races,
-        results=all_results,
-        metadata=metadata
+        venues=venues,
+        courses=courses,
+        schools=schools,
+        athletes=athletes,
+        meets=meets,
+        races=races,
+        results=results,
+        metadata={}
     )
 
 
 def scrape_by_race(
     meet_id: str,
     race_id: str,
-    progress_callback: Optional[Callable[[str], None]] = None
+    progress_callback: Optional[Callable[[str], None]] = None,
+    pool: Optional[DriverPool] = None,
+    limiter: Optional[AdaptiveRateLimiter] = None
 ) -> ScrapeResult:
     """
-    Scrape data for a single race within a meet.
+    Scrape a single race: only /results/{race_id} is loaded.
 
-    Note: Athletic.net doesn't provide direct race URLs,
-    so this scrapes the full meet and filters to the specific race.
+    The output folder still has the race's meet, venue and course so it
+    imports on its own (existing rows are matched by the importer).
 
     Args:
         meet_id: Athletic.net meet ID
-        race_id: Race identifier (generated during scraping)
+        race_id: Athletic.net race ID
+        progress_callback: Optional callback for progress updates
+        pool: Optional DriverPool to borrow a driver from
+        limiter: Rate limiter for the page load (default RATE_LIMITER)
+
+    Returns:
+        ScrapeResult for the single race
+    """
+    result = scrape_races([(meet_id, race_id)], progress_callback, pool=pool, limiter=limiter)
+    if not result.races:
+        raise LookupError(f"Race {race_id} of meet {meet_id} has no recognisable race title")
+
+    result.metadata = {
+        'scrape_type': 'race',
+        'entity_id': race_id,
+        'meet_id': meet_id,
+        'scraped_at': datetime.now().isoformat(),
+        'season_year': result.meets[0].season_year,
+        'total_results': len(result.results),
+        'total_races': len(result.races),
+        'total_schools': len(result.schools),
+        'total_athletes': len(result.athletes),
+        'race_fingerprints': race_fingerprints(
+            (asdict(r) for r in result.results), [race_id]
+        )
+    }
+
+    if progress_callback:
+        progress_callback(f"Complete: {len(result.results)} results from race {race_id}")
+
+    return result
+
+
+def athlete_profile_url(athlete_id: str) -> str:
+    return f"https://www.athletic.net/athlete/{athlete_id}/cross-country/"
+
+
+def fetch_athlete_races(
+    driver: webdriver.Chrome,
+    athlete_id: str,
+    limiter: Optional[AdaptiveRateLimiter] = None
+) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Load an athlete profile and collect the races it links to.
+
+    Args:
+        driver: Chrome WebDriver to load the page with
+        athlete_id: Athletic.net athlete ID
+        limiter: Rate limiter to pace the load (default RATE_LIMITER)
+
+    Returns:
+        (athlete name from the page title, [(meet_id, race_id), ...] in page order)
+    """
+    with (limiter or RATE_LIMITER).request():
+        driver.get(athlete_profile_url(athlete_id))
+    wait_for_stable_elements(driver, RACE_LINKS)
+
+    title = driver.title
+    athlete_name = title.split(" - ")[0].strip() if " - " in title else title.strip()
+    race_links = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/results/"]')
+    return athlete_name, race_refs_from_hrefs(link.get_attribute('href') for link in race_links)
+
+
+def _name_key(name: str) -> str:
+    return ' '.join(name.lower().split())
+
+
+def scrape_by_athletes(
+    athlete_ids: List[str],
+    seasons: List[int],
+    progress_callback: Optional[Callable[[str], None]] = None,
+    pool: Optional[DriverPool] = None,
+    limiter: Optional[AdaptiveRateLimiter] = None
+) -> ScrapeResult:
+    """
+    Scrape the results of many athletes in one browser session.
+
+    Each profile page is loaded once to collect the races it links to.
+    The union of those races is then scraped with scrape_races, so a race
+    shared by several athletes (teammates) is fetched only once. Results
+    are kept for the requested athletes only, in races of the requested
+    seasons. A result belongs to an athlete when its row links to the
+    athlete's profile; rows captured without links (older cached pages,
+    the HTTP backend) fall back to the profile name.
+
+    Args:
+        athlete_ids: Athletic.net athlete IDs
+        seasons: Season years to keep (at least one)
         progress_callback: Optional callback for progress updates
+        pool: Optional DriverPool to borrow drivers from
+        limiter: Rate limiter for the page loads (default RATE_LIMITER)
 
     Returns:
-        ScrapeResult filtered to single race
+        ScrapeResult with the athletes' results and the races/meets they ran
+
+    Raises:
+        ValueError if no seasons are given
     """
-    # Scrape full meet
-    meet_result = scrape_by_meet(meet_id, progress_callback)
+    if not seasons:
+        raise ValueError("scrape_by_athletes needs at least one season year")
 
-    # Filter to specific race
-    # Since race_id is auto-generated, filter by race index instead
-    # This is a limitation - may need UI to show race list first
+    own_pool = pool is None
+    if own_pool:
+        pool = DriverPool(create_driver)
 
-    return meet_result  # For now, return full meet
+    try:
+        # Step 1: Profile pages → races to scrape and who to keep in each
+        race_refs = []
+        wanted: Dict[str, Dict[str, str]] = {}  # race ID → {athlete ID: profile name key}
+        for idx, athlete_id in enumerate(athlete_ids, 1):
+            with pool.driver() as driver:
+                athlete_name, refs = fetch_athlete_races(driver, athlete_id, limiter)
+            if progress_callback:
+                progress_callback(f"Athlete {idx}/{len(athlete_ids)}: {athlete_name} ({len(refs)} races)")
+
+            for meet_id, race_id in refs:
+                if race_id not in wanted:
+                    wanted[race_id] = {}
+                    race_refs.append((meet_id, race_id))
+                wanted[race_id][str(athlete_id)] = _name_key(athlete_name)
+
+        if progress_callback:
+            progress_callback(f"Scraping {len(race_refs)} unique races...")
+
+        # Step 2: Each race once
+        scraped = scrape_races(race_refs, progress_callback, pool=pool, limiter=limiter)
+    finally:
+        if own_pool:
+            pool.close()
+
+    # Step 3: Keep the requested athletes' results in the requested seasons
+    season_meets = {m.athletic_net_id for m in scraped.meets if m.season_year in seasons}
+    races = [r for r in scraped.races if r.meet_athletic_net_id in season_meets]
+    race_ids = {r.athletic_net_race_id for r in races}
+    linked_ids = {(a.name, a.school_athletic_net_id): a.athletic_net_id for a in scraped.athletes}
+
+    def is_wanted(result: ScrapedResult) -> bool:
+        wanted_here = wanted[result.athletic_net_race_id]
+        linked_id = linked_ids.get((result.athlete_name, result.athlete_school_id))
+        if linked_id:
+            return linked_id in wanted_here
+        return _name_key(result.athlete_name) in wanted_here.values()
+
+    results = [r for r in scraped.results if r.athletic_net_race_id in race_ids and is_wanted(r)]
+    race_ids = {r.athletic_net_race_id for r in results}
+    races = [r for r in races if r.athletic_net_race_id in race_ids]
+    meet_ids = {r.meet_athletic_net_id for r in races}
+    meets = [m for m in scraped.meets if m.athletic_net_id in meet_ids]
+    course_names = {r.course_name for r in races}
+    venue_names = {m.venue_name for m in meets}
+    athlete_keys = {(r.athlete_name, r.athlete_school_id) for r in results}
+    school_ids = {r.athlete_school_id for r in results}
+
+    if progress_callback:
+        progress_callback(f"Complete: {len(results)} results for {len(athlete_ids)} athletes")
+
+    metadata = {
+        'scrape_type': 'athlete',
+        'entity_id': ','.join(athlete_ids),
+        'seasons': seasons,
+        'season_year': max(seasons),
+        'scraped_at': datetime.now().isoformat(),
+        'total_meets': len(meets),
+        'total_results': len(results),
+        'total_races': len(races),
+        'total_schools': len(school_ids),
+        'total_athletes': len(athlete_keys)
+    }
+
+    return ScrapeResult(
+        venues=[v for v in scraped.venues if v.name in venue_names],
+        courses=[c for c in scraped.courses if c.name in course_names],
+        schools=[s for s in scraped.schools if s.athletic_net_id in school_ids],
+        athletes=[a for a in scraped.athletes if (a.name, a.school_athletic_net_id) in athlete_keys],
+        meets=meets,
+        races=races,
+        results=results,
+        metadata=metadata
+    )
 
 
 def scrape_by_athlete(
@@ -872,9 +1551,6 @@ def scrape_by_athlete(
     """
     Scrape all results for a specific athlete across seasons.
 
-    Note: This requires scraping athlete profile page,
-    which has a different structure. Implementation TBD.
-
     Args:
         athlete_id: Athletic.net athlete ID
         seasons: List of season years
@@ -883,118 +1559,338 @@ def scrape_by_athlete(
     Returns:
         ScrapeResult with athlete's results
     """
-    # TODO: Implement athlete profile scraping
-    # Athlete page: https://www.athletic.net/athlete/{athlete_id}/cross-country
-    raise NotImplementedError("Athlete scraping not yet implemented")
+    return scrape_by_athletes([athlete_id], seasons, progress_callback)
+
+
+# ==============================================================================
+# INCREMENTAL RE-SCRAPE
+# ==============================================================================
+
+def load_race_fingerprints(folder: str) -> Dict[str, Dict]:
+    """
+    Race fingerprints of a previous scrape folder.
+
+    Uses metadata.json's race_fingerprints when present; older folders are
+    fingerprinted from races.csv and results.csv.
+
+    Args:
+        folder: Previous output folder of write_csv_files
+
+    Returns:
+        {race_id: {'results': count, 'sha256': digest}}
+    """
+    metadata_file = os.path.join(folder, 'metadata.json')
+    if os.path.exists(metadata_file):
+        with open(metadata_file, 'r', encoding='utf-8') as f:
+            fingerprints = json.load(f).get('race_fingerprints')
+        if fingerprints is not None:
+            return fingerprints
+
+    with open(os.path.join(folder, 'races.csv'), 'r', encoding='utf-8') as f:
+        race_ids = [row['athletic_net_race_id'] for row in csv.DictReader(f)]
+    with open(os.path.join(folder, 'results.csv'), 'r', encoding='utf-8') as f:
+        return race_fingerprints(csv.DictReader(f), race_ids)
+
+
+def delta_scrape_result(
+    result: ScrapeResult,
+    previous: Dict[str, Dict],
+    meet_race_ids: List[str],
+    base_folder: str
+) -> ScrapeResult:
+    """
+    Reduce a meet ScrapeResult to the races that are new or changed since `previous`.
+
+    Schools and athletes are kept only if a kept result refers to them;
+    the meet, venue and course are always kept so the folder imports on
+    its own. metadata['delta'] lists the race IDs per outcome so importers
+    can replace the results of changed races.
+
+    Args:
+        result: Scrape of the races that were fetched
+        previous: Fingerprints of the base scrape (load_race_fingerprints)
+        meet_race_ids: Every race ID currently on the meet page
+        base_folder: Folder the fingerprints came from (recorded in metadata)
+
+    Returns:
+        Delta ScrapeResult
+    """
+    current = result.metadata['race_fingerprints']
+    scraped_ids = [race.athletic_net_race_id for race in result.races]
+
+    new_races = [race_id for race_id in scraped_ids if race_id not in previous]
+    changed_races = [
+        race_id for race_id in scraped_ids
+        if race_id in previous and previous[race_id] != current.get(race_id)
+    ]
+    keep = set(new_races) | set(changed_races)
+
+    races = [race for race in result.races if race.athletic_net_race_id in keep]
+    results = [r for r in result.results if r.athletic_net_race_id in keep]
+    athlete_keys = {(r.athlete_name, r.athlete_school_id) for r in results}
+    athletes = [a for a in result.athletes if (a.name, a.school_athletic_net_id) in athlete_keys]
+    school_ids = {r.athlete_school_id for r in results}
+    schools = [s for s in result.schools if s.athletic_net_id in school_ids]
+
+    # Fingerprints of the whole meet as now known, so a delta folder can be
+    # the base of the next incremental scrape
+    fingerprints = {race_id: fp for race_id, fp in previous.items() if race_id in meet_race_ids}
+    fingerprints.update(current)
+
+    metadata = dict(result.metadata)
+    metadata.update({
+        'race_fingerprints': fingerprints,
+        'total_results': len(results),
+        'total_races': len(races),
+        'total_schools': len(schools),
+        'total_athletes': len(athletes),
+        'delta': {
+            'base_folder': base_folder,
+            'new_races': new_races,
+            'changed_races': changed_races,
+            'unchanged_races': [race_id for race_id in scraped_ids if race_id not in keep],
+            'unchecked_races': [
+                race_id for race_id in meet_race_ids
+                if race_id not in current and race_id in previous
+            ],
+            'removed_races': sorted(set(previous) - set(meet_race_ids))
+        }
+    })
+
+    return ScrapeResult(
+        venues=result.venues,
+        courses=result.courses,
+        schools=schools,
+        athletes=athletes,
+        meets=result.meets,
+        races=races,
+        results=results,
+        metadata=metadata
+    )
 
 
 # ==============================================================================
 # CSV GENERATION FUNCTIONS
 # ==============================================================================
 
+# Output files and their columns, in write order
+CSV_FIELDS = {
+    'venues': ['athletic_net_id', 'name', 'city', 'state', 'notes'],
+    'courses': [
+        'athletic_net_id', 'name', 'venue_name', 'distance_meters',
+        'distance_display', 'difficulty_rating', 'needs_review', 'needs_records_scraping'
+    ],
+    'schools': ['athletic_net_id', 'name', 'short_name', 'city', 'state', 'league'],
+    'athletes': [
+        'athletic_net_id', 'name', 'first_name', 'last_name',
+        'school_athletic_net_id', 'grad_year', 'gender',
+        'needs_review', 'fuzzy_match_score'
+    ],
+    'meets': ['athletic_net_id', 'name', 'meet_date', 'venue_name', 'season_year', 'meet_type'],
+    'races': [
+        'athletic_net_race_id', 'meet_athletic_net_id', 'name',
+        'gender', 'distance_meters', 'race_type', 'course_name'
+    ],
+    'results': [
+        'athletic_net_race_id', 'athlete_name', 'athlete_first_name', 'athlete_last_name',
+        'athlete_school_id', 'time_cs', 'place_overall', 'grade', 'needs_review'
+    ]
+}
+
+# Dataclass of each output file's rows (ScrapedVenue, ..., ScrapedResult), for typed Parquet columns
+RECORD_TYPES = {
+    kind: get_args(hint)[0] for kind, hint in get_type_hints(ScrapeResult).items() if kind in CSV_FIELDS
+}
+
+# De-duplication key of each entity when meets are merged (results follow their race)
+ENTITY_KEYS = {
+    'venues': lambda v: v.name,
+    'courses': lambda c: c.name,
+    'schools': lambda s: s.name,
+    'athletes': lambda a: (a.name, a.school_athletic_net_id),
+    'meets': lambda m: m.athletic_net_id,
+    'races': lambda r: r.athletic_net_race_id
+}
+
+
+class ScrapeSink:
+    """
+    Receives meet ScrapeResults one at a time and passes on each entity once.
+
+    Only the de-duplication keys of what was already emitted are kept
+    (names, athlete/school pairs, meet and race IDs), never the entities
+    themselves. Subclasses decide where the new rows go.
+    """
+
+    def __init__(self):
+        self.seen: Dict[str, Set] = {kind: set() for kind in ENTITY_KEYS}
+        self.counts: Dict[str, int] = {kind: 0 for kind in CSV_FIELDS}
+
+    def add(self, meet_result: ScrapeResult):
+        """Emit the entities of `meet_result` not seen before (first occurrence wins)"""
+        for kind, key in ENTITY_KEYS.items():
+            seen = self.seen[kind]
+            new_items = []
+            for item in getattr(meet_result, kind):
+                item_key = key(item)
+                if item_key not in seen:
+                    seen.add(item_key)
+                    new_items.append(item)
+            self._emit(kind, new_items)
+
+            # Results belong to their race: only keep those of races not emitted before
+            if kind == 'races':
+                new_race_ids = {r.athletic_net_race_id for r in new_items}
+                self._emit('results', [
+                    r for r in meet_result.results if r.athletic_net_race_id in new_race_ids
+                ])
+
+    def _emit(self, kind: str, items: List):
+        self.counts[kind] += len(items)
+
+    def scrape_result(self, metadata: Dict) -> ScrapeResult:
+        """ScrapeResult of everything added (entity lists are empty unless kept in memory)"""
+        return ScrapeResult([], [], [], [], [], [], [], metadata)
+
+
+class ScrapeCollector(ScrapeSink):
+    """Keeps the merged entities in memory (the default for scrape_by_school)"""
+
+    def __init__(self):
+        super().__init__()
+        self.items: Dict[str, List] = {kind: [] for kind in CSV_FIELDS}
+
+    def _emit(self, kind: str, items: List):
+        super()._emit(kind, items)
+        self.items[kind].extend(items)
+
+    def scrape_result(self, metadata: Dict) -> ScrapeResult:
+        return ScrapeResult(metadata=metadata, **self.items)
+
+
+class CsvSink(ScrapeSink):
+    """
+    Streams merged entities straight into the 7 CSV files of an output folder.
+
+    Files are opened (with headers) up front and flushed after every meet,
+    so a long multi-season scrape holds one meet in memory at a time and a
+    crash leaves the meets written so far on disk. With parquet=True each
+    meet is also appended as a row group to the matching .parquet file
+    (readable once the sink is closed).
+
+        with CsvSink(output_folder) as sink:
+            result = scrape_by_school(school_id, seasons, sink=sink)
+            sink.write_metadata(result.metadata)
+    """
+
+    def __init__(self, output_folder: str, parquet: bool = False):
+        super().__init__()
+        self.output_folder = output_folder
+        os.makedirs(output_folder, exist_ok=True)
+
+        self._parquet_writers = {}
+        if parquet:
+            require_pyarrow()
+            for kind, fieldnames in CSV_FIELDS.items():
+                self._parquet_writers[kind] = ParquetTableWriter(
+                    os.path.join(output_folder, f"{kind}.parquet"), RECORD_TYPES[kind], fieldnames
+                )
+
+        self._files = {}
+        self._writers = {}
+        for kind, fieldnames in CSV_FIELDS.items():
+            f = open(os.path.join(output_folder, f"{kind}.csv"), 'w', newline='', encoding='utf-8')
+            self._files[kind] = f
+            self._writers[kind] = csv.DictWriter(f, fieldnames=fieldnames)
+            self._writers[kind].writeheader()
+
+    def _emit(self, kind: str, items: List):
+        super()._emit(kind, items)
+        writer = self._writers[kind]
+        for item in items:
+            writer.writerow(asdict(item))
+        if self._parquet_writers:
+            self._parquet_writers[kind].write(items)
+
+    def add(self, meet_result: ScrapeResult):
+        super().add(meet_result)
+        for f in self._files.values():
+            f.flush()
+
+    def write_metadata(self, metadata: Dict):
+        """Write metadata.json next to the CSV files"""
+        with open(os.path.join(self.output_folder, 'metadata.json'), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+
+    def close(self, complete: bool = True):
+        """
+        Close the files; only a complete scrape gets a manifest.json.
+
+        Args:
+            complete: False when the scrape failed part way; the folder is
+                then left without a manifest.json, which marks a partial scrape
+        """
+        for f in self._files.values():
+            f.close()
+        for writer in self._parquet_writers.values():
+            writer.close()
+
+        manifest_path = os.path.join(self.output_folder, MANIFEST_FILE)
+        if complete:
+            write_manifest(self.output_folder)
+        elif os.path.exists(manifest_path):
+            os.remove(manifest_path)  # left by an earlier run into the same folder
+
+    def __enter__(self) -> 'CsvSink':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(complete=exc_type is None)
+
+
 def write_csv_files(
     scrape_result: ScrapeResult,
-    output_folder: str
+    output_folder: str,
+    parquet: bool = False
 ) -> Dict[str, int]:
     """
-    Write scraping results to 7 CSV files + metadata.json
+    Write scraping results to 7 CSV files + metadata.json + manifest.json
+    (content hashes, see scrape_manifest)
 
     Args:
         scrape_result: ScrapeResult object with all data
         output_folder: Output directory path
+        parquet: Also write typed <kind>.parquet files (needs pyarrow, see scrape_columnar)
 
     Returns:
         Dict with counts of records written to each file
     """
+    if parquet:
+        require_pyarrow()
     os.makedirs(output_folder, exist_ok=True)
 
     counts = {}
 
-    # Write venues.csv
-    venues_file = os.path.join(output_folder, 'venues.csv')
-    with open(venues_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['athletic_net_id', 'name', 'city', 'state', 'notes'])
-        writer.writeheader()
-        for venue in scrape_result.venues:
-            writer.writerow(asdict(venue))
-    counts['venues'] = len(scrape_result.venues)
-
-    # Write courses.csv
-    courses_file = os.path.join(output_folder, 'courses.csv')
-    with open(courses_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            'athletic_net_id', 'name', 'venue_name', 'distance_meters',
-            'distance_display', 'difficulty_rating', 'needs_review', 'needs_records_scraping'
-        ])
-        writer.writeheader()
-        for course in scrape_result.courses:
-            writer.writerow(asdict(course))
-    counts['courses'] = len(scrape_result.courses)
-
-    # Write schools.csv
-    schools_file = os.path.join(output_folder, 'schools.csv')
-    with open(schools_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            'athletic_net_id', 'name', 'short_name', 'city', 'state', 'league'
-        ])
-        writer.writeheader()
-        for school in scrape_result.schools:
-            writer.writerow(asdict(school))
-    counts['schools'] = len(scrape_result.schools)
-
-    # Write athletes.csv
-    athletes_file = os.path.join(output_folder, 'athletes.csv')
-    with open(athletes_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            'athletic_net_id', 'name', 'first_name', 'last_name',
-            'school_athletic_net_id', 'grad_year', 'gender',
-            'needs_review', 'fuzzy_match_score'
-        ])
-        writer.writeheader()
-        for athlete in scrape_result.athletes:
-            writer.writerow(asdict(athlete))
-    counts['athletes'] = len(scrape_result.athletes)
-
-    # Write meets.csv
-    meets_file = os.path.join(output_folder, 'meets.csv')
-    with open(meets_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            'athletic_net_id', 'name', 'meet_date', 'venue_name', 'season_year', 'meet_type'
-        ])
-        writer.writeheader()
-        for meet in scrape_result.meets:
-            writer.writerow(asdict(meet))
-    counts['meets'] = len(scrape_result.meets)
-
-    # Write races.csv
-    races_file = os.path.join(output_folder, 'races.csv')
-    with open(races_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            'athletic_net_race_id', 'meet_athletic_net_id', 'name',
-            'gender', 'distance_meters', 'race_type', 'course_name'
-        ])
-        writer.writeheader()
-        for race in scrape_result.races:
-            writer.writerow(asdict(race))
-    counts['races'] = len(scrape_result.races)
-
-    # Write results.csv
-    results_file = os.path.join(output_folder, 'results.csv')
-    with open(results_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            'athletic_net_race_id', 'athlete_name', 'athlete_first_name', 'athlete_last_name',
-            'athlete_school_id', 'time_cs', 'place_overall', 'grade', 'needs_review'
-        ])
-        writer.writeheader()
-        for result in scrape_result.results:
-            writer.writerow(asdict(result))
-    counts['results'] = len(scrape_result.results)
+    # Write venues.csv, courses.csv, ... results.csv
+    for kind, fieldnames in CSV_FIELDS.items():
+        items = getattr(scrape_result, kind)
+        with open(os.path.join(output_folder, f"{kind}.csv"), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            for item in items:
+                writer.writerow(asdict(item))
+        if parquet:
+            write_parquet_table(os.path.join(output_folder, f"{kind}.parquet"), RECORD_TYPES[kind], fieldnames, items)
+        counts[kind] = len(items)
 
     # Write metadata.json
     metadata_file = os.path.join(output_folder, 'metadata.json')
     with open(metadata_file, 'w', encoding='utf-8') as f:
         json.dump(scrape_result.metadata, f, indent=2)
 
+    # Write manifest.json (lets importers skip folders/races that already landed)
+    write_manifest(output_folder)
+
     return counts
 
 
@@ -1004,15 +1900,76 @@ def write_csv_files(
 
 if __name__ == "__main__":
     import sys
+    from scrape_checkpoint import CHECKPOINT_DIR
 
     def print_progress(msg: str):
         print(f"[PROGRESS] {msg}")
 
+    def print_wait_summary():
+        waits = WAIT_STATS.snapshot()
+        print(f"⏱️  Page waits: {waits['total_seconds']}s over {waits['waits']} pages "
+              f"(avg {waits['average_seconds']}s, {waits['empty']} empty, {waits['timeouts']} hit the ceiling)")
+        if cache:
+            print(f"📦 Page cache: {cache.hits} pages reused, {cache.writes} stored ({cache.root})")
+        limits = RATE_LIMITER.snapshot()
+        print(f"🚦 Rate limit: {limits['rate']} req/s now, {limits['wait_seconds']}s waited over "
+              f"{limits['requests']} requests ({limits['slowdowns']} slow, {limits['failures']} failed)")
+
+    # Optional flags: --workers N (parallel race page fetching),
+    # --http (experimental: fetch race results over HTTP, Selenium fallback),
+    # --cache (read/write the on-disk page cache), --replay (parse from the cache only),
+    # --since <folder> (delta against an earlier scrape), --new-races-only,
+    # --resume (continue an interrupted scrape from its checkpoints),
+    # --parquet (also write typed .parquet copies of the CSV files)
+    workers = 1
+    if '--workers' in sys.argv:
+        flag_index = sys.argv.index('--workers')
+        workers = int(sys.argv[flag_index + 1])
+        del sys.argv[flag_index:flag_index + 2]
+
+    http_first = '--http' in sys.argv
+    if http_first:
+        sys.argv.remove('--http')
+
+    replay = '--replay' in sys.argv
+    if replay:
+        sys.argv.remove('--replay')
+
+    previous_folder = None
+    if '--since' in sys.argv:
+        flag_index = sys.argv.index('--since')
+        previous_folder = sys.argv[flag_index + 1]
+        del sys.argv[flag_index:flag_index + 2]
+
+    new_races_only = '--new-races-only' in sys.argv
+    if new_races_only:
+        sys.argv.remove('--new-races-only')
+
+    resume = '--resume' in sys.argv
+    if resume:
+        sys.argv.remove('--resume')
+
+    parquet = '--parquet' in sys.argv
+    if parquet:
+        sys.argv.remove('--parquet')
+
+    cache = None
+    if '--cache' in sys.argv or replay:
+        if '--cache' in sys.argv:
+            sys.argv.remove('--cache')
+        cache = PageCache()
+
     if len(sys.argv) < 3:
         print("Usage:")
-        print("  python athletic_net_scraper_v2.py meet <meet_id>")
-        print("  python athletic_net_scraper_v2.py school <school_id> <season_year>")
+        print("  python athletic_net_scraper_v2.py meet <meet_id> [--workers N] [--http] [--cache | --replay]")
+        print("  python athletic_net_scraper_v2.py meet <meet_id> --since <previous_folder> [--new-races-only]")
+        print("  python athletic_net_scraper_v2.py school <school_id> <season_year> [--workers N] [--http] [--cache]")
+        print("  (meet/school scrapes are checkpointed; add --resume to continue one that died)")
+        print("  (add --parquet to any scrape for typed .parquet files next to the CSVs)")
+        print("  (--http is experimental: the JSON endpoint is unverified, misses fall back to Selenium)")
         print("  python athletic_net_scraper_v2.py school-meets <school_id> <season_year>")
+        print("  python athletic_net_scraper_v2.py race <meet_id> <race_id>")
+        print("  python athletic_net_scraper_v2.py athlete <athlete_id>[,<athlete_id>...] <season_year>")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -1022,16 +1979,24 @@ if __name__ == "__main__":
         print(f"\n🏃 Scraping Meet {meet_id}")
         print("=" * 60)
 
-        result = scrape_by_meet(meet_id, print_progress)
+        result = scrape_by_meet(
+            meet_id, print_progress, workers=workers, http_first=http_first,
+            cache=cache, replay=replay,
+            previous_folder=previous_folder, new_races_only=new_races_only,
+            checkpoint_dir=CHECKPOINT_DIR, resume=resume
+        )
 
         # Write CSV files
-        output_folder = f"to-be-processed/meet_{meet_id}_{int(time.time())}"
-        counts = write_csv_files(result, output_folder)
+        suffix = "_delta" if previous_folder else ""
+        output_folder = f"to-be-processed/meet_{meet_id}{suffix}_{int(time.time())}"
+        counts = write_csv_files(result, output_folder, parquet=parquet)
+        meet_checkpoint(CHECKPOINT_DIR, meet_id).remove()
 
         print("\n" + "=" * 60)
         print("✅ Scraping complete!")
         print(f"📊 Results: {counts['results']} results from {counts['races']} races")
         print(f"📊 Athletes: {counts['athletes']}, Schools: {counts['schools']}")
+        print_wait_summary()
         print(f"💾 Saved to: {output_folder}")
 
     elif command == "school-meets":
@@ -1055,17 +2020,64 @@ if __name__ == "__main__":
         print(f"\n🏃 Scraping School {school_id} ({season_year})")
         print("=" * 60)
 
-        result = scrape_by_school(school_id, [season_year], None, print_progress)
-
-        # Write CSV files
+        # Stream each meet into the CSV files as it is scraped
         output_folder = f"to-be-processed/school_{school_id}_{int(time.time())}"
-        counts = write_csv_files(result, output_folder)
+        with CsvSink(output_folder, parquet=parquet) as sink:
+            result = scrape_by_school(
+                school_id, [season_year], None, print_progress,
+                workers=workers, http_first=http_first, cache=cache,
+                checkpoint_dir=CHECKPOINT_DIR, resume=resume, sink=sink
+            )
+            sink.write_metadata(result.metadata)
+        counts = sink.counts
+        for meet_id in result.metadata['meet_ids']:
+            meet_checkpoint(CHECKPOINT_DIR, meet_id).remove()
+        school_checkpoint(CHECKPOINT_DIR, school_id, [season_year]).remove()
 
         print("\n" + "=" * 60)
         print("✅ Scraping complete!")
         print(f"📊 Meets: {counts['meets']}")
         print(f"📊 Results: {counts['results']} results from {counts['races']} races")
         print(f"📊 Athletes: {counts['athletes']}, Schools: {counts['schools']}")
+        print_wait_summary()
+        print(f"💾 Saved to: {output_folder}")
+
+    elif command == "race":
+        meet_id = sys.argv[2]
+        race_id = sys.argv[3]
+        print(f"\n🏃 Scraping Race {race_id} (meet {meet_id})")
+        print("=" * 60)
+
+        result = scrape_by_race(meet_id, race_id, print_progress)
+
+        # Write CSV files
+        output_folder = f"to-be-processed/race_{race_id}_{int(time.time())}"
+        counts = write_csv_files(result, output_folder, parquet=parquet)
+
+        print("\n" + "=" * 60)
+        print("✅ Scraping complete!")
+        print(f"📊 Results: {counts['results']} results")
+        print(f"📊 Athletes: {counts['athletes']}, Schools: {counts['schools']}")
+        print_wait_summary()
+        print(f"💾 Saved to: {output_folder}")
+
+    elif command == "athlete":
+        athlete_ids = sys.argv[2].split(',')
+        season_year = int(sys.argv[3])
+        print(f"\n🏃 Scraping {len(athlete_ids)} Athlete(s) ({season_year})")
+        print("=" * 60)
+
+        result = scrape_by_athletes(athlete_ids, [season_year], print_progress)
+
+        # Write CSV files
+        output_folder = f"to-be-processed/athlete_{athlete_ids[0]}_{int(time.time())}"
+        counts = write_csv_files(result, output_folder, parquet=parquet)
+
+        print("\n" + "=" * 60)
+        print("✅ Scraping complete!")
+        print(f"📊 Meets: {counts['meets']}")
+        print(f"📊 Results: {counts['results']} results from {counts['races']} races")
+        print_wait_summary()
         print(f"💾 Saved to: {output_folder}")
 
     else:
@@ -4,7 +4,6 @@ Athletic.net Scraper V3 - Fixed Gender Detection and All Races Capture
 Scrapes individual race pages to get accurate gender and complete race list
 """
 
-import re
 import time
 import csv
 import json
@@ -22,16 +21,168 @@ from nameparser import HumanName
 # Import all data structures and helper functions from v2
 from athletic_net_scraper_v2 import (
     ScrapedVenue, ScrapedCourse, ScrapedSchool, ScrapedAthlete,
-    ScrapedMeet, ScrapedRace, ScrapedResult, ScrapeResult,
-    create_driver, parse_distance_from_name, time_to_centiseconds,
-    parse_athlete_name, calculate_grad_year, parse_meet_date,
-    write_csv_files
+    ScrapedMeet, ScrapedRace, ScrapedResult, ScrapeResult, RacePage, EntityIndex,
+    create_driver, parse_athlete_name, calculate_grad_year, parse_meet_date,
+    fetch_race_pages, write_csv_files
 )
+from athletic_net_parser import (
+    time_to_centiseconds, find_strict_race_title,
+    tokenize_result_row, find_meet_date_text, find_venue,
+    race_ids_from_hrefs
+)
+from race_classifier import classify_race_name
+from driver_pool import DriverPool
+from scraper_waits import WAIT_STATS, wait_for_stable_elements, RACE_LINKS
+from rate_limiter import AdaptiveRateLimiter, RATE_LIMITER
+
+
+def parse_race_page_v3(
+    page: RacePage,
+    meet_id: str,
+    season_year: int,
+    schools: List[ScrapedSchool],
+    athletes: List[ScrapedAthlete],
+    results: List[ScrapedResult],
+    progress_callback: Optional[Callable[[str], None]] = None,
+    index: Optional[EntityIndex] = None
+) -> Optional[ScrapedRace]:
+    """
+    Parse one fetched race page using the strict V3 race title rules.
+
+    Unlike v2's parse_race_page, races without an explicit "Mens"/"Womens"
+    title are skipped rather than having their gender inferred.
+
+    Returns:
+        ScrapedRace, or None if the race name/gender could not be found
+    """
+    if index is None:
+        index = EntityIndex(schools, athletes)
+
+    race_id = page.race_id
+    race_lines = [line.strip() for line in page.body_text.splitlines() if line.strip()]
+
+    # Extract race name (includes "Mens" or "Womens")
+    # Typically appears as "Mens 2.74 Miles Varsity" or "Womens 2.74 Miles Junior Varsity"
+    # Look for gender + distance + race type pattern in the first 40 lines
+    # Include common race types: Varsity, JV, Junior Varsity, Frosh, Freshman, Reserves
+    race_name = find_strict_race_title(race_lines)
+    race_class = classify_race_name(race_name, grade_levels=False) if race_name else None
+    race_gender = race_class.gender if race_class else None
+
+    if not race_name or not race_gender:
+        if progress_callback:
+            progress_callback(f"WARNING: Could not extract race name/gender from race {race_id}, skipping")
+        return None
+
+    # Race type and distance from the same (memoized) classification
+    race_type = race_class.race_type
+    distance_meters = race_class.distance_meters if race_class.distance_meters is not None else 5000
+
+    # Add race
+    race = ScrapedRace(
+        athletic_net_race_id=race_id,
+        meet_athletic_net_id=meet_id,
+        name=race_name,
+        gender=race_gender,
+        distance_meters=distance_meters,
+        race_type=race_type
+    )
+
+    if progress_callback:
+        progress_callback(f"  → {race_name} ({race_gender})")
+
+    # Parse results from the captured result rows
+    # Results are in div[class*="result-row"] elements with structure:
+    # Place / Name / School / Time / Year info on separate lines
+    results_for_this_race = 0
+    for row_text in page.row_texts:
+        # Place / [initials] / name / school / time / "PR • Yr: 12 • +1pts"
+        row = tokenize_result_row(row_text)
+        if row is None:
+            continue  # Need at least: place, name, school, time
+
+        place = row.place
+        athlete_name = row.athlete_name
+        school_name = row.school_name
+        time_str = row.time_str
+        grade = row.grade
+
+        # Parse athlete name
+        first_name, last_name = parse_athlete_name(athlete_name)
+
+        # Convert time
+        time_cs = time_to_centiseconds(time_str)
+        if not time_cs:
+            continue
+
+        # Calculate grad year
+        if grade:
+            try:
+                grad_year = calculate_grad_year(grade, season_year)
+            except ValueError:
+                grad_year = season_year + 1
+        else:
+            grad_year = season_year + 1
+
+        # Generate school ID
+        school_id = f"school_{school_name.replace(' ', '_').lower()}"
+
+        # Add school (if not already added)
+        if school_name not in index.school_names:
+            index.school_names.add(school_name)
+            school = ScrapedSchool(
+                athletic_net_id=school_id,
+                name=school_name,
+                short_name=school_name.replace(' High School', '').replace(' HS', ''),
+                city="",
+                state="",
+                league=""
+            )
+            schools.append(school)
+
+        # Add athlete (if not already added)
+        athlete_key = (athlete_name, school_id)
+        if athlete_key not in index.athlete_keys:
+            index.athlete_keys.add(athlete_key)
+            athlete = ScrapedAthlete(
+                athletic_net_id=None,
+                name=athlete_name,
+                first_name=first_name,
+                last_name=last_name,
+                school_athletic_net_id=school_id,
+                grad_year=grad_year,
+                gender=race_gender,
+                needs_review=False
+            )
+            athletes.append(athlete)
+
+        # Add result
+        result = ScrapedResult(
+            athletic_net_race_id=race_id,
+            athlete_name=athlete_name,
+            athlete_first_name=first_name,
+            athlete_last_name=last_name,
+            athlete_school_id=school_id,
+            time_cs=time_cs,
+            place_overall=place,
+            grade=grade or 12,  # Default to senior if grade not found
+            needs_review=False
+        )
+        results.append(result)
+        results_for_this_race += 1
+
+    if progress_callback and results_for_this_race > 0:
+        progress_callback(f"    Parsed {results_for_this_race} results")
+
+    return race
 
 
 def scrape_by_meet_v3(
     meet_id: str,
-    progress_callback: Optional[Callable[[str], None]] = None
+    progress_callback: Optional[Callable[[str], None]] = None,
+    workers: int = 1,
+    limiter: Optional[AdaptiveRateLimiter] = None,
+    pool: Optional[DriverPool] = None
 ) -> ScrapeResult:
     """
     Scrape all data for a single meet - V3 with individual race page scraping.
@@ -43,6 +194,10 @@ def scrape_by_meet_v3(
     Args:
         meet_id: Athletic.net meet ID
         progress_callback: Optional callback for progress updates
+        workers: Number of drivers fetching race pages concurrently (1 = serial)
+        limiter: Rate limiter for every page load (default RATE_LIMITER)
+        pool: Optional DriverPool to borrow drivers from; by default a pool of
+            `workers` drivers is created for this meet and closed afterwards
 
     Returns:
         ScrapeResult with all entities
@@ -50,7 +205,11 @@ def scrape_by_meet_v3(
     if progress_callback:
         progress_callback(f"Starting scrape for meet {meet_id}...")
 
-    driver = create_driver()
+    own_pool = pool is None
+    if own_pool:
+        pool = DriverPool(create_driver, size=workers)
+    driver = pool.acquire()
+    wait_seconds_before = WAIT_STATS.total_seconds
 
     # Storage for all entities
     venues = []
@@ -67,11 +226,12 @@ def scrape_by_meet_v3(
         if progress_callback:
             progress_callback(f"Loading meet page...")
 
-        driver.get(meet_url)
+        with (limiter or RATE_LIMITER).request():
+            driver.get(meet_url)
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
-        time.sleep(3)
+        wait_for_stable_elements(driver, RACE_LINKS)
 
         # Extract meet metadata from main page
         meet_name = driver.title.split(" - ")[0] if " - " in driver.title else driver.title
@@ -79,32 +239,17 @@ def scrape_by_meet_v3(
 
         # Extract meet date
         meet_date = None
-        date_match = re.search(r'\w{3},?\s+\w{3}\s+\d{1,2},\s+\d{4}', body_text)
-        if date_match:
-            meet_date = parse_meet_date(date_match.group(0))
+        date_text = find_meet_date_text(body_text)
+        if date_text:
+            meet_date = parse_meet_date(date_text)
 
         # Extract season year from date or use current year
         season_year = int(meet_date.split('-')[0]) if meet_date else datetime.now().year
 
         # Extract venue information from body text
-        venue_name = "Unknown Venue"
-        venue_state = ""
-
-        lines = [line.strip() for line in body_text.splitlines() if line.strip()]
-
-        # Try to find venue in page text
         # Look for patterns like "Montgomery Hill Park, CA US"
-        for line in lines[:30]:
-            if re.search(r'[A-Z][a-z]+ [A-Z][a-z]+.*(Park|Course|Field|Center)', line, re.IGNORECASE):
-                # Extract state if present
-                state_match = re.search(r'\b([A-Z]{2})\b', line)
-                if state_match:
-                    venue_state = state_match.group(1)
-                    # Remove state and "US" from venue name
-                    venue_name = re.sub(r',?\s*[A-Z]{2}\s*US.*$', '', line).strip()
-                else:
-                    venue_name = line.strip()
-                break
+        lines = [line.strip() for line in body_text.splitlines() if line.strip()]
+        venue_name, venue_state = find_venue(lines)
 
         if progress_callback:
             progress_callback(f"Meet: {meet_name} at {venue_name}, {venue_state}")
@@ -114,190 +259,33 @@ def scrape_by_meet_v3(
             progress_callback(f"Finding all races...")
 
         race_links = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/results/"]')
-        race_ids_found = set()
-        for link in race_links:
-            href = link.get_attribute('href')
-            match = re.search(r'/results/(\d+)', href)
-            if match:
-                race_ids_found.add(match.group(1))
-
-        race_ids = sorted(race_ids_found)
+        race_ids = race_ids_from_hrefs(link.get_attribute('href') for link in race_links)
         if progress_callback:
             progress_callback(f"Found {len(race_ids)} races")
 
-        # STEP 2: Scrape each race individually
-        for race_id in race_ids:
-            race_url = f"https://www.athletic.net/CrossCountry/meet/{meet_id}/results/{race_id}"
-            if progress_callback:
-                progress_callback(f"Scraping race {race_id}...")
-
-            driver.get(race_url)
-            time.sleep(4)  # Increased wait for page to fully load
-
-            race_body_text = driver.find_element(By.TAG_NAME, "body").text
-            race_lines = [line.strip() for line in race_body_text.splitlines() if line.strip()]
-
-            # Extract race name (includes "Mens" or "Womens")
-            # Typically appears as "Mens 2.74 Miles Varsity" or "Womens 2.74 Miles Junior Varsity"
-            race_name = None
-            race_gender = None
-
-            for line in race_lines[:40]:  # Check first 40 lines
-                # Look for gender + distance + race type pattern
-                # Include common race types: Varsity, JV, Junior Varsity, Frosh, Freshman, Reserves
-                if re.search(r'\b(Mens?|Womens?)\s+[\d.]+\s+(?:Miles?|km|Kilometers?|m)\s+(Varsity|JV|Junior Varsity|Frosh|Freshman|Reserves?)\b', line, re.IGNORECASE):
-                    race_name = line
-                    # Extract gender
-                    if re.search(r'\bmens?\b', line, re.IGNORECASE):
-                        race_gender = 'M'
-                    elif re.search(r'\bwomens?\b', line, re.IGNORECASE):
-                        race_gender = 'F'
-                    break
-
-            if not race_name or not race_gender:
-                if progress_callback:
-                    progress_callback(f"WARNING: Could not extract race name/gender from race {race_id}, skipping")
-                continue
-
-            # Determine race type
-            if re.search(r'\bvarsity\b', race_name, re.IGNORECASE) and not re.search(r'\bjunior\b', race_name, re.IGNORECASE):
-                race_type = 'Varsity'
-            elif re.search(r'\b(jv|junior varsity)\b', race_name, re.IGNORECASE):
-                race_type = 'JV'
-            elif re.search(r'\b(frosh|freshman)\b', race_name, re.IGNORECASE):
-                race_type = 'Frosh'
-            elif re.search(r'\breserves?\b', race_name, re.IGNORECASE):
-                race_type = 'Reserves'
-            else:
-                race_type = 'Other'
-
-            # Parse distance from race name
-            distance_meters = parse_distance_from_name(race_name)
-
-            # Add race
-            race = ScrapedRace(
-                athletic_net_race_id=race_id,
-                meet_athletic_net_id=meet_id,
-                name=race_name,
-                gender=race_gender,
-                distance_meters=distance_meters,
-                race_type=race_type
+        # Meet page is done; hand its driver back for the race fetches
+        pool.release(driver)
+        driver = None
+
+        # STEP 2: Fetch each race page (optionally across several pooled drivers)
+        if progress_callback and workers > 1:
+            progress_callback(f"Fetching races with {workers} workers...")
+        pages = fetch_race_pages(
+            meet_id, race_ids, pool, workers,
+            limiter=limiter,
+            progress_callback=progress_callback
+        )
+
+        # STEP 3: Parse race pages in race ID order
+        index = EntityIndex()
+        for page in pages:
+            race = parse_race_page_v3(
+                page, meet_id, season_year,
+                schools, athletes, results,
+                progress_callback, index
             )
-            races.append(race)
-
-            if progress_callback:
-                progress_callback(f"  → {race_name} ({race_gender})")
-
-            # STEP 3: Parse results from this race page using DOM parsing
-            # Results are in div[class*="result-row"] elements with structure:
-            # Place / Name / School / Time / Year info on separate lines
-            results_for_this_race = 0
-            result_rows = driver.find_elements(By.CSS_SELECTOR, 'div[class*="result-row"]')
-
-            for row in result_rows:
-                row_text = row.text.strip()
-                if not row_text:
-                    continue
-
-                row_lines = [line.strip() for line in row_text.split('\n') if line.strip()]
-                if len(row_lines) < 4:
-                    continue  # Need at least: place, name, school, time
-
-                # Extract components
-                # Format can be:
-                # Line 0: place
-                # Line 1: initials (optional, 2-3 uppercase letters)
-                # Line 2: athlete name (or line 1 if no initials)
-                # Line 3: school name (or line 2 if no initials)
-                # Line 4: time (or line 3 if no initials)
-                # Line 5+: PR • Yr: 12 • +1pts
-
-                try:
-                    place = int(row_lines[0])
-                except ValueError:
-                    continue
-
-                # Check if line 1 is initials (2-3 uppercase letters)
-                offset = 0
-                if len(row_lines) >= 5 and re.match(r'^[A-Z]{2,3}$', row_lines[1]):
-                    offset = 1  # Skip initials line
-
-                athlete_name = row_lines[1 + offset]
-                school_name = row_lines[2 + offset]
-                time_str = row_lines[3 + offset]
-
-                # Extract grade from remaining lines
-                grade = None
-                for line in row_lines[4 + offset:]:
-                    yr_match = re.search(r'Yr:\s*(\d+)', line)
-                    if yr_match:
-                        grade = int(yr_match.group(1))
-                        break
-
-                # Parse athlete name
-                first_name, last_name = parse_athlete_name(athlete_name)
-
-                # Convert time
-                time_cs = time_to_centiseconds(time_str)
-                if not time_cs:
-                    continue
-
-                # Calculate grad year
-                if grade:
-                    try:
-                        grad_year = calculate_grad_year(grade, season_year)
-                    except ValueError:
-                        grad_year = season_year + 1
-                else:
-                    grad_year = season_year + 1
-
-                # Generate school ID
-                school_id = f"school_{school_name.replace(' ', '_').lower()}"
-
-                # Add school (if not already added)
-                if not any(s.name == school_name for s in schools):
-                    school = ScrapedSchool(
-                        athletic_net_id=school_id,
-                        name=school_name,
-                        short_name=school_name.replace(' High School', '').replace(' HS', ''),
-                        city="",
-                        state="",
-                        league=""
-                    )
-                    schools.append(school)
-
-                # Add athlete (if not already added)
-                athlete_key = (athlete_name, school_id)
-                if not any((a.name, a.school_athletic_net_id) == athlete_key for a in athletes):
-                    athlete = ScrapedAthlete(
-                        athletic_net_id=None,
-                        name=athlete_name,
-                        first_name=first_name,
-                        last_name=last_name,
-                        school_athletic_net_id=school_id,
-                        grad_year=grad_year,
-                        gender=race_gender,
-                        needs_review=False
-                    )
-                    athletes.append(athlete)
-
-                # Add result
-                result = ScrapedResult(
-                    athletic_net_race_id=race_id,
-                    athlete_name=athlete_name,
-                    athlete_first_name=first_name,
-                    athlete_last_name=last_name,
-                    athlete_school_id=school_id,
-                    time_cs=time_cs,
-                    place_overall=place,
-                    grade=grade or 12,  # Default to senior if grade not found
-                    needs_review=False
-                )
-                results.append(result)
-                results_for_this_race += 1
-
-            if progress_callback and results_for_this_race > 0:
-                progress_callback(f"    Parsed {results_for_this_race} results")
+            if race:
+                races.append(race)
 
         # Add meet
         meet = ScrapedMeet(
@@ -323,12 +311,8 @@ def scrape_by_meet_v3(
         # Create course
         if races:
             first_race_name = races[0].name
-            distance_display = "Unknown Distance"
-
             # Extract distance with unit
-            distance_match = re.search(r'([\d.]+\s+(?:Miles?|Kilometers?|km|m)\b)', first_race_name, re.IGNORECASE)
-            if distance_match:
-                distance_display = distance_match.group(1)
+            distance_display = classify_race_name(first_race_name).distance_display or "Unknown Distance"
 
             distance_meters = races[0].distance_meters
             course_name = f"{venue_name}, {distance_display}"
@@ -356,7 +340,8 @@ def scrape_by_meet_v3(
             'total_results': len(results),
             'total_races': len(races),
             'total_schools': len(schools),
-            'total_athletes': len(athletes)
+            'total_athletes': len(athletes),
+            'page_wait_seconds': round(WAIT_STATS.total_seconds - wait_seconds_before, 2)
         }
 
         return ScrapeResult(
@@ -371,14 +356,24 @@ def scrape_by_meet_v3(
         )
 
     finally:
-        driver.quit()
+        if driver is not None:
+            pool.release(driver, broken=True)
+        if own_pool:
+            pool.close()
 
 
 if __name__ == "__main__":
     import sys
 
+    # Optional flags: --workers N (parallel race page fetching)
+    workers = 1
+    if '--workers' in sys.argv:
+        flag_index = sys.argv.index('--workers')
+        workers = int(sys.argv[flag_index + 1])
+        del sys.argv[flag_index:flag_index + 2]
+
     if len(sys.argv) < 3 or sys.argv[1] != 'meet':
-        print("Usage: python3 athletic_net_scraper_v3.py meet <meet_id>")
+        print("Usage: python3 athletic_net_scraper_v3.py meet <meet_id> [--workers N]")
         sys.exit(1)
 
     meet_id = sys.argv[2]
@@ -387,7 +382,7 @@ if __name__ == "__main__":
         print(f"  {msg}")
 
     print(f"🏃 Scraping meet {meet_id} with V3 scraper...")
-    result = scrape_by_meet_v3(meet_id, progress_callback=progress)
+    result = scrape_by_meet_v3(meet_id, progress_callback=progress, workers=workers)
 
     # Save to CSV
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Restartable season backfill: scrape a list of meets across a process pool.
+
+Replaces looping over meet IDs in a shell script. Meet IDs are read from
+meet_ids_to_import.json ({"meet_ids": [...]}) or meet_lists_2025.json
+({section: [{"name", "id"}, ...]}) and queued in a SQLite job table:
+
+    pending → running → done
+                      ↘ pending again after a backoff (failed attempt)
+                      ↘ failed (max attempts reached)
+
+Each job is one scrape_by_meet run in a worker process, written to
+to-be-processed/meet_<id>_<ts> like the single-meet CLI. Interrupted runs
+pick up where they stopped: jobs left "running" are requeued, and each
+meet resumes from its race checkpoint.
+
+Usage:
+    python batch_scrape.py run meet_ids_to_import.json [--processes N] [--max-attempts N] [--http] [--cache]
+    python batch_scrape.py run --retry-failed          # requeue failed jobs and run the queue
+    python batch_scrape.py status
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Job database; override with SCRAPER_JOB_DB
+JOB_DB = os.getenv(
+    'SCRAPER_JOB_DB',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'batch_jobs.sqlite')
+)
+
+# Retry backoff: RETRY_BASE_SECONDS, doubled per failed attempt, capped at RETRY_MAX_SECONDS
+RETRY_BASE_SECONDS = float(os.getenv('SCRAPER_RETRY_BASE_SECONDS', '60'))
+RETRY_MAX_SECONDS = 30 * 60
+
+DEFAULT_MAX_ATTEMPTS = 4
+
+JOB_STATUSES = ('pending', 'running', 'done', 'failed')
+
+
+# ==============================================================================
+# MEET LISTS
+# ==============================================================================
+
+def load_meet_ids(path: str) -> List[str]:
+    """
+    Meet IDs from a meet list file, de-duplicated in file order.
+
+    Accepts meet_ids_to_import.json ({"meet_ids": [...]}),
+    meet_lists_<year>.json ({section: [{"name", "id"}, ...]}) or a plain
+    JSON list of IDs.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        List of meet ID strings
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if isinstance(data, dict) and 'meet_ids' in data:
+        entries = data['meet_ids']
+    elif isinstance(data, dict):
+        entries = [meet for section in data.values() for meet in section]
+    else:
+        entries = data
+
+    meet_ids = []
+    seen = set()
+    for entry in entries:
+        meet_id = str(entry['id'] if isinstance(entry, dict) else entry)
+        if meet_id not in seen:
+            seen.add(meet_id)
+            meet_ids.append(meet_id)
+    return meet_ids
+
+
+# ==============================================================================
+# JOB STATE (SQLite)
+# ==============================================================================
+
+class JobStore:
+    """Scrape jobs keyed by meet ID, persisted in a SQLite file"""
+
+    def __init__(self, path: str = JOB_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                meet_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                last_error TEXT,
+                output_folder TEXT,
+                results INTEGER,
+                started_at REAL,
+                finished_at REAL
+            )
+        """)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def enqueue(self, meet_ids: List[str]) -> int:
+        """Add meets not queued before; returns how many were new"""
+        with self.conn:
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (meet_id) VALUES (?)",
+                [(meet_id,) for meet_id in meet_ids]
+            )
+        return cursor.rowcount
+
+    def requeue_interrupted(self) -> int:
+        """Jobs still 'running' belong to a run that died; make them pending again"""
+        with self.conn:
+            cursor = self.conn.execute("UPDATE jobs SET status = 'pending' WHERE status = 'running'")
+        return cursor.rowcount
+
+    def requeue_broken(self, meet_ids: List[str], max_attempts: int) -> int:
+        """
+        Jobs lost with a dead worker pool go back to pending right away,
+        unless they have used up max_attempts (a meet that keeps killing
+        its worker must not loop forever).
+
+        Returns:
+            Number of jobs requeued
+        """
+        requeued = 0
+        with self.conn:
+            for meet_id in meet_ids:
+                row = self.conn.execute(
+                    "SELECT attempts FROM jobs WHERE meet_id = ? AND status = 'running'", (meet_id,)
+                ).fetchone()
+                if row is None:
+                    continue
+                status = 'failed' if row['attempts'] >= max_attempts else 'pending'
+                self.conn.execute(
+                    "UPDATE jobs SET status = ?, last_error = 'worker process died', "
+                    "next_attempt_at = 0, finished_at = ? WHERE meet_id = ?",
+                    (status, time.time(), meet_id)
+                )
+                requeued += status == 'pending'
+        return requeued
+
+    def requeue_failed(self) -> int:
+        """Give failed jobs a fresh set of attempts"""
+        with self.conn:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET status = 'pending', attempts = 0, next_attempt_at = 0 WHERE status = 'failed'"
+            )
+        return cursor.rowcount
+
+    def ready(self, limit: int, now: float) -> List[str]:
+        """Pending jobs whose backoff has expired, oldest first"""
+        rows = self.conn.execute(
+            "SELECT meet_id FROM jobs WHERE status = 'pending' AND next_attempt_at <= ? "
+            "ORDER BY next_attempt_at, rowid LIMIT ?",
+            (now, limit)
+        ).fetchall()
+        return [row['meet_id'] for row in rows]
+
+    def next_retry_at(self) -> Optional[float]:
+        """Earliest time a backed-off pending job becomes ready"""
+        row = self.conn.execute(
+            "SELECT MIN(next_attempt_at) AS at FROM jobs WHERE status = 'pending'"
+        ).fetchone()
+        return row['at']
+
+    def mark_running(self, meet_id: str):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = ? WHERE meet_id = ?",
+                (time.time(), meet_id)
+            )
+
+    def mark_done(self, meet_id: str, output_folder: str, results: int):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET status = 'done', output_folder = ?, results = ?, last_error = NULL, "
+                "finished_at = ? WHERE meet_id = ?",
+                (output_folder, results, time.time(), meet_id)
+            )
+
+    def mark_failed(self, meet_id: str, error: str, max_attempts: int) -> Tuple[str, float]:
+        """
+        Record a failed attempt: back off and retry, or give up after max_attempts.
+
+        Returns:
+            (new status, seconds until the retry; 0 when given up)
+        """
+        attempts = self.conn.execute(
+            "SELECT attempts FROM jobs WHERE meet_id = ?", (meet_id,)
+        ).fetchone()['attempts']
+
+        if attempts >= max_attempts:
+            status, delay = 'failed', 0.0
+        else:
+            status, delay = 'pending', min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+
+        with self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, last_error = ?, next_attempt_at = ?, finished_at = ? "
+                "WHERE meet_id = ?",
+                (status, error, time.time() + delay, time.time(), meet_id)
+            )
+        return status, delay
+
+    def counts(self) -> Dict[str, int]:
+        counts = {status: 0 for status in JOB_STATUSES}
+        for row in self.conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"):
+            counts[row['status']] = row['n']
+        return counts
+
+    def failed_jobs(self) -> List[sqlite3.Row]:
+        return self.conn.execute(
+            "SELECT meet_id, attempts, last_error FROM jobs WHERE status = 'failed' ORDER BY rowid"
+        ).fetchall()
+
+
+# ==============================================================================
+# WORKER
+# ==============================================================================
+
+def init_worker(processes: int):
+    """Give this worker process its 1/processes share of the request rate"""
+    from rate_limiter import RATE_LIMITER
+    RATE_LIMITER.scale(1.0 / processes)
+
+
+def scrape_meet_job(meet_id: str, http_first: bool = False, use_cache: bool = False) -> Tuple[str, int]:
+    """
+    Scrape one meet and write its CSV folder (runs in a worker process).
+
+    Resumes from the meet's checkpoint, so a retried job only fetches the
+    races the failed attempt did not finish.
+
+    Args:
+        meet_id: Athletic.net meet ID
+        http_first: Fetch race results over HTTP with Selenium fallback (experimental)
+        use_cache: Read/write the on-disk page cache
+
+    Returns:
+        (output_folder, number of results)
+    """
+    from athletic_net_scraper_v2 import scrape_by_meet, write_csv_files, meet_checkpoint
+    from page_cache import PageCache
+    from scrape_checkpoint import CHECKPOINT_DIR
+
+    result = scrape_by_meet(
+        meet_id, http_first=http_first,
+        cache=PageCache() if use_cache else None,
+        checkpoint_dir=CHECKPOINT_DIR, resume=True
+    )
+    output_folder = f"to-be-processed/meet_{meet_id}_{int(time.time())}"
+    counts = write_csv_files(result, output_folder)
+    meet_checkpoint(CHECKPOINT_DIR, meet_id).remove()
+    return output_folder, counts['results']
+
+
+# ==============================================================================
+# RUNNER
+# ==============================================================================
+
+def run_jobs(
+    store: JobStore,
+    processes: int = 2,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    http_first: bool = False,
+    use_cache: bool = False,
+    job: Callable[[str, bool, bool], Tuple[str, int]] = scrape_meet_job
+) -> Dict[str, float]:
+    """
+    Run every pending job across a process pool until the queue is drained.
+
+    Args:
+        store: JobStore with queued jobs
+        processes: Worker processes (each drives its own Chrome)
+        max_attempts: Attempts per meet before it is marked failed
+        http_first: Passed to scrape_by_meet
+        use_cache: Use the on-disk page cache in the workers
+        job: Worker function (meet_id, http_first, use_cache) → (output_folder, results)
+
+    Returns:
+        Dict with done, failed, retried counts and meets_per_hour for this run
+    """
+    requeued = store.requeue_interrupted()
+    if requeued:
+        print(f"🔁 Requeued {requeued} jobs interrupted by a previous run")
+
+    start = time.time()
+    done = failed = retried = 0
+    running = {}
+
+    def meets_per_hour() -> float:
+        hours = (time.time() - start) / 3600
+        return done / hours if hours > 0 else 0.0
+
+    while True:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=processes, initializer=init_worker, initargs=(processes,)
+            ) as executor:
+                while True:
+                    # Keep every worker busy with ready jobs
+                    for meet_id in store.ready(processes - len(running), time.time()):
+                        future = executor.submit(job, meet_id, http_first, use_cache)
+                        store.mark_running(meet_id)
+                        running[future] = meet_id
+                        print(f"🏃 Started meet {meet_id}")
+
+                    if not running:
+                        retry_at = store.next_retry_at()
+                        if retry_at is None:
+                            break
+                        # Only backed-off jobs are left: sleep until the first is due
+                        time.sleep(max(0.0, retry_at - time.time()))
+                        continue
+
+                    # With a free worker, also wake up when the next backed-off job is due
+                    timeout = None
+                    retry_at = store.next_retry_at()
+                    if len(running) < processes and retry_at is not None:
+                        timeout = max(0.0, retry_at - time.time())
+                    finished, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        if isinstance(future.exception(), BrokenProcessPool):
+                            raise future.exception()
+                        meet_id = running.pop(future)
+                        try:
+                            output_folder, results = future.result()
+                        except Exception as e:
+                            error = ''.join(traceback.format_exception_only(type(e), e)).strip()
+                            status, delay = store.mark_failed(meet_id, error, max_attempts)
+                            if status == 'failed':
+                                failed += 1
+                                print(f"❌ Meet {meet_id} failed for good: {error}")
+                            else:
+                                retried += 1
+                                print(f"⚠️  Meet {meet_id} failed ({error}); retrying in {delay:.0f}s")
+                            continue
+
+                        store.mark_done(meet_id, output_folder, results)
+                        done += 1
+                        counts = store.counts()
+                        print(f"✅ Meet {meet_id}: {results} results → {output_folder} "
+                              f"[{counts['done']} done, {counts['pending'] + counts['running']} left, "
+                              f"{meets_per_hour():.1f} meets/hour]")
+            break
+        except BrokenProcessPool:
+            # A worker died (crashed Chrome, OOM kill): every job in flight is lost
+            lost = list(running.values())
+            running.clear()
+            requeued = store.requeue_broken(lost, max_attempts)
+            retried += requeued
+            failed += len(lost) - requeued
+            print(f"💥 Worker process died; requeued {requeued} of {len(lost)} running meets "
+                  f"and restarting the pool")
+
+    return {
+        'done': done,
+        'failed': failed,
+        'retried': retried,
+        'meets_per_hour': round(meets_per_hour(), 1),
+        'elapsed_seconds': round(time.time() - start, 1)
+    }
+
+
+def print_status(store: JobStore):
+    counts = store.counts()
+    print(f"📋 Jobs: {counts['done']} done, {counts['pending']} pending, "
+          f"{counts['running']} running, {counts['failed']} failed ({store.path})")
+    for job in store.failed_jobs():
+        print(f"  ❌ {job['meet_id']} after {job['attempts']} attempts: {job['last_error']}")
+
+
+# ==============================================================================
+# CLI INTERFACE
+# ==============================================================================
+
+if __name__ == "__main__":
+    processes = 2
+    if '--processes' in sys.argv:
+        flag_index = sys.argv.index('--processes')
+        processes = int(sys.argv[flag_index + 1])
+        del sys.argv[flag_index:flag_index + 2]
+
+    max_attempts = DEFAULT_MAX_ATTEMPTS
+    if '--max-attempts' in sys.argv:
+        flag_index = sys.argv.index('--max-attempts')
+        max_attempts = int(sys.argv[flag_index + 1])
+        del sys.argv[flag_index:flag_index + 2]
+
+    http_first = '--http' in sys.argv
+    if http_first:
+        sys.argv.remove('--http')
+
+    use_cache = '--cache' in sys.argv
+    if use_cache:
+        sys.argv.remove('--cache')
+
+    retry_failed = '--retry-failed' in sys.argv
+    if retry_failed:
+        sys.argv.remove('--retry-failed')
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ('run', 'status'):
+        print("Usage:")
+        print("  python batch_scrape.py run [meet_list.json] [--processes N] [--max-attempts N] [--http] [--cache] [--retry-failed]")
+        print("  python batch_scrape.py status")
+        sys.exit(1)
+
+    store = JobStore()
+
+    if sys.argv[1] == 'status':
+        print_status(store)
+        sys.exit(0)
+
+    if len(sys.argv) > 2:
+        meet_ids = load_meet_ids(sys.argv[2])
+        added = store.enqueue(meet_ids)
+        print(f"📥 {len(meet_ids)} meets in {sys.argv[2]}, {added} newly queued")
+
+    if retry_failed:
+        print(f"🔁 Requeued {store.requeue_failed()} failed jobs")
+
+    print(f"\n🚀 Batch scrape with {processes} processes")
+    print("=" * 60)
+
+    summary = run_jobs(store, processes, max_attempts, http_first=http_first, use_cache=use_cache)
+
+    print("\n" + "=" * 60)
+    print(f"✅ Batch complete: {summary['done']} meets scraped, {summary['failed']} failed, "
+          f"{summary['retried']} retries in {summary['elapsed_seconds']}s")
+    print(f"📊 Throughput: {summary['meets_per_hour']} meets/hour")
+    print_status(store)
+    store.close()
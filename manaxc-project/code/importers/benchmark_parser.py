@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for athletic_net_parser on a large race (rows/sec).
+
+Compares the precompiled single-pass row tokenizer against the previous
+inline per-row re.search() code, reports what the HumanName name split costs
+on its own, and times the full parse_race_page with a cold and a warm
+athlete name cache.
+
+By default the largest race page in the page cache is used, then a race
+recorded with `athletic_net_http.py record`, then the synthetic race under
+tests/fixtures/http (rows rebuilt from a scraped CSV, labelled as such in
+the output). Real rows are far shorter than --synthetic ones, so the
+generated race overstates tokenizer gains.
+
+Usage:
+    python benchmark_parser.py                               # largest cached (or recorded) race
+    python benchmark_parser.py --cached <meet_id> <race_id>  # one race from the page cache
+    python benchmark_parser.py --synthetic --rows 20000      # synthetic race
+    python benchmark_parser.py --repeat 11
+"""
+
+import gc
+import glob
+import json
+import os
+import re
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from athletic_net_parser import tokenize_result_row
+from athletic_net_scraper_v2 import RacePage, parse_athlete_name, parse_race_page, race_page_url
+from page_cache import PageCache
+
+HTTP_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'fixtures', 'http')
+
+# Race pages recorded from the live site (see athletic_net_http.py record)
+RECORDED_PAGES = os.path.join(HTTP_FIXTURES, 'race_*.selenium.json')
+
+# Race pages rebuilt from scraped CSV rows, not captured from the site
+SYNTHETIC_PAGES = os.path.join(HTTP_FIXTURES, 'synthetic_race_*.page.json')
+
+
+SCHOOLS = ['Westmont', 'Leland', 'Los Gatos', 'Saratoga', 'Lynbrook', 'Monta Vista', 'Palo Alto', 'Bellarmine']
+FIRST_NAMES = ['John', 'Amy', 'Carlos', 'Priya', 'Ethan', 'Maya', 'Noah', 'Sofia', 'Liam', 'Ava']
+LAST_NAMES = ['Smith', 'Lee', 'Garcia', 'Patel', 'Nguyen', 'Kim', 'Chen', 'Lopez', 'Brown', 'Davis']
+
+
+def synthetic_race_page(rows: int = 5000) -> RacePage:
+    """A race page shaped like Athletic.net's (initials line on most rows)"""
+    row_texts = []
+    for place in range(1, rows + 1):
+        first = FIRST_NAMES[place % len(FIRST_NAMES)]
+        last = LAST_NAMES[(place // len(FIRST_NAMES)) % len(LAST_NAMES)]
+        seconds = 900 + place // 5
+        lines = [str(place)]
+        if place % 4:
+            lines.append(f"{first[0]}{last[0]}")
+        lines += [
+            f"{first} {last} {place}",
+            SCHOOLS[place % len(SCHOOLS)],
+            f"{seconds // 60}:{seconds % 60:02d}.{place % 10}",
+            f"PR • Yr: {9 + place % 4} • +1pts"
+        ]
+        row_texts.append('\n'.join(lines))
+
+    return RacePage(
+        race_id='benchmark',
+        body_text="Results\nMens 5,000 Meters Varsity\nTeam Scores",
+        row_texts=row_texts
+    )
+
+
+def legacy_tokenize_result_row(row_text: str) -> Optional[tuple]:
+    """The per-row parsing code scrape_by_meet used before athletic_net_parser (baseline)"""
+    row_text = row_text.strip()
+    if not row_text:
+        return None
+
+    row_lines = [line.strip() for line in row_text.split('\n') if line.strip()]
+    if len(row_lines) < 4:
+        return None
+
+    try:
+        place = int(row_lines[0])
+    except ValueError:
+        return None
+
+    offset = 0
+    if len(row_lines) >= 5 and re.match(r'^[A-Z]{2,3}$', row_lines[1]):
+        offset = 1
+
+    grade = None
+    for line in row_lines[4 + offset:]:
+        yr_match = re.search(r'Yr:\s*(\d+)', line)
+        if yr_match:
+            grade = int(yr_match.group(1))
+            break
+
+    return place, row_lines[1 + offset], row_lines[2 + offset], row_lines[3 + offset], grade
+
+
+def largest_cached_race_page(cache: PageCache) -> Optional[RacePage]:
+    """The cached race results page with the most rows, or None"""
+    best = None
+    for url in cache.urls():
+        if '/results/' not in url:
+            continue
+        content = cache.get(url, fresh_only=False)
+        if content and (best is None or len(content['row_texts']) > len(best['row_texts'])):
+            best = content
+    return RacePage(**best) if best else None
+
+
+def largest_fixture_race_page(pattern: str) -> Optional[RacePage]:
+    """The race page fixture matching `pattern` with the most rows, or None"""
+    best = None
+    for path in glob.glob(pattern):
+        with open(path, encoding='utf-8') as f:
+            recorded = json.load(f)
+        if best is None or len(recorded['row_texts']) > len(best['row_texts']):
+            best = recorded
+    if best is None:
+        return None
+    return RacePage(race_id=best['race_id'], body_text=best['body_text'], row_texts=best['row_texts'])
+
+
+def rows_per_second(candidates: Dict[str, Callable[[List[str]], None]], row_texts: List[str], repeat: int) -> Dict[str, float]:
+    """
+    Best-of-`repeat` throughput of each candidate(row_texts).
+
+    Candidates are run interleaved (A, B, C, A, B, C, ...) with the garbage
+    collector off, so machine noise hits all of them alike.
+    """
+    best = {name: float('inf') for name in candidates}
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for name, func in candidates.items():
+                start = time.perf_counter()
+                func(row_texts)
+                best[name] = min(best[name], time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {name: len(row_texts) / seconds for name, seconds in best.items()}
+
+
+if __name__ == "__main__":
+    rows = 5000
+    repeat = 7
+    if '--rows' in sys.argv:
+        rows = int(sys.argv[sys.argv.index('--rows') + 1])
+    if '--repeat' in sys.argv:
+        repeat = int(sys.argv[sys.argv.index('--repeat') + 1])
+
+    if '--cached' in sys.argv:
+        flag_index = sys.argv.index('--cached')
+        meet_id, race_id = sys.argv[flag_index + 1], sys.argv[flag_index + 2]
+        cached = PageCache().get(race_page_url(meet_id, race_id), fresh_only=False)
+        if cached is None:
+            print(f"❌ Race {race_id} of meet {meet_id} is not in the page cache")
+            sys.exit(1)
+        page = RacePage(**cached)
+        source = f"cached race {race_id} (meet {meet_id})"
+    elif '--synthetic' in sys.argv:
+        page = synthetic_race_page(rows)
+        source = "synthetic race"
+    else:
+        page = largest_cached_race_page(PageCache())
+        source = f"cached race {page.race_id}" if page else ""
+        if page is None:
+            page = largest_fixture_race_page(RECORDED_PAGES)
+            source = f"recorded race {page.race_id}" if page else ""
+        if page is None:
+            page = largest_fixture_race_page(SYNTHETIC_PAGES)
+            source = f"SYNTHETIC race {page.race_id} (rows rebuilt from a scraped CSV)" if page else ""
+        if page is None:
+            print("❌ No cached or recorded race page; scrape with --cache or pass --synthetic")
+            sys.exit(1)
+
+    row_texts = page.row_texts
+    names = [row.athlete_name for row in map(tokenize_result_row, row_texts) if row is not None]
+    split_name = parse_athlete_name.__wrapped__  # HumanName without the memo
+
+    def parse_full(texts: List[str]):
+        parse_race_page(RacePage(page.race_id, page.body_text, texts), 'benchmark', 2025, [], [], [])
+
+    def parse_cold(texts: List[str]):
+        parse_athlete_name.cache_clear()
+        parse_full(texts)
+
+    print(f"\n⏱️  Parser benchmark: {len(row_texts)} rows from {source}, best of {repeat}")
+    print("=" * 60)
+
+    rates = rows_per_second({
+        'legacy': lambda texts: [legacy_tokenize_result_row(t) for t in texts],
+        'tokenizer': lambda texts: [tokenize_result_row(t) for t in texts],
+        'names': lambda texts: [split_name(name) for name in names],
+        'cold': parse_cold,
+        'warm': parse_full
+    }, row_texts, repeat)
+    legacy, tokenizer, names_rate = rates['legacy'], rates['tokenizer'], rates['names']
+    cold, warm = rates['cold'], rates['warm']
+
+    print(f"  Inline re.search (before):  {legacy:>12,.0f} rows/sec")
+    print(f"  tokenize_result_row:        {tokenizer:>12,.0f} rows/sec ({tokenizer / legacy:.1f}x)")
+    print(f"  HumanName split only:       {names_rate:>12,.0f} rows/sec "
+          f"({cold / names_rate:.0%} of a cold full parse)")
+    print(f"  parse_race_page (cold names): {cold:>10,.0f} rows/sec")
+    print(f"  parse_race_page (warm names): {warm:>10,.0f} rows/sec ({warm / cold:.1f}x)")
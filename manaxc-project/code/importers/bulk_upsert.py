@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Set-based lookups and writes against Supabase/PostgREST.
+
+The importers used to check every row with its own select ... eq(...)
+before inserting it. These helpers do the same work in a handful of calls:
+
+    existing = select_in(supabase, 'schools', 'id, athletic_net_id', 'athletic_net_id', ids)
+    by_id = index_rows(existing, 'athletic_net_id')          # matching happens in memory
+    written, failed = write_rows(supabase, 'schools', missing_rows, on_conflict='athletic_net_id')
+
+select_in splits the keys into in_() chunks (URLs stay short) and pages
+through each chunk with range(). write_rows sends chunked upserts with
+ignore_duplicates, so rows that landed in the meantime are skipped instead
+of failing the chunk. If the table has no unique constraint matching
+on_conflict, it falls back to plain inserts, and a chunk that still fails
+is retried row by row so one bad row does not sink its neighbours. A
+plain insert that timed out after it was sent is not resent (it may have
+landed); its rows are returned as failed for the caller to look up.
+"""
+
+import os
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import httpx
+except ImportError:  # installed with supabase; only may_have_landed needs it
+    httpx = None
+
+
+# Keys per in_() filter (each key ends up in the request URL)
+IN_CHUNK_SIZE = int(os.getenv('IMPORT_IN_CHUNK_SIZE', '200'))
+
+# Rows per page when reading (PostgREST's default max-rows is 1000)
+SELECT_PAGE_SIZE = int(os.getenv('IMPORT_SELECT_PAGE_SIZE', '1000'))
+
+# Rows per upsert/insert request
+WRITE_CHUNK_SIZE = int(os.getenv('IMPORT_WRITE_CHUNK_SIZE', '500'))
+
+
+def chunked(items: Sequence, size: int) -> Iterable[Sequence]:
+    """Consecutive slices of `items` with up to `size` entries"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def no_matching_constraint(error: Exception) -> bool:
+    """True if `error` says the ON CONFLICT columns are not a unique/exclusion constraint (42P10)"""
+    message = str(error)
+    return '42P10' in message or 'no unique or exclusion constraint' in message
+
+
+def may_have_landed(error: Exception) -> bool:
+    """True if a request failed after it was sent (read/write timeout, dropped connection)"""
+    if httpx is None or not isinstance(error, httpx.TransportError):
+        return False
+    return not isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+# ==============================================================================
+# READ
+# ==============================================================================
+
+def select_in(
+    client,
+    table: str,
+    columns: str,
+    key_column: str,
+    keys: Iterable,
+    chunk_size: int = IN_CHUNK_SIZE,
+    page_size: int = SELECT_PAGE_SIZE
+) -> List[Dict]:
+    """
+    Fetch all rows whose `key_column` is one of `keys`.
+
+    Args:
+        client: Supabase client
+        table: Table name
+        columns: Columns to select (include key_column and anything matched on)
+        key_column: Column filtered with in_()
+        keys: Candidate values (duplicates and empty values are dropped)
+        chunk_size: Keys per request
+        page_size: Rows per page within a chunk
+
+    Returns:
+        Matching rows (every page of every chunk)
+    """
+    distinct_keys = list(dict.fromkeys(key for key in keys if key not in (None, '')))
+    rows = []
+    for chunk in chunked(distinct_keys, chunk_size):
+        offset = 0
+        while True:
+            page = client.table(table).select(columns).in_(key_column, list(chunk)) \
+                .range(offset, offset + page_size - 1).execute()
+            rows.extend(page.data or [])
+            if not page.data or len(page.data) < page_size:
+                break
+            offset += page_size
+    return rows
+
+
+def _as_key(value):
+    return str(value) if value is not None else None
+
+
+def row_key(row: Dict, key_columns: Sequence[str]) -> Hashable:
+    """
+    Key of a row: the value of one column, or a tuple for several.
+
+    Values are compared as strings (CSV values are strings, while an
+    athletic_net_id column may come back as a number).
+    """
+    if len(key_columns) == 1:
+        return _as_key(row.get(key_columns[0]))
+    return tuple(_as_key(row.get(column)) for column in key_columns)
+
+
+def index_rows(rows: Iterable[Dict], *key_columns: str) -> Dict[Hashable, Dict]:
+    """
+    Index rows by one column, or by a tuple of columns (see row_key).
+
+    The first row wins when several share a key, like existing.data[0] did.
+    """
+    index = {}
+    for row in rows:
+        index.setdefault(row_key(row, key_columns), row)
+    return index
+
+
+# ==============================================================================
+# WRITE
+# ==============================================================================
+
+def write_rows(
+    client,
+    table: str,
+    rows: List[Dict],
+    on_conflict: Optional[str] = None,
+    chunk_size: int = WRITE_CHUNK_SIZE
+) -> Tuple[List[Dict], List[Tuple[Dict, Exception]]]:
+    """
+    Write rows in chunks, skipping rows that collide with `on_conflict`.
+
+    Args:
+        client: Supabase client
+        table: Table name
+        rows: Rows to write
+        on_conflict: Comma-separated unique columns (None = plain inserts)
+        chunk_size: Rows per request
+
+    Returns:
+        (rows written as returned by the database, [(row, error), ...] for
+        rows that could not be written, or whose plain insert may have
+        landed without a response - see may_have_landed). Rows skipped as
+        conflicts are in neither list.
+    """
+    written = []
+    failed = []
+
+    for chunk in chunked(rows, chunk_size):
+        chunk = list(chunk)
+        try:
+            if on_conflict:
+                response = client.table(table).upsert(
+                    chunk, on_conflict=on_conflict, ignore_duplicates=True
+                ).execute()
+            else:
+                response = client.table(table).insert(chunk).execute()
+            written.extend(response.data or [])
+            continue
+        except Exception as e:
+            error = e
+            if on_conflict and no_matching_constraint(e):
+                print(f"  ⚠️  {table} has no unique constraint on ({on_conflict}), using plain inserts")
+                on_conflict = None
+                try:
+                    response = client.table(table).insert(chunk).execute()
+                    written.extend(response.data or [])
+                    continue
+                except Exception as e:
+                    error = e
+
+        # Resending a plain insert that may have landed would duplicate it
+        if not on_conflict and may_have_landed(error):
+            print(f"  ⚠️  Chunk of {len(chunk)} {table} may have been written ({type(error).__name__}), not resending")
+            failed.extend((row, error) for row in chunk)
+            continue
+
+        # Chunk failed - write row by row to isolate the bad rows
+        print(f"  ⚠️  Chunk of {len(chunk)} {table} failed, writing individually...")
+        for row in chunk:
+            try:
+                if on_conflict:
+                    response = client.table(table).upsert(
+                        row, on_conflict=on_conflict, ignore_duplicates=True
+                    ).execute()
+                else:
+                    response = client.table(table).insert(row).execute()
+                written.extend(response.data or [])
+            except Exception as e:
+                failed.append((row, e))
+
+    return written, failed
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Column-at-a-time time and distance parsing for bulk CSV/Excel imports.
+
+The importers used to call a scalar parser on every row. These helpers
+take a whole column instead:
+
+    times = times_to_centiseconds(df['time'])                 # "16:45.3" strings
+    times = excel_fractions_to_centiseconds(durations)        # Excel fraction-of-day values
+    miles = race_name_distances_miles([row['race_name'] for row in rows])
+
+    times.values    # parsed column, same length and order as the input
+    times.invalid   # positions of the rows that could not be parsed
+
+Race names and time strings repeat heavily (a meet has a handful of race
+names over thousands of rows), so text columns are parsed once per
+distinct value and the answers broadcast back. Excel fractions are
+converted arithmetically on the whole array when NumPy is installed.
+
+NumPy and pandas are optional. A pandas Series in gives a Series out, a
+NumPy array gives a float array (NaN for unparseable rows), anything
+else gives a list (None for unparseable rows).
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+from athletic_net_parser import METERS_PER_MILE, time_to_centiseconds
+from race_classifier import classify_race_name
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # optional dependency
+    pd = None
+
+
+SECONDS_PER_DAY = 86400
+
+
+@dataclass
+class ParsedColumn:
+    """A parsed column plus the positions of the rows that could not be parsed"""
+    values: Any
+    invalid: List[int] = field(default_factory=list)
+
+    @property
+    def valid_count(self) -> int:
+        return len(self.values) - len(self.invalid)
+
+
+def _is_missing(value) -> bool:
+    # None, NaN and blank cells
+    return value is None or value != value or (isinstance(value, str) and not value.strip())
+
+
+def _map_distinct(column, parse: Callable[[Any], Optional[float]]) -> ParsedColumn:
+    """Apply `parse` once per distinct value of `column` and broadcast the results"""
+    if pd is not None and isinstance(column, pd.Series):
+        distinct = column.dropna().unique()
+        parsed = {value: parse(value) for value in distinct if not _is_missing(value)}
+        values = column.map(parsed)
+        invalid = [int(i) for i in np.flatnonzero(values.isna().to_numpy())]
+        return ParsedColumn(values, invalid)
+
+    if np is not None and isinstance(column, np.ndarray):
+        distinct, inverse = np.unique(column.astype(str), return_inverse=True)
+        parsed = np.array([
+            float('nan') if (result := parse(value)) is None else result
+            for value in distinct
+        ], dtype=float)
+        values = parsed[inverse]
+        return ParsedColumn(values, [int(i) for i in np.flatnonzero(np.isnan(values))])
+
+    parsed = {}
+    values = []
+    invalid = []
+    for idx, value in enumerate(column):
+        if _is_missing(value):
+            result = None
+        else:
+            try:
+                result = parsed[value]
+            except KeyError:
+                result = parsed[value] = parse(value)
+        if result is None:
+            invalid.append(idx)
+        values.append(result)
+    return ParsedColumn(values, invalid)
+
+
+def times_to_centiseconds(column) -> ParsedColumn:
+    """
+    Parse a column of "MM:SS.CC" / "MM:SS" time strings.
+
+    Args:
+        column: List, NumPy array or pandas Series of time strings
+
+    Returns:
+        ParsedColumn of centiseconds (see time_to_centiseconds)
+    """
+    return _map_distinct(column, lambda value: time_to_centiseconds(str(value)))
+
+
+def race_name_distances_meters(column) -> ParsedColumn:
+    """
+    Parse the distances out of a column of race names.
+
+    Unlike parse_distance_from_name, a name without a distance is flagged
+    as invalid instead of silently becoming 5000.
+
+    Args:
+        column: List, NumPy array or pandas Series of race names
+
+    Returns:
+        ParsedColumn of meters
+    """
+    return _map_distinct(column, lambda value: classify_race_name(str(value)).distance_meters)
+
+
+def race_name_distances_miles(column) -> ParsedColumn:
+    """
+    Parse the distances out of a column of race names, in miles.
+
+    Miles are derived from classify_race_name's meters (rounded to 0.001 mi),
+    so both columns agree on every name.
+
+    Args:
+        column: List, NumPy array or pandas Series of race names
+
+    Returns:
+        ParsedColumn of miles
+    """
+    def miles(value) -> Optional[float]:
+        meters = classify_race_name(str(value)).distance_meters
+        return None if meters is None else round(meters / METERS_PER_MILE, 3)
+
+    return _map_distinct(column, miles)
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def _fraction_to_centiseconds(value) -> Optional[int]:
+    fraction = _to_float(value)
+    if not fraction > 0:  # also rejects NaN
+        return None
+    return int(round(fraction * SECONDS_PER_DAY * 100)) or None
+
+
+def excel_fractions_to_centiseconds(column) -> ParsedColumn:
+    """
+    Convert a column of Excel durations (fraction of a day) to centiseconds.
+
+    Blank, non-numeric and non-positive cells are flagged as invalid.
+
+    Args:
+        column: List, NumPy array or pandas Series of Excel duration values
+
+    Returns:
+        ParsedColumn of centiseconds
+    """
+    if pd is not None and isinstance(column, pd.Series):
+        fractions = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+        centiseconds = np.round(fractions * SECONDS_PER_DAY * 100)
+        bad = ~(centiseconds > 0)
+        values = pd.Series(centiseconds, index=column.index).where(~bad).astype('Int64')
+        return ParsedColumn(values, [int(i) for i in np.flatnonzero(bad)])
+
+    if np is not None and isinstance(column, np.ndarray):
+        if column.dtype.kind in 'biuf':
+            fractions = column.astype(float)
+        else:
+            fractions = np.array([_to_float(value) for value in column], dtype=float)
+        values = np.round(fractions * SECONDS_PER_DAY * 100)
+        bad = ~(values > 0)
+        values[bad] = np.nan
+        return ParsedColumn(values, [int(i) for i in np.flatnonzero(bad)])
+
+    values = [_fraction_to_centiseconds(value) for value in column]
+    return ParsedColumn(values, [idx for idx, value in enumerate(values) if value is None])
+
+
+def describe_invalid(parsed: ParsedColumn, labels: Optional[List[Any]] = None, limit: int = 10) -> str:
+    """
+    Short description of the invalid rows for a warning line,
+    e.g. "3 rows (2, 17, 40)".
+
+    Args:
+        parsed: Result of one of the column parsers
+        labels: Row labels to show instead of positions (e.g. spreadsheet row numbers)
+        limit: Labels listed before eliding the rest
+    """
+    shown = [str(labels[i] if labels is not None else i) for i in parsed.invalid[:limit]]
+    more = ', ...' if len(parsed.invalid) > limit else ''
+    return f"{len(parsed.invalid)} rows ({', '.join(shown)}{more})"
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Reusable Chrome WebDriver pool for the Athletic.net scrapers.
+
+Launching Chrome costs several seconds, so instead of create_driver() /
+driver.quit() per meet, scrapers borrow drivers from a long-lived pool:
+
+    with DriverPool(create_driver, size=4) as pool:
+        with pool.driver() as driver:
+            driver.get(url)
+
+Drivers are health-checked when borrowed, recycled after `max_pages`
+borrows, and discarded if they raise a WebDriverException while borrowed.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List
+from selenium.common.exceptions import WebDriverException
+
+
+class DriverPool:
+    """Bounded pool of lazily started WebDrivers (thread-safe)"""
+
+    def __init__(
+        self,
+        factory: Callable[[], object],
+        size: int = 1,
+        max_pages: int = 100
+    ):
+        """
+        Args:
+            factory: Zero-argument function that starts a new driver (e.g. create_driver)
+            size: Maximum number of drivers alive at once
+            max_pages: Borrows before a driver is quit and replaced
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_pages = max_pages
+
+        self._condition = threading.Condition()
+        self._idle: List[object] = []
+        self._uses: Dict[int, int] = {}
+        self._alive = 0
+        self._closed = False
+
+        # Lifetime counters
+        self.started = 0
+        self.recycled = 0
+        self.crashed = 0
+
+    def __enter__(self) -> 'DriverPool':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def acquire(self):
+        """
+        Borrow a healthy driver, starting one if the pool is below `size`.
+        Blocks while all drivers are in use.
+        """
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("DriverPool is closed")
+                if self._idle:
+                    driver = self._idle.pop()
+                    break
+                if self._alive < self.size:
+                    self._alive += 1
+                    driver = None
+                    break
+                self._condition.wait()
+
+        if driver is not None:
+            if self._is_healthy(driver):
+                return driver
+            with self._condition:
+                self.crashed += 1
+            self._discard(driver, keep_slot=True)
+
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._condition:
+                self._alive -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self.started += 1
+            self._uses[id(driver)] = 0
+        return driver
+
+    def release(self, driver, broken: bool = False):
+        """
+        Return a borrowed driver. Broken or worn-out drivers are quit and
+        their slot freed for a fresh one.
+        """
+        with self._condition:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+            if broken:
+                self.crashed += 1
+            elif uses >= self.max_pages:
+                self.recycled += 1
+            elif not self._closed:
+                self._idle.append(driver)
+                self._condition.notify()
+                return
+
+        self._discard(driver)
+
+    @contextmanager
+    def driver(self):
+        """Borrow a driver for the duration of a with-block"""
+        driver = self.acquire()
+        try:
+            yield driver
+        except WebDriverException:
+            self.release(driver, broken=True)
+            raise
+        except BaseException:
+            self.release(driver)
+            raise
+        else:
+            self.release(driver)
+
+    def close(self):
+        """Quit all idle drivers; drivers still borrowed are quit on release"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._alive -= len(idle)
+            self._condition.notify_all()
+
+        for driver in idle:
+            self._quit(driver)
+
+    def _discard(self, driver, keep_slot: bool = False):
+        with self._condition:
+            self._uses.pop(id(driver), None)
+        self._quit(driver)
+        if not keep_slot:
+            with self._condition:
+                self._alive -= 1
+                self._condition.notify()
+
+    @staticmethod
+    def _is_healthy(driver) -> bool:
+        try:
+            driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -13,6 +13,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from rate_limiter import RATE_LIMITER
+from scraper_waits import WAIT_STATS, wait_for_stable_elements, MEET_LINKS
 
 
 def create_driver():
@@ -37,13 +39,14 @@ def get_meet_ids_for_school(driver, school_id: str, school_name: str) -> List[st
     print(f"  Getting meets for {school_name} (ID: {school_id})")
 
     school_url = f"https://www.athletic.net/CrossCountry/School.aspx?SchoolID={school_id}"
-    driver.get(school_url)
+    with RATE_LIMITER.request():
+        driver.get(school_url)
 
     try:
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
-        time.sleep(2)
+        wait_for_stable_elements(driver, MEET_LINKS)
 
         # Find all meet links
         all_links = driver.find_elements(By.TAG_NAME, "a")
@@ -140,6 +143,9 @@ def main():
         for meet_id in meet_ids:
             print(f"  - https://www.athletic.net/CrossCountry/meet/{meet_id}")
 
+    waits = WAIT_STATS.snapshot()
+    print(f"\nPage waits: {waits['total_seconds']}s over {waits['waits']} pages")
+
     print("\n" + "="*60)
     print(f"UNIQUE MEET IDS TO IMPORT ({len(all_meet_ids)} total)")
     print("="*60)
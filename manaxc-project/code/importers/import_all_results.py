@@ -12,6 +12,8 @@ import re
 from dotenv import load_dotenv
 from trigger_manager import TriggerManager
 
+from column_parsers import describe_invalid, excel_fractions_to_centiseconds
+
 # Load environment variables from .env.local
 load_dotenv('/Users/ron/manaxc/.env.local')
 
@@ -29,17 +31,6 @@ def parse_excel_date(excel_date_value):
     except:
         return None
 
-def parse_time_decimal_to_centiseconds(decimal_value):
-    """Convert Excel decimal time (fraction of day) to centiseconds"""
-    try:
-        # Decimal is fraction of 24 hours
-        # 1 day = 86400 seconds
-        total_seconds = float(decimal_value) * 86400
-        centiseconds = int(round(total_seconds * 100))
-        return centiseconds
-    except:
-        return None
-
 def format_time_cs(cs):
     """Format centiseconds to MM:SS.ss"""
     if not cs:
@@ -116,6 +107,7 @@ def import_all_results():
     meets_cache = {}
     races_cache = {}
 
+    sheet_rows = []
     for idx, row in enumerate(rows[1:], 1):  # Skip header
         cells = row.findall('.//s:c', ns)
         if len(cells) < 8:
@@ -141,6 +133,14 @@ def import_all_results():
         if len(values) < 8:
             continue
 
+        sheet_rows.append((idx, values))
+
+    # Convert the whole Duration column at once, flagging cells that are not a time
+    durations = excel_fractions_to_centiseconds([values[3] for _, values in sheet_rows])
+    if durations.invalid:
+        print(f"   ⚠️  Unparseable Duration in {describe_invalid(durations, [idx + 1 for idx, _ in sheet_rows])}")
+
+    for (idx, values), time_cs in zip(sheet_rows, durations.values):
         # Parse row: Date, Athlete, Grade, Duration, Event, Course, Distance, Season
         date_serial = values[0]
         athlete_name = values[1]
@@ -178,8 +178,7 @@ def import_all_results():
             else:
                 year = meet_date.year
 
-        # Parse time
-        time_cs = parse_time_decimal_to_centiseconds(duration_decimal)
+        # Time was parsed with the rest of the column
         if not time_cs:
             continue
 
@@ -6,15 +6,21 @@ with validation, preview mode, and batch processing.
 """
 
 import sys
-import csv
 import json
 import os
 import shutil
-from typing import Dict, List, Tuple, Optional
+from contextlib import ExitStack
+from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime
 from supabase import create_client, Client
 
+from bulk_upsert import index_rows, select_in, write_rows
+from mapped_csv import MappedCsv, SCRAPE_COLUMN_TYPES
+from result_index import RaceResultIndex
+from scrape_columnar import parquet_path, read_checked_parquet_table
+from scrape_manifest import ImportLedger, expected_rows, load_manifest
+
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), '../../website/.env.local'))
@@ -128,12 +134,25 @@ def validate_athlete(athlete: Dict, season_year: int) -> ValidationResult:
 # CSV READING FUNCTIONS
 # ==============================================================================
 
-def read_csv_folder(folder_path: str) -> Dict:
+def read_csv_folder(
+    folder_path: str,
+    manifest: Optional[Dict] = None,
+    open_files: Optional[ExitStack] = None
+) -> Dict:
     """
     Read all CSV files from a scrape folder.
 
+    CSV files are memory-mapped and read lazily (mapped_csv.MappedCsv):
+    each entry is a sequence of row dicts whose numeric and flag columns
+    are already typed. A <kind>.parquet file (scraper --parquet) is read
+    instead of its CSV when present and pyarrow is installed, unless it is
+    unreadable or its row count differs from the manifest.
+
     Args:
         folder_path: Path to folder containing CSV files
+        manifest: The folder's manifest (loaded if omitted and a Parquet file is present)
+        open_files: ExitStack that closes the memory-mapped files (callers must
+            close them before the folder is moved; see import_csv_folder)
 
     Returns:
         Dictionary with all data:
@@ -178,10 +197,18 @@ def read_csv_folder(folder_path: str) -> Dict:
 
     for key, filename in csv_files.items():
         filepath = os.path.join(folder_path, filename)
+        typed_path = parquet_path(filepath)
+        if typed_path:
+            if manifest is None:
+                manifest = load_manifest(folder_path)
+            rows = read_checked_parquet_table(typed_path, expected_rows(manifest, filename))
+            if rows is not None:
+                data[key] = rows
+                continue
         if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                data[key] = list(reader)
+            data[key] = MappedCsv(filepath, SCRAPE_COLUMN_TYPES[key])
+            if open_files is not None:
+                open_files.enter_context(data[key])
 
     return data
 
@@ -190,18 +217,35 @@ def read_csv_folder(folder_path: str) -> Dict:
 # IMPORT FUNCTIONS
 # ==============================================================================
 
+def races_in_database(race_ids: Set[str]) -> Set[str]:
+    """The athletic_net_race_ids of `race_ids` the races table still has (one select_in)"""
+    rows = select_in(supabase, 'races', 'athletic_net_race_id', 'athletic_net_race_id', sorted(race_ids))
+    return {str(row['athletic_net_race_id']) for row in rows} & race_ids
+
+
 def import_csv_folder(
     folder_path: str,
     preview_only: bool = False,
-    target_school_name: Optional[str] = None
+    target_school_name: Optional[str] = None,
+    force: bool = False
 ) -> Dict:
     """
     Import data from CSV folder to Supabase.
 
+    The folder's content hashes (manifest.json) are checked against the
+    import ledger first: a folder identical to one already imported is
+    skipped, and so are the results of races whose content already landed.
+    A successful import is recorded in the ledger.
+
+    Existing rows are looked up per stage with a few in_() queries and
+    matched in memory; missing rows are written in chunked upserts
+    (bulk_upsert.py).
+
     Args:
         folder_path: Path to folder with CSV files
         preview_only: If True, validate but don't import
         target_school_name: Optional school name filter
+        force: Import even if the ledger says the content already landed
 
     Returns:
         Dictionary with import statistics and validation results
@@ -209,8 +253,23 @@ def import_csv_folder(
     print(f"\n📥 {'Previewing' if preview_only else 'Importing'} data from {folder_path}")
     print("=" * 60)
 
-    # Read CSV files
-    data = read_csv_folder(folder_path)
+    # Read CSV files; the memory maps are closed before returning, so the
+    # caller can move the folder (move_to_processed)
+    manifest = load_manifest(folder_path)
+    with ExitStack() as open_files:
+        data = read_csv_folder(folder_path, manifest, open_files)
+        return _import_folder_data(folder_path, data, manifest, preview_only, target_school_name, force)
+
+
+def _import_folder_data(
+    folder_path: str,
+    data: Dict,
+    manifest: Dict,
+    preview_only: bool,
+    target_school_name: Optional[str],
+    force: bool
+) -> Dict:
+    """Body of import_csv_folder, run while the folder's files are open"""
     metadata = data['metadata']
     season_year = metadata.get('season_year', datetime.now().year)
 
@@ -222,15 +281,44 @@ def import_csv_folder(
         'athletes_created': 0,
         'meets_created': 0,
         'races_created': 0,
+        'races_replaced': 0,
         'results_inserted': 0,
         'validation_errors': [],
         'validation_warnings': [],
         'skipped_results': 0,
         'skipped_already_exists': 0,
         'skipped_missing_athlete': 0,
-        'skipped_missing_race': 0
+        'skipped_missing_race': 0,
+        'skipped_unchanged_results': 0,
+        'already_imported': False
     }
 
+    # Content hashes vs. what already landed (scrape_manifest)
+    ledger = ImportLedger()
+    unchanged_races = set()
+    if not force:
+        previous_import = ledger.folder_imported(manifest)
+        unchanged_races = ledger.unchanged_races(manifest)
+
+        # The ledger cannot see rows deleted since (a cleaned database, a
+        # deleted meet): confirm the recorded races are still there
+        recorded = {race_id for race_id in (manifest['races'] if previous_import else unchanged_races) if race_id}
+        present = races_in_database(recorded)
+        if present != recorded:
+            print(f"\n⚠️  {len(recorded - present)} races in the import ledger are no longer in the "
+                  f"database, importing them again")
+            previous_import = None
+        unchanged_races &= present
+
+        if previous_import:
+            print(f"\n⏭️  Identical folder already imported ({previous_import['folder']} at "
+                  f"{previous_import['imported_at']}) - nothing to do (use --force to re-import)")
+            stats['already_imported'] = True
+            return stats
+        if unchanged_races:
+            print(f"\n⏭️  {len(unchanged_races)} of {len(manifest['races'])} races already imported "
+                  f"with identical results, skipping them")
+
     # Validate all results
     print(f"\n🔍 Validating {len(data['results'])} results...")
     for idx, result in enumerate(data['results']):
@@ -279,43 +367,49 @@ def import_csv_folder(
         print(f"\n❌ Cannot import - fix validation errors first")
         return stats
 
+    # Stages 1-6 look up existing rows for the whole folder with a few in_()
+    # queries (bulk_upsert.select_in), match in memory and write only the
+    # missing rows in chunks (bulk_upsert.write_rows)
+
     # ========== STAGE 1: IMPORT VENUES ==========
     print(f"\n📍 Stage 1/7: Importing Venues")
     print(f"  [DEBUG] Processing {len(data['venues'])} venues...")
     venue_id_map = {}  # Map venue_name to database ID
 
-    for venue in data['venues']:
-        athletic_net_id = venue.get('athletic_net_id', '').strip()
-        print(f"  [DEBUG] Processing venue: {venue['name']}, athletic_net_id: '{athletic_net_id}'")
-
-        # Check if exists by athletic_net_id (if it's not empty) or by name
-        if athletic_net_id:
-            existing = supabase.table('venues').select('id').eq('athletic_net_id', athletic_net_id).execute()
-        else:
-            existing = supabase.table('venues').select('id').eq('name', venue['name']).execute()
-
-        print(f"  [DEBUG] Existing check returned: {len(existing.data) if existing.data else 0} results")
-
-        if existing.data:
-            venue_id_map[venue['name']] = existing.data[0]['id']
-            print(f"  [DEBUG] Venue exists, using ID: {existing.data[0]['id']}")
-        else:
-            print(f"  [DEBUG] Creating new venue...")
-            venue_data = {
+    venues = [(venue, venue.get('athletic_net_id', '').strip()) for venue in data['venues']]
+
+    # Existing venues by athletic_net_id (if it's not empty) or by name
+    existing_by_net_id = index_rows(select_in(
+        supabase, 'venues', 'id, athletic_net_id', 'athletic_net_id', [net_id for _, net_id in venues]
+    ), 'athletic_net_id')
+    existing_by_name = index_rows(select_in(
+        supabase, 'venues', 'id, name', 'name', [venue['name'] for venue, net_id in venues if not net_id]
+    ), 'name')
+    print(f"  [DEBUG] Found {len(existing_by_net_id) + len(existing_by_name)} existing venues")
+
+    new_venues = {}  # Map venue_name to row to create
+    for venue, athletic_net_id in venues:
+        existing = existing_by_net_id.get(athletic_net_id) if athletic_net_id else existing_by_name.get(venue['name'])
+        if existing:
+            venue_id_map[venue['name']] = existing['id']
+        elif venue['name'] not in new_venues:
+            new_venues[venue['name']] = {
                 'name': venue['name'],
                 'city': venue.get('city', ''),
                 'state': venue.get('state', ''),
                 'athletic_net_id': athletic_net_id if athletic_net_id else None,
                 'notes': venue.get('notes', '')
             }
-            try:
-                response = supabase.table('venues').insert(venue_data).execute()
-                venue_id_map[venue['name']] = response.data[0]['id']
-                stats['venues_created'] += 1
-                print(f"  ✅ Created venue: {venue['name']}")
-            except Exception as e:
-                print(f"  ❌ ERROR creating venue {venue['name']}: {e}")
-                continue
+
+    if new_venues:
+        print(f"  [DEBUG] Creating {len(new_venues)} new venues...")
+        created, failed = write_rows(supabase, 'venues', list(new_venues.values()), on_conflict='athletic_net_id')
+        for row in created:
+            venue_id_map[row['name']] = row['id']
+            stats['venues_created'] += 1
+            print(f"  ✅ Created venue: {row['name']}")
+        for row, e in failed:
+            print(f"  ❌ ERROR creating venue {row['name']}: {e}")
 
     print(f"  [DEBUG] venue_id_map has {len(venue_id_map)} entries")
 
@@ -325,47 +419,49 @@ def import_csv_folder(
     print(f"  [DEBUG] venue_id_map keys: {list(venue_id_map.keys())}")
     course_id_map = {}  # Map course_name to database ID
 
+    courses = []
     for course in data['courses']:
-        print(f"  [DEBUG] Processing course: {course['name']}, venue: {course['venue_name']}")
-        # Get venue ID
         venue_id = venue_id_map.get(course['venue_name'])
-        print(f"  [DEBUG] Looked up venue_id: {venue_id}")
         if not venue_id:
             print(f"  ⚠️  Skipping course {course['name']} - venue not found")
             continue
-
-        athletic_net_id = course.get('athletic_net_id', '').strip()
-        print(f"  [DEBUG] Course athletic_net_id: '{athletic_net_id}'")
-
-        # Check if exists by athletic_net_id (if it's not empty) or by name+venue
+        courses.append((course, venue_id, course.get('athletic_net_id', '').strip()))
+
+    # Existing courses by athletic_net_id (if it's not empty) or by name+venue
+    existing_by_net_id = index_rows(select_in(
+        supabase, 'courses', 'id, athletic_net_id', 'athletic_net_id', [net_id for _, _, net_id in courses]
+    ), 'athletic_net_id')
+    existing_by_name = index_rows(select_in(
+        supabase, 'courses', 'id, name, venue_id', 'name', [course['name'] for course, _, net_id in courses if not net_id]
+    ), 'name', 'venue_id')
+    print(f"  [DEBUG] Found {len(existing_by_net_id) + len(existing_by_name)} existing courses")
+
+    new_courses = {}  # Map course_name to row to create
+    for course, venue_id, athletic_net_id in courses:
         if athletic_net_id:
-            existing = supabase.table('courses').select('id').eq('athletic_net_id', athletic_net_id).execute()
-        else:
-            print(f"  [DEBUG] Checking for existing course by name+venue...")
-            existing = supabase.table('courses').select('id').eq('name', course['name']).eq('venue_id', venue_id).execute()
-
-        print(f"  [DEBUG] Existing check returned: {len(existing.data) if existing.data else 0} results")
-
-        if existing.data:
-            course_id_map[course['name']] = existing.data[0]['id']
-            print(f"  [DEBUG] Course exists, using ID: {existing.data[0]['id']}")
+            existing = existing_by_net_id.get(athletic_net_id)
         else:
-            print(f"  [DEBUG] Creating new course...")
-            course_data = {
+            existing = existing_by_name.get((course['name'], venue_id))
+        if existing:
+            course_id_map[course['name']] = existing['id']
+        elif course['name'] not in new_courses:
+            new_courses[course['name']] = {
                 'name': course['name'],
                 'venue_id': venue_id,
                 'distance_meters': int(course['distance_meters']),
                 'difficulty_rating': float(course.get('difficulty_rating', 5.0)),
                 'athletic_net_id': athletic_net_id if athletic_net_id else None,
             }
-            try:
-                response = supabase.table('courses').insert(course_data).execute()
-                course_id_map[course['name']] = response.data[0]['id']
-                stats['courses_created'] += 1
-                print(f"  ✅ Created course: {course['name']}")
-            except Exception as e:
-                print(f"  ❌ ERROR creating course {course['name']}: {e}")
-                continue
+
+    if new_courses:
+        print(f"  [DEBUG] Creating {len(new_courses)} new courses...")
+        created, failed = write_rows(supabase, 'courses', list(new_courses.values()), on_conflict='athletic_net_id')
+        for row in created:
+            course_id_map[row['name']] = row['id']
+            stats['courses_created'] += 1
+            print(f"  ✅ Created course: {row['name']}")
+        for row, e in failed:
+            print(f"  ❌ ERROR creating course {row['name']}: {e}")
 
     print(f"  [DEBUG] course_id_map has {len(course_id_map)} entries")
 
@@ -373,42 +469,41 @@ def import_csv_folder(
     print(f"\n🏫 Stage 3/7: Importing Schools")
     school_id_map = {}  # Map athletic_net_id to database ID
 
-    for school in data['schools']:
-        athletic_net_id = school.get('athletic_net_id', '').strip()
-        print(f"  [DEBUG] Processing school: {school['name']}, athletic_net_id: '{athletic_net_id}'")
-
-        # Check if exists by athletic_net_id
-        if athletic_net_id:
-            print(f"  [DEBUG] Checking if school exists by athletic_net_id: {athletic_net_id}")
-            existing = supabase.table('schools').select('id').eq('athletic_net_id', athletic_net_id).execute()
-        else:
-            print(f"  [DEBUG] No athletic_net_id, checking by name: {school['name']}")
-            existing = supabase.table('schools').select('id').eq('name', school['name']).execute()
-
-        print(f"  [DEBUG] Existing check returned: {len(existing.data) if existing.data else 0} results")
-
-        if existing.data:
-            print(f"  [DEBUG] School exists, using ID: {existing.data[0]['id']}")
-            school_id_map[athletic_net_id] = existing.data[0]['id']
-        else:
-            print(f"  [DEBUG] School doesn't exist, creating new...")
-            school_data = {
+    schools = [(school, school.get('athletic_net_id', '').strip()) for school in data['schools']]
+
+    # Existing schools by athletic_net_id, or by name for schools without one
+    existing_by_net_id = index_rows(select_in(
+        supabase, 'schools', 'id, athletic_net_id', 'athletic_net_id', [net_id for _, net_id in schools]
+    ), 'athletic_net_id')
+    existing_by_name = index_rows(select_in(
+        supabase, 'schools', 'id, name', 'name', [school['name'] for school, net_id in schools if not net_id]
+    ), 'name')
+    print(f"  [DEBUG] Found {len(existing_by_net_id) + len(existing_by_name)} existing schools")
+
+    new_schools = {}  # Map athletic_net_id (name for schools without one) to row to create
+    for school, athletic_net_id in schools:
+        existing = existing_by_net_id.get(athletic_net_id) if athletic_net_id else existing_by_name.get(school['name'])
+        new_key = (athletic_net_id, '') if athletic_net_id else ('', school['name'])
+        if existing:
+            school_id_map[athletic_net_id] = existing['id']
+        elif new_key not in new_schools:
+            new_schools[new_key] = {
                 'name': school['name'],
                 'short_name': school.get('short_name', school['name']),
                 'city': school.get('city', ''),
                 'state': school.get('state', ''),
                 'athletic_net_id': athletic_net_id if athletic_net_id else None,
             }
-            print(f"  [DEBUG] Inserting school data: {school_data}")
-            try:
-                response = supabase.table('schools').insert(school_data).execute()
-                print(f"  [DEBUG] Insert response: {response.data}")
-                school_id_map[athletic_net_id] = response.data[0]['id']
-                stats['schools_created'] += 1
-                print(f"  ✅ Created school: {school['name']}")
-            except Exception as e:
-                print(f"  ❌ ERROR creating school {school['name']}: {e}")
-                continue
+
+    if new_schools:
+        print(f"  [DEBUG] Creating {len(new_schools)} new schools...")
+        created, failed = write_rows(supabase, 'schools', list(new_schools.values()))
+        for row in created:
+            school_id_map[str(row['athletic_net_id'] or '')] = row['id']
+            stats['schools_created'] += 1
+            print(f"  ✅ Created school: {row['name']}")
+        for row, e in failed:
+            print(f"  ❌ ERROR creating school {row['name']}: {e}")
 
     # ========== STAGE 4: IMPORT ATHLETES ==========
     print(f"\n👥 Stage 4/7: Importing Athletes")
@@ -416,35 +511,43 @@ def import_csv_folder(
     print(f"  [DEBUG] school_id_map has {len(school_id_map)} entries: {list(school_id_map.keys())[:5]}")
     athlete_map = {}  # Map (name, school_id) to database ID
 
-    for i, athlete in enumerate(data['athletes'], 1):
-        if i % 100 == 0:
-            print(f"  Progress: {i}/{len(data['athletes'])} athletes processed...")
-        if i <= 3:  # Debug first 3 athletes
-            print(f"  [DEBUG] Athlete {i}: {athlete['name']}, school_id: {athlete['school_athletic_net_id']}")
+    # Athletes only running in skipped (unchanged) races need no lookup
+    needed_athletes = None
+    if unchanged_races:
+        needed_athletes = {
+            (r['athlete_name'], r['athlete_school_id'])
+            for r in data['results'] if r['athletic_net_race_id'] not in unchanged_races
+        }
 
+    athletes = []
+    for athlete in data['athletes']:
+        if needed_athletes is not None and (athlete['name'], athlete['school_athletic_net_id']) not in needed_athletes:
+            continue
         school_db_id = school_id_map.get(athlete['school_athletic_net_id'])
-        if i <= 3:
-            print(f"  [DEBUG] Looked up school_db_id: {school_db_id}")
-
         if not school_db_id:
             print(f"  ⚠️  Skipping athlete {athlete['name']} - school not found (looked for: {athlete['school_athletic_net_id']})")
             continue
-
-        # Check if exists
-        existing = supabase.table('athletes').select('id').eq('first_name', athlete['first_name']).eq('last_name', athlete['last_name']).eq('school_id', school_db_id).execute()
-
-        if i <= 3:
-            print(f"  [DEBUG] Existing check returned: {len(existing.data) if existing.data else 0} results")
-
-        if existing.data:
-            athlete_map[(athlete['name'], athlete['school_athletic_net_id'])] = existing.data[0]['id']
-            if i <= 3:
-                print(f"  [DEBUG] Athlete exists, using ID: {existing.data[0]['id']}")
-        else:
-            if i <= 3:
-                print(f"  [DEBUG] Creating new athlete...")
+        athletes.append((athlete, school_db_id))
+
+    # Existing athletes of the schools involved, matched on first_name+last_name+school
+    existing_athletes = index_rows(select_in(
+        supabase, 'athletes', 'id, first_name, last_name, school_id', 'school_id',
+        [school_db_id for _, school_db_id in athletes]
+    ), 'first_name', 'last_name', 'school_id')
+    print(f"  [DEBUG] Loaded {len(existing_athletes)} existing athletes of {len(set(s for _, s in athletes))} schools")
+
+    new_athletes = {}  # Map (first_name, last_name, school_id) to row to create
+    athlete_keys = {}  # Map (first_name, last_name, school_id) to athlete_map keys
+    for athlete, school_db_id in athletes:
+        db_key = (athlete['first_name'], athlete['last_name'], school_db_id)
+        existing = existing_athletes.get(db_key)
+        if existing:
+            athlete_map[(athlete['name'], athlete['school_athletic_net_id'])] = existing['id']
+            continue
+        athlete_keys.setdefault(db_key, []).append((athlete['name'], athlete['school_athletic_net_id']))
+        if db_key not in new_athletes:
             # Keep gender as text 'M' or 'F' (schema has check constraint)
-            athlete_data = {
+            new_athletes[db_key] = {
                 'name': athlete['name'],  # Combined name field in current schema
                 'first_name': athlete['first_name'],
                 'last_name': athlete['last_name'],
@@ -453,15 +556,16 @@ def import_csv_folder(
                 'gender': athlete['gender'],  # Keep as 'M' or 'F' text
                 'athletic_net_id': athlete.get('athletic_net_id') or ''
             }
-            try:
-                response = supabase.table('athletes').insert(athlete_data).execute()
-                athlete_map[(athlete['name'], athlete['school_athletic_net_id'])] = response.data[0]['id']
-                stats['athletes_created'] += 1
-                if i <= 3:
-                    print(f"  [DEBUG] Created athlete ID: {response.data[0]['id']}")
-            except Exception as e:
-                print(f"  ❌ ERROR creating athlete {athlete['name']}: {e}")
-                continue
+
+    if new_athletes:
+        print(f"  [DEBUG] Creating {len(new_athletes)} new athletes...")
+        created, failed = write_rows(supabase, 'athletes', list(new_athletes.values()))
+        for row in created:
+            for key in athlete_keys.get((row['first_name'], row['last_name'], row['school_id']), []):
+                athlete_map[key] = row['id']
+            stats['athletes_created'] += 1
+        for row, e in failed:
+            print(f"  ❌ ERROR creating athlete {row['name']}: {e}")
 
     print(f"  ✅ Created {stats['athletes_created']} athletes")
     print(f"  [DEBUG] athlete_map has {len(athlete_map)} entries")
@@ -472,47 +576,52 @@ def import_csv_folder(
     print(f"  [DEBUG] venue_id_map keys: {list(venue_id_map.keys())}")
     meet_id_map = {}  # Map athletic_net_id to database ID
 
+    meets = []
     for meet in data['meets']:
-        print(f"  [DEBUG] Processing meet: {meet['name']}, venue: {meet.get('venue_name')}")
         # Get venue ID (meets are at venues, not courses)
-        # Use the venue from our venue_id_map
         venue_id = venue_id_map.get(meet.get('venue_name')) or venue_id_map.get('Unknown Venue')
-        print(f"  [DEBUG] Looked up venue_id: {venue_id}")
         if not venue_id:
             print(f"  ⚠️  Skipping meet {meet['name']} - no venue available")
             continue
-
-        athletic_net_id = meet.get('athletic_net_id', '').strip()
-        print(f"  [DEBUG] Meet athletic_net_id: '{athletic_net_id}'")
-
-        # Check if exists by athletic_net_id (if not empty) or by name+date
+        meets.append((meet, venue_id, meet.get('athletic_net_id', '').strip()))
+
+    # Existing meets by athletic_net_id (if not empty) or by name+date
+    existing_by_net_id = index_rows(select_in(
+        supabase, 'meets', 'id, athletic_net_id', 'athletic_net_id', [net_id for _, _, net_id in meets]
+    ), 'athletic_net_id')
+    existing_by_name = index_rows(select_in(
+        supabase, 'meets', 'id, name, meet_date', 'name', [meet['name'] for meet, _, net_id in meets if not net_id]
+    ), 'name', 'meet_date')
+    print(f"  [DEBUG] Found {len(existing_by_net_id) + len(existing_by_name)} existing meets")
+
+    new_meets = {}  # Map athletic_net_id (name+date for meets without one) to row to create
+    for meet, venue_id, athletic_net_id in meets:
         if athletic_net_id:
-            existing = supabase.table('meets').select('id').eq('athletic_net_id', athletic_net_id).execute()
-        else:
-            existing = supabase.table('meets').select('id').eq('name', meet['name']).eq('meet_date', meet['meet_date']).execute()
-
-        print(f"  [DEBUG] Existing check returned: {len(existing.data) if existing.data else 0} results")
-
-        if existing.data:
-            meet_id_map[athletic_net_id] = existing.data[0]['id']
-            print(f"  [DEBUG] Meet exists, using ID: {existing.data[0]['id']}")
+            existing = existing_by_net_id.get(athletic_net_id)
+            new_key = (athletic_net_id, '', '')
         else:
-            print(f"  [DEBUG] Creating new meet...")
-            meet_data = {
+            existing = existing_by_name.get((meet['name'], meet['meet_date']))
+            new_key = ('', meet['name'], meet['meet_date'])
+        if existing:
+            meet_id_map[athletic_net_id] = existing['id']
+        elif new_key not in new_meets:
+            new_meets[new_key] = {
                 'name': meet['name'],
                 'meet_date': meet['meet_date'],
                 'venue_id': venue_id,  # Changed from course_id to venue_id
                 'season_year': int(meet['season_year']),
                 'athletic_net_id': athletic_net_id if athletic_net_id else None,
             }
-            try:
-                response = supabase.table('meets').insert(meet_data).execute()
-                meet_id_map[athletic_net_id] = response.data[0]['id']
-                stats['meets_created'] += 1
-                print(f"  ✅ Created meet: {meet['name']}")
-            except Exception as e:
-                print(f"  ❌ ERROR creating meet {meet['name']}: {e}")
-                continue
+
+    if new_meets:
+        print(f"  [DEBUG] Creating {len(new_meets)} new meets...")
+        created, failed = write_rows(supabase, 'meets', list(new_meets.values()))
+        for row in created:
+            meet_id_map[str(row['athletic_net_id'] or '')] = row['id']
+            stats['meets_created'] += 1
+            print(f"  ✅ Created meet: {row['name']}")
+        for row, e in failed:
+            print(f"  ❌ ERROR creating meet {row['name']}: {e}")
 
     print(f"  [DEBUG] meet_id_map has {len(meet_id_map)} entries: {list(meet_id_map.keys())}")
 
@@ -524,12 +633,11 @@ def import_csv_folder(
     race_id_map = {}  # Map athletic_net_race_id to database ID
     race_to_meet_map = {}  # Map athletic_net_race_id to meet_db_id
 
-    for i, race in enumerate(data['races'], 1):
-        if i <= 3:
-            print(f"  [DEBUG] Race {i}: {race['name']}, meet_id: {race['meet_athletic_net_id']}")
+    races = []
+    for race in data['races']:
+        if race['athletic_net_race_id'] in unchanged_races:
+            continue
         meet_db_id = meet_id_map.get(race['meet_athletic_net_id'])
-        if i <= 3:
-            print(f"  [DEBUG] Looked up meet_db_id: {meet_db_id}")
         if not meet_db_id:
             print(f"  ⚠️  Skipping race {race['name']} - meet not found (looked for: {race['meet_athletic_net_id']})")
             continue
@@ -538,41 +646,38 @@ def import_csv_folder(
         course_name_from_race = race.get('course_name', '').strip()
         if course_name_from_race and course_name_from_race in course_id_map:
             course_id = course_id_map[course_name_from_race]
-            if i <= 3:
-                print(f"  [DEBUG] Using course_id from race's course_name '{course_name_from_race}': {course_id}")
         else:
             # Fall back to first course (for backward compatibility with old CSVs)
             course_id = list(course_id_map.values())[0] if course_id_map else None
-            if i <= 3:
-                print(f"  [DEBUG] Using first available course_id (fallback): {course_id}")
 
         if not course_id:
             print(f"  ⚠️  Skipping race - no course available")
             continue
 
-        athletic_net_race_id = race.get('athletic_net_race_id', '').strip()
-        if i <= 3:
-            print(f"  [DEBUG] Race athletic_net_race_id: '{athletic_net_race_id}'")
+        races.append((race, meet_db_id, course_id, race.get('athletic_net_race_id', '').strip()))
 
-        # Check if race already exists by athletic_net_race_id or by meet+name+gender
+    # Existing races by athletic_net_race_id or by meet+name+gender
+    existing_by_net_id = index_rows(select_in(
+        supabase, 'races', 'id, athletic_net_race_id', 'athletic_net_race_id', [net_id for _, _, _, net_id in races]
+    ), 'athletic_net_race_id')
+    existing_by_name = index_rows(select_in(
+        supabase, 'races', 'id, meet_id, name, gender', 'meet_id',
+        [meet_db_id for _, meet_db_id, _, net_id in races if not net_id]
+    ), 'meet_id', 'name', 'gender')
+    print(f"  [DEBUG] Found {len(existing_by_net_id) + len(existing_by_name)} existing races")
+
+    new_races = {}  # Map athletic_net_race_id to row to create
+    for race, meet_db_id, course_id, athletic_net_race_id in races:
         if athletic_net_race_id:
-            existing = supabase.table('races').select('id').eq('athletic_net_race_id', athletic_net_race_id).execute()
+            existing = existing_by_net_id.get(athletic_net_race_id)
         else:
-            existing = supabase.table('races').select('id').eq('meet_id', meet_db_id).eq('name', race['name']).eq('gender', race['gender']).execute()
-
-        if i <= 3:
-            print(f"  [DEBUG] Existing check returned: {len(existing.data) if existing.data else 0} results")
-
-        if existing.data:
-            race_id_map[athletic_net_race_id] = existing.data[0]['id']
+            existing = existing_by_name.get((meet_db_id, race['name'], race['gender']))
+        if existing:
+            race_id_map[athletic_net_race_id] = existing['id']
             race_to_meet_map[athletic_net_race_id] = meet_db_id
-            if i <= 3:
-                print(f"  [DEBUG] Race exists, using ID: {existing.data[0]['id']}")
-        else:
-            if i <= 3:
-                print(f"  [DEBUG] Creating new race...")
+        elif athletic_net_race_id not in new_races:
             # Keep gender as text 'M' or 'F' (schema has check constraint)
-            race_data = {
+            new_races[athletic_net_race_id] = {
                 'meet_id': meet_db_id,
                 'course_id': course_id,  # Races are on courses
                 'name': race['name'],
@@ -580,20 +685,41 @@ def import_csv_folder(
                 'distance_meters': int(race['distance_meters']),  # Required field
                 'athletic_net_race_id': athletic_net_race_id if athletic_net_race_id else None
             }
-            try:
-                response = supabase.table('races').insert(race_data).execute()
-                race_id_map[athletic_net_race_id] = response.data[0]['id']
-                race_to_meet_map[athletic_net_race_id] = meet_db_id
-                stats['races_created'] += 1
-                if i <= 3:
-                    print(f"  [DEBUG] Created race ID: {response.data[0]['id']}")
-            except Exception as e:
-                print(f"  ❌ ERROR creating race {race['name']}: {e}")
-                continue
+
+    if new_races:
+        print(f"  [DEBUG] Creating {len(new_races)} new races...")
+        # UNIQUE(meet_id, name, gender) in the races table
+        created, failed = write_rows(supabase, 'races', list(new_races.values()), on_conflict='meet_id,name,gender')
+        for row in created:
+            athletic_net_race_id = str(row['athletic_net_race_id'] or '')
+            race_id_map[athletic_net_race_id] = row['id']
+            race_to_meet_map[athletic_net_race_id] = row['meet_id']
+            stats['races_created'] += 1
+        for row, e in failed:
+            print(f"  ❌ ERROR creating race {row['name']}: {e}")
+        skipped = set(new_races) - set(race_id_map)
+        for athletic_net_race_id in skipped - {row['athletic_net_race_id'] or '' for row, _ in failed}:
+            print(f"  ⚠️  Race {new_races[athletic_net_race_id]['name']} not created - "
+                  f"same meet/name/gender exists under another athletic_net_race_id")
 
     print(f"  ✅ Created {stats['races_created']} races")
     print(f"  [DEBUG] race_id_map has {len(race_id_map)} entries")
 
+    # ========== DELTA: REPLACE CHANGED RACES ==========
+    # Delta folders (athletic_net_scraper_v2.py meet --since) list races whose
+    # results were corrected on Athletic.net; drop their old results so the
+    # corrected ones below replace them instead of sitting next to them
+    changed_races = metadata.get('delta', {}).get('changed_races', [])
+    if changed_races:
+        print(f"\n♻️  Replacing results of {len(changed_races)} changed races")
+        for athletic_net_race_id in changed_races:
+            race_db_id = race_id_map.get(athletic_net_race_id)
+            if not race_db_id:
+                continue
+            supabase.table('results').delete().eq('race_id', race_db_id).execute()
+            stats['races_replaced'] += 1
+        print(f"  ✅ Cleared old results for {stats['races_replaced']} races")
+
     # ========== STAGE 7: IMPORT RESULTS ==========
     print(f"\n📊 Stage 7/7: Importing Results")
     print(f"  [DEBUG] Processing {len(data['results'])} results...")
@@ -601,11 +727,21 @@ def import_csv_folder(
     print(f"  [DEBUG] race_to_meet_map keys: {list(race_to_meet_map.keys())[:5]}")
     print(f"  [DEBUG] athlete_map has {len(athlete_map)} entries")
 
-    # Batch import results (100 at a time)
-    BATCH_SIZE = 100
+    # Results are collected, then written in chunks (bulk_upsert.write_rows)
     results_to_import = []
+    failed_race_ids = set()  # Races with results that did not land (not recorded in the ledger)
+    race_net_ids = {race_db_id: race_id for race_id, race_db_id in race_id_map.items()}
+
+    # Existing (athlete_id, time_cs) pairs of these races, for the duplicate check
+    result_index = RaceResultIndex(supabase)
+    result_index.load_races(race_id_map.values())
+    print(f"  [DEBUG] Loaded {len(result_index)} existing results of these races")
+    candidates = []  # (result number, result, race_db_id, athlete_db_id, race_meet_id)
 
     for i, result in enumerate(data['results'], 1):
+        if result['athletic_net_race_id'] in unchanged_races:
+            stats['skipped_unchanged_results'] += 1
+            continue
         if i <= 3:
             print(f"  [DEBUG] Result {i}: {result['athlete_name']}, race_id: {result['athletic_net_race_id']}")
 
@@ -617,6 +753,7 @@ def import_csv_folder(
                 print(f"  ⚠️  Skipping result {i} - race not found (looked for: {result['athletic_net_race_id']})")
             stats['skipped_results'] += 1
             stats['skipped_missing_race'] += 1
+            failed_race_ids.add(result['athletic_net_race_id'])
             continue
 
         athlete_key = (result['athlete_name'], result['athlete_school_id'])
@@ -630,6 +767,7 @@ def import_csv_folder(
                 print(f"  ⚠️  Skipping result {i} - athlete not found")
             stats['skipped_results'] += 1
             stats['skipped_missing_athlete'] += 1
+            failed_race_ids.add(result['athletic_net_race_id'])
             continue
 
         # Get meet_id from race using the race_to_meet_map
@@ -640,68 +778,26 @@ def import_csv_folder(
             if i <= 3:
                 print(f"  ⚠️  Skipping result {i} - race_meet_id not found")
             stats['skipped_results'] += 1
+            failed_race_ids.add(result['athletic_net_race_id'])
             continue
 
-        # OPTIMIZED DUPLICATE CHECK - Time first (fast path for most results)
-        incoming_time_cs = int(result['time_cs'])
+        candidates.append((i, result, race_db_id, athlete_db_id, race_meet_id))
 
-        # Step 1: Check if this exact time exists in this race (fast check)
-        existing_with_time = supabase.table('results').select('id, athlete_id').eq('race_id', race_db_id).eq('time_cs', incoming_time_cs).execute()
+    # DUPLICATE CHECK - in memory: time match first, then athlete identity on ties
+    identities = result_index.load_identities(
+        (race_db_id, athlete_db_id, result['time_cs']) for _, result, race_db_id, athlete_db_id, _ in candidates
+    )
+    print(f"  [DEBUG] Loaded identity keys of {identities} athletes involved in time matches")
 
-        if i <= 3:
-            print(f"  [DEBUG] Time check ({incoming_time_cs}cs) returned: {len(existing_with_time.data) if existing_with_time.data else 0} results")
+    for i, result, race_db_id, athlete_db_id, race_meet_id in candidates:
+        incoming_time_cs = int(result['time_cs'])
 
-        if not existing_with_time.data:
-            # No matching time → definitely not a duplicate, proceed to insert (FAST PATH)
+        if result_index.is_duplicate(race_db_id, athlete_db_id, incoming_time_cs):
             if i <= 3:
-                print(f"  [DEBUG] No time match, proceeding to insert")
-        else:
-            # Step 2: Time exists, check if it's the same athlete
-            is_duplicate = False
-
-            # Get athlete info for comparison
-            athlete_record = supabase.table('athletes').select('id, athletic_net_id, slug').eq('id', athlete_db_id).execute()
-
-            if athlete_record.data:
-                incoming_athlete_net_id = athlete_record.data[0].get('athletic_net_id')
-                incoming_athlete_slug = athlete_record.data[0].get('slug')
-
-                # Check each existing result with this time
-                for existing_result in existing_with_time.data:
-                    existing_athlete_id = existing_result['athlete_id']
-
-                    # Fast check: same athlete_id?
-                    if existing_athlete_id == athlete_db_id:
-                        is_duplicate = True
-                        break
-
-                    # Get existing athlete info
-                    existing_athlete = supabase.table('athletes').select('athletic_net_id, slug').eq('id', existing_athlete_id).execute()
-
-                    if existing_athlete.data:
-                        existing_net_id = existing_athlete.data[0].get('athletic_net_id')
-                        existing_slug = existing_athlete.data[0].get('slug')
-
-                        # If both have athletic_net_id, compare those
-                        if incoming_athlete_net_id and existing_net_id:
-                            if incoming_athlete_net_id == existing_net_id:
-                                is_duplicate = True
-                                break
-                        # If no athletic_net_id, compare slugs (name-based)
-                        elif incoming_athlete_slug and existing_slug:
-                            if incoming_athlete_slug == existing_slug:
-                                is_duplicate = True
-                                break
-
-            if is_duplicate:
-                if i <= 3:
-                    print(f"  [DEBUG] Result {i} is a duplicate (same athlete, time, race), skipping")
-                stats['skipped_results'] += 1
-                stats['skipped_already_exists'] += 1
-                continue
-            else:
-                if i <= 3:
-                    print(f"  [DEBUG] Time match but different athlete (tie), proceeding to insert")
+                print(f"  [DEBUG] Result {i} is a duplicate (same athlete, time, race), skipping")
+            stats['skipped_results'] += 1
+            stats['skipped_already_exists'] += 1
+            continue
 
         if i <= 3:
             print(f"  [DEBUG] Adding result {i} to batch...")
@@ -710,46 +806,28 @@ def import_csv_folder(
             'race_id': race_db_id,
             'athlete_id': athlete_db_id,
             'meet_id': race_meet_id,  # Required field
-            'time_cs': int(result['time_cs']),
+            'time_cs': incoming_time_cs,
             'place_overall': int(result['place_overall']),
             'is_legacy_data': True,
             'data_source': 'athletic_net'  # Must be one of: excel_import, athletic_net, manual_import, scraper
         }
         results_to_import.append(result_data)
+        # Later rows of this folder are checked against it too
+        result_index.add(race_db_id, athlete_db_id, incoming_time_cs)
 
-        # Batch insert when we reach BATCH_SIZE
-        if len(results_to_import) >= BATCH_SIZE:
-            try:
-                supabase.table('results').insert(results_to_import).execute()
-                stats['results_inserted'] += len(results_to_import)
-                print(f"  ✅ Inserted {stats['results_inserted']} results...")
-            except Exception as e:
-                # If batch fails due to duplicates, insert one by one
-                print(f"  ⚠️  Batch insert failed, inserting individually...")
-                for result_data in results_to_import:
-                    try:
-                        supabase.table('results').insert(result_data).execute()
-                        stats['results_inserted'] += 1
-                    except Exception as e:
-                        print(f"      ❌ Failed to insert result: {str(e)[:100]}")
-                        stats['skipped_results'] += 1
-            results_to_import = []
-
-    # Insert remaining results
-    if results_to_import:
-        try:
-            supabase.table('results').insert(results_to_import).execute()
-            stats['results_inserted'] += len(results_to_import)
-        except Exception as e:
-            # If batch fails due to duplicates, insert one by one
-            print(f"  ⚠️  Batch insert failed, inserting individually...")
-            for result_data in results_to_import:
-                try:
-                    supabase.table('results').insert(result_data).execute()
-                    stats['results_inserted'] += 1
-                except Exception as e:
-                    print(f"      ❌ Failed to insert result: {str(e)[:100]}")
-                    stats['skipped_results'] += 1
+    # UNIQUE(athlete_id, meet_id, race_id, time_cs, data_source): rows that
+    # already landed are skipped by the upsert instead of failing their chunk
+    inserted, failed = write_rows(
+        supabase, 'results', results_to_import, on_conflict='athlete_id,meet_id,race_id,time_cs,data_source'
+    )
+    stats['results_inserted'] += len(inserted)
+    for result_data, e in failed:
+        print(f"      ❌ Failed to insert result: {str(e)[:100]}")
+        stats['skipped_results'] += 1
+        failed_race_ids.add(race_net_ids[result_data['race_id']])
+    conflicts = len(results_to_import) - len(inserted) - len(failed)
+    stats['skipped_results'] += conflicts
+    stats['skipped_already_exists'] += conflicts
 
     print(f"  ✅ Inserted {stats['results_inserted']} total results")
     if stats['skipped_results'] > 0:
@@ -760,11 +838,13 @@ def import_csv_folder(
             print(f"      - {stats['skipped_missing_athlete']} missing athlete")
         if stats['skipped_missing_race'] > 0:
             print(f"      - {stats['skipped_missing_race']} missing race")
+    if stats['skipped_unchanged_results'] > 0:
+        print(f"  ⏭️  {stats['skipped_unchanged_results']} results of unchanged races not re-imported")
 
     # ========== UPDATE MEET RESULT COUNT ==========
     # Update the cached result_count on the meet(s) that had results added
     # This is necessary because triggers are disabled during bulk imports
-    if stats['results_inserted'] > 0:
+    if stats['results_inserted'] > 0 or stats['races_replaced'] > 0:
         print(f"\n🔢 Updating meet result counts...")
         # Get unique meet IDs from the imported results
         unique_meet_ids = set(race_to_meet_map.values())
@@ -780,6 +860,15 @@ def import_csv_folder(
             except Exception as e:
                 print(f"  ⚠️  Warning: Failed to update meet result_count: {e}")
 
+    # ========== RECORD IN IMPORT LEDGER ==========
+    # Races whose results all landed are skipped by later imports of the same
+    # content; the folder as a whole only if nothing failed
+    failed_race_ids |= set(manifest['races']) - unchanged_races - set(race_id_map)
+    if failed_race_ids:
+        ledger.record(manifest, folder_path, [race_id for race_id in race_id_map if race_id not in failed_race_ids])
+    else:
+        ledger.record(manifest, folder_path)
+
     # Print final summary
     print(f"\n{'=' * 60}")
     print(f"✅ Import complete!")
@@ -790,6 +879,8 @@ def import_csv_folder(
     print(f"  Athletes: {stats['athletes_created']}")
     print(f"  Meets: {stats['meets_created']}")
     print(f"  Races: {stats['races_created']}")
+    if stats['races_replaced']:
+        print(f"  Races replaced (delta): {stats['races_replaced']}")
     print(f"  Results: {stats['results_inserted']}")
 
     return stats
@@ -820,7 +911,7 @@ def move_to_processed(folder_path: str):
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage:")
-        print("  python import_csv_data.py <folder_path> [--preview]")
+        print("  python import_csv_data.py <folder_path> [--preview] [--force]")
         print("\nExample:")
         print("  python import_csv_data.py to-be-processed/meet_265306_1761610508")
         print("  python import_csv_data.py to-be-processed/meet_265306_1761610508 --preview")
@@ -828,14 +919,15 @@ if __name__ == "__main__":
 
     folder_path = sys.argv[1]
     preview_only = '--preview' in sys.argv
+    force = '--force' in sys.argv  # Re-import content the import ledger says already landed
 
     if not os.path.exists(folder_path):
         print(f"❌ Error: Folder not found: {folder_path}")
         sys.exit(1)
 
     # Import data
-    stats = import_csv_folder(folder_path, preview_only=preview_only)
+    stats = import_csv_folder(folder_path, preview_only=preview_only, force=force)
 
-    # Move to processed if successful
-    if not preview_only and stats['results_inserted'] > 0:
+    # Move to processed if successful (or already imported before)
+    if not preview_only and (stats['results_inserted'] > 0 or stats['already_imported']):
         move_to_processed(folder_path)
@@ -1,16 +1,26 @@
 #!/usr/bin/env python3
 """
 Import a meet folder with automatic batching for large files.
-Files with >2000 rows are automatically split and imported in batches.
+All seven stages run through staged_import.run_stage: each batch of rows
+is matched against the database with a few bulk lookups and the missing
+rows are inserted in chunks. Batch and chunk sizes can be tuned per run.
+
+With --async the stages run on async_postgrest.AsyncPostgrest: chunks are
+sent concurrently (bounded by --concurrency), transient errors and
+timeouts are retried, and the schools → athletes chain runs alongside
+venues → courses → meet → races.
 """
 import sys
-import csv
 import os
-import math
+import asyncio
 from dotenv import load_dotenv
 from supabase import create_client
 import time
 
+from async_postgrest import AsyncPostgrest, IMPORT_CONCURRENCY
+from bulk_upsert import WRITE_CHUNK_SIZE
+from staged_import import STAGE_BATCH_SIZE, EntitySpec, run_stage, run_stage_async
+
 load_dotenv('.env')
 
 supabase = create_client(
@@ -18,487 +28,208 @@ supabase = create_client(
     os.getenv('NEXT_PUBLIC_SUPABASE_ANON_KEY')
 )
 
-BATCH_SIZE = 2000
-
-def count_csv_rows(filepath):
-    """Count rows in CSV file (excluding header)"""
-    with open(filepath, 'r') as f:
-        return sum(1 for line in f) - 1  # -1 for header
-
-def import_venues(folder):
-    """Import venues"""
-    print("\n📍 STEP 1/7: Importing Venues")
-    filepath = os.path.join(folder, 'venues.csv')
-
-    if not os.path.exists(filepath):
-        print("  ⚠️  No venues.csv found, skipping")
-        return {}
-
-    venue_id_map = {}
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            venue_name = row['name']
-            existing = supabase.table('venues').select('id').eq('name', venue_name).execute()
-
-            if existing.data:
-                venue_id_map[venue_name] = existing.data[0]['id']
-                print(f"  ✓ {venue_name}")
-            else:
-                venue_data = {
-                    'name': venue_name,
-                    'athletic_net_id': row.get('athletic_net_id', ''),
-                    'city': row.get('city'),
-                    'state': row.get('state')
-                }
-                result = supabase.table('venues').insert(venue_data).execute()
-                venue_id_map[venue_name] = result.data[0]['id']
-                print(f"  + Created: {venue_name}")
-
-    print(f"  ✅ {len(venue_id_map)} venues ready")
-    return venue_id_map
-
-def import_courses(folder, venue_id_map):
-    """Import courses"""
-    print("\n🏃 STEP 2/7: Importing Courses")
-    filepath = os.path.join(folder, 'courses.csv')
-
-    if not os.path.exists(filepath):
-        print("  ⚠️  No courses.csv found, skipping")
-        return {}
-
-    course_id_map = {}
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            course_name = row['name']
-            venue_name = row['venue_name']
-
-            if venue_name not in venue_id_map:
-                print(f"  ⚠️  Venue not found: {venue_name}")
-                continue
-
-            venue_id = venue_id_map[venue_name]
-            existing = supabase.table('courses').select('id').eq('name', course_name).eq('venue_id', venue_id).execute()
-
-            if existing.data:
-                course_id_map[course_name] = existing.data[0]['id']
-                print(f"  ✓ {course_name}")
-            else:
-                course_data = {
-                    'name': course_name,
-                    'venue_id': venue_id,
-                    'distance_label': row.get('distance_label', ''),
-                    'athletic_net_id': row.get('athletic_net_id', '')
-                }
-                result = supabase.table('courses').insert(course_data).execute()
-                course_id_map[course_name] = result.data[0]['id']
-                print(f"  + Created: {course_name}")
-
-    print(f"  ✅ {len(course_id_map)} courses ready")
-    return course_id_map
-
-def import_schools_batched(folder):
-    """Import schools in batches"""
-    print("\n🏫 STEP 3/7: Importing Schools")
-    filepath = os.path.join(folder, 'schools.csv')
-
-    if not os.path.exists(filepath):
-        print("  ⚠️  No schools.csv found, skipping")
-        return {}
-
-    row_count = count_csv_rows(filepath)
-    print(f"  Found {row_count} schools")
-
-    school_id_map = {}
-    imported = 0
-    skipped = 0
-
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        batch_num = 0
-        batch = []
-
-        for row in reader:
-            batch.append(row)
-
-            if len(batch) >= BATCH_SIZE:
-                batch_num += 1
-                print(f"  Batch {batch_num}: Processing {len(batch)} schools...")
-
-                for school_row in batch:
-                    school_name = school_row['name']
-                    athletic_net_id = school_row['athletic_net_id']
-
-                    existing = supabase.table('schools').select('id').eq('athletic_net_id', athletic_net_id).execute()
-
-                    if existing.data:
-                        school_id_map[school_name] = existing.data[0]['id']
-                        skipped += 1
-                    else:
-                        school_data = {
-                            'name': school_name,
-                            'athletic_net_id': athletic_net_id
-                        }
-                        result = supabase.table('schools').insert(school_data).execute()
-                        school_id_map[school_name] = result.data[0]['id']
-                        imported += 1
-
-                print(f"    Progress: {imported} created, {skipped} existed")
-                batch = []
-                time.sleep(0.5)  # Small pause between batches
-
-        # Process remaining
-        if batch:
-            batch_num += 1
-            print(f"  Batch {batch_num}: Processing {len(batch)} schools...")
-            for school_row in batch:
-                school_name = school_row['name']
-                athletic_net_id = school_row['athletic_net_id']
-
-                existing = supabase.table('schools').select('id').eq('athletic_net_id', athletic_net_id).execute()
-
-                if existing.data:
-                    school_id_map[school_name] = existing.data[0]['id']
-                    skipped += 1
-                else:
-                    school_data = {
-                        'name': school_name,
-                        'athletic_net_id': athletic_net_id
-                    }
-                    result = supabase.table('schools').insert(school_data).execute()
-                    school_id_map[school_name] = result.data[0]['id']
-                    imported += 1
-
-    print(f"  ✅ {imported} created, {skipped} existed")
-    return school_id_map
-
-def import_meet(folder, venue_id_map):
-    """Import meet"""
-    print("\n📅 STEP 4/7: Importing Meet")
-    filepath = os.path.join(folder, 'meets.csv')
-
-    if not os.path.exists(filepath):
-        print("  ⚠️  No meets.csv found, skipping")
+BATCH_SIZE = STAGE_BATCH_SIZE
+
+
+# ==============================================================================
+# ENTITY SPECS
+# ==============================================================================
+
+def venue_row(row, context):
+    return {
+        'name': row['name'],
+        'athletic_net_id': row.get('athletic_net_id', ''),
+        'city': row.get('city'),
+        'state': row.get('state')
+    }
+
+
+def course_row(row, context):
+    venue_id = context['venues'].get(row['venue_name'])
+    if not venue_id:
+        print(f"  ⚠️  Venue not found: {row['venue_name']}")
         return None
+    return {
+        'name': row['name'],
+        'venue_id': venue_id,
+        'distance_label': row.get('distance_label', ''),
+        'athletic_net_id': row.get('athletic_net_id', '')
+    }
+
+
+def school_row(row, context):
+    return {
+        'name': row['name'],
+        'athletic_net_id': row['athletic_net_id']
+    }
+
+
+def meet_row(row, context):
+    venue_id = context['venues'].get(row['venue_name'])
+    if not venue_id:
+        print(f"  ❌ Venue not found: {row['venue_name']}")
+        return None
+    return {
+        'name': row['name'],
+        'athletic_net_id': row['athletic_net_id'],
+        'venue_id': venue_id,
+        'meet_date': row.get('meet_date', ''),
+        'season_year': int(row.get('season_year') or 2025),
+        'result_count': 0
+    }
+
+
+def race_row(row, context):
+    course_name = row.get('course_name', '')
+    return {
+        'name': row['name'],
+        'athletic_net_id': row['athletic_net_race_id'],
+        'meet_id': context['meet_id'],
+        'gender': row.get('gender'),
+        'distance_meters': int(row['distance_meters']) if row.get('distance_meters') else None,
+        'course_id': context['courses'].get(course_name) if course_name else None
+    }
+
+
+def athlete_key(row):
+    return f"{row.get('first_name', '')}_{row.get('last_name', '')}_{row['school_name']}"
+
+
+def athlete_row(row, context):
+    school_id = context['schools'].get(row['school_name'])
+    if not school_id:
+        return None
+    return {
+        'first_name': row.get('first_name', ''),
+        'last_name': row.get('last_name', ''),
+        'school_id': school_id,
+        'gender': row.get('gender'),
+        'grad_year': int(row['grad_year']) if row.get('grad_year') else None
+    }
+
+
+def result_row(row, context):
+    race_id = context['races'].get(row['athletic_net_race_id'])
+    school_id = context['schools'].get(row['school_name'])
+    athlete_id = context['athletes'].get(athlete_key(row))
+    if not race_id or not school_id or not athlete_id:
+        return None
+    return {
+        'meet_id': context['meet_id'],
+        'race_id': race_id,
+        'athlete_id': athlete_id,
+        'school_id': school_id,
+        'time_in_seconds': float(row['time_in_seconds']) if row.get('time_in_seconds') else None,
+        'place': int(row['place']) if row.get('place') else None,
+        'grade': int(row['grade']) if row.get('grade') else None
+    }
+
+
+VENUES = EntitySpec('Venues', 'venues', 'venues.csv', ('name',), venue_row,
+                    map_key=lambda row: row['name'])
+COURSES = EntitySpec('Courses', 'courses', 'courses.csv', ('name', 'venue_id'), course_row,
+                     map_key=lambda row: row['name'])
+SCHOOLS = EntitySpec('Schools', 'schools', 'schools.csv', ('athletic_net_id',), school_row,
+                     map_key=lambda row: row['name'])
+MEETS = EntitySpec('Meet', 'meets', 'meets.csv', ('athletic_net_id',), meet_row,
+                   map_key=lambda row: row['athletic_net_id'])
+RACES = EntitySpec('Races', 'races', 'races.csv', ('athletic_net_id',), race_row,
+                   map_key=lambda row: row['athletic_net_race_id'])
+ATHLETES = EntitySpec('Athletes', 'athletes', 'athletes.csv', ('first_name', 'last_name', 'school_id'), athlete_row,
+                      map_key=athlete_key, prefetch_column='school_id')
+RESULTS = EntitySpec('Results', 'results', 'results.csv', ('race_id', 'athlete_id'), result_row)
+
+# (stage emoji, spec, context key of its ID map) in import order
+STAGES = [
+    ('📍', VENUES, 'venues'),
+    ('🏃', COURSES, 'courses'),
+    ('🏫', SCHOOLS, 'schools'),
+    ('📅', MEETS, 'meets'),
+    ('🏁', RACES, 'races'),
+    ('👤', ATHLETES, 'athletes'),
+    ('📊', RESULTS, 'results'),
+]
+
+
+# ==============================================================================
+# IMPORT
+# ==============================================================================
+
+def import_meet_folder(folder, batch_size=BATCH_SIZE, chunk_size=WRITE_CHUNK_SIZE):
+    """
+    Run all seven stages on a meet folder.
+
+    Args:
+        folder: Meet folder with venues.csv ... results.csv
+        batch_size: CSV rows per prefetch/write round
+        chunk_size: Rows per insert request
+
+    Returns:
+        (meet_id or None, list of StageStats)
+    """
+    context = {'meet_id': None}
+    all_stats = []
+
+    for step, (emoji, spec, context_key) in enumerate(STAGES, 1):
+        print(f"\n{emoji} STEP {step}/{len(STAGES)}: Importing {spec.name}")
+        id_map, stats = run_stage(supabase, spec, folder, context, batch_size, chunk_size)
+        context[context_key] = id_map
+        all_stats.append(stats)
+
+        if spec is MEETS:
+            context['meet_id'] = next(iter(id_map.values()), None)
+            if not context['meet_id']:
+                return None, all_stats
+            print(f"  ✅ Meet ready (ID: {context['meet_id']})")
+
+    return context['meet_id'], all_stats
+
+
+async def import_meet_folder_async(folder, batch_size=BATCH_SIZE, chunk_size=WRITE_CHUNK_SIZE,
+                                   concurrency=None):
+    """
+    import_meet_folder over async_postgrest with independent stages overlapped.
+
+    Args:
+        folder: Meet folder with venues.csv ... results.csv
+        batch_size: CSV rows per prefetch/write round
+        chunk_size: Rows per insert request
+        concurrency: Requests in flight (default IMPORT_CONCURRENCY)
+
+    Returns:
+        (meet_id or None, list of StageStats)
+    """
+    context = {'meet_id': None}
+    stats_by_spec = {}
+
+    async with AsyncPostgrest.from_env(concurrency=concurrency or IMPORT_CONCURRENCY) as client:
+        async def run(spec, context_key):
+            emoji, _, _ = next(stage for stage in STAGES if stage[1] is spec)
+            print(f"\n{emoji} Importing {spec.name}")
+            context[context_key], stats_by_spec[spec.name] = await run_stage_async(
+                client, spec, folder, context, batch_size, chunk_size
+            )
+
+        async def venue_chain():
+            await run(VENUES, 'venues')
+            await run(COURSES, 'courses')
+            await run(MEETS, 'meets')
+            context['meet_id'] = next(iter(context['meets'].values()), None)
+            if context['meet_id']:
+                print(f"  ✅ Meet ready (ID: {context['meet_id']})")
+                await run(RACES, 'races')
+
+        async def school_chain():
+            await run(SCHOOLS, 'schools')
+            await run(ATHLETES, 'athletes')
+
+        await asyncio.gather(venue_chain(), school_chain())
+        if context['meet_id']:
+            await run(RESULTS, 'results')
+        print(f"\n  {client.requests} requests, {client.retries} retries")
+
+    return context['meet_id'], [stats_by_spec[spec.name] for _, spec, _ in STAGES if spec.name in stats_by_spec]
 
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        meet_row = next(reader)
-
-        meet_name = meet_row['name']
-        athletic_net_id = meet_row['athletic_net_id']
-        venue_name = meet_row['venue_name']
-        meet_date = meet_row.get('meet_date', '')
-        season_year = int(meet_row.get('season_year', 2025))
-
-        if venue_name not in venue_id_map:
-            print(f"  ❌ Venue not found: {venue_name}")
-            sys.exit(1)
-
-        venue_id = venue_id_map[venue_name]
-        existing = supabase.table('meets').select('id').eq('athletic_net_id', athletic_net_id).execute()
-
-        if existing.data:
-            meet_id = existing.data[0]['id']
-            print(f"  ✓ {meet_name}")
-        else:
-            meet_data = {
-                'name': meet_name,
-                'athletic_net_id': athletic_net_id,
-                'venue_id': venue_id,
-                'meet_date': meet_date,
-                'season_year': season_year,
-                'result_count': 0
-            }
-            result = supabase.table('meets').insert(meet_data).execute()
-            meet_id = result.data[0]['id']
-            print(f"  + Created: {meet_name}")
-
-    print(f"  ✅ Meet ready (ID: {meet_id})")
-    return meet_id
-
-def import_races(folder, meet_id, course_id_map):
-    """Import races"""
-    print("\n🏁 STEP 5/7: Importing Races")
-    filepath = os.path.join(folder, 'races.csv')
-
-    if not os.path.exists(filepath):
-        print("  ⚠️  No races.csv found, skipping")
-        return {}
-
-    race_id_map = {}
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            race_name = row['name']
-            athletic_net_race_id = row['athletic_net_race_id']
-            course_name = row.get('course_name', '')
-
-            course_id = course_id_map.get(course_name) if course_name else None
-            existing = supabase.table('races').select('id').eq('athletic_net_id', athletic_net_race_id).execute()
-
-            if existing.data:
-                race_id_map[athletic_net_race_id] = existing.data[0]['id']
-                print(f"  ✓ {race_name}")
-            else:
-                try:
-                    race_data = {
-                        'name': race_name,
-                        'athletic_net_id': athletic_net_race_id,
-                        'meet_id': meet_id,
-                        'gender': row.get('gender'),
-                        'distance_meters': int(row['distance_meters']) if row.get('distance_meters') else None,
-                        'course_id': course_id
-                    }
-                    result = supabase.table('races').insert(race_data).execute()
-                    race_id_map[athletic_net_race_id] = result.data[0]['id']
-                    print(f"  + Created: {race_name}")
-                except Exception as e:
-                    # Race might exist from previous attempt, look it up
-                    existing2 = supabase.table('races').select('id').eq('athletic_net_id', athletic_net_race_id).execute()
-                    if existing2.data:
-                        race_id_map[athletic_net_race_id] = existing2.data[0]['id']
-                        print(f"  ✓ {race_name} (recovered)")
-                    else:
-                        print(f"  ⚠️  Skipped: {race_name} - {str(e)[:50]}")
-
-    print(f"  ✅ {len(race_id_map)} races ready")
-    return race_id_map
-
-def import_athletes_batched(folder, school_id_map):
-    """Import athletes in batches"""
-    print("\n👤 STEP 6/7: Importing Athletes")
-    filepath = os.path.join(folder, 'athletes.csv')
-
-    if not os.path.exists(filepath):
-        print("  ⚠️  No athletes.csv found, skipping")
-        return {}
-
-    row_count = count_csv_rows(filepath)
-    num_batches = math.ceil(row_count / BATCH_SIZE)
-    print(f"  Found {row_count} athletes → {num_batches} batches")
-
-    athlete_id_map = {}
-    imported = 0
-    skipped = 0
-    errors = 0
-
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        batch_num = 0
-        batch = []
-
-        for row in reader:
-            batch.append(row)
-
-            if len(batch) >= BATCH_SIZE:
-                batch_num += 1
-                print(f"  Batch {batch_num}/{num_batches}: Processing {len(batch)} athletes...")
-
-                for athlete_row in batch:
-                    school_name = athlete_row['school_name']
-
-                    if school_name not in school_id_map:
-                        errors += 1
-                        continue
-
-                    school_id = school_id_map[school_name]
-                    first_name = athlete_row.get('first_name', '')
-                    last_name = athlete_row.get('last_name', '')
-
-                    # Check if exists
-                    existing = supabase.table('athletes').select('id').eq('first_name', first_name).eq('last_name', last_name).eq('school_id', school_id).execute()
-
-                    if existing.data:
-                        athlete_id_map[f"{first_name}_{last_name}_{school_name}"] = existing.data[0]['id']
-                        skipped += 1
-                    else:
-                        try:
-                            athlete_data = {
-                                'first_name': first_name,
-                                'last_name': last_name,
-                                'school_id': school_id,
-                                'gender': athlete_row.get('gender'),
-                                'grad_year': int(athlete_row['grad_year']) if athlete_row.get('grad_year') else None
-                            }
-                            result = supabase.table('athletes').insert(athlete_data).execute()
-                            athlete_id_map[f"{first_name}_{last_name}_{school_name}"] = result.data[0]['id']
-                            imported += 1
-                        except Exception as e:
-                            # Skip duplicate slugs or other errors
-                            errors += 1
-
-                print(f"    Progress: {imported} created, {skipped} existed, {errors} skipped")
-                batch = []
-                time.sleep(0.5)
-
-        # Process remaining
-        if batch:
-            batch_num += 1
-            print(f"  Batch {batch_num}/{num_batches}: Processing {len(batch)} athletes...")
-            for athlete_row in batch:
-                school_name = athlete_row['school_name']
-
-                if school_name not in school_id_map:
-                    errors += 1
-                    continue
-
-                school_id = school_id_map[school_name]
-                first_name = athlete_row.get('first_name', '')
-                last_name = athlete_row.get('last_name', '')
-
-                existing = supabase.table('athletes').select('id').eq('first_name', first_name).eq('last_name', last_name).eq('school_id', school_id).execute()
-
-                if existing.data:
-                    athlete_id_map[f"{first_name}_{last_name}_{school_name}"] = existing.data[0]['id']
-                    skipped += 1
-                else:
-                    try:
-                        athlete_data = {
-                            'first_name': first_name,
-                            'last_name': last_name,
-                            'school_id': school_id,
-                            'gender': athlete_row.get('gender'),
-                            'grad_year': int(athlete_row['grad_year']) if athlete_row.get('grad_year') else None
-                        }
-                        result = supabase.table('athletes').insert(athlete_data).execute()
-                        athlete_id_map[f"{first_name}_{last_name}_{school_name}"] = result.data[0]['id']
-                        imported += 1
-                    except Exception as e:
-                        errors += 1
-
-    print(f"  ✅ {imported} created, {skipped} existed, {errors} skipped")
-    return athlete_id_map
-
-def import_results_batched(folder, meet_id, race_id_map, athlete_id_map, school_id_map):
-    """Import results in batches"""
-    print("\n📊 STEP 7/7: Importing Results")
-    filepath = os.path.join(folder, 'results.csv')
-
-    if not os.path.exists(filepath):
-        print("  ⚠️  No results.csv found, skipping")
-        return 0
-
-    row_count = count_csv_rows(filepath)
-    num_batches = math.ceil(row_count / BATCH_SIZE)
-    print(f"  Found {row_count} results → {num_batches} batches")
-
-    imported = 0
-    skipped = 0
-    errors = 0
-
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        batch_num = 0
-        batch = []
-
-        for row in reader:
-            batch.append(row)
-
-            if len(batch) >= BATCH_SIZE:
-                batch_num += 1
-                print(f"  Batch {batch_num}/{num_batches}: Processing {len(batch)} results...")
-
-                for result_row in batch:
-                    athletic_net_race_id = result_row['athletic_net_race_id']
-                    school_name = result_row['school_name']
-                    first_name = result_row.get('first_name', '')
-                    last_name = result_row.get('last_name', '')
-
-                    if athletic_net_race_id not in race_id_map:
-                        errors += 1
-                        continue
-
-                    if school_name not in school_id_map:
-                        errors += 1
-                        continue
-
-                    race_id = race_id_map[athletic_net_race_id]
-                    school_id = school_id_map[school_name]
-                    athlete_key = f"{first_name}_{last_name}_{school_name}"
-
-                    if athlete_key not in athlete_id_map:
-                        errors += 1
-                        continue
-
-                    athlete_id = athlete_id_map[athlete_key]
-
-                    # Check if exists
-                    existing = supabase.table('results').select('id').eq('race_id', race_id).eq('athlete_id', athlete_id).execute()
-
-                    if existing.data:
-                        skipped += 1
-                    else:
-                        try:
-                            result_data = {
-                                'meet_id': meet_id,
-                                'race_id': race_id,
-                                'athlete_id': athlete_id,
-                                'school_id': school_id,
-                                'time_in_seconds': float(result_row['time_in_seconds']) if result_row.get('time_in_seconds') else None,
-                                'place': int(result_row['place']) if result_row.get('place') else None,
-                                'grade': int(result_row['grade']) if result_row.get('grade') else None
-                            }
-                            supabase.table('results').insert(result_data).execute()
-                            imported += 1
-                        except Exception as e:
-                            errors += 1
-
-                print(f"    Progress: {imported} created, {skipped} existed, {errors} skipped")
-                batch = []
-                time.sleep(0.5)
-
-        # Process remaining
-        if batch:
-            batch_num += 1
-            print(f"  Batch {batch_num}/{num_batches}: Processing {len(batch)} results...")
-            for result_row in batch:
-                athletic_net_race_id = result_row['athletic_net_race_id']
-                school_name = result_row['school_name']
-                first_name = result_row.get('first_name', '')
-                last_name = result_row.get('last_name', '')
-
-                if athletic_net_race_id not in race_id_map:
-                    errors += 1
-                    continue
-
-                if school_name not in school_id_map:
-                    errors += 1
-                    continue
-
-                race_id = race_id_map[athletic_net_race_id]
-                school_id = school_id_map[school_name]
-                athlete_key = f"{first_name}_{last_name}_{school_name}"
-
-                if athlete_key not in athlete_id_map:
-                    errors += 1
-                    continue
-
-                athlete_id = athlete_id_map[athlete_key]
-
-                existing = supabase.table('results').select('id').eq('race_id', race_id).eq('athlete_id', athlete_id).execute()
-
-                if existing.data:
-                    skipped += 1
-                else:
-                    try:
-                        result_data = {
-                            'meet_id': meet_id,
-                            'race_id': race_id,
-                            'athlete_id': athlete_id,
-                            'school_id': school_id,
-                            'time_in_seconds': float(result_row['time_in_seconds']) if result_row.get('time_in_seconds') else None,
-                            'place': int(result_row['place']) if result_row.get('place') else None,
-                            'grade': int(result_row['grade']) if result_row.get('grade') else None
-                        }
-                        supabase.table('results').insert(result_data).execute()
-                        imported += 1
-                    except Exception as e:
-                        errors += 1
-
-    print(f"  ✅ {imported} created, {skipped} existed, {errors} skipped")
-    return imported
 
 def run_housekeeping(meet_id):
     """Update result_count for the meet"""
@@ -512,45 +243,52 @@ def run_housekeeping(meet_id):
     supabase.table('meets').update({'result_count': count}).eq('id', meet_id).execute()
     print(f"  ✅ Updated result_count to {count}")
 
+
+def _int_flag(name, default):
+    if name in sys.argv:
+        return int(sys.argv[sys.argv.index(name) + 1])
+    return default
+
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
-        print("Usage: python3 import_meet_batched.py <folder>")
+        print("Usage: python3 import_meet_batched.py <folder> [--batch-size N] [--chunk-size N] [--async [--concurrency N]]")
         print("Example: python3 import_meet_batched.py to-be-processed/meet_256230_1761716889")
+        print(f"  --batch-size N   CSV rows per lookup/insert round (default {BATCH_SIZE}, env IMPORT_BATCH_SIZE)")
+        print(f"  --chunk-size N   Rows per insert request (default {WRITE_CHUNK_SIZE}, env IMPORT_WRITE_CHUNK_SIZE)")
+        print("  --async          Concurrent requests with retries (async_postgrest.py)")
+        print("  --concurrency N  Requests in flight with --async (default 8, env IMPORT_CONCURRENCY)")
         sys.exit(1)
 
     folder = sys.argv[1]
+    batch_size = _int_flag('--batch-size', BATCH_SIZE)
+    chunk_size = _int_flag('--chunk-size', WRITE_CHUNK_SIZE)
+    use_async = '--async' in sys.argv
+    concurrency = _int_flag('--concurrency', None)
 
     print("=" * 80)
     print("BATCHED MEET IMPORT")
     print("=" * 80)
     print(f"\nFolder: {folder}")
-    print(f"Batch size: {BATCH_SIZE} rows")
+    print(f"Batch size: {batch_size} rows, insert chunks of {chunk_size}")
+    if use_async:
+        print(f"Async client, concurrency: {concurrency or 'default'}")
     print("\nImport order:")
-    print("  1. Venues (small)")
-    print("  2. Courses (small)")
-    print("  3. Schools (batched if >2000)")
-    print("  4. Meet (1 record)")
-    print("  5. Races (small)")
-    print("  6. Athletes (batched if >2000)")
-    print("  7. Results (batched if >2000)")
+    for step, (_, spec, _) in enumerate(STAGES, 1):
+        print(f"  {step}. {spec.name}")
     print()
 
     start_time = time.time()
 
-    # Import in order
-    venue_id_map = import_venues(folder)
-    course_id_map = import_courses(folder, venue_id_map)
-    school_id_map = import_schools_batched(folder)
-    meet_id = import_meet(folder, venue_id_map)
+    if use_async:
+        meet_id, all_stats = asyncio.run(import_meet_folder_async(folder, batch_size, chunk_size, concurrency))
+    else:
+        meet_id, all_stats = import_meet_folder(folder, batch_size, chunk_size)
 
     if not meet_id:
         print("\n❌ Failed to import meet")
         sys.exit(1)
 
-    race_id_map = import_races(folder, meet_id, course_id_map)
-    athlete_id_map = import_athletes_batched(folder, school_id_map)
-    result_count = import_results_batched(folder, meet_id, race_id_map, athlete_id_map, school_id_map)
-
     run_housekeeping(meet_id)
 
     elapsed = time.time() - start_time
@@ -558,6 +296,9 @@ if __name__ == '__main__':
     print("IMPORT COMPLETE")
     print("=" * 80)
     print(f"\nTotal time: {elapsed:.1f} seconds")
-    print(f"Results imported: {result_count}")
+    print("\nPer stage:")
+    for stats in all_stats:
+        print(f"  {stats.name:<9} {stats.summary()}")
+    print(f"\nResults imported: {sum(stats.created for stats in all_stats if stats.name == RESULTS.name)}")
     print("\nNext: Run batch operations to rebuild derived tables")
     print("  → http://localhost:3000/admin/batch")
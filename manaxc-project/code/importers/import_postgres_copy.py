@@ -0,0 +1,773 @@
+#!/usr/bin/env python3
+"""
+Direct PostgreSQL import of a scrape folder with COPY and staging tables.
+
+import_csv_data.py goes through the Supabase REST API. This importer
+connects to the database itself (DATABASE_URL, e.g. the Supabase
+connection string or a local Postgres) and does the whole folder in one
+transaction:
+
+    1. COPY venues.csv ... results.csv FROM STDIN into temp staging tables
+    2. validate the staged rows (same rules as import_csv_data)
+    3. per stage: resolve existing rows with one UPDATE ... FROM join,
+       insert the missing ones with INSERT ... SELECT ... ON CONFLICT DO
+       NOTHING, and resolve again to pick up the new IDs
+    4. insert results that are not duplicates (same race and time, same
+       athlete by ID, athletic_net_id or slug) in one statement
+
+Nothing is committed unless every stage succeeds, and --preview runs the
+full import and rolls it back. Matching, skipping and the import ledger
+(scrape_manifest.ImportLedger) work like import_csv_data, except that the
+ledger is kept per database (import_ledger.postgres-<host>-<port>-<db>.json),
+apart from the one of the Supabase REST importer.
+
+The target schema is read from information_schema, so the same code runs
+against production (venues table, meets.venue_id, races.course_id,
+races.athletic_net_race_id, meets.result_count) and against a local
+database built from database/01-core-tables.sql and
+02-results-migration.sql (courses.venue, meets.course_id,
+races.athletic_net_id):
+
+    DATABASE_URL=postgresql://localhost/manaxc python3 import_postgres_copy.py to-be-processed/meet_265306_1761610508
+
+Requires psycopg 3 (optional, not in requirements.txt):
+
+    pip install "psycopg[binary]"
+"""
+
+import csv
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+try:
+    import psycopg
+    from psycopg import sql
+except ImportError:  # optional dependency
+    psycopg = None
+    sql = None
+
+from scrape_manifest import ImportLedger, load_manifest, target_ledger_file
+
+# Load environment variables
+from dotenv import load_dotenv
+load_dotenv(os.path.join(os.path.dirname(__file__), '../../website/.env.local'))
+
+DATABASE_URL = os.getenv('DATABASE_URL')
+
+# Bytes per COPY write
+COPY_BLOCK_SIZE = 1024 * 1024
+
+# Columns the import reads from each file (athletic_net_scraper_v2.CSV_FIELDS).
+# Staging tables get these plus whatever else the CSV header has, so older
+# files with fewer columns still load.
+STAGE_COLUMNS = {
+    'venues': ['athletic_net_id', 'name', 'city', 'state', 'notes'],
+    'courses': ['athletic_net_id', 'name', 'venue_name', 'distance_meters', 'difficulty_rating'],
+    'schools': ['athletic_net_id', 'name', 'short_name', 'city', 'state'],
+    'athletes': ['athletic_net_id', 'name', 'first_name', 'last_name', 'school_athletic_net_id', 'grad_year', 'gender'],
+    'meets': ['athletic_net_id', 'name', 'meet_date', 'venue_name', 'season_year'],
+    'races': ['athletic_net_race_id', 'meet_athletic_net_id', 'name', 'gender', 'distance_meters', 'course_name'],
+    'results': ['athletic_net_race_id', 'athlete_name', 'athlete_school_id', 'time_cs', 'place_overall', 'grade']
+}
+
+# Database IDs filled in during the import (besides db_id)
+STAGE_LINKS = {
+    'courses': ['venue_db_id'],
+    'athletes': ['school_db_id'],
+    'meets': ['venue_db_id', 'course_db_id'],
+    'races': ['meet_db_id', 'course_db_id'],
+    'results': ['race_db_id', 'meet_db_id', 'athlete_db_id']
+}
+
+POSITIVE_INT = "'^0*[1-9][0-9]*$'"
+
+# (file, condition on a staged row, error) - the rules of import_csv_data's
+# validate_result/validate_athlete plus the NOT NULL/CHECK columns a COPY
+# import would otherwise fail on
+VALIDATION_CHECKS = [
+    ('results', "athlete_name IS NULL", "Missing athlete_name"),
+    ('results', f"COALESCE(time_cs, '') !~ {POSITIVE_INT}", "Missing or invalid time_cs (must be positive)"),
+    ('results', f"COALESCE(place_overall, '') !~ {POSITIVE_INT}", "Missing or invalid place_overall"),
+    ('results', "COALESCE(grade, '') !~ '^[0-9]+$'", "Missing or invalid grade"),
+    ('athletes', "name IS NULL", "Missing athlete name"),
+    ('athletes', "COALESCE(grad_year, '') !~ '^[0-9]+$'", "Missing or invalid grad_year"),
+    ('athletes', "gender IS NULL OR gender NOT IN ('M', 'F')", "Gender must be M or F"),
+    ('courses', f"COALESCE(distance_meters, '') !~ {POSITIVE_INT}", "Missing or invalid distance_meters"),
+    ('meets', "meet_date IS NULL", "Missing meet_date"),
+    ('meets', "COALESCE(season_year, '') !~ '^[0-9]+$'", "Missing or invalid season_year"),
+    ('races', f"COALESCE(distance_meters, '') !~ {POSITIVE_INT}", "Missing or invalid distance_meters"),
+    ('races', "gender IS NULL OR gender NOT IN ('M', 'F')", "Gender must be M or F"),
+]
+
+
+def require_psycopg():
+    if psycopg is None:
+        raise ImportError('The COPY import needs psycopg 3 (pip install "psycopg[binary]")')
+
+
+def ledger_target(dsn: str) -> str:
+    """Ledger label of the database behind `dsn` (host, port and name, no credentials)"""
+    params = psycopg.conninfo.conninfo_to_dict(dsn)
+    host = params.get('host') or params.get('hostaddr') or 'local'
+    if host.startswith('/'):
+        host = 'local'  # Unix socket directory
+    dbname = params.get('dbname') or params.get('user') or os.getenv('PGDATABASE', 'postgres')
+    return f"postgres-{host}-{params.get('port') or 5432}-{dbname}"
+
+
+# ==============================================================================
+# TARGET SCHEMA
+# ==============================================================================
+
+@dataclass
+class TargetSchema:
+    """Tables and columns of the target database"""
+    columns: Dict[str, Set[str]] = field(default_factory=dict)
+
+    def has(self, table: str, column: Optional[str] = None) -> bool:
+        if column is None:
+            return table in self.columns
+        return column in self.columns.get(table, set())
+
+    @property
+    def race_net_id_column(self) -> str:
+        """races.athletic_net_race_id in production, races.athletic_net_id in 01-core-tables.sql"""
+        return 'athletic_net_race_id' if self.has('races', 'athletic_net_race_id') else 'athletic_net_id'
+
+    def values(self, table: str, values: Dict[str, str]) -> Dict[str, str]:
+        """`values` ({column: SQL expression}) without the columns `table` does not have"""
+        return {column: expression for column, expression in values.items() if self.has(table, column)}
+
+
+def load_schema(cur) -> TargetSchema:
+    """Read the columns of the tables the import writes"""
+    cur.execute(
+        "SELECT table_name, column_name FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = ANY(%s)",
+        (['venues', 'courses', 'schools', 'athletes', 'meets', 'races', 'results'],)
+    )
+    schema = TargetSchema()
+    for table, column in cur.fetchall():
+        schema.columns.setdefault(table, set()).add(column)
+    return schema
+
+
+# ==============================================================================
+# STAGING
+# ==============================================================================
+
+def copy_to_staging(cur, folder: str, kind: str) -> int:
+    """
+    Load <kind>.csv into the temp table stage_<kind> with COPY FROM STDIN.
+
+    Every CSV column is staged as text, empty cells as NULL and values
+    trimmed. `line` keeps the file order (the first row of a key wins, like
+    in import_csv_data), db_id and the STAGE_LINKS columns are filled in
+    by the stages.
+
+    Args:
+        cur: psycopg cursor (inside the import transaction)
+        folder: Scrape folder
+        kind: 'venues' ... 'results'
+
+    Returns:
+        Number of rows staged (0 if the file does not exist)
+    """
+    path = os.path.join(folder, f'{kind}.csv')
+    header = []
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            header = next(csv.reader(f), [])
+
+    table = sql.Identifier(f'stage_{kind}')
+    columns = list(dict.fromkeys(header + STAGE_COLUMNS[kind]))
+    cur.execute(sql.SQL("CREATE TEMP TABLE {} (line bigserial, {}, {}) ON COMMIT DROP").format(
+        table,
+        sql.SQL(', ').join(sql.SQL('{} text').format(sql.Identifier(column)) for column in columns),
+        sql.SQL(', ').join(sql.SQL('{} uuid').format(sql.Identifier(column))
+                           for column in ['db_id'] + STAGE_LINKS.get(kind, []))
+    ))
+    if not header:
+        return 0
+
+    copy = sql.SQL("COPY {} ({}) FROM STDIN (FORMAT csv, HEADER true)").format(
+        table, sql.SQL(', ').join(map(sql.Identifier, header))
+    )
+    with cur.copy(copy) as stream, open(path, 'rb') as f:
+        while True:
+            block = f.read(COPY_BLOCK_SIZE)
+            if not block:
+                break
+            stream.write(block)
+
+    cur.execute(sql.SQL("UPDATE {} SET {}").format(
+        table,
+        sql.SQL(', ').join(sql.SQL("{0} = NULLIF(btrim({0}), '')").format(sql.Identifier(column)) for column in header)
+    ))
+    cur.execute(sql.SQL("ANALYZE {}").format(table))
+    return _count(cur, f'stage_{kind}')
+
+
+def _count(cur, table: str, where: str = 'TRUE', distinct: Optional[str] = None) -> int:
+    expression = f"DISTINCT ({distinct})" if distinct else '*'
+    cur.execute(f"SELECT count({expression}) FROM {table} s WHERE {where}")
+    return cur.fetchone()[0]
+
+
+def validate_staging(cur) -> List[str]:
+    """Run VALIDATION_CHECKS on the staged rows; returns one error per failing check"""
+    errors = []
+    for kind, condition, message in VALIDATION_CHECKS:
+        cur.execute(f"SELECT count(*), min(line) FROM stage_{kind} WHERE {condition}")
+        count, first_line = cur.fetchone()
+        if count:
+            errors.append(f"{kind}.csv: {message} ({count} rows, first at row {first_line})")
+    return errors
+
+
+# ==============================================================================
+# STAGES
+# ==============================================================================
+
+@dataclass
+class StageCounts:
+    """Distinct staged keys per outcome of one stage"""
+    existed: int = 0
+    created: int = 0
+    unresolved: int = 0   # Parents found, but neither matched nor inserted (e.g. a unique conflict)
+    skipped: int = 0      # Parent row missing
+
+
+def import_stage(
+    cur,
+    kind: str,
+    table: str,
+    values: Dict[str, str],
+    match: str,
+    key: str,
+    ready: str = 'TRUE'
+) -> StageCounts:
+    """
+    Match staged rows against `table`, insert the missing ones, resolve db_id.
+
+    Args:
+        cur: psycopg cursor (inside the import transaction)
+        kind: Staging table suffix ('venues' ... 'races')
+        table: Target table
+        values: {column: SQL expression over staged row s} of inserted rows
+        match: SQL condition: staged row s is the existing row t
+        key: Columns of s identifying one entity (first staged row wins)
+        ready: SQL condition: the parents of s were found
+
+    Returns:
+        StageCounts (per distinct key)
+    """
+    stage = f"stage_{kind}"
+    resolve = f"UPDATE {stage} s SET db_id = t.id FROM {table} t WHERE s.db_id IS NULL AND {ready} AND ({match})"
+    counts = StageCounts()
+
+    # Statistics with the link columns filled in, so the joins are planned as hash joins
+    cur.execute(f"ANALYZE {stage}")
+    cur.execute(resolve)
+    counts.existed = _count(cur, stage, 's.db_id IS NOT NULL', key)
+
+    cur.execute(
+        f"INSERT INTO {table} ({', '.join(values)}) "
+        f"SELECT DISTINCT ON ({key}) {', '.join(values.values())} "
+        f"FROM {stage} s WHERE s.db_id IS NULL AND {ready} "
+        f"ORDER BY {key}, s.line "
+        f"ON CONFLICT DO NOTHING"
+    )
+    counts.created = cur.rowcount
+
+    cur.execute(resolve)
+    counts.unresolved = _count(cur, stage, f's.db_id IS NULL AND {ready}', key)
+    counts.skipped = _count(cur, stage, f'NOT ({ready})', key)
+    return counts
+
+
+def _print_stage(counts: StageCounts, noun: str, skip_reason: str = 'parent not found'):
+    print(f"  ✅ {counts.created} created, {counts.existed} existed")
+    if counts.skipped:
+        print(f"  ⚠️  {counts.skipped} {noun} skipped - {skip_reason}")
+    if counts.unresolved:
+        print(f"  ⚠️  {counts.unresolved} {noun} not created - conflict with an existing row")
+
+
+def import_venues(cur, schema: TargetSchema, stats: Dict):
+    print("\n📍 Stage 1/7: Importing Venues")
+    if not schema.has('venues'):
+        print("  ⏭️  No venues table - venue names are kept on courses")
+        return
+    counts = import_stage(
+        cur, 'venues', 'venues',
+        schema.values('venues', {
+            'name': 's.name',
+            'city': "COALESCE(s.city, '')",
+            'state': "COALESCE(s.state, '')",
+            'athletic_net_id': 's.athletic_net_id',
+            'notes': "COALESCE(s.notes, '')"
+        }),
+        match="(s.athletic_net_id IS NOT NULL AND t.athletic_net_id = s.athletic_net_id) "
+              "OR (s.athletic_net_id IS NULL AND t.name = s.name)",
+        key='s.name',
+        ready='s.name IS NOT NULL'
+    )
+    stats['venues_created'] = counts.created
+    _print_stage(counts, 'venues', 'no name')
+
+
+def import_courses(cur, schema: TargetSchema, stats: Dict):
+    print("\n🏃 Stage 2/7: Importing Courses")
+    ready = 'TRUE'
+    by_name = 't.name = s.name'
+    if schema.has('venues'):
+        cur.execute(
+            "UPDATE stage_courses c SET venue_db_id = v.db_id FROM stage_venues v "
+            "WHERE v.name = c.venue_name AND v.db_id IS NOT NULL"
+        )
+        ready = 's.venue_db_id IS NOT NULL'
+    if schema.has('courses', 'venue_id'):
+        by_name += ' AND t.venue_id = s.venue_db_id'
+    elif schema.has('courses', 'venue'):
+        by_name += ' AND t.venue IS NOT DISTINCT FROM s.venue_name'
+
+    counts = import_stage(
+        cur, 'courses', 'courses',
+        schema.values('courses', {
+            'name': 's.name',
+            'venue_id': 's.venue_db_id',
+            'venue': 's.venue_name',
+            'distance_meters': 's.distance_meters::int',
+            'difficulty_rating': "COALESCE(s.difficulty_rating, '5.0')::numeric",
+            'athletic_net_id': 's.athletic_net_id'
+        }),
+        match=f"(s.athletic_net_id IS NOT NULL AND t.athletic_net_id = s.athletic_net_id) "
+              f"OR (s.athletic_net_id IS NULL AND {by_name})",
+        key='s.name',
+        ready=ready
+    )
+    stats['courses_created'] = counts.created
+    _print_stage(counts, 'courses', 'venue not found')
+
+
+def import_schools(cur, schema: TargetSchema, stats: Dict):
+    print("\n🏫 Stage 3/7: Importing Schools")
+    counts = import_stage(
+        cur, 'schools', 'schools',
+        schema.values('schools', {
+            'name': 's.name',
+            'short_name': 'COALESCE(s.short_name, s.name)',
+            'city': "COALESCE(s.city, '')",
+            'state': "COALESCE(s.state, '')",
+            'athletic_net_id': 's.athletic_net_id'
+        }),
+        match="(s.athletic_net_id IS NOT NULL AND t.athletic_net_id = s.athletic_net_id) "
+              "OR (s.athletic_net_id IS NULL AND t.name = s.name)",
+        key='s.athletic_net_id, s.name',
+        ready='s.name IS NOT NULL'
+    )
+    stats['schools_created'] = counts.created
+    _print_stage(counts, 'schools', 'no name')
+
+
+def import_athletes(cur, schema: TargetSchema, stats: Dict):
+    print("\n👥 Stage 4/7: Importing Athletes")
+    cur.execute(
+        "UPDATE stage_athletes a SET school_db_id = s.db_id FROM stage_schools s "
+        "WHERE s.athletic_net_id = a.school_athletic_net_id AND s.db_id IS NOT NULL"
+    )
+    counts = import_stage(
+        cur, 'athletes', 'athletes',
+        schema.values('athletes', {
+            'name': 's.name',
+            'first_name': 's.first_name',
+            'last_name': 's.last_name',
+            'school_id': 's.school_db_id',
+            'grad_year': 's.grad_year::int',
+            'gender': 's.gender',
+            'athletic_net_id': 's.athletic_net_id'
+        }),
+        # Matched on first_name+last_name+school like import_csv_data
+        match="t.school_id = s.school_db_id "
+              "AND COALESCE(t.first_name, '') = COALESCE(s.first_name, '') "
+              "AND COALESCE(t.last_name, '') = COALESCE(s.last_name, '')",
+        key='s.first_name, s.last_name, s.school_db_id',
+        ready='s.school_db_id IS NOT NULL'
+    )
+    stats['athletes_created'] = counts.created
+    _print_stage(counts, 'athletes', 'school not found')
+
+
+def import_meets(cur, schema: TargetSchema, stats: Dict):
+    print("\n🏁 Stage 5/7: Importing Meets")
+    ready = 'TRUE'
+    if schema.has('venues'):
+        # Meets are at venues, falling back to 'Unknown Venue'
+        cur.execute(
+            "UPDATE stage_meets m SET venue_db_id = COALESCE("
+            "(SELECT v.db_id FROM stage_venues v WHERE v.name = m.venue_name AND v.db_id IS NOT NULL LIMIT 1), "
+            "(SELECT v.db_id FROM stage_venues v WHERE v.name = 'Unknown Venue' AND v.db_id IS NOT NULL LIMIT 1), "
+            "(SELECT v.id FROM venues v WHERE v.name = 'Unknown Venue' LIMIT 1))"
+        )
+    if schema.has('meets', 'venue_id'):
+        ready = 's.venue_db_id IS NOT NULL'
+    if schema.has('meets', 'course_id'):
+        # Schemas without meets.venue_id hang meets on the first course at their venue
+        cur.execute(
+            "UPDATE stage_meets m SET course_db_id = ("
+            "SELECT c.db_id FROM stage_courses c WHERE c.venue_name = m.venue_name AND c.db_id IS NOT NULL "
+            "ORDER BY c.line LIMIT 1)"
+        )
+
+    counts = import_stage(
+        cur, 'meets', 'meets',
+        schema.values('meets', {
+            'name': 's.name',
+            'meet_date': 's.meet_date::date',
+            'venue_id': 's.venue_db_id',
+            'course_id': 's.course_db_id',
+            'season_year': 's.season_year::int',
+            'athletic_net_id': 's.athletic_net_id'
+        }),
+        match="(s.athletic_net_id IS NOT NULL AND t.athletic_net_id = s.athletic_net_id) "
+              "OR (s.athletic_net_id IS NULL AND t.name = s.name AND t.meet_date = s.meet_date::date)",
+        key='s.athletic_net_id, s.name, s.meet_date',
+        ready=ready
+    )
+    stats['meets_created'] = counts.created
+    _print_stage(counts, 'meets', 'no venue available')
+
+
+def import_races(cur, schema: TargetSchema, stats: Dict):
+    print("\n🏃‍♂️ Stage 6/7: Importing Races")
+    race_net_id = schema.race_net_id_column
+    cur.execute(
+        "UPDATE stage_races r SET meet_db_id = m.db_id FROM stage_meets m "
+        "WHERE m.athletic_net_id IS NOT DISTINCT FROM r.meet_athletic_net_id AND m.db_id IS NOT NULL"
+    )
+    ready = 's.meet_db_id IS NOT NULL'
+    if schema.has('races', 'course_id'):
+        # Course by course_name, or the first course (older CSVs have no course_name)
+        cur.execute(
+            "UPDATE stage_races r SET course_db_id = COALESCE("
+            "(SELECT c.db_id FROM stage_courses c WHERE c.name = r.course_name AND c.db_id IS NOT NULL LIMIT 1), "
+            "(SELECT c.db_id FROM stage_courses c WHERE c.db_id IS NOT NULL ORDER BY c.line LIMIT 1))"
+        )
+        ready += ' AND s.course_db_id IS NOT NULL'
+
+    counts = import_stage(
+        cur, 'races', 'races',
+        schema.values('races', {
+            'meet_id': 's.meet_db_id',
+            'course_id': 's.course_db_id',
+            'name': 's.name',
+            'gender': 's.gender',
+            'distance_meters': 's.distance_meters::int',
+            race_net_id: 's.athletic_net_race_id'
+        }),
+        match=f"(s.athletic_net_race_id IS NOT NULL AND t.{race_net_id} = s.athletic_net_race_id) "
+              f"OR (s.athletic_net_race_id IS NULL AND t.meet_id = s.meet_db_id "
+              f"AND t.name = s.name AND t.gender = s.gender)",
+        key='s.athletic_net_race_id, s.meet_db_id, s.name, s.gender',
+        ready=ready
+    )
+    stats['races_created'] = counts.created
+    # UNIQUE(meet_id, name, gender) in the races table
+    _print_stage(counts, 'races', 'meet or course not found')
+    if counts.unresolved:
+        print(f"      (same meet/name/gender exists under another {race_net_id})")
+
+
+def replace_changed_races(cur, changed_races: List[str], stats: Dict):
+    """Delete the old results of races a delta folder lists as changed"""
+    print(f"\n♻️  Replacing results of {len(changed_races)} changed races")
+    cur.execute(
+        "SELECT array_agg(DISTINCT db_id) FROM stage_races "
+        "WHERE athletic_net_race_id = ANY(%s) AND db_id IS NOT NULL",
+        (changed_races,)
+    )
+    race_db_ids = cur.fetchone()[0] or []
+    if race_db_ids:
+        cur.execute("DELETE FROM results WHERE race_id = ANY(%s)", (race_db_ids,))
+    stats['races_replaced'] = len(race_db_ids)
+    print(f"  ✅ Cleared old results for {stats['races_replaced']} races")
+
+
+def import_results(cur, schema: TargetSchema, stats: Dict):
+    print("\n📊 Stage 7/7: Importing Results")
+    cur.execute(
+        "UPDATE stage_results r SET race_db_id = t.id, meet_db_id = t.meet_id "
+        "FROM stage_races s JOIN races t ON t.id = s.db_id "
+        "WHERE s.athletic_net_race_id = r.athletic_net_race_id"
+    )
+    cur.execute(
+        "UPDATE stage_results r SET athlete_db_id = a.db_id FROM stage_athletes a "
+        "WHERE a.name = r.athlete_name AND a.school_athletic_net_id = r.athlete_school_id AND a.db_id IS NOT NULL"
+    )
+    stats['skipped_missing_race'] = _count(cur, 'stage_results', 's.race_db_id IS NULL')
+    stats['skipped_missing_athlete'] = _count(cur, 'stage_results', 's.race_db_id IS NOT NULL AND s.athlete_db_id IS NULL')
+    candidates = _count(cur, 'stage_results', 's.race_db_id IS NOT NULL AND s.athlete_db_id IS NOT NULL')
+    cur.execute("ANALYZE stage_results")
+
+    # DUPLICATE CHECK - an existing result in the race with the same time is
+    # the same result if it is the same athlete: same ID, else same
+    # athletic_net_id when both have one, else same slug when both have one.
+    # The subquery sees the results from before this statement, like
+    # result_index.RaceResultIndex; other unique conflicts are skipped too.
+    values = schema.values('results', {
+        'athlete_id': 'r.athlete_db_id',
+        'meet_id': 'r.meet_db_id',
+        'race_id': 'r.race_db_id',
+        'time_cs': 'r.time_cs::int',
+        'place_overall': 'r.place_overall::int',
+        'is_legacy_data': 'TRUE',
+        'data_source': "'athletic_net'"
+    })
+    cur.execute(f"""
+        INSERT INTO results ({', '.join(values)})
+        SELECT {', '.join(values.values())}
+        FROM stage_results r
+        JOIN athletes incoming ON incoming.id = r.athlete_db_id
+        WHERE r.race_db_id IS NOT NULL
+          AND NOT EXISTS (
+            SELECT 1 FROM results e JOIN athletes existing ON existing.id = e.athlete_id
+            WHERE e.race_id = r.race_db_id AND e.time_cs = r.time_cs::int
+              AND (e.athlete_id = r.athlete_db_id OR CASE
+                WHEN NULLIF(incoming.athletic_net_id, '') IS NOT NULL AND NULLIF(existing.athletic_net_id, '') IS NOT NULL
+                  THEN incoming.athletic_net_id = existing.athletic_net_id
+                WHEN NULLIF(incoming.slug, '') IS NOT NULL AND NULLIF(existing.slug, '') IS NOT NULL
+                  THEN incoming.slug = existing.slug
+                ELSE FALSE END)
+          )
+        ORDER BY r.line
+        ON CONFLICT DO NOTHING
+    """)
+    stats['results_inserted'] = cur.rowcount
+    stats['skipped_already_exists'] = candidates - cur.rowcount
+    stats['skipped_results'] = (
+        stats['skipped_missing_race'] + stats['skipped_missing_athlete'] + stats['skipped_already_exists']
+    )
+
+    print(f"  ✅ Inserted {stats['results_inserted']} total results")
+    if stats['skipped_results'] > 0:
+        print(f"  ⚠️  Skipped {stats['skipped_results']} results:")
+        if stats['skipped_already_exists'] > 0:
+            print(f"      - {stats['skipped_already_exists']} already exist")
+        if stats['skipped_missing_athlete'] > 0:
+            print(f"      - {stats['skipped_missing_athlete']} missing athlete")
+        if stats['skipped_missing_race'] > 0:
+            print(f"      - {stats['skipped_missing_race']} missing race")
+
+
+def update_result_counts(cur):
+    """Recount results of the folder's meets (triggers are disabled during bulk imports)"""
+    print("\n🔢 Updating meet result counts...")
+    cur.execute(
+        "UPDATE meets m SET result_count = (SELECT count(*) FROM results r WHERE r.meet_id = m.id) "
+        "WHERE m.id IN (SELECT t.meet_id FROM stage_races s JOIN races t ON t.id = s.db_id)"
+    )
+    print(f"  ✅ Updated result_count of {cur.rowcount} meets")
+
+
+# ==============================================================================
+# IMPORT
+# ==============================================================================
+
+def import_folder_copy(
+    folder_path: str,
+    dsn: Optional[str] = None,
+    preview_only: bool = False,
+    force: bool = False
+) -> Dict:
+    """
+    Import a scrape folder straight into Postgres in one transaction.
+
+    Args:
+        folder_path: Path to folder with CSV files
+        dsn: Connection string (default DATABASE_URL)
+        preview_only: Run the whole import, then roll it back
+        force: Import even if the ledger says the content already landed
+
+    Returns:
+        Import statistics (same keys as import_csv_data.import_csv_folder)
+    """
+    require_psycopg()
+    dsn = dsn or DATABASE_URL
+    if not dsn:
+        raise ValueError("No database: set DATABASE_URL or pass --dsn")
+
+    print(f"\n📥 {'Previewing' if preview_only else 'Importing'} data from {folder_path} (COPY)")
+    print("=" * 60)
+
+    stats = {
+        'venues_created': 0,
+        'courses_created': 0,
+        'schools_created': 0,
+        'athletes_created': 0,
+        'meets_created': 0,
+        'races_created': 0,
+        'races_replaced': 0,
+        'results_inserted': 0,
+        'validation_errors': [],
+        'skipped_results': 0,
+        'skipped_already_exists': 0,
+        'skipped_missing_athlete': 0,
+        'skipped_missing_race': 0,
+        'skipped_unchanged_results': 0,
+        'already_imported': False
+    }
+
+    # Content hashes vs. what already landed (scrape_manifest)
+    manifest = load_manifest(folder_path)
+    ledger = ImportLedger(target_ledger_file(ledger_target(dsn)))
+    unchanged_races = set()
+    if not force:
+        previous_import = ledger.folder_imported(manifest)
+        if previous_import:
+            print(f"\n⏭️  Identical folder already imported ({previous_import['folder']} at "
+                  f"{previous_import['imported_at']}) - nothing to do (use --force to re-import)")
+            stats['already_imported'] = True
+            return stats
+        unchanged_races = ledger.unchanged_races(manifest)
+
+    metadata = {}
+    metadata_file = os.path.join(folder_path, 'metadata.json')
+    if os.path.exists(metadata_file):
+        with open(metadata_file, 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+
+    start_time = time.time()
+    with psycopg.connect(dsn) as conn, conn.cursor() as cur:
+        schema = load_schema(cur)
+
+        print("\n📋 Copying CSV files into staging tables...")
+        for kind in STAGE_COLUMNS:
+            rows = copy_to_staging(cur, folder_path, kind)
+            print(f"  {kind}.csv: {rows} rows")
+
+        errors = validate_staging(cur)
+        stats['validation_errors'] = errors
+        print("\n📊 Validation Summary:")
+        print(f"  Errors: {len(errors)}")
+        if errors:
+            print("\n❌ Validation Errors:")
+            for error in errors:
+                print(f"  - {error}")
+            print("\n❌ Cannot import - fix validation errors first")
+            conn.rollback()
+            return stats
+
+        if unchanged_races:
+            print(f"\n⏭️  {len(unchanged_races)} of {len(manifest['races'])} races already imported "
+                  f"with identical results, skipping them")
+            cur.execute("DELETE FROM stage_races WHERE athletic_net_race_id = ANY(%s)", (list(unchanged_races),))
+            cur.execute("DELETE FROM stage_results WHERE athletic_net_race_id = ANY(%s)", (list(unchanged_races),))
+            stats['skipped_unchanged_results'] = cur.rowcount
+            # Athletes only running in skipped races need no lookup
+            cur.execute(
+                "DELETE FROM stage_athletes a WHERE NOT EXISTS ("
+                "SELECT 1 FROM stage_results r WHERE r.athlete_name = a.name "
+                "AND r.athlete_school_id = a.school_athletic_net_id)"
+            )
+
+        import_venues(cur, schema, stats)
+        import_courses(cur, schema, stats)
+        import_schools(cur, schema, stats)
+        import_athletes(cur, schema, stats)
+        import_meets(cur, schema, stats)
+        import_races(cur, schema, stats)
+
+        # Delta folders (athletic_net_scraper_v2.py meet --since) list races whose
+        # results were corrected on Athletic.net
+        changed_races = metadata.get('delta', {}).get('changed_races', [])
+        if changed_races:
+            replace_changed_races(cur, changed_races, stats)
+
+        import_results(cur, schema, stats)
+        if stats['skipped_unchanged_results'] > 0:
+            print(f"  ⏭️  {stats['skipped_unchanged_results']} results of unchanged races not re-imported")
+
+        if schema.has('meets', 'result_count') and (stats['results_inserted'] > 0 or stats['races_replaced'] > 0):
+            update_result_counts(cur)
+
+        # Races with results that did not land are not recorded in the ledger
+        cur.execute(
+            "SELECT DISTINCT athletic_net_race_id FROM stage_results "
+            "WHERE race_db_id IS NULL OR athlete_db_id IS NULL"
+        )
+        failed_race_ids = {row[0] for row in cur.fetchall()}
+        cur.execute("SELECT DISTINCT athletic_net_race_id FROM stage_races WHERE db_id IS NOT NULL")
+        imported_races = {row[0] for row in cur.fetchall()}
+
+        if preview_only:
+            conn.rollback()
+            print("\n✅ Preview complete - transaction rolled back, no data imported")
+            return stats
+        conn.commit()
+
+    # ========== RECORD IN IMPORT LEDGER ==========
+    failed_race_ids |= set(manifest['races']) - unchanged_races - imported_races
+    if failed_race_ids:
+        ledger.record(manifest, folder_path, [race_id for race_id in imported_races if race_id not in failed_race_ids])
+    else:
+        ledger.record(manifest, folder_path)
+
+    print(f"\n{'=' * 60}")
+    print(f"✅ Import complete! ({time.time() - start_time:.1f}s, one transaction)")
+    print("\n📊 Summary:")
+    print(f"  Venues: {stats['venues_created']}")
+    print(f"  Courses: {stats['courses_created']}")
+    print(f"  Schools: {stats['schools_created']}")
+    print(f"  Athletes: {stats['athletes_created']}")
+    print(f"  Meets: {stats['meets_created']}")
+    print(f"  Races: {stats['races_created']}")
+    if stats['races_replaced']:
+        print(f"  Races replaced (delta): {stats['races_replaced']}")
+    print(f"  Results: {stats['results_inserted']}")
+
+    return stats
+
+
+# ==============================================================================
+# CLI INTERFACE
+# ==============================================================================
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  python import_postgres_copy.py <folder_path> [--dsn URL] [--preview] [--force]")
+        print("\nExample:")
+        print("  python import_postgres_copy.py to-be-processed/meet_265306_1761610508")
+        print("  python import_postgres_copy.py to-be-processed/meet_265306_1761610508 --preview")
+        print("\n  --dsn URL   Postgres connection string (default: DATABASE_URL)")
+        print("  --preview   Run the import and roll it back")
+        print("  --force     Re-import content the import ledger says already landed")
+        sys.exit(1)
+
+    folder_path = sys.argv[1]
+    dsn = sys.argv[sys.argv.index('--dsn') + 1] if '--dsn' in sys.argv else None
+    preview_only = '--preview' in sys.argv
+    force = '--force' in sys.argv
+
+    if not os.path.exists(folder_path):
+        print(f"❌ Error: Folder not found: {folder_path}")
+        sys.exit(1)
+
+    try:
+        require_psycopg()
+        stats = import_folder_copy(folder_path, dsn=dsn, preview_only=preview_only, force=force)
+    except (ImportError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    except psycopg.Error as e:
+        # The connection context rolled the transaction back
+        print(f"\n❌ Import failed, nothing was written: {e}")
+        sys.exit(1)
+
+    if stats['validation_errors']:
+        sys.exit(1)
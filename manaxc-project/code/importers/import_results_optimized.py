@@ -6,30 +6,35 @@ Tries to insert results directly, catches FK violations, then imports only missi
 
 import os
 import sys
-import csv
+from contextlib import ExitStack
 from dotenv import load_dotenv
 from supabase import create_client
 from datetime import datetime
 
+from mapped_csv import MappedCsv
+
 load_dotenv('.env')
 supabase = create_client(os.getenv('NEXT_PUBLIC_SUPABASE_URL'), os.getenv('NEXT_PUBLIC_SUPABASE_ANON_KEY'))
 
-def load_csv_to_dict(filepath):
-    """Load CSV into list of dicts"""
-    with open(filepath, 'r') as f:
-        return list(csv.DictReader(f))
+def load_csv_to_dict(filepath, open_files):
+    """Open a CSV lazily as a sequence of row dicts (memory-mapped, see mapped_csv), closed with `open_files`"""
+    return open_files.enter_context(MappedCsv(filepath))
 
 def main(import_dir):
+    with ExitStack() as open_files:
+        import_folder(import_dir, open_files)
+
+def import_folder(import_dir, open_files):
     print(f"📥 Optimized import from {import_dir}")
     print("="*60)
 
     # Load CSVs
     print("📂 Loading CSV files...")
-    meets = load_csv_to_dict(f"{import_dir}/meets.csv")
-    races = load_csv_to_dict(f"{import_dir}/races.csv")
-    results = load_csv_to_dict(f"{import_dir}/results.csv")
-    athletes_csv = load_csv_to_dict(f"{import_dir}/athletes.csv")
-    schools = load_csv_to_dict(f"{import_dir}/schools.csv")
+    meets = load_csv_to_dict(f"{import_dir}/meets.csv", open_files)
+    races = load_csv_to_dict(f"{import_dir}/races.csv", open_files)
+    results = load_csv_to_dict(f"{import_dir}/results.csv", open_files)
+    athletes_csv = load_csv_to_dict(f"{import_dir}/athletes.csv", open_files)
+    schools = load_csv_to_dict(f"{import_dir}/schools.csv", open_files)
 
     print(f"  {len(results)} results to import")
     print(f"  {len(athletes_csv)} athletes in CSV")
@@ -112,12 +117,12 @@ def main(import_dir):
     result_batch = []
     failed_results = []
 
+    athlete_name_by_net_id = {}
+    for a in athletes_csv:
+        athlete_name_by_net_id.setdefault(a['athletic_net_id'], a['name'])
+
     for idx, r in enumerate(results):
-        athlete_name = None
-        for a in athletes_csv:
-            if a['athletic_net_id'] == r['athlete_athletic_net_id']:
-                athlete_name = a['name']
-                break
+        athlete_name = athlete_name_by_net_id.get(r['athlete_athletic_net_id'])
 
         if not athlete_name:
             print(f"  ⚠️  Skipping result {idx}: Can't find athlete {r['athlete_athletic_net_id']}")
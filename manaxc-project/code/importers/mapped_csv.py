@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Lazy, memory-mapped reader for scrape folder CSV files.
+
+list(csv.DictReader(f)) keeps every row of a file alive as a dict of
+strings. MappedCsv memory-maps the file instead and indexes where each
+row starts (one pass, quoted newlines handled). Rows are only decoded
+when they are read, in batches or by position:
+
+    with MappedCsv('results.csv', SCRAPE_COLUMN_TYPES['results']) as results:
+        len(results)                  # from the index, no parsing
+        results[1500]                 # one row, typed: {'time_cs': 90550, 'grade': 12, ...}
+        for batch in results.batches(2000):
+            ...
+
+A MappedCsv is a read-only sequence, so it can stand in for the lists
+the importers used to build (len(), iteration, indexing, slicing). Each
+pass decodes rows again instead of keeping them.
+"""
+
+import csv
+import io
+import mmap
+import os
+from array import array
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+
+# Rows decoded per read when iterating
+BATCH_ROWS = 1000
+
+
+def _to_bool(value: str) -> bool:
+    return value == 'True'
+
+
+# Typed columns of the scraper's CSV files (athletic_net_scraper_v2.CSV_FIELDS);
+# other columns stay strings. Empty cells of typed columns read as None.
+SCRAPE_COLUMN_TYPES: Dict[str, Dict[str, Callable[[str], object]]] = {
+    'venues': {},
+    'courses': {
+        'distance_meters': int, 'difficulty_rating': float,
+        'needs_review': _to_bool, 'needs_records_scraping': _to_bool
+    },
+    'schools': {},
+    'athletes': {'grad_year': int, 'needs_review': _to_bool, 'fuzzy_match_score': float},
+    'meets': {'season_year': int},
+    'races': {'distance_meters': int},
+    'results': {'time_cs': int, 'place_overall': int, 'grade': int, 'needs_review': _to_bool}
+}
+
+
+def _row_offsets(data, start: int) -> array:
+    """Byte offset of every row start from `start`, plus the end offset"""
+    offsets = array('Q')
+    end = len(data)
+    pos = start
+    row_start = start
+    in_quotes = False
+
+    while pos < end:
+        newline = data.find(b'\n', pos)
+        line_end = end if newline == -1 else newline + 1
+        # A newline inside a quoted field continues the row
+        if data.find(b'"', pos, line_end) != -1 and data[pos:line_end].count(b'"') % 2:
+            in_quotes = not in_quotes
+        if not in_quotes:
+            # Skip blank lines like csv.DictReader does
+            if data[row_start:line_end].strip(b'\r\n'):
+                offsets.append(row_start)
+            row_start = line_end
+        pos = line_end
+
+    offsets.append(end)
+    return offsets
+
+
+class MappedCsv(Sequence):
+    """Memory-mapped CSV file with a row-offset index (rows are dicts)"""
+
+    def __init__(self, path: str, types: Optional[Dict[str, Callable[[str], object]]] = None):
+        """
+        Args:
+            path: CSV file with a header row
+            types: Column -> converter for typed columns (e.g. SCRAPE_COLUMN_TYPES['results'])
+        """
+        self.path = path
+        self.types = types or {}
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap cannot map an empty file
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+        header_end = self._data.find(b'\n')
+        header_end = len(self._data) if header_end == -1 else header_end + 1
+        header_line = bytes(self._data[:header_end]).decode('utf-8-sig')
+        self.header: List[str] = next(csv.reader([header_line]), [])
+        self._offsets = _row_offsets(self._data, header_end)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _decode(self, first: int, stop: int) -> List[Dict]:
+        if first >= stop:
+            return []
+        text = bytes(self._data[self._offsets[first]:self._offsets[stop]]).decode('utf-8')
+        rows = []
+        for values in csv.reader(io.StringIO(text, newline='')):
+            # Blank lines sit inside the previous row's byte range
+            if not values:
+                continue
+            row = dict(zip(self.header, values))
+            for column, convert in self.types.items():
+                value = row.get(column)
+                if value is not None:
+                    row[column] = convert(value) if value != '' else None
+            rows.append(row)
+        return rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self._decode(start, stop)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"row {index} out of range ({len(self)} rows in {self.path})")
+        return self._decode(index, index + 1)[0]
+
+    def batches(self, batch_size: int = BATCH_ROWS, start: int = 0) -> Iterator[List[Dict]]:
+        """
+        Yield the rows in lists of up to `batch_size`.
+
+        Args:
+            batch_size: Rows per batch
+            start: Row to start at (random access, e.g. to resume)
+        """
+        for first in range(start, len(self), batch_size):
+            yield self._decode(first, min(first + batch_size, len(self)))
+
+    def __iter__(self) -> Iterator[Dict]:
+        for batch in self.batches():
+            yield from batch
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MappedCsv':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def count_rows(path: str) -> int:
+    """Number of data rows in a CSV file (quoted newlines are not row breaks)"""
+    with MappedCsv(path) as rows:
+        return len(rows)
+
+
+def open_scrape_folder(folder_path: str, typed: bool = True) -> Dict[str, MappedCsv]:
+    """
+    Open the CSV files of a scrape folder lazily.
+
+    Args:
+        folder_path: Folder written by write_csv_files / CsvSink
+        typed: Convert numeric and flag columns (SCRAPE_COLUMN_TYPES)
+
+    Returns:
+        Dict of kind ('venues', ..., 'results') -> MappedCsv, for the files that
+        exist; the caller closes them (e.g. ExitStack.enter_context)
+    """
+    files = {}
+    for kind, types in SCRAPE_COLUMN_TYPES.items():
+        path = os.path.join(folder_path, f"{kind}.csv")
+        if os.path.exists(path):
+            files[kind] = MappedCsv(path, types if typed else None)
+    return files
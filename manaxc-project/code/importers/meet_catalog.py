@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Season meet catalog: crawl many schools' schedules and track new meets.
+
+Loads each school's season page concurrently (get_school_meets over a
+shared DriverPool), unions the meet IDs and merges them into
+meet_catalog.json, a de-duplicated catalog that records which schools ran
+each meet and when it was first and last seen. Meets not in the catalog
+before are reported and written as a meet_ids_to_import.json-style file,
+ready for batch_scrape.py:
+
+    python meet_catalog.py crawl 2025 1076 1077 1081 [--workers N]
+    python meet_catalog.py crawl 2025 --known-schools      # every school in the school ID cache
+    python batch_scrape.py run new_meets_2025_<ts>.json
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from athletic_net_scraper_v2 import create_driver, get_school_meets
+from driver_pool import DriverPool
+
+
+# Catalog file; override with MEET_CATALOG_FILE
+MEET_CATALOG_FILE = os.getenv(
+    'MEET_CATALOG_FILE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'meet_catalog.json')
+)
+
+
+# ==============================================================================
+# CRAWLER
+# ==============================================================================
+
+def crawl_season_meets(
+    school_ids: List[str],
+    season: int,
+    workers: int = 4,
+    progress_callback: Optional[Callable[[str], None]] = None
+) -> Dict[str, Dict]:
+    """
+    Fetch the season meet lists of many schools concurrently and union them.
+
+    Args:
+        school_ids: Athletic.net school IDs
+        season: Season year
+        workers: Schools loaded concurrently (one driver each)
+        progress_callback: Optional callback for progress updates
+
+    Returns:
+        Dict of meet ID -> {'athletic_net_id', 'name', 'url', 'season_year', 'school_ids'}
+    """
+    meets: Dict[str, Dict] = {}
+
+    with DriverPool(create_driver, size=workers) as pool:
+        def crawl(school_id: str) -> List[Dict]:
+            try:
+                return get_school_meets(school_id, [season], pool=pool)
+            except Exception as e:
+                if progress_callback:
+                    progress_callback(f"WARNING: Could not load meets for school {school_id}: {e}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for idx, (school_id, school_meets) in enumerate(zip(school_ids, executor.map(crawl, school_ids)), 1):
+                for meet in school_meets:
+                    entry = meets.setdefault(meet['athletic_net_id'], {
+                        'athletic_net_id': meet['athletic_net_id'],
+                        'name': meet['name'],
+                        'url': meet['url'],
+                        'season_year': season,
+                        'school_ids': []
+                    })
+                    entry['school_ids'].append(school_id)
+                if progress_callback:
+                    progress_callback(f"School {idx}/{len(school_ids)} ({school_id}): "
+                                      f"{len(school_meets)} meets, {len(meets)} unique so far")
+
+    return meets
+
+
+# ==============================================================================
+# CATALOG
+# ==============================================================================
+
+class MeetCatalog:
+    """De-duplicated meet catalog with first/last-seen timestamps, kept in a JSON file"""
+
+    def __init__(self, path: str = MEET_CATALOG_FILE):
+        self.path = path
+        self.meets: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.meets = json.load(f)
+
+    def merge(self, crawled: Dict[str, Dict], seen_at: Optional[str] = None) -> List[Dict]:
+        """
+        Merge a crawl into the catalog.
+
+        Known meets get their last_seen updated and any new schools added;
+        unknown meets are added with first_seen = last_seen = seen_at.
+
+        Args:
+            crawled: Result of crawl_season_meets
+            seen_at: ISO timestamp of the crawl (default now)
+
+        Returns:
+            The meets that were not in the catalog before
+        """
+        seen_at = seen_at or datetime.now().isoformat()
+        new_meets = []
+
+        for meet_id, meet in crawled.items():
+            entry = self.meets.get(meet_id)
+            if entry is None:
+                entry = dict(meet, school_ids=sorted(set(meet['school_ids'])), first_seen=seen_at)
+                self.meets[meet_id] = entry
+                new_meets.append(entry)
+            else:
+                entry['school_ids'] = sorted(set(entry['school_ids']) | set(meet['school_ids']))
+                if meet['name'] and meet['name'] != 'Unknown Meet':
+                    entry['name'] = meet['name']
+            entry['last_seen'] = seen_at
+
+        return new_meets
+
+    def save(self):
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp-{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.meets, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+# ==============================================================================
+# CLI INTERFACE
+# ==============================================================================
+
+if __name__ == "__main__":
+    workers = 4
+    if '--workers' in sys.argv:
+        flag_index = sys.argv.index('--workers')
+        workers = int(sys.argv[flag_index + 1])
+        del sys.argv[flag_index:flag_index + 2]
+
+    known_schools = '--known-schools' in sys.argv
+    if known_schools:
+        sys.argv.remove('--known-schools')
+
+    if len(sys.argv) < 3 or sys.argv[1] != 'crawl' or (len(sys.argv) < 4 and not known_schools):
+        print("Usage:")
+        print("  python meet_catalog.py crawl <season_year> <school_id> [<school_id> ...] [--workers N]")
+        print("  python meet_catalog.py crawl <season_year> --known-schools [--workers N]")
+        sys.exit(1)
+
+    season = int(sys.argv[2])
+    school_ids = sys.argv[3:]
+    if known_schools:
+        from school_id_cache import SchoolIdCache
+        id_cache = SchoolIdCache()
+        known = list(id_cache.manual.values()) + [
+            entry['school_id'] for entry in id_cache.entries.values() if entry['school_id']
+        ]
+        school_ids = list(dict.fromkeys(school_ids + known))
+
+    print(f"\n🗂️  Crawling {season} meet lists for {len(school_ids)} schools ({workers} workers)")
+    print("=" * 60)
+
+    start = time.time()
+    crawled = crawl_season_meets(school_ids, season, workers, lambda msg: print(f"[PROGRESS] {msg}"))
+
+    catalog = MeetCatalog()
+    new_meets = catalog.merge(crawled)
+    catalog.save()
+
+    print("\n" + "=" * 60)
+    print(f"✅ {len(crawled)} meets found in {time.time() - start:.0f}s, {len(new_meets)} new since the last crawl")
+    for meet in new_meets:
+        print(f"  🆕 {meet['name']} (ID: {meet['athletic_net_id']})")
+    print(f"📚 Catalog: {len(catalog.meets)} meets ({catalog.path})")
+
+    if new_meets:
+        output_file = f"new_meets_{season}_{int(time.time())}.json"
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'season_year': season,
+                'crawled_at': datetime.now().isoformat(),
+                'meet_ids': [meet['athletic_net_id'] for meet in new_meets]
+            }, f, indent=2)
+        print(f"💾 New meet IDs saved to: {output_file} (python batch_scrape.py run {output_file})")
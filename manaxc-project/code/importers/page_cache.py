@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+On-disk page cache for the Athletic.net scrapers.
+
+Stores the raw text captured from each page (meet page snapshots and
+RacePages) so a meet can be re-parsed without touching the network:
+
+    python athletic_net_scraper_v2.py meet 254378 --cache    # fetch + store
+    python athletic_net_scraper_v2.py meet 254378 --replay   # parse from cache only
+
+Layout (content-addressed):
+
+    page_cache/
+        objects/ab/ab12....json.gz   page content, named by the SHA-256 of its JSON
+        urls/cd/cd34....json         fetch history for one URL: [{fetched_at, sha256}]
+
+Identical content fetched twice is stored once; each URL keeps its last
+MAX_VERSIONS_PER_URL fetches. Entries older than the TTL are ignored for
+normal (read-through) scrapes but still used by replay.
+
+Maintenance:
+    python page_cache.py stats
+    python page_cache.py evict [--max-age-days N] [--max-mb N]
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+
+# Cache location; override with SCRAPER_CACHE_DIR
+DEFAULT_CACHE_DIR = os.getenv(
+    'SCRAPER_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'page_cache')
+)
+
+# Age (seconds) after which a cached page is refetched; override with SCRAPER_CACHE_TTL
+DEFAULT_TTL_SECONDS = float(os.getenv('SCRAPER_CACHE_TTL', str(7 * 24 * 3600)))
+
+# Fetches remembered per URL (older versions become eligible for eviction)
+MAX_VERSIONS_PER_URL = 5
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_atomic(path: str, data: bytes):
+    """Write via a temp file + rename so readers never see a partial file"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class PageCache:
+    """Content-addressed store of captured page text, keyed by URL and fetch time (thread-safe)"""
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS):
+        """
+        Args:
+            root: Cache directory (created on first write)
+            ttl_seconds: Max age of a page served by get(); None = never stale
+        """
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        # Lifetime counters
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    # --------------------------------------------------------------------------
+    # Paths
+    # --------------------------------------------------------------------------
+
+    def _url_path(self, url: str) -> str:
+        key = _sha256(url.encode('utf-8'))
+        return os.path.join(self.root, 'urls', key[:2], f"{key}.json")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, 'objects', digest[:2], f"{digest}.json.gz")
+
+    # --------------------------------------------------------------------------
+    # Read / write
+    # --------------------------------------------------------------------------
+
+    def _read_history(self, path: str) -> Dict:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'url': None, 'entries': []}
+
+    def _read_object(self, digest: str) -> Optional[Dict]:
+        try:
+            with open(self._object_path(digest), 'rb') as f:
+                return json.loads(gzip.decompress(f.read()).decode('utf-8'))
+        except (OSError, ValueError, EOFError):
+            return None
+
+    def get(self, url: str, fresh_only: bool = True) -> Optional[Dict]:
+        """
+        Return the most recently cached content for `url`.
+
+        Args:
+            url: Page URL
+            fresh_only: Ignore fetches older than ttl_seconds (False for replay)
+
+        Returns:
+            Cached content dict, or None on a miss
+        """
+        history = self._read_history(self._url_path(url))
+        now = time.time()
+
+        for entry in reversed(history['entries']):
+            if fresh_only and self.ttl_seconds is not None and now - entry['fetched_at'] > self.ttl_seconds:
+                break
+            content = self._read_object(entry['sha256'])
+            if content is not None:
+                with self._lock:
+                    self.hits += 1
+                return content
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, url: str, content: Dict) -> str:
+        """
+        Store `content` as the latest fetch of `url`.
+
+        Args:
+            url: Page URL
+            content: JSON-serialisable page content
+
+        Returns:
+            SHA-256 of the stored content
+        """
+        data = json.dumps(content, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        digest = _sha256(data)
+
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            _write_atomic(object_path, gzip.compress(data))
+
+        url_path = self._url_path(url)
+        with self._lock:
+            history = self._read_history(url_path)
+            history['url'] = url
+            history['entries'].append({'fetched_at': time.time(), 'sha256': digest})
+            history['entries'] = history['entries'][-MAX_VERSIONS_PER_URL:]
+            _write_atomic(url_path, json.dumps(history).encode('utf-8'))
+            self.writes += 1
+
+        return digest
+
+    # --------------------------------------------------------------------------
+    # Maintenance
+    # --------------------------------------------------------------------------
+
+    def _history_files(self) -> List[str]:
+        paths = []
+        for dirpath, _, filenames in os.walk(os.path.join(self.root, 'urls')):
+            paths.extend(os.path.join(dirpath, name) for name in filenames if name.endswith('.json'))
+        return paths
+
+    def _object_sizes(self) -> Dict[str, int]:
+        sizes = {}
+        for dirpath, _, filenames in os.walk(os.path.join(self.root, 'objects')):
+            for name in filenames:
+                if name.endswith('.json.gz'):
+                    sizes[name[:-len('.json.gz')]] = os.path.getsize(os.path.join(dirpath, name))
+        return sizes
+
+    def urls(self) -> List[str]:
+        """Every URL with at least one cached fetch"""
+        histories = (self._read_history(path) for path in self._history_files())
+        return [h['url'] for h in histories if h['url'] and h['entries']]
+
+    def stats(self) -> Dict:
+        """URL, object and byte counts for the whole cache"""
+        sizes = self._object_sizes()
+        return {
+            'urls': len(self._history_files()),
+            'objects': len(sizes),
+            'bytes': sum(sizes.values())
+        }
+
+    def evict(self, max_age_seconds: Optional[float] = None, max_bytes: Optional[int] = None) -> Dict:
+        """
+        Drop old fetches and delete objects no fetch refers to any more.
+
+        Args:
+            max_age_seconds: Remove fetches older than this
+            max_bytes: Then remove the oldest fetches until objects fit in this size
+
+        Returns:
+            Dict with fetches_removed, objects_removed, bytes_freed
+        """
+        with self._lock:
+            now = time.time()
+            histories = {path: self._read_history(path) for path in self._history_files()}
+            sizes = self._object_sizes()
+            fetches_removed = 0
+
+            if max_age_seconds is not None:
+                for history in histories.values():
+                    kept = [e for e in history['entries'] if now - e['fetched_at'] <= max_age_seconds]
+                    fetches_removed += len(history['entries']) - len(kept)
+                    history['entries'] = kept
+
+            refs = Counter(e['sha256'] for h in histories.values() for e in h['entries'])
+            total_bytes = sum(size for digest, size in sizes.items() if refs[digest])
+
+            if max_bytes is not None and total_bytes > max_bytes:
+                oldest_first = sorted(
+                    ((path, e) for path, h in histories.items() for e in h['entries']),
+                    key=lambda item: item[1]['fetched_at']
+                )
+                for path, entry in oldest_first:
+                    if total_bytes <= max_bytes:
+                        break
+                    histories[path]['entries'].remove(entry)
+                    fetches_removed += 1
+                    refs[entry['sha256']] -= 1
+                    if refs[entry['sha256']] == 0:
+                        total_bytes -= sizes.get(entry['sha256'], 0)
+
+            for path, history in histories.items():
+                if history['entries']:
+                    _write_atomic(path, json.dumps(history).encode('utf-8'))
+                else:
+                    os.remove(path)
+
+            objects_removed = 0
+            bytes_freed = 0
+            for digest, size in sizes.items():
+                if refs[digest] <= 0:
+                    os.remove(self._object_path(digest))
+                    objects_removed += 1
+                    bytes_freed += size
+
+        return {
+            'fetches_removed': fetches_removed,
+            'objects_removed': objects_removed,
+            'bytes_freed': bytes_freed
+        }
+
+
+# ==============================================================================
+# CLI INTERFACE (maintenance)
+# ==============================================================================
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] not in ('stats', 'evict'):
+        print("Usage:")
+        print("  python page_cache.py stats")
+        print("  python page_cache.py evict [--max-age-days N] [--max-mb N]")
+        sys.exit(1)
+
+    cache = PageCache()
+
+    if sys.argv[1] == 'evict':
+        max_age = None
+        max_bytes = None
+        if '--max-age-days' in sys.argv:
+            max_age = float(sys.argv[sys.argv.index('--max-age-days') + 1]) * 24 * 3600
+        if '--max-mb' in sys.argv:
+            max_bytes = int(float(sys.argv[sys.argv.index('--max-mb') + 1]) * 1024 * 1024)
+
+        removed = cache.evict(max_age, max_bytes)
+        print(f"🧹 Removed {removed['fetches_removed']} fetches, {removed['objects_removed']} objects "
+              f"({removed['bytes_freed'] / 1024:.1f} KB)")
+
+    stats = cache.stats()
+    print(f"📦 Page cache: {stats['urls']} URLs, {stats['objects']} objects, "
+          f"{stats['bytes'] / 1024:.1f} KB ({cache.root})")
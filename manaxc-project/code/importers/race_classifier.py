@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Memoized race-name classifier shared by the scrapers, importers and reports.
+
+One call answers everything the code reads out of a race name:
+
+    race = classify_race_name("Mens 2.74 Miles Varsity")
+    race.distance_meters, race.race_type, race.gender, race.distance_display
+    # → 4409, 'Varsity', 'M', '2.74 Miles'
+
+Answers are kept in an LRU cache, so a report grouping tens of thousands
+of results by race name runs the regexes once per distinct name.
+
+Known race names can also be listed in race_name_table.json (override the
+path with RACE_NAME_TABLE_FILE). Table entries win over the regexes, which
+is how odd names are corrected by hand:
+
+    {"Open 2 Mile Run (Alumni)": {"distance_meters": 3219, "race_type": "Other",
+                                  "gender": null, "distance_display": "2 Mile"}}
+
+    python race_classifier.py show "Womens 4,000 Meters Frosh"
+    python race_classifier.py learn races.csv [results.csv ...]   # add every race name seen
+"""
+
+import csv
+import json
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from athletic_net_parser import (
+    classify_race_type, find_distance_display, find_distance_meters, gender_from_race_name
+)
+
+
+# Persisted table of known race names; override with RACE_NAME_TABLE_FILE
+RACE_NAME_TABLE_FILE = os.getenv(
+    'RACE_NAME_TABLE_FILE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'race_name_table.json')
+)
+
+# Distinct race names kept in memory
+RACE_NAME_CACHE_SIZE = int(os.getenv('RACE_NAME_CACHE_SIZE', '4096'))
+
+
+class RaceClass(NamedTuple):
+    """Everything read out of a race name"""
+    distance_meters: Optional[int]
+    race_type: str
+    gender: Optional[str]
+    distance_display: Optional[str]
+
+
+# ==============================================================================
+# LOOKUP TABLE
+# ==============================================================================
+
+class RaceNameTable:
+    """Known race names and their classification, kept in a JSON file"""
+
+    def __init__(self, path: Optional[str] = RACE_NAME_TABLE_FILE):
+        """
+        Args:
+            path: Table file (None for an in-memory table)
+        """
+        self.path = path
+        self.entries: Dict[str, RaceClass] = {}
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = {name: RaceClass(**entry) for name, entry in json.load(f).items()}
+
+    def get(self, race_name: str) -> Optional[RaceClass]:
+        return self.entries.get(race_name)
+
+    def learn(self, race_names: Iterable[str]) -> int:
+        """
+        Classify race names not in the table yet and add them.
+
+        Returns:
+            Number of names added
+        """
+        added = 0
+        for race_name in race_names:
+            if race_name and race_name not in self.entries:
+                self.entries[race_name] = _classify_uncached(race_name)
+                added += 1
+        return added
+
+    def save(self):
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp-{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({name: entry._asdict() for name, entry in self.entries.items()}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+_table: Optional[RaceNameTable] = None
+
+
+def use_race_name_table(table: Optional[RaceNameTable]):
+    """Classify with `table` from now on (None for regexes only) and forget cached answers"""
+    global _table
+    _table = table if table is not None else RaceNameTable(None)
+    classify_race_name.cache_clear()
+
+
+# ==============================================================================
+# CLASSIFIER
+# ==============================================================================
+
+def _classify_uncached(race_name: str, grade_levels: bool = True) -> RaceClass:
+    return RaceClass(
+        distance_meters=find_distance_meters(race_name),
+        race_type=classify_race_type(race_name, grade_levels),
+        gender=gender_from_race_name(race_name),
+        distance_display=find_distance_display(race_name)
+    )
+
+
+@lru_cache(maxsize=RACE_NAME_CACHE_SIZE)
+def classify_race_name(race_name: str, grade_levels: bool = True) -> RaceClass:
+    """
+    Classify a race name (memoized).
+
+    Examples:
+        "Mens 2.74 Miles Varsity" → (4409, 'Varsity', 'M', '2.74 Miles')
+        "Womens 4,000 Meters Frosh" → (4000, 'Frosh', 'F', None)
+        "Junior Boys 2.95 Miles" → (4747, 'Junior', 'M', '2.95 Miles')
+
+    Args:
+        race_name: Race title
+        grade_levels: See classify_race_type (ignored for names in the table)
+
+    Returns:
+        RaceClass; distance_meters is None if the name has no distance
+        (callers that need a number default to 5000 like parse_distance_from_name)
+    """
+    global _table
+    if _table is None:
+        _table = RaceNameTable()
+
+    known = _table.get(race_name)
+    if known is not None:
+        return known
+    return _classify_uncached(race_name, grade_levels)
+
+
+# ==============================================================================
+# CLI INTERFACE
+# ==============================================================================
+
+def race_names_from_csv(path: str) -> Iterable[str]:
+    """Race names from a scraper/import CSV ('race_name' column, or 'name' in races.csv)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        column = 'race_name' if 'race_name' in (reader.fieldnames or []) else 'name'
+        for row in reader:
+            yield (row.get(column) or '').strip()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] not in ('show', 'learn'):
+        print("Usage:")
+        print("  python race_classifier.py show <race name> [<race name> ...]")
+        print("  python race_classifier.py learn <csv_file> [<csv_file> ...]")
+        sys.exit(1)
+
+    if sys.argv[1] == 'show':
+        for race_name in sys.argv[2:]:
+            race = classify_race_name(race_name)
+            print(f"{race_name}: {race.distance_meters}m, {race.race_type}, "
+                  f"gender={race.gender}, display={race.distance_display}")
+        sys.exit(0)
+
+    table = RaceNameTable()
+    for csv_file in sys.argv[2:]:
+        added = table.learn(race_names_from_csv(csv_file))
+        print(f"📋 {csv_file}: {added} new race names")
+    table.save()
+    print(f"✅ {len(table.entries)} race names in {table.path}")
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Adaptive request rate limiter shared by every Athletic.net fetch.
+
+A token bucket paces requests across all drivers, threads and the HTTP
+backend of a process. The rate adapts AIMD-style (like TCP congestion
+control): every fast, successful load adds a little to the rate, while a
+failed load or one slower than SLOW_SECONDS halves it. The scraper speeds
+up while the site is responsive and backs off as soon as it struggles.
+
+    with RATE_LIMITER.request():
+        driver.get(url)
+        ...
+
+Tuning (environment):
+    SCRAPER_RATE          initial requests/second (default 1.0)
+    SCRAPER_MIN_RATE      floor (default 0.1)
+    SCRAPER_MAX_RATE      ceiling (default 4.0)
+    SCRAPER_SLOW_SECONDS  a load slower than this counts as congestion (default 8)
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+INITIAL_RATE = float(os.getenv('SCRAPER_RATE', '1.0'))
+MIN_RATE = float(os.getenv('SCRAPER_MIN_RATE', '0.1'))
+MAX_RATE = float(os.getenv('SCRAPER_MAX_RATE', '4.0'))
+SLOW_SECONDS = float(os.getenv('SCRAPER_SLOW_SECONDS', '8'))
+
+# AIMD steps: requests/second added per fast load, factor applied on congestion
+ADDITIVE_INCREASE = 0.05
+MULTIPLICATIVE_DECREASE = 0.5
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose rate follows additive-increase / multiplicative-decrease (thread-safe)"""
+
+    def __init__(
+        self,
+        rate: float = INITIAL_RATE,
+        min_rate: float = MIN_RATE,
+        max_rate: float = MAX_RATE,
+        burst: float = 1.0,
+        slow_seconds: float = SLOW_SECONDS
+    ):
+        """
+        Args:
+            rate: Initial requests per second
+            min_rate: Lowest rate backoff can reach
+            max_rate: Highest rate increases can reach
+            burst: Bucket size (requests that may start back to back after idling)
+            slow_seconds: Loads slower than this are treated like failures
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.additive_increase = ADDITIVE_INCREASE
+        self.burst = burst
+        self.slow_seconds = slow_seconds
+
+        self._lock = threading.Lock()
+        self._rate = min(max(rate, min_rate), max_rate)
+        self._tokens = burst
+        self._refilled_at = time.monotonic()
+        self._last_decrease = float('-inf')
+
+        # Lifetime counters
+        self.requests = 0
+        self.wait_seconds = 0.0
+        self.successes = 0
+        self.slowdowns = 0
+        self.failures = 0
+
+    @property
+    def rate(self) -> float:
+        """Current requests per second"""
+        return self._rate
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self._rate)
+        self._refilled_at = now
+
+    def acquire(self) -> float:
+        """
+        Block until a request may start.
+
+        Callers reserve their token immediately (the bucket may go negative),
+        so concurrent callers are spaced out in arrival order.
+
+        Returns:
+            Seconds waited
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            self.requests += 1
+            self.wait_seconds += delay
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def scale(self, share: float):
+        """
+        Keep only `share` of the configured rates, e.g. 1/N in each of N
+        worker processes so that together they stay within one limiter's budget.
+
+        Args:
+            share: Fraction of the rate, floor, ceiling and increase step to keep
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.min_rate *= share
+            self.max_rate *= share
+            self.additive_increase *= share
+            self._rate = min(max(self._rate * share, self.min_rate), self.max_rate)
+
+    def on_success(self, seconds: float):
+        """Report a completed load; slow loads count as congestion"""
+        if seconds > self.slow_seconds:
+            with self._lock:
+                self.slowdowns += 1
+            self._decrease()
+            return
+
+        with self._lock:
+            self.successes += 1
+            self._refill(time.monotonic())
+            self._rate = min(self.max_rate, self._rate + self.additive_increase)
+
+    def on_failure(self):
+        """Report a failed load (error response, timeout, crashed driver)"""
+        with self._lock:
+            self.failures += 1
+        self._decrease()
+
+    def _decrease(self):
+        # At most one cut per request interval, so a burst of failures from
+        # concurrent workers hitting the same slow patch counts once
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < 1.0 / self._rate:
+                return
+            self._refill(now)
+            self._rate = max(self.min_rate, self._rate * MULTIPLICATIVE_DECREASE)
+            self._last_decrease = now
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        """Wait for a slot, then time the block and report its outcome"""
+        self.acquire()
+        start = time.monotonic()
+        try:
+            yield
+        except Exception:
+            self.on_failure()
+            raise
+        self.on_success(time.monotonic() - start)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                'rate': round(self._rate, 2),
+                'requests': self.requests,
+                'wait_seconds': round(self.wait_seconds, 2),
+                'successes': self.successes,
+                'slowdowns': self.slowdowns,
+                'failures': self.failures
+            }
+
+
+# Process-wide limiter shared by all Athletic.net scrapers and backends
+RATE_LIMITER = AdaptiveRateLimiter()
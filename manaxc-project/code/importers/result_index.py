@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+In-memory index of the results already stored for a set of races.
+
+The importers decide whether an incoming result is already in the
+database by (race, time) first and then by athlete identity:
+
+    1. No existing result in the race has this time → new result
+    2. An existing result with this time has the same athlete_id → duplicate
+    3. Otherwise compare the athletes: athletic_net_id when both have one,
+       else slug (name-based) when both have one → duplicate if equal
+    4. Anything else is a tie (two athletes, same time) → new result
+
+RaceResultIndex answers this from hash maps. It loads the existing
+(athlete_id, time_cs) pairs of all races once, and the identity keys of
+the athletes involved in time matches in one more round of lookups:
+
+    index = RaceResultIndex(supabase)
+    index.load_races(race_db_ids)
+    index.load_identities(candidates)                 # [(race_id, athlete_id, time_cs), ...]
+    index.is_duplicate(race_id, athlete_id, time_cs)
+"""
+
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from bulk_upsert import select_in
+
+
+class RaceResultIndex:
+    """Existing results per (race_id, time_cs) plus athlete identity keys"""
+
+    def __init__(self, client):
+        """
+        Args:
+            client: Supabase client
+        """
+        self.client = client
+        self.athletes_by_time: Dict[Tuple[str, int], Set[str]] = {}
+        self.identities: Dict[str, Tuple[Optional[str], Optional[str]]] = {}  # athlete_id → (athletic_net_id, slug)
+
+    def __len__(self) -> int:
+        return sum(len(athlete_ids) for athlete_ids in self.athletes_by_time.values())
+
+    def load_races(self, race_ids: Iterable[str]):
+        """Load the (athlete_id, time_cs) pairs of every existing result in `race_ids`"""
+        for row in select_in(self.client, 'results', 'race_id, athlete_id, time_cs', 'race_id', race_ids):
+            self.add(row['race_id'], row['athlete_id'], row['time_cs'])
+
+    def add(self, race_id: str, athlete_id: str, time_cs: int):
+        """Record a result (e.g. one just written) so later checks see it"""
+        self.athletes_by_time.setdefault((race_id, int(time_cs)), set()).add(athlete_id)
+
+    def time_matches(self, race_id: str, time_cs: int) -> Set[str]:
+        """Athlete IDs with an existing result of exactly `time_cs` in the race"""
+        return self.athletes_by_time.get((race_id, int(time_cs)), set())
+
+    def load_identities(self, candidates: Iterable[Tuple[str, str, int]]) -> int:
+        """
+        Fetch athletic_net_id/slug of every athlete a duplicate check may compare.
+
+        Only results whose time already exists in their race need identities:
+        the incoming athlete and the athletes holding that time.
+
+        Args:
+            candidates: Incoming (race_id, athlete_id, time_cs) tuples
+
+        Returns:
+            Number of athletes fetched
+        """
+        needed = set()
+        for race_id, athlete_id, time_cs in candidates:
+            matches = self.time_matches(race_id, time_cs)
+            if matches and athlete_id not in matches:
+                needed.add(athlete_id)
+                needed.update(matches)
+        needed -= set(self.identities)
+
+        rows = select_in(self.client, 'athletes', 'id, athletic_net_id, slug', 'id', needed)
+        for row in rows:
+            self.identities[row['id']] = (row.get('athletic_net_id'), row.get('slug'))
+        return len(rows)
+
+    def is_duplicate(self, race_id: str, athlete_id: str, time_cs: int) -> bool:
+        """
+        True if the race already has this result (see module docstring).
+
+        Athletes missing from the identity map are never treated as the
+        same athlete, so a tie is inserted rather than dropped.
+        """
+        matches = self.time_matches(race_id, time_cs)
+        if not matches:
+            return False
+        if athlete_id in matches:
+            return True
+
+        incoming = self.identities.get(athlete_id)
+        if incoming is None:
+            return False
+        incoming_net_id, incoming_slug = incoming
+
+        for existing_athlete_id in matches:
+            existing = self.identities.get(existing_athlete_id)
+            if existing is None:
+                continue
+            existing_net_id, existing_slug = existing
+            # If both have athletic_net_id, compare those
+            if incoming_net_id and existing_net_id:
+                if incoming_net_id == existing_net_id:
+                    return True
+            # If no athletic_net_id, compare slugs (name-based)
+            elif incoming_slug and existing_slug:
+                if incoming_slug == existing_slug:
+                    return True
+        return False
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Persistent school name → Athletic.net SchoolID cache.
+
+scrape_meet_lists resolves school names through Athletic.net search, which
+costs up to four page loads per school. Answers are remembered here so
+later runs only search for schools never seen before:
+
+    cache = SchoolIdCache()
+    hit, school_id = cache.lookup("Westmont")     # (True, "1076") / (True, None) / (False, None)
+    cache.store("Westmont", "1076")
+
+Lookups are case- and whitespace-insensitive. IDs filled in by hand in
+school_athletic_net_ids.json always win over searched ones. "Not found"
+answers are cached too, but expire after NOT_FOUND_TTL_SECONDS so the
+school is searched again later.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+IMPORTERS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Cache file; override with SCHOOL_ID_CACHE_FILE
+SCHOOL_ID_CACHE_FILE = os.getenv('SCHOOL_ID_CACHE_FILE', os.path.join(IMPORTERS_DIR, 'school_id_cache.json'))
+
+# Hand-maintained mapping ({"schools": {name: id or null}})
+MANUAL_IDS_FILE = os.path.join(IMPORTERS_DIR, 'school_athletic_net_ids.json')
+
+# Age after which a cached "not found" is searched again
+NOT_FOUND_TTL_SECONDS = 7 * 24 * 3600
+
+
+def _name_key(name: str) -> str:
+    return ' '.join(name.lower().split())
+
+
+class SchoolIdCache:
+    """JSON-file cache of searched school IDs (thread-safe, saved on every store)"""
+
+    def __init__(self, path: str = SCHOOL_ID_CACHE_FILE, manual_path: Optional[str] = MANUAL_IDS_FILE):
+        """
+        Args:
+            path: Cache file (created on first store)
+            manual_path: Hand-maintained school_athletic_net_ids.json (None to skip)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict] = {}
+        self.manual: Dict[str, str] = {}
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+        if manual_path and os.path.exists(manual_path):
+            with open(manual_path, 'r', encoding='utf-8') as f:
+                schools = json.load(f).get('schools', {})
+            self.manual = {_name_key(name): str(school_id) for name, school_id in schools.items() if school_id}
+
+    def lookup(self, school_name: str) -> Tuple[bool, Optional[str]]:
+        """
+        Cached SchoolID for `school_name`.
+
+        Returns:
+            (hit, school_id); a hit with school_id None is a cached "not found"
+        """
+        key = _name_key(school_name)
+        if key in self.manual:
+            return True, self.manual[key]
+
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            return False, None
+        if entry['school_id'] is None and time.time() - entry['resolved_at'] > NOT_FOUND_TTL_SECONDS:
+            return False, None
+        return True, entry['school_id']
+
+    def store(self, school_name: str, school_id: Optional[str]):
+        """Remember a search answer (None = not found) and save the file"""
+        with self._lock:
+            self.entries[_name_key(school_name)] = {
+                'name': school_name,
+                'school_id': school_id,
+                'resolved_at': time.time()
+            }
+            self._save()
+
+    def _save(self):
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp-{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Append-only checkpoint logs for resumable scrapes.
+
+A checkpoint is a JSON-lines file: every completed unit of work (meet page,
+race page, meet list) is appended as one line and fsynced before the
+scraper moves on. If Chrome or the process dies, everything up to the last
+complete line survives; a torn final line is ignored on read.
+
+    log = CheckpointLog('checkpoints/meet_254378.jsonl')
+    log.append({'type': 'race', 'page': {...}})
+    for record in log.records():
+        ...
+
+The scrapers write checkpoints to CHECKPOINT_DIR and remove them once the
+CSV output has been written.
+"""
+
+import json
+import os
+from typing import Dict, List
+
+
+# Checkpoint location; override with SCRAPER_CHECKPOINT_DIR
+CHECKPOINT_DIR = os.getenv(
+    'SCRAPER_CHECKPOINT_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'checkpoints')
+)
+
+
+class CheckpointLog:
+    """Append-only JSON-lines file; each append is flushed and fsynced"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._repaired = False
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def append(self, record: Dict):
+        """Durably append one record"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        if not self._repaired:
+            self._drop_torn_tail()
+            self._repaired = True
+
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _drop_torn_tail(self):
+        """Cut a partial last line left by a crash so new records start on a fresh line"""
+        if not self.exists():
+            return
+        with open(self.path, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b'\n'):
+                f.truncate(data.rfind(b'\n') + 1)
+
+    def records(self) -> List[Dict]:
+        """
+        All complete records, oldest first.
+
+        Reading stops at the first line that is not valid JSON (a write
+        interrupted by a crash); anything after it is ignored.
+        """
+        if not self.exists():
+            return []
+
+        records = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+        return records
+
+    def remove(self):
+        """Delete the checkpoint (after the scrape's output is safely written)"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
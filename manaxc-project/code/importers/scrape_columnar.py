@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Typed Parquet copies of the seven scrape CSV files.
+
+With --parquet the scraper writes venues.parquet ... results.parquet next
+to the CSVs. Column types come from the Scraped* dataclasses, so time_cs,
+place_overall, grade, grad_year and distance_meters are stored as
+integers, ratings as floats and the review flags as booleans.
+read_csv_folder (import_csv_data.py) prefers a .parquet file over its CSV
+when both exist, which skips DictReader and the str→int conversions. It
+falls back to the CSV when the Parquet file cannot be read (a scrape killed
+mid-write leaves no footer) or has a different row count than the manifest.
+
+Requires pyarrow (optional, not in requirements.txt):
+
+    pip install pyarrow
+"""
+
+import dataclasses
+import os
+from dataclasses import asdict
+from typing import Dict, List, Optional, Union, get_args, get_origin, get_type_hints
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = None
+    pq = None
+
+
+def columnar_available() -> bool:
+    """True if pyarrow is installed"""
+    return pa is not None
+
+
+def require_pyarrow():
+    if pa is None:
+        raise ImportError("Parquet output needs pyarrow (pip install pyarrow)")
+
+
+def _arrow_type(hint):
+    # Optional[X] → X (every column is nullable)
+    if get_origin(hint) is Union:
+        hint = next(arg for arg in get_args(hint) if arg is not type(None))
+    return {
+        int: pa.int32(),
+        float: pa.float64(),
+        bool: pa.bool_(),
+    }.get(hint, pa.string())
+
+
+def arrow_schema(record_type: type, fieldnames: List[str]) -> 'pa.Schema':
+    """
+    Arrow schema for the columns `fieldnames` of a Scraped* dataclass.
+
+    Args:
+        record_type: Dataclass the rows are instances of (e.g. ScrapedResult)
+        fieldnames: Columns in file order (CSV_FIELDS[kind])
+    """
+    require_pyarrow()
+    hints = get_type_hints(record_type)
+    return pa.schema([pa.field(name, _arrow_type(hints[name])) for name in fieldnames])
+
+
+def _to_table(items: List, schema: 'pa.Schema') -> 'pa.Table':
+    names = schema.names
+    rows = [asdict(item) if dataclasses.is_dataclass(item) else item for item in items]
+    return pa.table({name: [row.get(name) for row in rows] for name in names}, schema=schema)
+
+
+class ParquetTableWriter:
+    """Appends batches of rows to one Parquet file (one row group per batch)"""
+
+    def __init__(self, path: str, record_type: type, fieldnames: List[str]):
+        self.path = path
+        self.schema = arrow_schema(record_type, fieldnames)
+        self._writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, items: List):
+        if items:
+            self._writer.write_table(_to_table(items, self.schema))
+
+    def close(self):
+        self._writer.close()
+
+
+def write_parquet_table(path: str, record_type: type, fieldnames: List[str], items: List):
+    """Write all rows of one entity kind to a Parquet file"""
+    schema = arrow_schema(record_type, fieldnames)
+    pq.write_table(_to_table(items, schema), path)
+
+
+def read_parquet_table(path: str) -> List[Dict]:
+    """
+    Read a Parquet file as a list of row dicts, like csv.DictReader would.
+
+    Numbers and flags keep their types; missing strings are '' (as in the
+    CSV) so callers can keep calling .strip() on ID columns. Missing
+    numbers stay None.
+    """
+    require_pyarrow()
+    table = pq.read_table(path)
+    string_columns = [field.name for field in table.schema if pa.types.is_string(field.type)]
+    rows = table.to_pylist()
+    for row in rows:
+        for name in string_columns:
+            if row[name] is None:
+                row[name] = ''
+    return rows
+
+
+def read_checked_parquet_table(path: str, expected_rows: Optional[int] = None) -> Optional[List[Dict]]:
+    """
+    read_parquet_table, or None if the file is unreadable or incomplete.
+
+    Args:
+        path: Parquet file
+        expected_rows: Row count the file must have (None: any)
+
+    Returns:
+        Row dicts, or None if the caller should read the CSV instead
+    """
+    try:
+        rows = read_parquet_table(path)
+    except (pa.ArrowInvalid, OSError) as e:
+        print(f"  ⚠️  Unreadable {os.path.basename(path)} ({e}), reading the CSV instead")
+        return None
+    if expected_rows is not None and len(rows) != expected_rows:
+        print(f"  ⚠️  {os.path.basename(path)} has {len(rows)} rows, manifest says "
+              f"{expected_rows}; reading the CSV instead")
+        return None
+    return rows
+
+
+def parquet_path(csv_path: str) -> Optional[str]:
+    """The .parquet file next to `csv_path`, if it can be read here"""
+    path = os.path.splitext(csv_path)[0] + '.parquet'
+    return path if pa is not None and os.path.exists(path) else None
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Content-hash manifests for scrape folders and a ledger of what was imported.
+
+write_csv_files (and CsvSink) write manifest.json next to the CSV files:
+
+    {
+      "files": {"venues.csv": "<sha256>", ..., "results.csv": "<sha256>"},
+      "rows": {"venues.csv": 1, ..., "results.csv": 1840},
+      "races": {"<race_id>": {"results": 212, "sha256": "<digest>"}},
+      "folder_sha256": "<digest of the file digests>"
+    }
+
+metadata.json is left out on purpose, so two scrapes of unchanged data
+get the same folder hash.
+
+After a successful import, import_csv_data records the manifest in the
+ImportLedger (import_ledger.json, override with IMPORT_LEDGER_FILE). A
+folder whose hash is already there is skipped outright. Races whose
+fingerprint already landed are skipped within a new folder.
+import_postgres_copy keeps one ledger per target database
+(target_ledger_file), since a folder that landed in one database has not
+landed in another.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Set
+
+
+IMPORTERS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Ledger of imported folders and races; override with IMPORT_LEDGER_FILE
+IMPORT_LEDGER_FILE = os.getenv('IMPORT_LEDGER_FILE', os.path.join(IMPORTERS_DIR, 'import_ledger.json'))
+
+MANIFEST_FILE = 'manifest.json'
+
+# Files covered by the folder hash (athletic_net_scraper_v2.CSV_FIELDS order)
+MANIFEST_FILES = (
+    'venues.csv', 'courses.csv', 'schools.csv', 'athletes.csv', 'meets.csv', 'races.csv', 'results.csv'
+)
+
+# Result fields that make up a race's content fingerprint
+FINGERPRINT_FIELDS = ('place_overall', 'athlete_name', 'athlete_school_id', 'time_cs', 'grade')
+
+
+def race_fingerprints(result_rows: Iterable[Dict], race_ids: Iterable[str] = ()) -> Dict[str, Dict]:
+    """
+    Fingerprint each race by its result count and a hash of its results.
+
+    Works on results.csv rows and on asdict(ScrapedResult) alike (values
+    are compared as strings), and does not depend on row order.
+
+    Args:
+        result_rows: Result dicts with athletic_net_race_id + FINGERPRINT_FIELDS
+        race_ids: Races to include even if they have no results
+
+    Returns:
+        {race_id: {'results': count, 'sha256': digest}}
+    """
+    lines_by_race = {str(race_id): [] for race_id in race_ids}
+    for row in result_rows:
+        line = '|'.join(str(row[field]) for field in FINGERPRINT_FIELDS)
+        lines_by_race.setdefault(str(row['athletic_net_race_id']), []).append(line)
+
+    return {
+        race_id: {
+            'results': len(lines),
+            'sha256': hashlib.sha256('\n'.join(sorted(lines)).encode('utf-8')).hexdigest()
+        }
+        for race_id, lines in lines_by_race.items()
+    }
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _csv_row_count(path: str) -> int:
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return max(0, sum(1 for _ in csv.reader(f)) - 1)
+
+
+# ==============================================================================
+# MANIFEST
+# ==============================================================================
+
+def build_manifest(folder: str) -> Dict:
+    """
+    Hash the CSV files of a scrape folder and fingerprint its races.
+
+    Race fingerprints are computed from results.csv as written, so the
+    manifest can be rebuilt from the folder alone (e.g. for older folders).
+
+    Args:
+        folder: Output folder of write_csv_files / CsvSink
+
+    Returns:
+        Manifest dict (see module docstring)
+    """
+    files = {
+        filename: _file_sha256(os.path.join(folder, filename))
+        for filename in MANIFEST_FILES
+        if os.path.exists(os.path.join(folder, filename))
+    }
+
+    race_ids = []
+    races_path = os.path.join(folder, 'races.csv')
+    if os.path.exists(races_path):
+        with open(races_path, 'r', encoding='utf-8', newline='') as f:
+            race_ids = [row['athletic_net_race_id'] for row in csv.DictReader(f)]
+
+    races = {}
+    results_path = os.path.join(folder, 'results.csv')
+    if os.path.exists(results_path):
+        with open(results_path, 'r', encoding='utf-8', newline='') as f:
+            races = race_fingerprints(csv.DictReader(f), race_ids)
+
+    rows = {filename: _csv_row_count(os.path.join(folder, filename)) for filename in files}
+
+    folder_digest = '\n'.join(f"{name} {digest}" for name, digest in sorted(files.items()))
+    return {
+        'files': files,
+        'rows': rows,
+        'races': races,
+        'folder_sha256': hashlib.sha256(folder_digest.encode('utf-8')).hexdigest()
+    }
+
+
+def write_manifest(folder: str) -> Dict:
+    """Build the manifest of `folder` and save it as manifest.json"""
+    manifest = build_manifest(folder)
+    with open(os.path.join(folder, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def expected_rows(manifest: Dict, filename: str) -> Optional[int]:
+    """
+    Row count of `filename` when the manifest was written, or None if unknown.
+
+    Manifests written before row counts existed still give the race and
+    result counts.
+    """
+    if filename in manifest.get('rows', {}):
+        return manifest['rows'][filename]
+    if filename == 'races.csv' and manifest.get('races'):
+        return len(manifest['races'])
+    if filename == 'results.csv' and manifest.get('races'):
+        return sum(race['results'] for race in manifest['races'].values())
+    return None
+
+
+def load_manifest(folder: str) -> Dict:
+    """manifest.json of `folder`, built on the fly for folders written before manifests existed"""
+    path = os.path.join(folder, MANIFEST_FILE)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return build_manifest(folder)
+
+
+# ==============================================================================
+# IMPORT LEDGER
+# ==============================================================================
+
+def target_ledger_file(target: str) -> str:
+    """
+    Ledger path for one target database, next to IMPORT_LEDGER_FILE.
+
+    Args:
+        target: Database label, e.g. 'postgres-localhost-5432-manaxc'
+
+    Returns:
+        e.g. .../import_ledger.postgres-localhost-5432-manaxc.json
+    """
+    root, ext = os.path.splitext(IMPORT_LEDGER_FILE)
+    return f"{root}.{re.sub(r'[^A-Za-z0-9_.]+', '-', target).strip('-.')}{ext or '.json'}"
+
+
+class ImportLedger:
+    """Folder hashes and race fingerprints that were imported, kept in a JSON file"""
+
+    def __init__(self, path: str = IMPORT_LEDGER_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.folders: Dict[str, Dict] = {}
+        self.races: Dict[str, str] = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                ledger = json.load(f)
+            self.folders = ledger.get('folders', {})
+            self.races = ledger.get('races', {})
+
+    def folder_imported(self, manifest: Dict) -> Optional[Dict]:
+        """Ledger entry of an identical folder imported before, or None"""
+        return self.folders.get(manifest['folder_sha256'])
+
+    def unchanged_races(self, manifest: Dict) -> Set[str]:
+        """Race IDs of the manifest whose exact results were imported before"""
+        return {
+            race_id for race_id, fingerprint in manifest['races'].items()
+            if self.races.get(race_id) == fingerprint['sha256']
+        }
+
+    def record(self, manifest: Dict, folder: str, race_ids: Optional[Iterable[str]] = None):
+        """
+        Remember an import and save the ledger.
+
+        Args:
+            manifest: Manifest of the imported folder
+            folder: Folder path (informational)
+            race_ids: Races that fully landed (None = all races, and the folder itself)
+        """
+        with self._lock:
+            if race_ids is None:
+                race_ids = manifest['races'].keys()
+                self.folders[manifest['folder_sha256']] = {
+                    'folder': os.path.basename(os.path.normpath(folder)),
+                    'imported_at': datetime.now().isoformat()
+                }
+            for race_id in race_ids:
+                fingerprint = manifest['races'].get(race_id)
+                if fingerprint:
+                    self.races[race_id] = fingerprint['sha256']
+            self._save()
+
+    def _save(self):
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp-{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'folders': self.folders, 'races': self.races}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
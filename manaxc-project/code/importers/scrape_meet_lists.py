@@ -5,15 +5,20 @@ Generates a list of meets organized by priority sections for 2025 season.
 """
 
 import json
-import time
-import re
-from typing import List, Dict, Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from athletic_net_parser import school_id_from_href, meet_id_from_href
+from scraper_waits import wait_for_stable_elements, SCHOOL_LINKS, MEET_LINKS
+from rate_limiter import RATE_LIMITER
+from driver_pool import DriverPool
+from school_id_cache import SchoolIdCache
 
 
 def create_driver():
@@ -30,13 +35,22 @@ def create_driver():
     return driver
 
 
+class SchoolSearchError(Exception):
+    """A school search could not finish, so "not found" is unknown"""
+
+
 def search_school(driver, school_name: str) -> Optional[str]:
     """
     Search for a school on Athletic.net and return the school ID.
 
     Returns:
-        School ID (string) or None if not found
+        School ID (string) or None if every search loaded and none matched
+
+    Raises:
+        SchoolSearchError: No match, but at least one search timed out or failed
     """
+    errors = []
+
     # Try different search variations
     search_variations = [
         f"{school_name} High School CA",
@@ -49,14 +63,16 @@ def search_school(driver, school_name: str) -> Optional[str]:
         print(f"  Searching for: {search_term}")
 
         search_url = f"https://www.athletic.net/Search.aspx?search={search_term.replace(' ', '+')}"
-        driver.get(search_url)
-
         try:
+            with RATE_LIMITER.request():
+                driver.get(search_url)
+
             # Wait for search results
             WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
-            time.sleep(2)
+            # Short ceiling: a search with no school hits is a normal outcome
+            wait_for_stable_elements(driver, SCHOOL_LINKS, timeout=3)
 
             # Look for school links in search results
             # Athletic.net school links follow pattern: /CrossCountry/School.aspx?SchoolID=XXXXX
@@ -68,20 +84,24 @@ def search_school(driver, school_name: str) -> Optional[str]:
                 href = first_link.get_attribute('href')
 
                 # Extract school ID from URL
-                match = re.search(r'SchoolID=(\d+)', href)
-                if match:
-                    school_id = match.group(1)
+                school_id = school_id_from_href(href)
+                if school_id:
                     school_display_name = first_link.text.strip()
                     print(f"    ✅ Found: {school_display_name} (ID: {school_id})")
                     return school_id
 
         except TimeoutException:
             print(f"    ⚠️  Timeout with: {search_term}")
+            errors.append(f"timeout with {search_term!r}")
             continue
         except Exception as e:
             print(f"    ⚠️  Error with {search_term}: {e}")
+            errors.append(f"{type(e).__name__} with {search_term!r}")
             continue
 
+    if errors:
+        raise SchoolSearchError(f"{school_name}: {', '.join(errors)}")
+
     print(f"    ❌ No school found after trying all variations")
     return None
 
@@ -99,13 +119,14 @@ def get_school_meets(driver, school_id: str, school_name: str, year: int = 2025)
     # Note: Year might be in format YYYY or might need adjustment based on athletic.net's season handling
     school_url = f"https://www.athletic.net/CrossCountry/School.aspx?SchoolID={school_id}"
 
-    driver.get(school_url)
+    with RATE_LIMITER.request():
+        driver.get(school_url)
 
     try:
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
-        time.sleep(2)
+        wait_for_stable_elements(driver, MEET_LINKS)
 
         meets = []
 
@@ -120,12 +141,10 @@ def get_school_meets(driver, school_id: str, school_name: str, year: int = 2025)
                 meet_name = link.text.strip()
 
                 # Extract meet ID
-                match = re.search(r'/meet/(\d+)', href)
-                if not match:
+                meet_id = meet_id_from_href(href)
+                if not meet_id:
                     continue
 
-                meet_id = match.group(1)
-
                 # Skip duplicates
                 if meet_id in seen_meet_ids:
                     continue
@@ -158,10 +177,71 @@ def get_school_meets(driver, school_id: str, school_name: str, year: int = 2025)
         return []
 
 
-def scrape_section_meets(schools: List[str], section_name: str, year: int = 2025) -> Dict:
+def resolve_school_ids(
+    school_names: List[str],
+    workers: int = 4,
+    cache: Optional[SchoolIdCache] = None
+) -> Dict[str, Optional[str]]:
+    """
+    Resolve school names to Athletic.net School IDs, cache first.
+
+    Names in the cache (or filled in by hand in school_athletic_net_ids.json)
+    are answered without a page load. The rest are searched concurrently,
+    one driver per worker. Found IDs and real "not found" answers are
+    written to the cache; a search that failed is not, so the next run
+    searches that school again.
+
+    Args:
+        school_names: School names to resolve
+        workers: Concurrent searches (drivers) for uncached schools
+        cache: SchoolIdCache to use (default: the on-disk cache)
+
+    Returns:
+        Dict of school name -> School ID (None if not found); schools whose
+        search failed are left out
+    """
+    if cache is None:
+        cache = SchoolIdCache()
+
+    school_ids = {}
+    uncached = []
+    for school_name in school_names:
+        hit, school_id = cache.lookup(school_name)
+        if hit:
+            school_ids[school_name] = school_id
+        else:
+            uncached.append(school_name)
+
+    print(f"  School IDs: {len(school_ids)} cached, {len(uncached)} to search")
+    if not uncached:
+        return school_ids
+
+    with DriverPool(create_driver, size=workers) as pool:
+        def resolve(school_name: str) -> Tuple[bool, Optional[str]]:
+            try:
+                with pool.driver() as driver:
+                    school_id = search_school(driver, school_name)
+            except Exception as e:
+                print(f"    ⚠️  Search failed, not caching: {e}")
+                return False, None
+            cache.store(school_name, school_id)
+            return True, school_id
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for school_name, (resolved, school_id) in zip(uncached, executor.map(resolve, uncached)):
+                if resolved:
+                    school_ids[school_name] = school_id
+
+    return school_ids
+
+
+def scrape_section_meets(schools: List[str], section_name: str, year: int = 2025, workers: int = 4) -> Dict:
     """
     Scrape meets for a section of schools.
 
+    School IDs are resolved up front with resolve_school_ids (cached,
+    concurrent); meet lists are then read one school at a time.
+
     Returns:
         Dictionary with school names as keys and list of meets as values
     """
@@ -169,6 +249,8 @@ def scrape_section_meets(schools: List[str], section_name: str, year: int = 2025
     print(f"SCRAPING SECTION: {section_name}")
     print(f"{'='*60}")
 
+    school_ids = resolve_school_ids(schools, workers)
+
     driver = create_driver()
     section_data = {}
 
@@ -176,8 +258,15 @@ def scrape_section_meets(schools: List[str], section_name: str, year: int = 2025
         for school_name in schools:
             print(f"\n[{schools.index(school_name) + 1}/{len(schools)}] Processing: {school_name}")
 
-            # Search for school
-            school_id = search_school(driver, school_name)
+            # School ID from the search step
+            if school_name not in school_ids:
+                section_data[school_name] = {
+                    'status': 'search_failed',
+                    'meets': []
+                }
+                continue
+
+            school_id = school_ids[school_name]
             if not school_id:
                 section_data[school_name] = {
                     'status': 'not_found',
@@ -194,9 +283,6 @@ def scrape_section_meets(schools: List[str], section_name: str, year: int = 2025
                 'meets': meets
             }
 
-            # Small delay between schools
-            time.sleep(2)
-
     finally:
         driver.quit()
 
@@ -231,6 +317,11 @@ def compile_meet_list(section_data: Dict) -> List[Dict]:
 def main():
     """Main scraping workflow"""
 
+    # Optional: --workers N (concurrent school searches)
+    workers = 4
+    if '--workers' in sys.argv:
+        workers = int(sys.argv[sys.argv.index('--workers') + 1])
+
     # Load school sections
     print("Loading school sections...")
     with open('meet_scrape_sections.json', 'r') as f:
@@ -247,7 +338,7 @@ def main():
             'd2_additional': 'Additional D2 Schools'
         }.get(section_key, section_key)
 
-        section_data = scrape_section_meets(schools, section_name, year)
+        section_data = scrape_section_meets(schools, section_name, year, workers)
         results[section_key] = section_data
 
     # Save detailed results
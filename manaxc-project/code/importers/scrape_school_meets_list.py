@@ -9,6 +9,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from rate_limiter import RATE_LIMITER
+from scraper_waits import wait_for_reload, wait_for_stable_elements, LEGACY_MEET_LINKS
 import time
 import json
 import os
@@ -38,10 +40,11 @@ def scrape_school_meets(driver, school_id, season_year):
         # Navigate to school's meet history page
         url = f"https://www.athletic.net/CrossCountry/School.aspx?SchoolID={school_id}"
         print(f"  📍 Loading: {url}")
-        driver.get(url)
+        with RATE_LIMITER.request():
+            driver.get(url)
 
-        # Wait for page to load
-        time.sleep(2)
+        # Wait for meet links to render
+        wait_for_stable_elements(driver, LEGACY_MEET_LINKS)
 
         # Look for season selector and select the year
         try:
@@ -52,8 +55,10 @@ def scrape_school_meets(driver, school_id, season_year):
             # Find and select the target season
             for option in options:
                 if str(season_year) in option.text:
-                    option.click()
-                    time.sleep(2)
+                    # The season change posts back - wait for the new page's meet links
+                    with RATE_LIMITER.request():
+                        option.click()
+                        wait_for_reload(driver, season_select, LEGACY_MEET_LINKS)
                     break
         except:
             print(f"  ⚠️  Could not find/select season dropdown, using default")
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Condition-based page waits for the Athletic.net Selenium scrapers.
+
+Replaces fixed time.sleep() calls after driver.get() with a poll that returns
+as soon as the elements we are about to read (result rows, meet links, race
+links, school links) are present and their count has stopped changing.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+# Ceiling for a single wait (seconds). Override with SCRAPER_WAIT_TIMEOUT.
+PAGE_WAIT_TIMEOUT = float(os.getenv('SCRAPER_WAIT_TIMEOUT', '10'))
+
+# How long the element count must stay unchanged before the page counts as rendered
+SETTLE_SECONDS = 0.3
+
+# Interval between element-count polls
+POLL_SECONDS = 0.1
+
+# How long a fully loaded page must show no matches before it counts as empty
+# (e.g. a race without results); the old fixed sleep was 4s
+EMPTY_SECONDS = float(os.getenv('SCRAPER_EMPTY_WAIT', '1.5'))
+
+# Selectors for the lists each scraper reads
+RESULT_ROWS = 'div[class*="result-row"]'
+RACE_LINKS = 'a[href*="/results/"]'
+MEET_LINKS = 'a[href*="/CrossCountry/meet/"]'
+SCHOOL_LINKS = "a[href*='School.aspx?SchoolID=']"
+LEGACY_MEET_LINKS = "a[href*='Meet.aspx?Meet=']"
+
+
+class WaitStats:
+    """Running totals of time actually spent waiting for pages (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total_seconds = 0.0
+        self.waits = 0
+        self.timeouts = 0
+        self.empty = 0
+
+    def record(self, seconds: float, timed_out: bool, empty: bool = False):
+        with self._lock:
+            self.total_seconds += seconds
+            self.waits += 1
+            if timed_out:
+                self.timeouts += 1
+            if empty:
+                self.empty += 1
+
+    def snapshot(self) -> Dict:
+        """Current totals as a dict (suitable for metadata.json)"""
+        with self._lock:
+            return {
+                'waits': self.waits,
+                'total_seconds': round(self.total_seconds, 2),
+                'average_seconds': round(self.total_seconds / self.waits, 3) if self.waits else 0.0,
+                'timeouts': self.timeouts,
+                'empty': self.empty
+            }
+
+
+# Process-wide wait metrics shared by all scrapers
+WAIT_STATS = WaitStats()
+
+
+def _document_complete(driver) -> bool:
+    try:
+        return driver.execute_script('return document.readyState') == 'complete'
+    except Exception:
+        return False
+
+
+def wait_for_stable_elements(
+    driver,
+    css_selector: str,
+    timeout: Optional[float] = None,
+    settle: float = SETTLE_SECONDS,
+    poll: float = POLL_SECONDS,
+    stats: Optional[WaitStats] = None,
+    empty_after: Optional[float] = EMPTY_SECONDS
+) -> float:
+    """
+    Wait until elements matching `css_selector` are present and stable.
+
+    Returns as soon as at least one element matches and the match count has
+    not changed for `settle` seconds. A page that has finished loading
+    (document.readyState 'complete') and still has no match after
+    `empty_after` seconds is taken as rendered empty, e.g. a race without
+    results. Gives up silently after `timeout` seconds (the page is then
+    read as-is, like the old fixed sleeps).
+
+    The driver's implicit wait is disabled while polling so an empty
+    find_elements() returns immediately, and restored afterwards.
+
+    Args:
+        driver: Selenium WebDriver that has just been sent to a page
+        css_selector: Selector for the list the caller is about to read
+        timeout: Ceiling in seconds (default PAGE_WAIT_TIMEOUT)
+        settle: Seconds the element count must stay unchanged
+        poll: Seconds between polls
+        stats: WaitStats to record into (default WAIT_STATS)
+        empty_after: Seconds without a match on a loaded page before giving
+            up early (None = always wait for a match or the timeout)
+
+    Returns:
+        Seconds actually waited
+    """
+    if timeout is None:
+        timeout = PAGE_WAIT_TIMEOUT
+    if stats is None:
+        stats = WAIT_STATS
+
+    try:
+        implicit_wait = driver.timeouts.implicit_wait
+    except Exception:
+        implicit_wait = 0
+
+    start = time.monotonic()
+    deadline = start + timeout
+    last_count = -1
+    stable_since = start
+    timed_out = True
+    empty = False
+
+    driver.implicitly_wait(0)
+    try:
+        while True:
+            now = time.monotonic()
+            count = len(driver.find_elements(By.CSS_SELECTOR, css_selector))
+
+            if count != last_count:
+                last_count = count
+                stable_since = now
+            elif count > 0 and now - stable_since >= settle:
+                timed_out = False
+                break
+            elif (count == 0 and empty_after is not None and now - stable_since >= empty_after
+                  and _document_complete(driver)):
+                timed_out = False
+                empty = True
+                break
+
+            if now >= deadline:
+                break
+            time.sleep(poll)
+    finally:
+        driver.implicitly_wait(implicit_wait)
+
+    waited = time.monotonic() - start
+    stats.record(waited, timed_out, empty)
+    return waited
+
+
+def wait_for_reload(driver, element, css_selector: str, timeout: Optional[float] = None, **kwargs) -> float:
+    """
+    Wait for a postback that replaces `element` (e.g. a season dropdown
+    change), then for `css_selector` to be stable on the new page.
+
+    If the page is not replaced within the ceiling (the change was handled
+    client-side), the elements are waited for on the current page.
+
+    Returns:
+        Seconds actually waited
+    """
+    if timeout is None:
+        timeout = PAGE_WAIT_TIMEOUT
+    start = time.monotonic()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_SECONDS).until(EC.staleness_of(element))
+    except TimeoutException:
+        pass
+    remaining = max(0.0, timeout - (time.monotonic() - start))
+    return (time.monotonic() - start) + wait_for_stable_elements(driver, css_selector, timeout=remaining, **kwargs)
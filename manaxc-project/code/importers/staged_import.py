@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Generic staged importer: one code path for every entity kind of a meet folder.
+
+Each stage is described by an EntitySpec (table, CSV file, the columns
+that identify an existing row, and how to turn a CSV row into a database
+row). run_stage then works through the file in batches:
+
+    1. build database rows from the CSV batch (rows with a missing parent are skipped)
+    2. prefetch existing rows for the whole batch with chunked in_() queries
+    3. insert the missing rows in chunks (bulk_upsert.write_rows)
+    4. return CSV key → database ID for the next stages
+
+    venue_ids, stats = run_stage(supabase, VENUES, folder, context)
+    print(stats.summary())   # "3 created, 1 existed, 0 skipped, 0 failed (4 rows in 0.4s, 10 rows/sec)"
+
+Batch size (rows per prefetch/write round) and write chunk size are
+arguments, so large meets can be tuned without code changes.
+
+run_stage_async does the same on an async_postgrest.AsyncPostgrest
+client, sending the lookup and insert chunks of a batch concurrently.
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from bulk_upsert import WRITE_CHUNK_SIZE, index_rows, row_key, select_in, write_rows
+from mapped_csv import MappedCsv
+
+
+# CSV rows per prefetch/write round
+STAGE_BATCH_SIZE = int(os.getenv('IMPORT_BATCH_SIZE', '2000'))
+
+
+@dataclass
+class EntitySpec:
+    """How one entity kind is read from its CSV file and matched in the database"""
+    name: str                                   # Stage label, e.g. 'Schools'
+    table: str                                  # Database table
+    filename: str                               # CSV file in the meet folder
+    key_columns: Tuple[str, ...]                # Database columns identifying an existing row
+    build_row: Callable[[Dict, Dict], Optional[Dict]]  # (CSV row, context) → database row, None to skip
+    map_key: Optional[Callable[[Dict], Hashable]] = None  # CSV row → key of the returned ID map
+    prefetch_column: Optional[str] = None       # Column for the in_() prefetch (default: first key column)
+    on_conflict: Optional[str] = None           # Unique columns for the upsert (None = plain inserts)
+
+
+@dataclass
+class StageStats:
+    """Row counts and timing of one stage"""
+    name: str
+    rows: int = 0
+    created: int = 0
+    existed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    errors: list = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (f"{self.created} created, {self.existed} existed, {self.skipped} skipped, {self.failed} failed "
+                f"({self.rows} rows in {self.seconds:.1f}s, {self.rows_per_second:.0f} rows/sec)")
+
+
+def _pending_rows(spec: EntitySpec, batch, context: Dict, stats: StageStats) -> List[Tuple[Dict, Dict, Hashable]]:
+    """CSV rows → (CSV row, database row, key); rows with a missing parent are skipped"""
+    pending = []
+    for csv_row in batch:
+        db_row = spec.build_row(csv_row, context)
+        if db_row is None:
+            stats.skipped += 1
+            continue
+        pending.append((csv_row, db_row, row_key(db_row, spec.key_columns)))
+    return pending
+
+
+def _lookup_args(spec: EntitySpec, db_rows: List[Dict]) -> Tuple[str, str, str, List]:
+    """select_in arguments that find existing rows matching `db_rows`"""
+    prefetch_column = spec.prefetch_column or spec.key_columns[0]
+    columns = ', '.join(dict.fromkeys(('id',) + spec.key_columns))
+    return spec.table, columns, prefetch_column, [db_row.get(prefetch_column) for db_row in db_rows]
+
+
+def _missing_rows(pending, existing: Dict) -> Dict[Hashable, Dict]:
+    """Rows not in the database yet (each key once)"""
+    new_rows = {}
+    for _, db_row, key in pending:
+        if key not in existing and key not in new_rows:
+            new_rows[key] = db_row
+    return new_rows
+
+
+def _record_failures(spec: EntitySpec, failed, existing: Dict, stats: StageStats):
+    """Errors of failed writes whose row is not in the database after all"""
+    for db_row, e in failed:
+        key = row_key(db_row, spec.key_columns)
+        if key not in existing:
+            stats.errors.append(f"{key}: {str(e)[:100]}")
+
+
+def _record_ids(spec: EntitySpec, pending, existing: Dict, created: Dict, id_map: Dict, stats: StageStats):
+    """Map every CSV row to its database ID; count each key's outcome once"""
+    counted = set()
+    for csv_row, _, key in pending:
+        match = existing.get(key) or created.get(key)
+        if match is not None and spec.map_key:
+            id_map[spec.map_key(csv_row)] = match['id']
+        if key in counted:
+            continue
+        counted.add(key)
+        if match is None:
+            stats.failed += 1
+        elif key in created:
+            stats.created += 1
+        else:
+            stats.existed += 1
+
+
+def _import_batch(client, spec: EntitySpec, batch, context: Dict, id_map: Dict, stats: StageStats,
+                  chunk_size: int):
+    pending = _pending_rows(spec, batch, context, stats)
+    existing = index_rows(select_in(client, *_lookup_args(spec, [db_row for _, db_row, _ in pending])), *spec.key_columns)
+
+    new_rows = _missing_rows(pending, existing)
+    created = {}
+    if new_rows:
+        written, failed = write_rows(client, spec.table, list(new_rows.values()), spec.on_conflict, chunk_size)
+        created = index_rows(written, *spec.key_columns)
+
+        # Rows skipped as conflicts, or failed as duplicates, may have landed
+        # in the meantime - look them all up once before counting failures
+        missing = [db_row for key, db_row in new_rows.items() if key not in created]
+        if missing:
+            existing.update(index_rows(select_in(client, *_lookup_args(spec, missing)), *spec.key_columns))
+        _record_failures(spec, failed, existing, stats)
+
+    _record_ids(spec, pending, existing, created, id_map, stats)
+
+
+async def _import_batch_async(client, spec: EntitySpec, batch, context: Dict, id_map: Dict, stats: StageStats,
+                              chunk_size: int):
+    pending = _pending_rows(spec, batch, context, stats)
+    existing = index_rows(
+        await client.select_in(*_lookup_args(spec, [db_row for _, db_row, _ in pending])), *spec.key_columns
+    )
+
+    new_rows = _missing_rows(pending, existing)
+    created = {}
+    if new_rows:
+        written, failed = await client.write_rows(spec.table, list(new_rows.values()), spec.on_conflict, chunk_size)
+        created = index_rows(written, *spec.key_columns)
+
+        missing = [db_row for key, db_row in new_rows.items() if key not in created]
+        if missing:
+            existing.update(index_rows(await client.select_in(*_lookup_args(spec, missing)), *spec.key_columns))
+        _record_failures(spec, failed, existing, stats)
+
+    _record_ids(spec, pending, existing, created, id_map, stats)
+
+
+def _finish_stage(stats: StageStats, start: float):
+    stats.seconds = time.time() - start
+    for error in stats.errors[:5]:
+        print(f"    ❌ {error}")
+    print(f"  ✅ {stats.summary()}")
+
+
+def _print_batch(stats: StageStats, batch_num: int, num_batches: int):
+    if num_batches > 1:
+        print(f"    Batch {batch_num}/{num_batches}: {stats.created} created, {stats.existed} existed, "
+              f"{stats.skipped} skipped")
+
+
+def run_stage(
+    client,
+    spec: EntitySpec,
+    folder: str,
+    context: Dict,
+    batch_size: int = STAGE_BATCH_SIZE,
+    chunk_size: int = WRITE_CHUNK_SIZE
+) -> Tuple[Dict, StageStats]:
+    """
+    Import one entity kind of a meet folder.
+
+    Args:
+        client: Supabase client
+        spec: What to import and how to match it
+        folder: Meet folder with the CSV files
+        context: ID maps of earlier stages, passed to spec.build_row
+        batch_size: CSV rows per prefetch/write round
+        chunk_size: Rows per insert request
+
+    Returns:
+        (ID map from spec.map_key to database ID, StageStats)
+    """
+    stats = StageStats(spec.name)
+    id_map = {}
+    filepath = os.path.join(folder, spec.filename)
+    if not os.path.exists(filepath):
+        print(f"  ⚠️  No {spec.filename} found, skipping")
+        return id_map, stats
+
+    start = time.time()
+    with MappedCsv(filepath) as reader:
+        num_batches = max(1, -(-len(reader) // batch_size))
+        print(f"  Found {len(reader)} {spec.table} → {num_batches} batches of up to {batch_size}")
+        for batch_num, batch in enumerate(reader.batches(batch_size), 1):
+            _import_batch(client, spec, batch, context, id_map, stats, chunk_size)
+            stats.rows += len(batch)
+            _print_batch(stats, batch_num, num_batches)
+    _finish_stage(stats, start)
+    return id_map, stats
+
+
+async def run_stage_async(
+    client,
+    spec: EntitySpec,
+    folder: str,
+    context: Dict,
+    batch_size: int = STAGE_BATCH_SIZE,
+    chunk_size: int = WRITE_CHUNK_SIZE
+) -> Tuple[Dict, StageStats]:
+    """
+    run_stage on an async_postgrest.AsyncPostgrest client.
+
+    Batches still run one after another (a later batch may match rows an
+    earlier one created), but the lookup and insert chunks within a batch
+    are sent concurrently.
+    """
+    stats = StageStats(spec.name)
+    id_map = {}
+    filepath = os.path.join(folder, spec.filename)
+    if not os.path.exists(filepath):
+        print(f"  ⚠️  No {spec.filename} found, skipping")
+        return id_map, stats
+
+    start = time.time()
+    with MappedCsv(filepath) as reader:
+        num_batches = max(1, -(-len(reader) // batch_size))
+        print(f"  Found {len(reader)} {spec.table} → {num_batches} batches of up to {batch_size}")
+        for batch_num, batch in enumerate(reader.batches(batch_size), 1):
+            await _import_batch_async(client, spec, batch, context, id_map, stats, chunk_size)
+            stats.rows += len(batch)
+            _print_batch(stats, batch_num, num_batches)
+    _finish_stage(stats, start)
+    return id_map, stats
@@ -0,0 +1,40 @@
+"""Importer tests: the scripts are flat modules in the importers folder"""
+
+import os
+import sys
+
+import pytest
+
+IMPORTERS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+if IMPORTERS_DIR not in sys.path:
+    sys.path.insert(0, IMPORTERS_DIR)
+
+# Unique constraints of the production Supabase schema (01/02 + fix_schema.sql)
+SUPABASE_UNIQUE = {
+    'venues': [('athletic_net_id',)],
+    'courses': [('athletic_net_id',)],
+    'schools': [('name',)],
+    'athletes': [('slug',)],
+    'races': [('meet_id', 'name', 'gender')],
+    'results': [('athlete_id', 'meet_id', 'race_id', 'time_cs', 'data_source')],
+}
+
+
+@pytest.fixture
+def import_csv_data(monkeypatch, tmp_path):
+    """import_csv_data with a FakeSupabase client and a throwaway import ledger"""
+    pytest.importorskip('supabase')
+    pytest.importorskip('dotenv')
+    monkeypatch.setenv('NEXT_PUBLIC_SUPABASE_URL', os.getenv('NEXT_PUBLIC_SUPABASE_URL') or 'http://localhost')
+    monkeypatch.setenv('NEXT_PUBLIC_SUPABASE_ANON_KEY', os.getenv('NEXT_PUBLIC_SUPABASE_ANON_KEY') or 'test')
+
+    import import_csv_data as module
+    from fake_supabase import FakeSupabase
+    from scrape_manifest import ImportLedger
+
+    ledger_path = str(tmp_path / 'import_ledger.json')
+    monkeypatch.setattr(module, 'supabase', FakeSupabase(unique=SUPABASE_UNIQUE))
+    monkeypatch.setattr(module, 'ImportLedger', lambda: ImportLedger(ledger_path))
+    return module
@@ -0,0 +1,184 @@
+"""
+In-memory stand-in for the supabase-py client, enough for bulk_upsert and
+the importers: table().select().in_()/eq().range().execute(), insert,
+upsert(on_conflict, ignore_duplicates), update and delete.
+
+Tables have unique constraints (tuples of columns); an insert that breaks
+one fails with 23505, an upsert whose on_conflict matches no constraint
+fails with 42P10, and rows rejected by `checks` fail with 23514. Like
+Postgres, a failing request writes nothing. Every request is logged in
+`requests` so tests can count round trips.
+"""
+
+import itertools
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class FakeAPIError(Exception):
+    """Error raised the way postgrest.APIError prints (the SQLSTATE is in the message)"""
+
+    def __init__(self, code: str, message: str):
+        super().__init__(f"{{'code': '{code}', 'message': '{message}'}}")
+        self.code = code
+
+
+class FakeResponse:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    def __init__(self, client: 'FakeSupabase', table: str):
+        self.client = client
+        self.table = table
+        self.op = None
+        self.columns = '*'
+        self.payload = None
+        self.on_conflict = None
+        self.filters: List[Tuple[str, str, object]] = []
+        self.window: Optional[Tuple[int, int]] = None
+        self.count = None
+
+    # Operations
+    def select(self, columns: str = '*', count: Optional[str] = None) -> 'FakeQuery':
+        self.op, self.columns, self.count = 'select', columns, count
+        return self
+
+    def insert(self, rows) -> 'FakeQuery':
+        self.op, self.payload = 'insert', rows if isinstance(rows, list) else [rows]
+        return self
+
+    def upsert(self, rows, on_conflict: str = '', ignore_duplicates: bool = False) -> 'FakeQuery':
+        self.op, self.payload = 'upsert', rows if isinstance(rows, list) else [rows]
+        self.on_conflict = tuple(column.strip() for column in on_conflict.split(',') if column.strip())
+        return self
+
+    def update(self, values: Dict) -> 'FakeQuery':
+        self.op, self.payload = 'update', values
+        return self
+
+    def delete(self) -> 'FakeQuery':
+        self.op = 'delete'
+        return self
+
+    # Filters
+    def in_(self, column: str, values) -> 'FakeQuery':
+        self.filters.append(('in', column, [str(v) for v in values]))
+        return self
+
+    def eq(self, column: str, value) -> 'FakeQuery':
+        self.filters.append(('eq', column, str(value)))
+        return self
+
+    def range(self, start: int, end: int) -> 'FakeQuery':
+        self.window = (start, end)
+        return self
+
+    def _matches(self, row: Dict) -> bool:
+        for kind, column, value in self.filters:
+            cell = None if row.get(column) is None else str(row.get(column))
+            if kind == 'in' and cell not in value:
+                return False
+            if kind == 'eq' and cell != value:
+                return False
+        return True
+
+    def _project(self, row: Dict) -> Dict:
+        if self.columns.strip() == '*':
+            return dict(row)
+        return {column.strip(): row.get(column.strip()) for column in self.columns.split(',')}
+
+    def execute(self) -> FakeResponse:
+        self.client.requests.append((self.op, self.table, self))
+        if self.client.fail_next:
+            raise self.client.fail_next.pop(0)
+        rows = self.client.tables.setdefault(self.table, [])
+
+        if self.op == 'select':
+            matched = [row for row in rows if self._matches(row)]
+            if self.window is not None:
+                start, end = self.window
+                matched = matched[start:min(end + 1, start + self.client.max_rows)]
+            else:
+                matched = matched[:self.client.max_rows]
+            return FakeResponse([self._project(row) for row in matched],
+                                count=len(matched) if self.count else None)
+
+        if self.op == 'update':
+            for row in rows:
+                if self._matches(row):
+                    row.update(self.payload)
+            return FakeResponse([])
+
+        if self.op == 'delete':
+            deleted = [row for row in rows if self._matches(row)]
+            self.client.tables[self.table] = [row for row in rows if not self._matches(row)]
+            return FakeResponse(deleted)
+
+        return FakeResponse(self.client._write(self.table, self.payload, self.op, self.on_conflict))
+
+
+class FakeSupabase:
+    """
+    Args:
+        unique: table -> unique constraints, e.g. {'schools': [('athletic_net_id',)]}
+        checks: table -> predicate a row must pass (else 23514)
+        max_rows: Server row cap per response (PostgREST max-rows)
+    """
+
+    def __init__(
+        self,
+        unique: Optional[Dict[str, Sequence[Tuple[str, ...]]]] = None,
+        checks: Optional[Dict[str, Callable[[Dict], bool]]] = None,
+        max_rows: int = 1000
+    ):
+        self.tables: Dict[str, List[Dict]] = {}
+        self.unique = {table: [tuple(c) for c in constraints] for table, constraints in (unique or {}).items()}
+        self.checks = checks or {}
+        self.max_rows = max_rows
+        self.requests: List[Tuple[str, str, FakeQuery]] = []
+        self.fail_next: List[Exception] = []
+        self._ids = itertools.count(1)
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def seed(self, table: str, rows: List[Dict]) -> List[Dict]:
+        """Add rows directly (ids assigned), bypassing constraints"""
+        stored = [{'id': f"{table}-{next(self._ids)}", **row} for row in rows]
+        self.tables.setdefault(table, []).extend(stored)
+        return stored
+
+    def calls(self, op: str, table: str) -> List[FakeQuery]:
+        return [query for kind, name, query in self.requests if kind == op and name == table]
+
+    def _key(self, row: Dict, columns: Tuple[str, ...]):
+        values = tuple(row.get(column) for column in columns)
+        # NULLs never collide, as in Postgres
+        return None if any(value is None for value in values) else tuple(str(v) for v in values)
+
+    def _write(self, table: str, rows: List[Dict], op: str, on_conflict: Tuple[str, ...]) -> List[Dict]:
+        constraints = self.unique.get(table, [])
+        if op == 'upsert' and on_conflict not in constraints:
+            raise FakeAPIError('42P10', 'there is no unique or exclusion constraint matching the ON CONFLICT specification')
+
+        check = self.checks.get(table)
+        taken = {c: {self._key(row, c) for row in self.tables.get(table, [])} - {None} for c in constraints}
+        written = []
+        for row in rows:
+            if check and not check(row):
+                raise FakeAPIError('23514', f'new row for relation "{table}" violates check constraint')
+            keys = {c: self._key(row, c) for c in constraints}
+            clash = [c for c, key in keys.items() if key is not None and key in taken[c]]
+            if clash:
+                if op == 'upsert' and on_conflict in clash:
+                    continue  # ignore_duplicates
+                raise FakeAPIError('23505', f'duplicate key value violates unique constraint on {clash[0]}')
+            for c, key in keys.items():
+                if key is not None:
+                    taken[c].add(key)
+            written.append({'id': f"{table}-{next(self._ids)}", **row})
+
+        self.tables.setdefault(table, []).extend(written)
+        return written
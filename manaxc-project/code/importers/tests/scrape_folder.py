@@ -0,0 +1,57 @@
+"""Builds small scrape folders in the athletic_net_scraper_v2 CSV format"""
+
+import csv
+import os
+from typing import Dict, List, Optional
+
+from athletic_net_scraper_v2 import CSV_FIELDS
+from scrape_manifest import write_manifest
+
+
+def scrape_rows(results_per_race: int = 5, races: int = 2, schools: int = 3) -> Dict[str, List[Dict]]:
+    """
+    Rows of one meet (athletic.net ID 777) at one venue and course.
+
+    Race r has athletic_net_race_id 5000+r; athlete i of race r is
+    "First{r}_{i} Last{r}_{i}" of school 1000+i%schools, placed i+1.
+    """
+    rows = {kind: [] for kind in CSV_FIELDS}
+    rows['venues'].append({'name': 'Big Park', 'city': 'San Jose', 'state': 'CA'})
+    rows['courses'].append({'name': 'Big Park 5K', 'venue_name': 'Big Park', 'distance_meters': 5000,
+                            'difficulty_rating': 5.0})
+    for s in range(schools):
+        rows['schools'].append({'name': f'School {s}', 'short_name': f'S{s}', 'city': '', 'state': 'CA',
+                                'athletic_net_id': str(1000 + s)})
+    rows['meets'].append({'name': 'Big Meet', 'meet_date': '2025-10-01', 'venue_name': 'Big Park',
+                          'season_year': 2025, 'athletic_net_id': '777'})
+    for r in range(races):
+        rows['races'].append({'name': f'Varsity {r}', 'meet_athletic_net_id': '777',
+                              'gender': 'M' if r % 2 else 'F', 'distance_meters': 5000,
+                              'race_type': 'Varsity', 'athletic_net_race_id': str(5000 + r),
+                              'course_name': 'Big Park 5K'})
+        for i in range(results_per_race):
+            first, last = f'First{r}_{i}', f'Last{r}_{i}'
+            school = str(1000 + i % schools)
+            rows['athletes'].append({'name': f'{first} {last}', 'first_name': first, 'last_name': last,
+                                     'school_athletic_net_id': school, 'grad_year': 2027,
+                                     'gender': 'M' if r % 2 else 'F'})
+            rows['results'].append({'athletic_net_race_id': str(5000 + r), 'athlete_name': f'{first} {last}',
+                                    'athlete_first_name': first, 'athlete_last_name': last,
+                                    'athlete_school_id': school, 'time_cs': 100000 + 100 * i,
+                                    'place_overall': i + 1, 'grade': 11})
+    return rows
+
+
+def write_scrape_folder(folder: str, rows: Optional[Dict[str, List[Dict]]] = None, manifest: bool = True) -> str:
+    """Write `rows` (default scrape_rows()) as the seven CSV files of a scrape folder"""
+    rows = scrape_rows() if rows is None else rows
+    os.makedirs(folder, exist_ok=True)
+    for kind, fieldnames in CSV_FIELDS.items():
+        with open(os.path.join(folder, f'{kind}.csv'), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            for row in rows[kind]:
+                writer.writerow({field: row.get(field, '') for field in fieldnames})
+    if manifest:
+        write_manifest(folder)
+    return folder
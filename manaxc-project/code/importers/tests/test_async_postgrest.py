@@ -0,0 +1,245 @@
+"""AsyncPostgrest and run_stage_async over httpx.MockTransport, backed by FakeSupabase"""
+
+import asyncio
+import json
+import random
+import re
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+import async_postgrest  # noqa: E402
+from async_postgrest import AsyncPostgrest, PostgrestError, _retryable  # noqa: E402
+from fake_supabase import FakeAPIError, FakeSupabase  # noqa: E402
+from staged_import import EntitySpec, run_stage_async  # noqa: E402
+
+STATUS = {'23505': 409, '23514': 400, '42P10': 400}
+
+
+class MockPostgrest:
+    """
+    PostgREST in front of a FakeSupabase, as an httpx.MockTransport handler.
+
+    `fail_rate` of the requests fail before reaching the database, half
+    with 503 and half with a connect timeout. `in_flight_max` is the most
+    requests ever handled at once.
+    """
+
+    def __init__(self, db: FakeSupabase, fail_rate: float = 0.0, seed: int = 0):
+        self.db = db
+        self.fail_rate = fail_rate
+        self.random = random.Random(seed)
+        self.in_flight = 0
+        self.in_flight_max = 0
+        self.injected = 0
+
+    def transport(self) -> 'httpx.MockTransport':
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: 'httpx.Request') -> 'httpx.Response':
+        self.in_flight += 1
+        self.in_flight_max = max(self.in_flight_max, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if self.random.random() < self.fail_rate:
+                self.injected += 1
+                if self.random.random() < 0.5:
+                    return httpx.Response(503, json={'message': 'Service Unavailable'})
+                raise httpx.ConnectTimeout('injected', request=request)
+            return self.execute(request)
+        finally:
+            self.in_flight -= 1
+
+    def execute(self, request: 'httpx.Request') -> 'httpx.Response':
+        table = request.url.path.rsplit('/', 1)[-1]
+        params = dict(request.url.params)
+        query = self.db.table(table)
+        if request.method == 'GET':
+            query.select(params.pop('select'))
+            offset, limit = int(params.pop('offset')), int(params.pop('limit'))
+            for column, value in params.items():
+                query.in_(column, [json.loads(v) for v in re.findall(r'"(?:[^"\\]|\\.)*"', value[4:-1])])
+            query.range(offset, offset + limit - 1)
+        elif 'on_conflict' in params:
+            query.upsert(json.loads(request.content), on_conflict=params['on_conflict'], ignore_duplicates=True)
+        else:
+            query.insert(json.loads(request.content))
+        try:
+            return httpx.Response(200 if request.method == 'GET' else 201, json=query.execute().data)
+        except FakeAPIError as e:
+            return httpx.Response(STATUS[e.code], json={'code': e.code, 'message': str(e)})
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(async_postgrest, 'RETRY_BASE_DELAY', 0.0)
+
+
+def client_for(transport, **kwargs) -> AsyncPostgrest:
+    return AsyncPostgrest('http://supabase.test', 'key', http2=False, transport=transport, **kwargs)
+
+
+async def run_client(transport, work, **kwargs):
+    async with client_for(transport, **kwargs) as client:
+        return await work(client), client
+
+
+def test_concurrency_is_bounded():
+    db = FakeSupabase()
+    db.seed('results', [{'race_id': str(r), 'n': n} for r in range(40) for n in range(2)])
+    server = MockPostgrest(db)
+
+    rows, client = asyncio.run(run_client(
+        server.transport(),
+        lambda c: c.select_in('results', 'race_id, n', 'race_id', [str(r) for r in range(40)], chunk_size=2),
+        concurrency=3
+    ))
+
+    assert len(rows) == 80
+    assert client.requests == 20
+    assert server.in_flight_max == 3
+
+
+# ==============================================================================
+# STAGES WITH INJECTED FAILURES
+# ==============================================================================
+
+SCHOOLS = EntitySpec(
+    'Schools', 'schools', 'schools.csv', ('athletic_net_id',),
+    lambda row, context: {'name': row['name'], 'athletic_net_id': row['athletic_net_id']},
+    map_key=lambda row: row['athletic_net_id'], on_conflict='athletic_net_id'
+)
+
+ATHLETES = EntitySpec(
+    'Athletes', 'athletes', 'athletes.csv', ('first_name', 'last_name', 'school_id'),
+    lambda row, context: {'first_name': row['first_name'], 'last_name': row['last_name'],
+                          'school_id': context['schools'][row['school_athletic_net_id']]},
+    map_key=lambda row: (row['first_name'], row['last_name'], row['school_athletic_net_id']),
+    prefetch_column='school_id'
+)
+
+
+def write_meet(folder, schools=30, athletes=600):
+    (folder / 'schools.csv').write_text(
+        'athletic_net_id,name\n' + ''.join(f'{1000 + s},School {s}\n' for s in range(schools)), encoding='utf-8')
+    (folder / 'athletes.csv').write_text(
+        'first_name,last_name,school_athletic_net_id\n'
+        + ''.join(f'First{a},Last{a},{1000 + a % schools}\n' for a in range(athletes)), encoding='utf-8')
+    return str(folder)
+
+
+async def import_meet(client, folder):
+    school_ids, schools = await run_stage_async(client, SCHOOLS, folder, {}, batch_size=20, chunk_size=2)
+    athlete_ids, athletes = await run_stage_async(client, ATHLETES, folder, {'schools': school_ids},
+                                                  batch_size=250, chunk_size=10)
+    return athlete_ids, [schools, athletes]
+
+
+def table_rows(db):
+    """Rows without their ids; athletes name their school by athletic_net_id (ids depend on write order)"""
+    schools = {row['id']: row['athletic_net_id'] for row in db.tables['schools']}
+    return {
+        'schools': sorted((row['athletic_net_id'], row['name']) for row in db.tables['schools']),
+        'athletes': sorted((row['first_name'], row['last_name'], schools[row['school_id']])
+                           for row in db.tables['athletes']),
+    }
+
+
+def test_stages_survive_injected_503s_and_connect_timeouts(tmp_path, capsys):
+    folder = write_meet(tmp_path)
+    clean = FakeSupabase(unique={'schools': [('athletic_net_id',)]})
+    asyncio.run(run_client(MockPostgrest(clean).transport(), lambda c: import_meet(c, folder), concurrency=6))
+
+    db = FakeSupabase(unique={'schools': [('athletic_net_id',)]})
+    server = MockPostgrest(db, fail_rate=0.2, seed=3)
+    (athlete_ids, stats), client = asyncio.run(run_client(
+        server.transport(), lambda c: import_meet(c, folder), concurrency=6, max_retries=8
+    ))
+
+    assert server.injected >= 10 and client.retries == server.injected
+    assert 1 < server.in_flight_max <= 6
+    assert [(s.created, s.existed, s.failed) for s in stats] == [(30, 0, 0), (600, 0, 0)]
+    assert len(athlete_ids) == 600
+    assert table_rows(db) == table_rows(clean)
+
+    # Re-run: everything is found, nothing is written twice
+    (_, stats), _ = asyncio.run(run_client(
+        server.transport(), lambda c: import_meet(c, folder), concurrency=6, max_retries=8
+    ))
+    assert [(s.created, s.existed, s.failed) for s in stats] == [(0, 30, 0), (0, 600, 0)]
+    assert table_rows(db) == table_rows(clean)
+
+
+# ==============================================================================
+# WHAT IS RETRIED
+# ==============================================================================
+
+def timeout_once(db, timeout=httpx.ReadTimeout):
+    """Handler that writes the first request, then times out reading the response"""
+    backend = MockPostgrest(db)
+    attempts = []
+
+    def handle(request):
+        attempts.append(request)
+        response = backend.execute(request)
+        if len(attempts) == 1:
+            raise timeout('injected', request=request)
+        return response
+    return httpx.MockTransport(handle), attempts
+
+
+def test_plain_insert_is_not_retried_after_read_timeout():
+    db = FakeSupabase()
+    transport, attempts = timeout_once(db)
+
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(run_client(transport, lambda c: c.insert('results', [{'time_cs': 1}])))
+
+    assert len(attempts) == 1
+    assert len(db.tables['results']) == 1  # the first attempt did land
+
+
+def test_write_rows_reports_a_plain_insert_chunk_that_timed_out():
+    db = FakeSupabase()
+    transport, attempts = timeout_once(db)
+    rows = [{'time_cs': t} for t in (100, 200, 300)]
+
+    (written, failed), _ = asyncio.run(run_client(transport, lambda c: c.write_rows('results', rows)))
+
+    # Neither retried nor resent row by row: the chunk landed once
+    assert len(attempts) == 1
+    assert len(db.tables['results']) == 3
+    assert written == []
+    assert [row for row, _ in failed] == rows
+
+
+def test_ignore_duplicates_upsert_is_retried_after_read_timeout():
+    db = FakeSupabase(unique={'schools': [('athletic_net_id',)]})
+    transport, attempts = timeout_once(db)
+
+    written, client = asyncio.run(run_client(
+        transport, lambda c: c.insert('schools', [{'athletic_net_id': '1'}], on_conflict='athletic_net_id')
+    ))
+
+    assert len(attempts) == 2 and client.retries == 1
+    assert written == []  # the retry found the row already there
+    assert len(db.tables['schools']) == 1
+
+
+@pytest.mark.parametrize('error,idempotent,retry', [
+    (httpx.ReadTimeout('t'), False, False),
+    (httpx.ReadTimeout('t'), True, True),
+    (httpx.WriteTimeout('t'), False, False),
+    (httpx.RemoteProtocolError('t'), False, False),
+    (httpx.ConnectTimeout('t'), False, True),
+    (httpx.ConnectError('t'), False, True),
+    (httpx.PoolTimeout('t'), False, True),
+    (PostgrestError(503, {}), False, True),
+    (PostgrestError(429, {}), False, True),
+    (PostgrestError(502, {}), False, False),
+    (PostgrestError(502, {}), True, True),
+    (PostgrestError(409, {'code': '23505'}), True, False),
+])
+def test_retryable(error, idempotent, retry):
+    assert _retryable(error, idempotent) is retry
@@ -0,0 +1,133 @@
+"""
+The JSON payload path of athletic_net_http.
+
+Recorded pairs (race_<id>.payload.json + race_<id>.selenium.json, written by
+`athletic_net_http.py record`) must parse the same race both ways. The
+synthetic payload only checks the conversion of the assumed key names; it
+says nothing about what the live site returns.
+"""
+
+import csv
+import glob
+import json
+import os
+from dataclasses import asdict
+
+import httpx
+import pytest
+
+from athletic_net_http import MAX_MISSES_WITHOUT_HIT, HttpRaceFetcher, race_page_from_payload
+from athletic_net_scraper_v2 import RacePage, parse_race_page
+from conftest import FIXTURES_DIR
+from rate_limiter import AdaptiveRateLimiter
+
+HTTP_FIXTURES = os.path.join(FIXTURES_DIR, 'http')
+RECORDED = sorted(glob.glob(os.path.join(HTTP_FIXTURES, 'race_*.payload.json')))
+SYNTHETIC = os.path.join(HTTP_FIXTURES, 'synthetic_race_1053255.payload.json')
+
+
+def _load(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _parse(page, meet_id):
+    schools, athletes, results = [], [], []
+    race = parse_race_page(page, meet_id, 2025, schools, athletes, results)
+    return race, schools, athletes, results
+
+
+@pytest.mark.parametrize('payload_path', RECORDED, ids=os.path.basename)
+def test_recorded_payload_parses_like_selenium_page(payload_path):
+    selenium = _load(payload_path.replace('.payload.json', '.selenium.json'))
+    meet_id, race_id = selenium['meet_id'], selenium['race_id']
+
+    http_page = race_page_from_payload(race_id, _load(payload_path))
+    assert http_page is not None
+
+    dom_page = RacePage(race_id=race_id, body_text=selenium['body_text'],
+                        row_texts=selenium['row_texts'])
+
+    http_race, http_schools, http_athletes, http_results = _parse(http_page, meet_id)
+    dom_race, dom_schools, dom_athletes, dom_results = _parse(dom_page, meet_id)
+
+    assert http_race is not None
+    assert asdict(http_race) == asdict(dom_race)
+    assert [asdict(s) for s in http_schools] == [asdict(s) for s in dom_schools]
+    assert [asdict(a) for a in http_athletes] == [asdict(a) for a in dom_athletes]
+    assert [asdict(r) for r in http_results] == [asdict(r) for r in dom_results]
+    assert len(http_results) == len(selenium['row_texts'])
+
+
+def test_payload_key_names_are_pinned():
+    payload = _load(SYNTHETIC)
+    page = race_page_from_payload('1', payload)
+    assert page.body_text == 'Mens 2.74 Miles Varsity'
+    assert page.row_texts[0].splitlines()[:3] == ['1', 'VC', 'Vincent Cheung']
+
+    renamed = {'race': payload['race'],
+               'results': [{'Name': 'Vincent Cheung', **r} for r in payload['results']]}
+    renamed['results'] = [{k: v for k, v in r.items() if k not in ('FirstName', 'LastName')}
+                          for r in renamed['results']]
+    assert race_page_from_payload('1', renamed) is None
+
+
+@pytest.mark.parametrize('name,gender,title', [
+    ('2.74 Miles Varsity', 'M', 'Mens 2.74 Miles Varsity'),
+    ('5K Varsity', 'F', 'Womens 5K Varsity'),
+    ('Boys 3 Mile Varsity', 'M', 'Boys 3 Mile Varsity'),
+    ('Girls 5K JV', 'F', 'Girls 5K JV'),
+    ('Varsity (F)', 'F', 'Varsity (F)'),
+    ("Men's 8K", 'M', "Men's 8K"),
+])
+def test_gender_word_is_added_only_when_missing(name, gender, title):
+    payload = {'race': {'RaceName': name, 'Gender': gender},
+               'results': [{'Place': 1, 'FirstName': 'A', 'LastName': 'B', 'SchoolName': 'S', 'Result': '15:00.0'}]}
+    assert race_page_from_payload('1', payload).body_text == title
+
+
+def test_synthetic_payload_renders_the_scraped_rows():
+    """The synthetic payload was built from this CSV; its rows must parse back to it"""
+    folder = os.path.join(os.path.dirname(os.path.dirname(FIXTURES_DIR)),
+                          'processed', '1761627176', 'meet_265306_1761627031')
+    if not os.path.isdir(folder):
+        pytest.skip('scraped meet folder not present')
+
+    with open(os.path.join(folder, 'results.csv'), newline='', encoding='utf-8') as f:
+        scraped = [r for r in csv.DictReader(f) if r['athletic_net_race_id'] == '1053255']
+
+    page = race_page_from_payload('1053255', _load(SYNTHETIC))
+    _, _, _, results = _parse(page, '265306')
+    assert [(r.athlete_name, r.time_cs, r.place_overall) for r in results] == \
+        [(r['athlete_name'], int(r['time_cs']), int(r['place_overall'])) for r in scraped]
+
+
+def test_fetcher_gives_up_after_misses_without_a_hit():
+    requests = []
+
+    def handle(request):
+        requests.append(request)
+        return httpx.Response(404, text='Not Found')
+
+    limiter = AdaptiveRateLimiter(rate=1000, max_rate=1000)
+    with HttpRaceFetcher(limiter=limiter, transport=httpx.MockTransport(handle)) as fetcher:
+        pages = [fetcher.fetch_race_page('1', str(race_id)) for race_id in range(10)]
+
+    assert pages == [None] * 10
+    assert len(requests) == MAX_MISSES_WITHOUT_HIT
+    assert fetcher.gave_up
+
+
+def test_fetcher_keeps_going_once_it_has_hit():
+    payload = _load(SYNTHETIC)
+    served = iter([payload] + [None] * 9)
+
+    def handle(request):
+        body = next(served)
+        return httpx.Response(200, json=body) if body else httpx.Response(404)
+
+    limiter = AdaptiveRateLimiter(rate=1000, max_rate=1000)
+    with HttpRaceFetcher(limiter=limiter, transport=httpx.MockTransport(handle)) as fetcher:
+        pages = [fetcher.fetch_race_page('1', str(race_id)) for race_id in range(10)]
+
+    assert pages[0] is not None and fetcher.hits == 1 and fetcher.misses == 9
@@ -0,0 +1,57 @@
+"""run_jobs against stand-in worker functions (no Chrome)"""
+
+import os
+
+from batch_scrape import JobStore, run_jobs
+from rate_limiter import AdaptiveRateLimiter
+
+
+def report_rate(meet_id, http_first, use_cache):
+    from rate_limiter import RATE_LIMITER
+    return f"rate={RATE_LIMITER.rate:.3f}/max={RATE_LIMITER.max_rate:.3f}", 1
+
+
+def crash_once(meet_id, http_first, use_cache):
+    marker = os.path.join(os.environ['BATCH_TEST_DIR'], f"crashed_{meet_id}")
+    if meet_id == 'crash' and not os.path.exists(marker):
+        open(marker, 'w').close()
+        os._exit(1)
+    return f"out/{meet_id}", 3
+
+
+def always_crash(meet_id, http_first, use_cache):
+    os._exit(1)
+
+
+def test_workers_share_the_rate_budget(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.sqlite'))
+    store.enqueue(['1', '2', '3'])
+    run_jobs(store, processes=3, job=report_rate)
+
+    expected = AdaptiveRateLimiter()
+    folders = {row[0] for row in store.conn.execute("SELECT output_folder FROM jobs")}
+    assert folders == {f"rate={expected.rate / 3:.3f}/max={expected.max_rate / 3:.3f}"}
+
+
+def test_broken_pool_requeues_running_jobs(tmp_path, monkeypatch):
+    monkeypatch.setenv('BATCH_TEST_DIR', str(tmp_path))
+    store = JobStore(str(tmp_path / 'jobs.sqlite'))
+    store.enqueue(['a', 'crash', 'b', 'c'])
+
+    summary = run_jobs(store, processes=2, job=crash_once)
+
+    assert store.counts() == {'pending': 0, 'running': 0, 'done': 4, 'failed': 0}
+    assert summary['done'] == 4
+    assert summary['retried'] >= 1
+
+
+def test_meet_that_keeps_killing_its_worker_fails(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.sqlite'))
+    store.enqueue(['crash'])
+
+    summary = run_jobs(store, processes=1, max_attempts=2, job=always_crash)
+
+    assert store.counts()['failed'] == 1
+    assert summary['failed'] == 1
+    job = store.conn.execute("SELECT attempts, last_error FROM jobs").fetchone()
+    assert (job['attempts'], job['last_error']) == (2, 'worker process died')
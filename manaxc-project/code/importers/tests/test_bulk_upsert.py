@@ -0,0 +1,103 @@
+"""select_in chunking/paging and the write_rows fallbacks against FakeSupabase"""
+
+import httpx
+
+from bulk_upsert import index_rows, select_in, write_rows
+from fake_supabase import FakeSupabase
+
+
+def test_select_in_chunks_keys_and_pages_rows():
+    client = FakeSupabase()
+    client.seed('results', [{'race_id': str(key), 'n': n} for key in range(25) for n in range(3)])
+
+    keys = [str(key) for key in range(25)] + ['3', '', None]  # duplicates and empties are dropped
+    rows = select_in(client, 'results', 'race_id, n', 'race_id', keys, chunk_size=10, page_size=7)
+
+    assert sorted((r['race_id'], r['n']) for r in rows) == sorted((str(k), n) for k in range(25) for n in range(3))
+    queries = client.calls('select', 'results')
+    # 30 + 30 + 15 rows in pages of 7: 5 + 5 + 3 requests
+    assert len(queries) == 13
+    assert [len(q.filters[0][2]) for q in queries] == [10] * 5 + [10] * 5 + [5] * 3
+    assert [q.window for q in queries[:5]] == [(0, 6), (7, 13), (14, 20), (21, 27), (28, 34)]
+
+
+def test_select_in_reads_past_an_exact_page():
+    client = FakeSupabase()
+    client.seed('races', [{'meet_id': 'm', 'name': f'race {i}'} for i in range(14)])
+
+    rows = select_in(client, 'races', 'name', 'meet_id', ['m'], page_size=7)
+
+    assert len(rows) == 14
+    assert len(client.calls('select', 'races')) == 3  # 7, 7, then an empty page
+
+
+def test_select_in_without_keys_sends_nothing():
+    client = FakeSupabase()
+    assert select_in(client, 'races', 'id', 'id', []) == []
+    assert client.requests == []
+
+
+def test_index_rows_matches_numbers_as_strings():
+    index = index_rows([{'athletic_net_id': 1234, 'id': 'a'}, {'athletic_net_id': 1234, 'id': 'b'}], 'athletic_net_id')
+    assert index == {'1234': {'athletic_net_id': 1234, 'id': 'a'}}
+
+
+def test_write_rows_upsert_skips_conflicts():
+    client = FakeSupabase(unique={'schools': [('athletic_net_id',)]})
+    client.seed('schools', [{'athletic_net_id': '1', 'name': 'Leland'}])
+
+    rows = [{'athletic_net_id': str(i), 'name': f'School {i}'} for i in range(5)]
+    written, failed = write_rows(client, 'schools', rows, on_conflict='athletic_net_id', chunk_size=2)
+
+    assert sorted(r['athletic_net_id'] for r in written) == ['0', '2', '3', '4']
+    assert failed == []
+    assert len(client.calls('upsert', 'schools')) == 3
+
+
+def test_write_rows_falls_back_to_inserts_without_a_constraint():
+    client = FakeSupabase()  # no unique constraint matches on_conflict (42P10)
+
+    rows = [{'athletic_net_id': str(i)} for i in range(5)]
+    written, failed = write_rows(client, 'venues', rows, on_conflict='athletic_net_id', chunk_size=2)
+
+    assert len(written) == 5 and failed == []
+    # One rejected upsert, then plain inserts for that chunk and every later one
+    assert [op for op, _, _ in client.requests] == ['upsert', 'insert', 'insert', 'insert']
+
+
+def test_write_rows_isolates_bad_rows():
+    client = FakeSupabase(checks={'results': lambda row: row['time_cs'] > 0})
+
+    rows = [{'time_cs': t} for t in (100, 200, -1, 300, 400)]
+    written, failed = write_rows(client, 'results', rows, chunk_size=3)
+
+    assert sorted(r['time_cs'] for r in written) == [100, 200, 300, 400]
+    assert [(row['time_cs'], '23514' in str(e)) for row, e in failed] == [(-1, True)]
+    # Chunk [100, 200, -1] fails as a whole, then goes row by row; [300, 400] is one insert
+    assert len(client.calls('insert', 'results')) == 1 + 3 + 1
+
+
+def test_write_rows_after_42P10_isolates_bad_rows_with_inserts():
+    client = FakeSupabase(checks={'meets': lambda row: row['name'] != 'bad'})
+
+    rows = [{'name': 'a'}, {'name': 'bad'}, {'name': 'c'}]
+    written, failed = write_rows(client, 'meets', rows, on_conflict='athletic_net_id')
+
+    assert [r['name'] for r in written] == ['a', 'c']
+    assert [row['name'] for row, _ in failed] == ['bad']
+    assert [op for op, _, _ in client.requests] == ['upsert', 'insert', 'insert', 'insert', 'insert']
+    assert len(client.tables['meets']) == 2
+
+
+def test_write_rows_does_not_resend_a_plain_insert_after_read_timeout():
+    client = FakeSupabase()
+    client.fail_next = [httpx.ReadTimeout('t')]
+
+    rows = [{'time_cs': t} for t in (100, 200, 300)]
+    written, failed = write_rows(client, 'results', rows, chunk_size=2)
+
+    # The timed-out chunk may have landed, so it is reported rather than resent
+    assert [row['time_cs'] for row, _ in failed] == [100, 200]
+    assert all(isinstance(e, httpx.ReadTimeout) for _, e in failed)
+    assert [r['time_cs'] for r in written] == [300]
+    assert len(client.calls('insert', 'results')) == 2
@@ -0,0 +1,31 @@
+"""Race name distances: the miles column follows classify_race_name"""
+
+import pytest
+
+from column_parsers import race_name_distances_meters, race_name_distances_miles
+from race_classifier import classify_race_name
+
+NAMES = [
+    ('Mens 2.74 Miles Varsity', 4409, 2.74),
+    ('Womens 4,000 Meters Frosh', 4000, 2.485),
+    ('5K JV', 5000, 3.107),
+    ('3 Mile Varsity', 4828, 3.0),
+    ('Frosh/Soph 2Mi', 3218, 2.0),
+    ('1.5 mi Novice', 2414, 1.5),
+    ('5000m Varsity Boys', 5000, 3.107),
+    ('3200m Open', 3200, 1.988),
+]
+
+
+@pytest.mark.parametrize('name,meters,miles', NAMES)
+def test_classifier_distance(name, meters, miles):
+    assert classify_race_name(name).distance_meters == meters
+
+
+def test_miles_agree_with_meters():
+    names = [name for name, _, _ in NAMES] + ['Mens 2 Mixed Relay', 'Girls Varsity']
+    meters = race_name_distances_meters(names)
+    miles = race_name_distances_miles(names)
+
+    assert miles.values[:len(NAMES)] == [m for _, _, m in NAMES]
+    assert miles.invalid == meters.invalid == [len(NAMES), len(NAMES) + 1]
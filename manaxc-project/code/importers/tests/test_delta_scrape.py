@@ -0,0 +1,80 @@
+"""scrape_by_meet --since must fetch live pages even when the page cache has them"""
+
+import pytest
+
+import athletic_net_scraper_v2 as scraper
+from athletic_net_scraper_v2 import MeetPage, RacePage, meet_page_url, race_page_url
+from driver_pool import DriverPool
+from page_cache import PageCache
+from rate_limiter import AdaptiveRateLimiter
+from scrape_folder import write_scrape_folder
+
+TITLE = 'Big Meet - Meet Results'
+BODY = 'Big Meet\nWed, Oct 1, 2025\nBig Park, San Jose, CA\nResults'
+
+
+class FakeDriver:
+    def execute_script(self, script):
+        return 1
+
+    def quit(self):
+        pass
+
+
+def race_page(race_id, seconds):
+    rows = [f"{place}\nRunner{race_id}_{place} Last\nSchool {place % 2}\n{seconds // 60}:{seconds % 60:02d}.{place}\nYr: 11"
+            for place in range(1, 4)]
+    return RacePage(race_id, 'Big Meet\nResults\nMens 5,000 Meters Varsity', rows)
+
+
+@pytest.fixture
+def live_site(monkeypatch):
+    """The site now has a third race and a corrected race 5001"""
+    fetched = []
+
+    def fetch_meet_page(driver, meet_id, limiter=None):
+        fetched.append('meet')
+        return MeetPage(meet_id, TITLE, BODY, ['5000', '5001', '5002'])
+
+    def fetch_race_page(driver, meet_id, race_id, limiter=None):
+        fetched.append(race_id)
+        return race_page(race_id, 960 if race_id == '5001' else 900)
+
+    monkeypatch.setattr(scraper, 'fetch_meet_page', fetch_meet_page)
+    monkeypatch.setattr(scraper, 'fetch_race_page', fetch_race_page)
+    return fetched
+
+
+@pytest.fixture
+def stale_cache(tmp_path):
+    """The page cache still has last week's meet page (two races) and race pages"""
+    cache = PageCache(str(tmp_path / 'cache'))
+    cache.put(meet_page_url('777'), scraper.asdict(MeetPage('777', TITLE, BODY, ['5000', '5001'])))
+    for race_id in ('5000', '5001'):
+        cache.put(race_page_url('777', race_id), scraper.asdict(race_page(race_id, 900)))
+    return cache
+
+
+def scrape(cache, previous_folder=None):
+    limiter = AdaptiveRateLimiter(rate=1000, max_rate=1000)
+    with DriverPool(FakeDriver) as pool:
+        return scraper.scrape_by_meet('777', limiter=limiter, pool=pool, cache=cache,
+                                      previous_folder=previous_folder)
+
+
+def test_delta_ignores_cached_pages_but_refreshes_them(tmp_path, live_site, stale_cache):
+    previous = write_scrape_folder(str(tmp_path / 'previous'))
+
+    result = scrape(stale_cache, previous)
+
+    assert live_site == ['meet', '5000', '5001', '5002']
+    assert {race.athletic_net_race_id for race in result.races} >= {'5001', '5002'}
+    assert stale_cache.get(meet_page_url('777'))['race_ids'] == ['5000', '5001', '5002']
+    assert stale_cache.get(race_page_url('777', '5001'))['row_texts'][0].split('\n')[3] == '16:00.1'
+
+
+def test_plain_scrape_reads_the_cache(live_site, stale_cache):
+    result = scrape(stale_cache)
+
+    assert live_site == []
+    assert [race.athletic_net_race_id for race in result.races] == ['5000', '5001']
@@ -0,0 +1,54 @@
+"""DriverPool bookkeeping under concurrent borrows"""
+
+import threading
+
+from driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    def execute_script(self, script):
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_every_borrow_is_counted_and_worn_drivers_recycled():
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    pool = DriverPool(factory, size=4, max_pages=5)
+    threads, borrows = 8, 500
+
+    def work():
+        for _ in range(borrows):
+            with pool.driver():
+                pass
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    # Each recycled driver served exactly max_pages borrows, the rest are idle
+    assert pool.recycled * 5 + sum(pool._uses.values()) == threads * borrows
+    assert pool.started == len(drivers) == pool.recycled + len(pool._idle)
+    assert all(driver.quit_called for driver in drivers if driver not in pool._idle)
+    pool.close()
+    assert all(driver.quit_called for driver in drivers)
+
+
+def test_broken_driver_frees_its_slot():
+    pool = DriverPool(FakeDriver, size=1)
+    driver = pool.acquire()
+    pool.release(driver, broken=True)
+
+    assert pool.crashed == 1 and pool._alive == 0
+    assert pool.acquire() is not driver
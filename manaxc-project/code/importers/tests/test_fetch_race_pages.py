@@ -0,0 +1,60 @@
+"""fetch_race_pages: page order and the bounded submit window"""
+
+import threading
+import time
+
+import pytest
+
+from athletic_net_scraper_v2 import RacePage, fetch_race_pages
+
+
+class CountingFetcher:
+    """HTTP backend stand-in that records when each race started"""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.started = []
+        self.in_flight = 0
+        self.in_flight_max = 0
+        self.lock = threading.Lock()
+
+    def fetch_race_page(self, meet_id, race_id):
+        with self.lock:
+            self.started.append(race_id)
+            self.in_flight += 1
+            self.in_flight_max = max(self.in_flight_max, self.in_flight)
+        time.sleep(0.005 if int(race_id) % 2 else 0.001)
+        with self.lock:
+            self.in_flight -= 1
+        if race_id == self.fail_on:
+            raise RuntimeError('broken pool')
+        return RacePage(race_id, f'body {race_id}', [])
+
+
+def test_pages_come_back_in_order_with_at_most_workers_in_flight():
+    fetcher = CountingFetcher()
+    race_ids = [str(i) for i in range(20)]
+
+    pages = list(fetch_race_pages('1', race_ids, pool=None, workers=3, http_fetcher=fetcher))
+
+    assert [page.race_id for page in pages] == race_ids
+    assert fetcher.in_flight_max <= 3
+
+
+def test_stopping_early_leaves_later_races_unstarted():
+    fetcher = CountingFetcher()
+    pages = fetch_race_pages('1', [str(i) for i in range(50)], pool=None, workers=3, http_fetcher=fetcher)
+
+    assert next(pages).race_id == '0'
+    pages.close()
+
+    assert len(fetcher.started) <= 4
+
+
+def test_a_failing_race_stops_the_queue():
+    fetcher = CountingFetcher(fail_on='2')
+
+    with pytest.raises(RuntimeError):
+        list(fetch_race_pages('1', [str(i) for i in range(50)], pool=None, workers=3, http_fetcher=fetcher))
+
+    assert len(fetcher.started) <= 5
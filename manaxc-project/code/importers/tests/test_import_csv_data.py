@@ -0,0 +1,55 @@
+"""import_csv_folder end to end against FakeSupabase"""
+
+from scrape_folder import scrape_rows, write_scrape_folder
+
+
+def rows_without_ids():
+    rows = scrape_rows()
+    rows['schools'] += [
+        {'name': 'No ID High', 'short_name': 'NIH', 'state': 'CA', 'athletic_net_id': ''},
+        {'name': 'No ID Academy', 'short_name': 'NIA', 'state': 'CA', 'athletic_net_id': ''},
+    ]
+    rows['meets'] += [
+        {'name': 'Dual Meet', 'meet_date': '2025-09-01', 'venue_name': 'Big Park', 'season_year': 2025},
+        {'name': 'Dual Meet', 'meet_date': '2025-09-15', 'venue_name': 'Big Park', 'season_year': 2025},
+        {'name': 'Twilight', 'meet_date': '2025-09-15', 'venue_name': 'Big Park', 'season_year': 2025},
+    ]
+    return rows
+
+
+def test_schools_and_meets_without_ids_are_each_created(import_csv_data, tmp_path):
+    folder = write_scrape_folder(str(tmp_path / 'meet_777'), rows_without_ids())
+
+    stats = import_csv_data.import_csv_folder(folder)
+
+    tables = import_csv_data.supabase.tables
+    assert stats['schools_created'] == 5
+    assert sorted(s['name'] for s in tables['schools'] if s['athletic_net_id'] is None) == \
+        ['No ID Academy', 'No ID High']
+    assert stats['meets_created'] == 4
+    assert sorted((m['name'], m['meet_date']) for m in tables['meets'] if m['athletic_net_id'] is None) == \
+        [('Dual Meet', '2025-09-01'), ('Dual Meet', '2025-09-15'), ('Twilight', '2025-09-15')]
+
+
+def test_rerun_creates_nothing(import_csv_data, tmp_path):
+    folder = write_scrape_folder(str(tmp_path / 'meet_777'), rows_without_ids())
+    import_csv_data.import_csv_folder(folder)
+    counts = {table: len(rows) for table, rows in import_csv_data.supabase.tables.items()}
+
+    stats = import_csv_data.import_csv_folder(folder, force=True)
+
+    assert {table: len(rows) for table, rows in import_csv_data.supabase.tables.items()} == counts
+    assert stats['results_inserted'] == 0
+    assert stats['skipped_already_exists'] == 10
+
+
+def test_repeated_rows_in_one_folder_are_queued_once(import_csv_data, tmp_path):
+    rows = scrape_rows()
+    rows['results'].append(dict(rows['results'][0]))  # the scrape listed a result twice
+    folder = write_scrape_folder(str(tmp_path / 'meet_777'), rows)
+
+    stats = import_csv_data.import_csv_folder(folder)
+
+    written = [row for query in import_csv_data.supabase.calls('upsert', 'results') for row in query.payload]
+    assert len(written) == 10
+    assert stats['results_inserted'] == 10 and stats['skipped_already_exists'] == 1
@@ -0,0 +1,65 @@
+"""Ledger skips are confirmed against the database; failed scrapes get no manifest"""
+
+import os
+
+import pytest
+
+from athletic_net_scraper_v2 import CsvSink
+from scrape_folder import write_scrape_folder
+from scrape_manifest import MANIFEST_FILE, load_manifest
+
+
+def test_failed_scrape_writes_no_manifest(tmp_path):
+    with CsvSink(str(tmp_path / 'ok')):
+        pass
+    assert os.path.exists(tmp_path / 'ok' / MANIFEST_FILE)
+
+    failed = tmp_path / 'failed'
+    failed.mkdir()
+    (failed / MANIFEST_FILE).write_text('{}')  # from an earlier run into the same folder
+    with pytest.raises(RuntimeError):
+        with CsvSink(str(failed)):
+            raise RuntimeError('driver crashed')
+    assert not os.path.exists(failed / MANIFEST_FILE)
+    assert os.path.exists(failed / 'results.csv')
+
+
+@pytest.fixture
+def imported_folder(import_csv_data, tmp_path):
+    """A folder the ledger says was imported, with its races in the fake database"""
+    folder = write_scrape_folder(str(tmp_path / 'meet_777'))
+    manifest = load_manifest(folder)
+    import_csv_data.ImportLedger().record(manifest, folder)
+    import_csv_data.supabase.seed('races', [
+        {'athletic_net_race_id': race_id} for race_id in manifest['races']
+    ])
+    return folder
+
+
+def test_identical_folder_is_skipped_while_its_races_exist(import_csv_data, imported_folder):
+    stats = import_csv_data.import_csv_folder(imported_folder, preview_only=True)
+    assert stats['already_imported']
+    assert len(import_csv_data.supabase.calls('select', 'races')) == 1
+
+
+def test_deleted_races_are_imported_again(import_csv_data, imported_folder, capsys):
+    supabase = import_csv_data.supabase
+    supabase.tables['races'] = [r for r in supabase.tables['races'] if r['athletic_net_race_id'] != '5001']
+
+    stats = import_csv_data.import_csv_folder(imported_folder, preview_only=True)
+
+    assert not stats['already_imported']
+    out = capsys.readouterr().out
+    assert '1 races in the import ledger are no longer in the database' in out
+    assert '1 of 2 races already imported' in out
+
+
+def test_unchanged_race_skip_is_confirmed(import_csv_data, tmp_path, capsys):
+    folder = write_scrape_folder(str(tmp_path / 'meet_777'))
+    manifest = load_manifest(folder)
+    import_csv_data.ImportLedger().record(manifest, folder, ['5000'])
+
+    stats = import_csv_data.import_csv_folder(folder, preview_only=True)
+
+    assert not stats['already_imported']
+    assert 'races already imported' not in capsys.readouterr().out
@@ -0,0 +1,192 @@
+"""
+import_postgres_copy against a real Postgres built from database/01-core-tables.sql
+and 02-results-migration.sql.
+
+The server is TEST_DATABASE_URL if set (each test creates and drops its own
+database there), else a throwaway pgserver instance; without either, or
+without psycopg, the tests are skipped.
+"""
+
+import itertools
+import json
+import os
+import re
+
+import pytest
+
+psycopg = pytest.importorskip('psycopg')
+pytest.importorskip('dotenv')
+
+from psycopg.conninfo import make_conninfo  # noqa: E402
+
+import import_postgres_copy  # noqa: E402
+import scrape_manifest  # noqa: E402
+from scrape_folder import scrape_rows, write_scrape_folder  # noqa: E402
+
+DATABASE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'database')
+SCHEMA_FILES = ('01-core-tables.sql', '02-results-migration.sql')
+UUID_OSSP = re.compile(r'CREATE EXTENSION IF NOT EXISTS "uuid-ossp";')
+
+_databases = itertools.count(1)
+
+
+@pytest.fixture(scope='module')
+def server_url(tmp_path_factory):
+    if os.getenv('TEST_DATABASE_URL'):
+        return os.getenv('TEST_DATABASE_URL')
+    pgserver = pytest.importorskip('pgserver')
+    server = pgserver.get_server(str(tmp_path_factory.mktemp('pgdata')), cleanup_mode='stop')
+    return server.get_uri()
+
+
+def load_schema(conn):
+    try:
+        conn.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"')
+    except psycopg.Error:
+        # Server built without contrib: gen_random_uuid() is core since Postgres 13
+        conn.execute("CREATE FUNCTION uuid_generate_v4() RETURNS uuid LANGUAGE sql AS $$ SELECT gen_random_uuid() $$")
+    for filename in SCHEMA_FILES:
+        with open(os.path.join(DATABASE_DIR, filename), 'r', encoding='utf-8') as f:
+            conn.execute(UUID_OSSP.sub('', f.read()))
+
+
+@pytest.fixture
+def dsn(server_url, tmp_path, monkeypatch):
+    """A fresh database with the schema loaded, and a ledger under tmp_path"""
+    monkeypatch.setattr(scrape_manifest, 'IMPORT_LEDGER_FILE', str(tmp_path / 'import_ledger.json'))
+    name = f"manaxc_test_{os.getpid()}_{next(_databases)}"
+    with psycopg.connect(server_url, autocommit=True) as admin:
+        admin.execute(f'DROP DATABASE IF EXISTS "{name}"')
+        admin.execute(f'CREATE DATABASE "{name}"')
+    database_url = make_conninfo(server_url, dbname=name)
+    with psycopg.connect(database_url, autocommit=True) as conn:
+        load_schema(conn)
+    yield database_url
+    with psycopg.connect(server_url, autocommit=True) as admin:
+        admin.execute(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
+
+
+def query(dsn, statement, params=None):
+    with psycopg.connect(dsn) as conn:
+        return conn.execute(statement, params).fetchall()
+
+
+def table_counts(dsn):
+    return {table: query(dsn, f"SELECT count(*) FROM {table}")[0][0]
+            for table in ('courses', 'schools', 'athletes', 'meets', 'races', 'results')}
+
+
+def race_times(dsn, race_net_id):
+    return sorted(row[0] for row in query(
+        dsn, "SELECT r.time_cs FROM results r JOIN races x ON x.id = r.race_id WHERE x.athletic_net_id = %s",
+        (race_net_id,)
+    ))
+
+
+def rows_with_athlete_ids():
+    rows = scrape_rows(results_per_race=5, races=2, schools=3)
+    for i, athlete in enumerate(rows['athletes']):
+        athlete['athletic_net_id'] = str(90000 + i)
+    return rows
+
+
+EXPECTED = {'courses': 1, 'schools': 3, 'athletes': 10, 'meets': 1, 'races': 2, 'results': 10}
+
+
+def test_import_and_rerun(tmp_path, dsn):
+    folder = write_scrape_folder(str(tmp_path / 'meet'), rows_with_athlete_ids())
+
+    stats = import_postgres_copy.import_folder_copy(folder, dsn=dsn)
+    assert stats['results_inserted'] == 10 and stats['validation_errors'] == []
+    assert table_counts(dsn) == EXPECTED
+
+    # Same folder again: the ledger of this database skips it outright
+    assert import_postgres_copy.import_folder_copy(folder, dsn=dsn)['already_imported']
+
+    # Forced: every row is matched, nothing is written twice
+    stats = import_postgres_copy.import_folder_copy(folder, dsn=dsn, force=True)
+    assert stats['results_inserted'] == 0 and stats['skipped_already_exists'] == 10
+    assert table_counts(dsn) == EXPECTED
+
+
+def test_ledger_is_kept_per_database(tmp_path, dsn):
+    folder = write_scrape_folder(str(tmp_path / 'meet'), rows_with_athlete_ids())
+    # The Supabase REST importer's ledger already has the folder
+    scrape_manifest.ImportLedger(scrape_manifest.IMPORT_LEDGER_FILE).record(
+        scrape_manifest.load_manifest(folder), folder)
+
+    stats = import_postgres_copy.import_folder_copy(folder, dsn=dsn)
+
+    assert not stats['already_imported'] and stats['results_inserted'] == 10
+    ledger_file = scrape_manifest.target_ledger_file(import_postgres_copy.ledger_target(dsn))
+    assert ledger_file != scrape_manifest.IMPORT_LEDGER_FILE and os.path.exists(ledger_file)
+
+
+def test_preview_rolls_back(tmp_path, dsn):
+    folder = write_scrape_folder(str(tmp_path / 'meet'), rows_with_athlete_ids())
+
+    stats = import_postgres_copy.import_folder_copy(folder, dsn=dsn, preview_only=True)
+
+    assert stats['results_inserted'] == 10
+    assert set(table_counts(dsn).values()) == {0}
+    # Nothing was recorded either
+    assert import_postgres_copy.import_folder_copy(folder, dsn=dsn)['results_inserted'] == 10
+
+
+def test_delta_replaces_changed_races(tmp_path, dsn):
+    rows = rows_with_athlete_ids()
+    import_postgres_copy.import_folder_copy(write_scrape_folder(str(tmp_path / 'meet'), rows), dsn=dsn)
+    old_times = race_times(dsn, '5001')
+
+    for result in rows['results']:
+        if result['athletic_net_race_id'] == '5001':
+            result['time_cs'] += 1
+    delta = write_scrape_folder(str(tmp_path / 'delta'), rows)
+    with open(os.path.join(delta, 'metadata.json'), 'w', encoding='utf-8') as f:
+        json.dump({'delta': {'changed_races': ['5001']}}, f)
+
+    stats = import_postgres_copy.import_folder_copy(delta, dsn=dsn)
+
+    assert stats['races_replaced'] == 1 and stats['results_inserted'] == 5
+    assert stats['skipped_unchanged_results'] == 5  # race 5000 has the same fingerprint
+    assert race_times(dsn, '5001') == [t + 1 for t in old_times]
+    assert table_counts(dsn) == EXPECTED
+
+
+def test_ties_are_kept_and_duplicates_skipped(tmp_path, dsn):
+    rows = rows_with_athlete_ids()
+    import_postgres_copy.import_folder_copy(write_scrape_folder(str(tmp_path / 'meet'), rows), dsn=dsn)
+
+    first = rows['athletes'][0]  # First0_0 Last0_0 of school 1000, 90000, in race 5000
+    first_time = rows['results'][0]['time_cs']
+    rows['athletes'] += [
+        dict(first, name='Same Runner', first_name='Same', last_name='Runner', school_athletic_net_id='1001'),
+        dict(first, name='Tie Runner', first_name='Tie', last_name='Runner', school_athletic_net_id='1001',
+             athletic_net_id='123456'),
+    ]
+    rows['results'] += [
+        dict(rows['results'][0], athlete_name=name, athlete_first_name='', athlete_last_name='',
+             athlete_school_id='1001')
+        for name in ('Same Runner', 'Tie Runner')
+    ]
+
+    stats = import_postgres_copy.import_folder_copy(write_scrape_folder(str(tmp_path / 'more'), rows), dsn=dsn)
+
+    # Same athletic_net_id under another name is the same result; another athlete at that time is a tie
+    assert stats['results_inserted'] == 1
+    assert query(dsn, "SELECT a.name FROM results r JOIN athletes a ON a.id = r.athlete_id "
+                      "JOIN races x ON x.id = r.race_id WHERE x.athletic_net_id = '5000' AND r.time_cs = %s "
+                      "ORDER BY 1", (first_time,)) == [('First0_0 Last0_0',), ('Tie Runner',)]
+
+
+def test_bad_row_rolls_everything_back(tmp_path, dsn):
+    rows = rows_with_athlete_ids()
+    rows['schools'].append({'name': 'Brand New', 'athletic_net_id': '4242', 'state': 'CA'})
+    rows['meets'][0]['meet_date'] = 'not a date'  # passes validation, fails the INSERT
+    folder = write_scrape_folder(str(tmp_path / 'meet'), rows)
+
+    with pytest.raises(psycopg.Error):
+        import_postgres_copy.import_folder_copy(folder, dsn=dsn)
+
+    assert set(table_counts(dsn).values()) == {0}
+    assert not os.path.exists(scrape_manifest.target_ledger_file(import_postgres_copy.ledger_target(dsn)))
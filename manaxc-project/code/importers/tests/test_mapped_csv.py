@@ -0,0 +1,44 @@
+"""MappedCsv must read exactly what csv.DictReader reads"""
+
+import csv
+
+import pytest
+
+from mapped_csv import MappedCsv
+
+CASES = {
+    'blank_lines': 'a,b\n1,2\n\n3,4\n',
+    'crlf': 'a,b\r\n1,2\r\n\r\n3,4\r\n',
+    'quoted_newlines': 'a,b\r\n"line one\nline two",2\r\n\r\n"x\r\ny",4\r\n5,6',
+    'quoted_quotes': 'a,b\n"he said ""hi""",1\n\n\n"""",2\n',
+    'trailing_blank_lines': 'a,b\n1,2\n\n\n',
+    'header_only': 'a,b\n',
+}
+
+
+@pytest.mark.parametrize('text', CASES.values(), ids=CASES.keys())
+def test_matches_dict_reader(tmp_path, text):
+    path = tmp_path / 'rows.csv'
+    path.write_bytes(text.encode('utf-8'))
+    with open(path, encoding='utf-8', newline='') as f:
+        expected = list(csv.DictReader(f))
+
+    with MappedCsv(str(path)) as rows:
+        assert len(rows) == len(expected)
+        assert list(rows) == expected
+        assert [rows[i] for i in range(len(rows))] == expected
+        for start in range(len(expected) + 1):
+            for stop in range(start, len(expected) + 1):
+                assert rows[start:stop] == expected[start:stop]
+        for size in (1, 2, 3):
+            assert [row for batch in rows.batches(size) for row in batch] == expected
+
+
+def test_typed_columns(tmp_path):
+    path = tmp_path / 'results.csv'
+    path.write_text('time_cs,grade,needs_review\n90550,12,True\n\n,11,False\n', encoding='utf-8')
+    with MappedCsv(str(path), {'time_cs': int, 'grade': int, 'needs_review': lambda v: v == 'True'}) as rows:
+        assert list(rows) == [
+            {'time_cs': 90550, 'grade': 12, 'needs_review': True},
+            {'time_cs': None, 'grade': 11, 'needs_review': False},
+        ]
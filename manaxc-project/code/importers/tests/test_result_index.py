@@ -0,0 +1,68 @@
+"""RaceResultIndex.is_duplicate: same athlete vs. a tie at the same time"""
+
+import pytest
+
+from fake_supabase import FakeSupabase
+from result_index import RaceResultIndex
+
+
+@pytest.fixture
+def client():
+    client = FakeSupabase()
+    client.tables['athletes'] = [
+        {'id': 'a1', 'athletic_net_id': '111', 'slug': 'amy-lee-2027'},
+        {'id': 'a1-copy', 'athletic_net_id': '111', 'slug': 'amy-lee-2027-2'},   # same athlete, second row
+        {'id': 'a2', 'athletic_net_id': '222', 'slug': 'amy-lee-2027'},          # same name, other athlete
+        {'id': 'b1', 'athletic_net_id': None, 'slug': 'ben-ng-2026'},
+        {'id': 'b1-copy', 'athletic_net_id': None, 'slug': 'ben-ng-2026'},
+        {'id': 'c1', 'athletic_net_id': None, 'slug': 'cal-ortiz-2026'},
+    ]
+    client.tables['results'] = [
+        {'race_id': 'r1', 'athlete_id': 'a1', 'time_cs': 100000},
+        {'race_id': 'r1', 'athlete_id': 'b1', 'time_cs': 101000},
+        {'race_id': 'r2', 'athlete_id': 'c1', 'time_cs': 100000},
+    ]
+    return client
+
+
+def loaded_index(client, candidates):
+    index = RaceResultIndex(client)
+    index.load_races(['r1', 'r2'])
+    index.load_identities(candidates)
+    return index
+
+
+@pytest.mark.parametrize('race_id,athlete_id,time_cs,duplicate', [
+    ('r1', 'a2', 99999, False),      # no result at this time
+    ('r1', 'a1', 100000, True),      # same athlete_id
+    ('r1', 'a1-copy', 100000, True),  # same athletic_net_id
+    ('r1', 'a2', 100000, False),     # same slug but different athletic_net_id: a tie
+    ('r1', 'b1-copy', 101000, True),  # no athletic_net_ids, same slug
+    ('r1', 'c1', 101000, False),     # no athletic_net_ids, different slug: a tie
+    ('r2', 'a1', 100000, False),     # the same time in another race
+])
+def test_is_duplicate(client, race_id, athlete_id, time_cs, duplicate):
+    index = loaded_index(client, [(race_id, athlete_id, time_cs)])
+    assert index.is_duplicate(race_id, athlete_id, time_cs) is duplicate
+
+
+def test_unknown_identity_is_a_tie(client):
+    index = loaded_index(client, [])  # identities never loaded
+    assert index.is_duplicate('r1', 'a1-copy', 100000) is False
+    assert index.is_duplicate('r1', 'a1', 100000) is True
+
+
+def test_only_time_matches_need_identities(client):
+    candidates = [('r1', 'a2', 100000), ('r1', 'c1', 55555), ('r1', 'a1', 100000)]
+    index = loaded_index(client, candidates)
+
+    assert set(index.identities) == {'a1', 'a2'}
+    assert len(client.calls('select', 'athletes')) == 1
+
+
+def test_added_results_are_seen(client):
+    index = loaded_index(client, [])
+    assert len(index) == 3
+    index.add('r1', 'c1', 120000)
+    assert index.is_duplicate('r1', 'c1', 120000)
+    assert len(index) == 4
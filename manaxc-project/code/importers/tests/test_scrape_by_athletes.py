@@ -0,0 +1,65 @@
+"""scrape_by_athletes keeps the requested athletes' results by profile link"""
+
+import pytest
+
+import athletic_net_scraper_v2 as scraper
+from athletic_net_scraper_v2 import RacePage
+from driver_pool import DriverPool
+from rate_limiter import AdaptiveRateLimiter
+
+BODY = 'Big Meet\nWed, Oct 1, 2025\nBig Park, San Jose, CA\nResults\nMens 5,000 Meters Varsity'
+ROWS = [
+    ('1\nSamuel Smith\nLeland\n15:00.1\nYr: 11', '111'),   # the requested athlete, listed by full name
+    ('2\nSam Smith\nWestmont\n15:10.2\nYr: 12', '222'),    # another athlete with the profile's name
+    ('3\nAmy Lee\nLeland\n15:20.3\nYr: 10', '333'),
+]
+
+
+class FakeDriver:
+    title = 'Big Meet - Results'
+
+    def execute_script(self, script):
+        return 1
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def site(monkeypatch):
+    def fetch_athlete_races(driver, athlete_id, limiter=None):
+        return 'Sam Smith', [('777', '5000')]
+
+    def fetch_race_page(driver, meet_id, race_id, limiter=None):
+        return RacePage(race_id, BODY, [text for text, _ in ROWS], site.athlete_ids)
+
+    site.athlete_ids = [athlete_id for _, athlete_id in ROWS]
+    monkeypatch.setattr(scraper, 'fetch_athlete_races', fetch_athlete_races)
+    monkeypatch.setattr(scraper, 'fetch_race_page', fetch_race_page)
+    return site
+
+
+def scrape(seasons):
+    with DriverPool(FakeDriver) as pool:
+        return scraper.scrape_by_athletes(['111'], seasons, pool=pool,
+                                          limiter=AdaptiveRateLimiter(rate=1000, max_rate=1000))
+
+
+def test_results_are_matched_by_athlete_link(site):
+    result = scrape([2025])
+
+    assert [r.athlete_name for r in result.results] == ['Samuel Smith']
+    assert [(a.name, a.athletic_net_id) for a in result.athletes] == [('Samuel Smith', '111')]
+
+
+def test_pages_without_links_fall_back_to_the_profile_name(site):
+    site.athlete_ids = []
+
+    result = scrape([2025])
+
+    assert [r.athlete_name for r in result.results] == ['Sam Smith']
+
+
+def test_seasons_are_required(site):
+    with pytest.raises(ValueError):
+        scrape([])
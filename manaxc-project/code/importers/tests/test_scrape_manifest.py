@@ -0,0 +1,66 @@
+"""Manifest row counts and the Parquet → CSV fallback"""
+
+import csv
+
+import pytest
+
+from scrape_manifest import build_manifest, expected_rows
+
+RESULT_FIELDS = ['athletic_net_race_id', 'athlete_name', 'athlete_school_id', 'time_cs',
+                 'place_overall', 'grade']
+
+
+def write_csv(path, fieldnames, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def result(race_id, place, name='Amy "AJ" Lee\nJr'):
+    return {'athletic_net_race_id': race_id, 'athlete_name': name, 'athlete_school_id': 's1',
+            'time_cs': 90000 + place, 'place_overall': place, 'grade': 11}
+
+
+@pytest.fixture
+def folder(tmp_path):
+    write_csv(tmp_path / 'races.csv', ['athletic_net_race_id'], [{'athletic_net_race_id': '1'},
+                                                                {'athletic_net_race_id': '2'}])
+    write_csv(tmp_path / 'results.csv', RESULT_FIELDS,
+              [result('1', 1), result('1', 2), result('2', 1)])
+    return tmp_path
+
+
+def test_manifest_counts_rows_not_lines(folder):
+    manifest = build_manifest(str(folder))
+    assert manifest['rows'] == {'races.csv': 2, 'results.csv': 3}
+    assert expected_rows(manifest, 'results.csv') == 3
+    assert expected_rows(manifest, 'athletes.csv') is None
+
+
+def test_older_manifest_falls_back_to_race_counts(folder):
+    manifest = build_manifest(str(folder))
+    del manifest['rows']
+    assert expected_rows(manifest, 'races.csv') == 2
+    assert expected_rows(manifest, 'results.csv') == 3
+
+
+def test_unreadable_or_short_parquet_is_not_used(tmp_path):
+    pytest.importorskip('pyarrow')
+    from athletic_net_scraper_v2 import CSV_FIELDS, ScrapedResult
+    from scrape_columnar import read_checked_parquet_table, write_parquet_table
+
+    rows = [ScrapedResult('1', 'Amy Lee', 'Amy', 'Lee', 's1', 90000 + i, i, 11) for i in range(1, 4)]
+    path = str(tmp_path / 'results.parquet')
+
+    write_parquet_table(path, ScrapedResult, CSV_FIELDS['results'], rows)
+    assert len(read_checked_parquet_table(path, 3)) == 3
+    assert read_checked_parquet_table(path, 4) is None
+
+    # A scrape killed mid-write leaves a file without its footer
+    killed = str(tmp_path / 'killed.parquet')
+    with open(path, 'rb') as f:
+        truncated = f.read()[:-12]
+    with open(killed, 'wb') as f:
+        f.write(truncated)
+    assert read_checked_parquet_table(killed) is None
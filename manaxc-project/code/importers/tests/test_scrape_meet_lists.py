@@ -0,0 +1,77 @@
+"""resolve_school_ids: only real search answers are cached"""
+
+from selenium.common.exceptions import TimeoutException
+
+import scrape_meet_lists
+from rate_limiter import AdaptiveRateLimiter
+from school_id_cache import SchoolIdCache
+
+
+class FakeLink:
+    def __init__(self, school_id, text):
+        self.school_id = school_id
+        self.text = text
+
+    def get_attribute(self, name):
+        return f"https://www.athletic.net/CrossCountry/School.aspx?SchoolID={self.school_id}"
+
+
+class FakeSearchDriver:
+    """Search pages: schools in `found` have one hit, names in `broken` time out"""
+
+    def __init__(self, found=None, broken=()):
+        self.found = found or {}
+        self.broken = broken
+        self.url = ''
+
+    def get(self, url):
+        if any(name.replace(' ', '+') in url for name in self.broken):
+            raise TimeoutException('page load timed out')
+        self.url = url
+
+    def find_element(self, by, value):
+        return object()
+
+    def find_elements(self, by, selector):
+        for name, school_id in self.found.items():
+            if name.replace(' ', '+') in self.url:
+                return [FakeLink(school_id, name)]
+        return []
+
+    def execute_script(self, script):
+        return 'complete' if 'readyState' in script else 1
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    @property
+    def timeouts(self):
+        return type('Timeouts', (), {'implicit_wait': 0})()
+
+    def quit(self):
+        pass
+
+
+def _resolve(monkeypatch, tmp_path, driver, names):
+    monkeypatch.setattr(scrape_meet_lists, 'create_driver', lambda: driver)
+    monkeypatch.setattr(scrape_meet_lists, 'wait_for_stable_elements', lambda *a, **k: 0)
+    monkeypatch.setattr(scrape_meet_lists, 'RATE_LIMITER', AdaptiveRateLimiter(rate=1000, max_rate=1000))
+    cache = SchoolIdCache(str(tmp_path / 'cache.json'), manual_path=None)
+    return scrape_meet_lists.resolve_school_ids(names, workers=1, cache=cache), cache
+
+
+def test_found_and_not_found_are_cached(monkeypatch, tmp_path):
+    driver = FakeSearchDriver(found={'Leland': '1234'})
+    school_ids, cache = _resolve(monkeypatch, tmp_path, driver, ['Leland', 'Nowhere'])
+
+    assert school_ids == {'Leland': '1234', 'Nowhere': None}
+    assert cache.lookup('Leland') == (True, '1234')
+    assert cache.lookup('Nowhere') == (True, None)
+
+
+def test_failed_search_is_not_cached(monkeypatch, tmp_path):
+    driver = FakeSearchDriver(found={'Leland': '1234'}, broken=['Westmont'])
+    school_ids, cache = _resolve(monkeypatch, tmp_path, driver, ['Leland', 'Westmont'])
+
+    assert school_ids == {'Leland': '1234'}
+    assert cache.lookup('Westmont') == (False, None)
@@ -0,0 +1,61 @@
+"""wait_for_stable_elements against a fake WebDriver"""
+
+import time
+
+from scraper_waits import WaitStats, wait_for_stable_elements
+
+
+class FakeDriver:
+    """Serves `counts(elapsed)` matches and a readyState"""
+
+    def __init__(self, counts, ready_state='complete'):
+        self.counts = counts
+        self.ready_state = ready_state
+        self.start = time.monotonic()
+        self.implicit = 5
+
+    @property
+    def timeouts(self):
+        return type('Timeouts', (), {'implicit_wait': self.implicit})()
+
+    def implicitly_wait(self, seconds):
+        self.implicit = seconds
+
+    def find_elements(self, by, selector):
+        return [object()] * self.counts(time.monotonic() - self.start)
+
+    def execute_script(self, script):
+        return self.ready_state
+
+
+def test_returns_once_rows_are_stable():
+    stats = WaitStats()
+    driver = FakeDriver(lambda elapsed: 0 if elapsed < 0.2 else 25)
+    waited = wait_for_stable_elements(driver, 'div', timeout=5, settle=0.1, poll=0.02, stats=stats)
+    assert 0.2 <= waited < 1.0
+    assert stats.snapshot()['timeouts'] == 0
+    assert driver.implicit == 5
+
+
+def test_empty_page_returns_early():
+    stats = WaitStats()
+    driver = FakeDriver(lambda elapsed: 0)
+    waited = wait_for_stable_elements(driver, 'div', timeout=5, poll=0.02, stats=stats, empty_after=0.3)
+    assert waited < 1.0
+    snapshot = stats.snapshot()
+    assert snapshot['empty'] == 1 and snapshot['timeouts'] == 0
+
+
+def test_empty_while_loading_waits_for_ceiling():
+    stats = WaitStats()
+    driver = FakeDriver(lambda elapsed: 0, ready_state='loading')
+    waited = wait_for_stable_elements(driver, 'div', timeout=0.5, poll=0.02, stats=stats, empty_after=0.1)
+    assert waited >= 0.5
+    assert stats.snapshot()['timeouts'] == 1
+
+
+def test_rows_arriving_after_empty_window_without_load_complete():
+    stats = WaitStats()
+    driver = FakeDriver(lambda elapsed: 0 if elapsed < 0.4 else 3, ready_state='interactive')
+    wait_for_stable_elements(driver, 'div', timeout=5, settle=0.1, poll=0.02, stats=stats, empty_after=0.1)
+    assert stats.snapshot()['empty'] == 0
@@ -0,0 +1,74 @@
+"""run_stage outcome counts against FakeSupabase"""
+
+import csv
+
+from fake_supabase import FakeSupabase
+from staged_import import EntitySpec, run_stage
+
+SCHOOLS = EntitySpec(
+    'Schools', 'schools', 'schools.csv', ('athletic_net_id',),
+    lambda row, context: {'athletic_net_id': row['athletic_net_id'], 'name': row['name']} if row['name'] else None,
+    map_key=lambda row: row['name']
+)
+
+
+def write_schools(folder, rows):
+    with open(folder / 'schools.csv', 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['athletic_net_id', 'name'])
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(folder)
+
+
+class RacingClient(FakeSupabase):
+    """Another importer inserts `racing` rows between our lookup and our insert"""
+
+    def __init__(self, racing, **kwargs):
+        super().__init__(**kwargs)
+        self.racing = racing
+
+    def _write(self, table, rows, op, on_conflict):
+        if self.racing:
+            self.seed(table, self.racing)
+            self.racing = []
+        return super()._write(table, rows, op, on_conflict)
+
+
+def test_each_key_is_counted_once(tmp_path):
+    client = FakeSupabase(unique={'schools': [('athletic_net_id',)]},
+                          checks={'schools': lambda row: row['athletic_net_id'] != '9'})
+    client.seed('schools', [{'athletic_net_id': '2', 'name': 'Old Name'}])
+    folder = write_schools(tmp_path, [
+        {'athletic_net_id': '1', 'name': 'Leland'},
+        {'athletic_net_id': '1', 'name': 'Leland HS'},     # same school, second spelling
+        {'athletic_net_id': '2', 'name': 'Westmont'},
+        {'athletic_net_id': '2', 'name': 'Westmont HS'},
+        {'athletic_net_id': '9', 'name': 'Rejected'},
+        {'athletic_net_id': '9', 'name': 'Rejected Again'},
+        {'athletic_net_id': '3', 'name': ''},               # build_row skips it
+    ])
+
+    id_map, stats = run_stage(client, SCHOOLS, folder, {}, batch_size=100)
+
+    assert (stats.created, stats.existed, stats.failed, stats.skipped, stats.rows) == (1, 1, 1, 1, 7)
+    assert id_map['Leland'] == id_map['Leland HS']
+    assert id_map['Westmont'] == id_map['Westmont HS']
+    assert 'Rejected' not in id_map
+    assert len(stats.errors) == 1
+
+
+def test_rows_that_landed_meanwhile_are_resolved_not_failed(tmp_path):
+    racing = [{'athletic_net_id': '1', 'name': 'Leland'}]
+    client = RacingClient(racing, unique={'schools': [('athletic_net_id',)]})
+    folder = write_schools(tmp_path, [
+        {'athletic_net_id': '1', 'name': 'Leland'},
+        {'athletic_net_id': '2', 'name': 'Westmont'},
+    ])
+
+    id_map, stats = run_stage(client, SCHOOLS, folder, {})  # plain inserts: the chunk hits 23505
+
+    assert (stats.created, stats.existed, stats.failed) == (1, 1, 0)
+    assert stats.errors == []
+    assert id_map['Leland'] == client.tables['schools'][0]['id']
+    # One lookup before the insert, one for the rows that did not land
+    assert len(client.calls('select', 'schools')) == 2